@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Read benchmark for QuakeML files.
+
+Creates a large synthetic catalog (events with one origin, one magnitude and
+a configurable number of picks, arrivals and amplitudes each), writes it to
+a temporary QuakeML file and reports the time needed to read it with
+:func:`~obspy.core.event.read_events` and
+:func:`~obspy.core.event.iread_events`.
+
+Usage::
+
+    python benchmark_quakeml_read.py --events 1000 --picks 20 --repeat 3
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import argparse
+import os
+import time
+
+from obspy import UTCDateTime
+from obspy.core.event import (Amplitude, Arrival, Catalog, CreationInfo, Event,
+                              Magnitude, Origin, OriginQuality, Pick,
+                              WaveformStreamID, iread_events, read_events)
+from obspy.core.util import NamedTemporaryFile
+
+
+def create_catalog(num_events, num_picks):
+    """
+    Creates a synthetic catalog.
+    """
+    catalog = Catalog()
+    t0 = UTCDateTime(2010, 1, 1)
+    for i in range(num_events):
+        event = Event(resource_id="smi:local/event/%d" % i,
+                      event_type="earthquake")
+        origin = Origin(
+            resource_id="smi:local/origin/%d" % i, time=t0 + i * 100,
+            latitude=10 + i * 1e-3, longitude=20, depth=1000.0,
+            latitude_errors={"uncertainty": 0.1}, evaluation_mode="manual",
+            creation_info=CreationInfo(agency_id="XX", author="obspy"),
+            quality=OriginQuality(used_phase_count=num_picks,
+                                  standard_error=0.5))
+        for j in range(num_picks):
+            waveform_id = WaveformStreamID("XX", "S%03d" % j, "", "HHZ")
+            pick = Pick(
+                resource_id="smi:local/pick/%d/%d" % (i, j),
+                time=t0 + i * 100 + j, phase_hint="P",
+                waveform_id=waveform_id, onset="impulsive",
+                polarity="positive", evaluation_mode="manual")
+            event.picks.append(pick)
+            origin.arrivals.append(Arrival(
+                resource_id="smi:local/arrival/%d/%d" % (i, j),
+                pick_id=pick.resource_id, phase="P", distance=0.1 * j,
+                time_residual=0.01, azimuth=12.0, time_weight=1.0))
+            event.amplitudes.append(Amplitude(
+                resource_id="smi:local/amplitude/%d/%d" % (i, j),
+                generic_amplitude=1e-6, type="A", pick_id=pick.resource_id,
+                waveform_id=waveform_id))
+        event.origins.append(origin)
+        event.magnitudes.append(Magnitude(
+            resource_id="smi:local/magnitude/%d" % i, mag=3.0,
+            magnitude_type="ML", origin_id=origin.resource_id,
+            station_count=num_picks))
+        event.preferred_origin_id = origin.resource_id
+        event.preferred_magnitude_id = event.magnitudes[0].resource_id
+        catalog.append(event)
+    return catalog
+
+
+def benchmark(func, repeat):
+    """
+    Returns the best time out of ``repeat`` calls of ``func``.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--events", type=int, default=1000,
+                        help="number of events (default: 1000)")
+    parser.add_argument("--picks", type=int, default=20,
+                        help="number of picks per event (default: 20)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of repetitions (default: 3)")
+    args = parser.parse_args(argv)
+
+    catalog = create_catalog(args.events, args.picks)
+    with NamedTemporaryFile(suffix=".xml") as tf:
+        catalog.write(tf.name, format="QUAKEML")
+        del catalog
+        size = os.path.getsize(tf.name) / 1024.0 ** 2
+        print("%d events with %d picks each, %.1f MB" % (
+            args.events, args.picks, size))
+        seconds = benchmark(
+            lambda: read_events(tf.name, format="QUAKEML"), args.repeat)
+        print("read_events:  %8.3f s (%.0f events/s)" % (
+            seconds, args.events / seconds))
+        seconds = benchmark(
+            lambda: sum(1 for _ in iread_events(tf.name, format="QUAKEML")),
+            args.repeat)
+        print("iread_events: %8.3f s (%.0f events/s)" % (
+            seconds, args.events / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,7 @@ from lxml import etree
 
 import obspy
 from obspy import UTCDateTime, read_inventory
+from obspy.core.event import iread_events
 from .header import (DEFAULT_PARAMETERS, DEFAULT_USER_AGENT, FDSNWS,
                      OPTIONAL_PARAMETERS, PARAMETER_ALIASES, URL_MAPPINGS,
                      WADL_PARAMETERS_NOT_TO_BE_PARSED, FDSNException,
@@ -269,7 +270,8 @@ class Client(object):
                    includeallorigins=None, includeallmagnitudes=None,
                    includearrivals=None, eventid=None, limit=None, offset=None,
                    orderby=None, catalog=None, contributor=None,
-                   updatedafter=None, filename=None, **kwargs):
+                   updatedafter=None, filename=None, iterate=False,
+                   **kwargs):
         """
         Query the event service of the client.
 
@@ -375,6 +377,13 @@ class Client(object):
         :param filename: If given, the downloaded data will be saved there
             instead of being parsed to an ObsPy object. Thus it will contain
             the raw data from the webservices.
+        :type iterate: bool
+        :param iterate: If ``True``, a generator yielding one
+            :class:`~obspy.core.event.event.Event` at a time is returned
+            instead of a :class:`~obspy.core.event.Catalog`. The downloaded
+            QuakeML document is parsed incrementally, which keeps the memory
+            usage low for large requests (see
+            :func:`~obspy.core.event.iread_events`).
 
 
         Any additional keyword arguments will be passed to the webservice as
@@ -398,6 +407,8 @@ class Client(object):
         if filename:
             self._write_to_file_object(filename, data_stream)
             data_stream.close()
+        elif iterate:
+            return iread_events(data_stream, format="quakeml")
         else:
             cat = obspy.read_events(data_stream, format="quakeml")
             data_stream.close()
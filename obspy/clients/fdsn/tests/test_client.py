@@ -24,7 +24,7 @@ from difflib import Differ
 import lxml
 import requests
 
-from obspy import UTCDateTime, read, read_inventory
+from obspy import UTCDateTime, read, read_events, read_inventory
 from obspy.core.compatibility import mock
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.clients.fdsn import Client
@@ -262,6 +262,21 @@ class ClientTestCase(unittest.TestCase):
             self.assertEqual(p.call_count, 1)
             self.assertIn("location=--", p.call_args[0][0])
 
+    def test_get_events_iterate(self):
+        """
+        Tests streaming the events of an event request.
+        """
+        filename = os.path.join(self.path, os.pardir, os.pardir, os.pardir,
+                                "core", "tests", "data", "neries_events.xml")
+        with open(filename, "rb") as fh:
+            data = fh.read()
+        with mock.patch("obspy.clients.fdsn.Client._download") as p:
+            p.return_value = io.BytesIO(data)
+            events = self.client.get_events(minmagnitude=4, iterate=True)
+        self.assertEqual(p.call_count, 1)
+        self.assertNotIn("iterate", p.call_args[0][0])
+        self.assertEqual(list(events), read_events(filename).events)
+
     def test_url_building_with_auth(self):
         """
         Tests the Client._build_url() method with authentication.
@@ -117,7 +117,7 @@ from future.builtins import *  # NOQA
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util.attribdict import AttribDict
 from obspy.core.trace import Stats, Trace
-from obspy.core.stream import Stream, read
+from obspy.core.stream import Stream, read, scan
 from obspy.scripts.runtests import run_tests
 
 
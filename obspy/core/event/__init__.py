@@ -26,14 +26,16 @@ from future.builtins import *  # NOQA
 from .base import (
     Comment, CompositeTime, ConfidenceEllipsoid, CreationInfo, DataUsed,
     QuantityError, ResourceIdentifier, TimeWindow, WaveformStreamID)
-from .catalog import Catalog, read_events
+from .catalog import Catalog, iread_events, read_events
 from .event import Event, EventDescription
+from .index import CatalogIndex
 from .magnitude import (
     Amplitude, Magnitude, StationMagnitude, StationMagnitudeContribution)
 from .origin import Origin, OriginQuality, OriginUncertainty, Pick, Arrival
 from .source import (
     Axis, FocalMechanism, MomentTensor, NodalPlane, NodalPlanes, PrincipalAxes,
     SourceTimeFunction, Tensor)
+from .table import CatalogTable, scan_events
 
 if __name__ == '__main__':
     import doctest
@@ -24,12 +24,14 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 from future.utils import native_str
 
-import collections
 import copy
 import inspect
+import math
 import re
+import threading
 import warnings
 import weakref
+from collections import OrderedDict
 from copy import deepcopy
 from uuid import uuid4
 
@@ -38,6 +40,183 @@ import numpy as np
 from obspy.core.event.header import DataUsedWaveType, ATTRIBUTE_HAS_ERRORS
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import AttribDict
+from obspy.core.util.deprecation_helpers import ObsPyDeprecationWarning
+
+
+# Number of modifications of event type objects and of the lists of their
+# containers. Allows caches derived from events (e.g. the columns of a
+# Catalog) to detect modifications in constant time.
+_modification_count = 0
+
+
+def _get_modification_count():
+    """
+    Returns the number of modifications of all event type objects.
+    """
+    return _modification_count
+
+
+def _modified():
+    """
+    Counts a modification of an event type object.
+    """
+    global _modification_count
+    _modification_count += 1
+
+
+class _ContainerList(list):
+    """
+    List of the objects in a container of an event type object (e.g. the
+    origins of an event) counting all its modifications.
+
+    Pickled as a plain list.
+    """
+    def __setitem__(self, index, value):
+        _modified()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):
+        _modified()
+        list.__delitem__(self, index)
+
+    # Python 2 only
+    def __setslice__(self, i, j, sequence):
+        _modified()
+        list.__setslice__(self, i, j, sequence)
+
+    def __delslice__(self, i, j):
+        _modified()
+        list.__delslice__(self, i, j)
+
+    def __iadd__(self, other):
+        _modified()
+        return list.__iadd__(self, other)
+
+    def __imul__(self, n):
+        _modified()
+        return list.__imul__(self, n)
+
+    def append(self, value):
+        _modified()
+        list.append(self, value)
+
+    def extend(self, values):
+        _modified()
+        list.extend(self, values)
+
+    def insert(self, index, value):
+        _modified()
+        list.insert(self, index, value)
+
+    def pop(self, *args):
+        _modified()
+        return list.pop(self, *args)
+
+    def remove(self, value):
+        _modified()
+        list.remove(self, value)
+
+    def clear(self):
+        _modified()
+        del self[:]
+
+    def reverse(self):
+        _modified()
+        list.reverse(self)
+
+    def sort(self, *args, **kwargs):
+        _modified()
+        list.sort(self, *args, **kwargs)
+
+    def __reduce__(self):
+        return (list, (list(self), ))
+
+    def __deepcopy__(self, memodict=None):
+        if memodict is None:
+            memodict = {}
+        result = self.__class__()
+        memodict[id(self)] = result
+        list.extend(result, [deepcopy(_i, memodict) for _i in self])
+        return result
+
+
+class _LazyContainerList(_ContainerList):
+    """
+    Container list whose objects are only created when it is first used.
+
+    Turns into a :class:`_ContainerList` once the objects are loaded.
+    Unloaded lists are skipped by :func:`_yield_resource_id_parent_attr`,
+    the loader has to bind the resource identifiers of its objects.
+
+    :param load: Called with the list to add the objects to it with
+        :meth:`list.extend`, which is not counted as a modification.
+    """
+    def __init__(self, load):
+        list.__init__(self)
+        self._load = load
+
+    def _load_objects(self):
+        load = self._load
+        del self._load
+        self.__class__ = _ContainerList
+        load(self)
+
+    def __radd__(self, other):
+        self._load_objects()
+        return other + list(self)
+
+    def _refer(self, resource_id):
+        """
+        Lets a resource identifier referring to an object of the list load
+        the list when it is resolved.
+        """
+        resource_id._object_ref = _LazyReference(self, resource_id)
+
+
+class _LazyReference(object):
+    """
+    Stands in for the weak reference of a resource identifier to an object
+    of a :class:`_LazyContainerList`, calling it loads the list.
+    """
+    def __init__(self, container, resource_id):
+        self._container = container
+        self._resource_id = resource_id
+
+    def __call__(self):
+        if type(self._container) is _LazyContainerList:
+            self._container._load_objects()
+        ref = self._resource_id._object_ref
+        if ref is self:
+            # the loader did not bind the resource identifier
+            self._resource_id._object_ref = None
+            return None
+        return None if ref is None else ref()
+
+
+def _loading(name):
+    """
+    Returns a method of container lists that loads the objects first.
+    """
+    method = getattr(_ContainerList, name)
+
+    def _method(self, *args, **kwargs):
+        self._load_objects()
+        return method(self, *args, **kwargs)
+    _method.__name__ = method.__name__
+    return _method
+
+
+for _name in ("__add__", "__contains__", "__deepcopy__", "__delitem__",
+              "__delslice__", "__eq__", "__ge__", "__getitem__",
+              "__getslice__", "__gt__", "__iadd__", "__imul__", "__iter__",
+              "__le__", "__len__", "__lt__", "__mul__", "__ne__",
+              "__reduce__", "__reduce_ex__", "__repr__", "__reversed__",
+              "__rmul__", "__setitem__", "__setslice__", "append", "clear",
+              "copy", "count", "extend", "index", "insert", "pop", "remove",
+              "reverse", "sort"):
+    # some methods only exist on Python 2 or 3
+    if hasattr(_ContainerList, _name):
+        setattr(_LazyContainerList, _name, _loading(_name))
 
 
 class QuantityError(AttribDict):
@@ -64,10 +243,15 @@ class QuantityError(AttribDict):
     def __init__(self, uncertainty=None, lower_uncertainty=None,
                  upper_uncertainty=None, confidence_level=None):
         super(QuantityError, self).__init__()
-        self.uncertainty = uncertainty
-        self.lower_uncertainty = lower_uncertainty
-        self.upper_uncertainty = upper_uncertainty
-        self.confidence_level = confidence_level
+        # all default values are None already
+        if uncertainty is not None:
+            self.uncertainty = uncertainty
+        if lower_uncertainty is not None:
+            self.lower_uncertainty = lower_uncertainty
+        if upper_uncertainty is not None:
+            self.upper_uncertainty = upper_uncertainty
+        if confidence_level is not None:
+            self.confidence_level = confidence_level
 
     def __bool__(self):
         """
@@ -91,6 +275,11 @@ class QuantityError(AttribDict):
         """
         return any([getattr(self, key) is not None for key in self.defaults])
 
+    def __deepcopy__(self, memodict=None):
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(deepcopy(self.__dict__, memodict))
+        return result
+
     # Python 2 compatibility
     __nonzero__ = __bool__
 
@@ -201,6 +390,12 @@ def _event_type_class_factory(class_name, class_attributes=[],
         for key, value in _properties:
             _property_dict[key] = value
         _containers = class_contains
+        _error_keys = [_i for _i in _property_keys if _i.endswith("_errors")]
+        # attributes holding resource identifiers and nested event types
+        _resource_id_keys = [_i[0] for _i in _properties
+                             if _i[1] is ResourceIdentifier]
+        _nested_keys = [_i[0] for _i in _properties
+                        if hasattr(_i[1], "_property_dict")]
         warn_on_non_default_key = True
         defaults = dict.fromkeys(class_contains, [])
         defaults.update(dict.fromkeys(_property_keys, None))
@@ -223,16 +418,51 @@ def _event_type_class_factory(class_name, class_attributes=[],
                         if value is None:
                             value = ResourceIdentifier()
                 setattr(self, key, value)
-            # Containers currently are simple lists.
+            # Containers are lists counting their modifications.
             for name in self._containers:
-                setattr(self, name, list(kwargs.get(name, [])))
+                setattr(self, name, _ContainerList(kwargs.get(name, [])))
             # All errors are QuantityError. If they are not set yet, set them
             # now.
             for key, _ in self._properties:
                 if key.endswith("_errors") and getattr(self, key) is None:
-                    setattr(self, key, QuantityError())
+                    self.__dict__[key] = QuantityError()
+
+        @classmethod
+        def _from_trusted(cls, **kwargs):
+            """
+            Alternative constructor for readers.
+
+            Values that are ``None`` or already of the type of the attribute
+            are stored directly, skipping the type checks and conversions of
+            :meth:`__setattr__`. All other values are set as usual, i.e.
+            converted and validated. Error quantities that are not given are
+            set to empty :class:`QuantityError` objects, no resource
+            identifier is created if none is given and the resource
+            identifier is set last.
+            """
+            self = cls.__new__(cls)
+            self.__dict__.update(cls.defaults)
+            for name in cls._containers:
+                self.__dict__[name] = _ContainerList(kwargs.pop(name, []))
+            resource_id = kwargs.pop("resource_id", None)
+            for key, value in kwargs.items():
+                attrib_type = cls._property_dict.get(key)
+                if value is None and attrib_type is not None:
+                    continue
+                if type(value) is not attrib_type or attrib_type is float \
+                        and (math.isnan(value) or math.isinf(value)):
+                    setattr(self, key, value)
+                else:
+                    self.__dict__[key] = value
+            for key in cls._error_keys:
+                if key not in kwargs:
+                    self.__dict__[key] = QuantityError()
+            if resource_id is not None:
+                self.resource_id = resource_id
+            return self
 
         def clear(self):
+            _modified()
             super(AbstractEventType, self).clear()
             self.__init__(force_resource_id=False)
 
@@ -353,6 +583,9 @@ def _event_type_class_factory(class_name, class_attributes=[],
             Custom property implementation that works if the class is
             inheriting from AttribDict.
             """
+            # attributes are only modified once set, i.e. not by __init__
+            if name in self.__dict__:
+                _modified()
             # avoid type casting of 'extra' attribute, to make it possible to
             # control ordering of extra tags by using an OrderedDict for
             # 'extra'.
@@ -361,6 +594,9 @@ def _event_type_class_factory(class_name, class_attributes=[],
                 return
             # Pass to the parent method if not a custom property.
             if name not in self._property_dict.keys():
+                if name in self._containers and \
+                        type(value) is not _ContainerList:
+                    value = _ContainerList(value)
                 AttribDict.__setattr__(self, name, value)
                 return
             attrib_type = self._property_dict[name]
@@ -395,7 +631,23 @@ def _event_type_class_factory(class_name, class_attributes=[],
                 if name == "resource_id":  # bind the resource_id to self
                     self.resource_id.set_referred_object(self, warn=False)
                 else:  # else unbind to allow event scoping later
-                    value._object_id = None
+                    value._unbind()
+
+        def __setitem__(self, name, value):
+            _modified()
+            AttribDict.__setitem__(self, name, value)
+
+        def __delitem__(self, name):
+            _modified()
+            AttribDict.__delitem__(self, name)
+
+        __delattr__ = __delitem__
+
+        def __setstate__(self, state):
+            AttribDict.__setstate__(self, state)
+            for name in self._containers:
+                self.__dict__[name] = _ContainerList(
+                    self.__dict__.get(name, []))
 
     class AbstractEventTypeWithResourceID(AbstractEventType):
         def __init__(self, force_resource_id=True, *args, **kwargs):
@@ -408,12 +660,21 @@ def _event_type_class_factory(class_name, class_attributes=[],
             reset resource_id's object_id after deep copy to allow the
             object specific behavior of get_referred_object
             """
-            memodict = memodict or {}
+            if memodict is None:
+                memodict = {}
             cls = self.__class__
             result = cls.__new__(cls)
             memodict[id(self)] = result
+            # The values of a valid object need no type checks, only the
+            # resource identifiers need to be (un)bound.
             for k, v in self.__dict__.items():
-                setattr(result, k, deepcopy(v, memodict))
+                v = deepcopy(v, memodict)
+                result.__dict__[k] = v
+                if isinstance(v, ResourceIdentifier):
+                    if k == "resource_id":
+                        v.set_referred_object(result, warn=False)
+                    else:
+                        v._unbind()
             return result
 
     if "resource_id" in [item[0] for item in class_attributes]:
@@ -535,8 +796,15 @@ class ResourceIdentifier(object):
     always return the same object it did on the first call as long as the
     object still exists. If the bound object gets garage collected a warning
     will be issued and another object with the same resource_id will be
-    returned if one exists. If no other object has the same resource_id, an
-    additional warning will be issued and None returned.
+    returned if one exists. If no other object has the same resource_id,
+    None is returned.
+
+    Objects are only referenced weakly and are dropped from the class level
+    registry as soon as they get garbage collected. The resource identifiers
+    of an :class:`~obspy.core.event.event.Event` can be bound to the objects
+    of that event in one go with :meth:`Event.scope_resource_ids()
+    <obspy.core.event.event.Event.scope_resource_ids>`, which is done
+    automatically when reading and copying events.
 
     >>> res_id = 'obspy.org/tests/test_resource_doc_example'
     >>> obj_a = UTCDateTime(10)
@@ -605,16 +873,35 @@ class ResourceIdentifier(object):
     ResourceIdentifier(id="foo") bar1
     ...'foo' bar2
     """
-    # Class (not instance) attribute that keeps track of all resource
-    # identifier throughout one Python run. Will only store weak references
-    # and therefore does not interfere with the garbage collection.
+    # Class (not instance) attribute that maps every resource id to an
+    # ordered dictionary of weak references to the objects registered with
+    # it, keyed by the identity of the objects and the most recently
+    # registered object last. It is only consulted by instances that are not
+    # bound to an object of their own. Entries are removed by weak reference
+    # callbacks as soon as the referred objects get garbage collected, so the
+    # ResourceIdentifier instances themselves need no bookkeeping at all.
     # DO NOT CHANGE THIS FROM OUTSIDE THE CLASS.
-    __resource_id_weak_dict = {}  # a nested dict for weak object references
-    # Use an additional dictionary to track all resource ids.
-    __resource_id_tracker = collections.defaultdict(int)
-    # yet another dictionary for keep track of resources id that are not bound
-    # keys are the id and values are a weak ref to the resource identifier
-    __unbound_resource_id = weakref.WeakValueDictionary()
+    __resource_id_weak_dict = {}
+    # Reentrant as the callbacks might be triggered by a garbage collection
+    # while the lock is held.
+    __lock = threading.RLock()
+
+    def __remove_reference(ref, _registry=__resource_id_weak_dict,
+                           _lock=__lock):
+        """
+        Weak reference callback removing the reference of a garbage collected
+        object from the class level dictionary.
+        """
+        key, object_id = ref.key
+        with _lock:
+            refs = _registry.get(key)
+            if refs is None or refs.get(object_id) is not ref:
+                return
+            del refs[object_id]
+            if not refs:
+                del _registry[key]
+
+    __remove_reference = staticmethod(__remove_reference)
 
     def __init__(self, id=None, prefix="smi:local",
                  referred_object=None):
@@ -629,43 +916,41 @@ class ResourceIdentifier(object):
         else:
             self.fixed = True
             self.id = id
-        # Append the referred object in case one is given to the class level
-        # reference dictionary.
-        self._object_id = None  # the object specific ID
+        # Weak reference to and identity of the object this instance is
+        # bound to.
+        self._object_ref = None
+        self._object_id = None
         if referred_object is not None:
             self.set_referred_object(referred_object)
 
-        # Increment the counter for the current resource id.
-        ResourceIdentifier.__resource_id_tracker[self.id] += 1
-
-    def __del__(self):
-        if self.id not in ResourceIdentifier.__resource_id_tracker:
-            return
-        # Decrement the resource id counter.
-        ResourceIdentifier.__resource_id_tracker[self.id] -= 1
-        # If below or equal to zero, delete it and also delete it from the weak
-        # value dictionary.
-        if ResourceIdentifier.__resource_id_tracker[self.id] <= 0:
-            del ResourceIdentifier.__resource_id_tracker[self.id]
-            try:
-                del ResourceIdentifier.__resource_id_weak_dict[self.id]
-            except KeyError:
-                pass
+    def __getstate__(self):
+        # Weak references can neither be pickled nor copied, copies are
+        # unbound and get bound to an object again when scoped or used.
+        state = self.__dict__.copy()
+        state["_object_ref"] = None
+        state["_object_id"] = None
+        return state
+
+    def __deepcopy__(self, memodict=None):
+        # All attributes are immutable, no need to go through the generic
+        # (and slow) copy protocol.
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__getstate__())
+        return result
 
     @classmethod
     def bind_resource_ids(cls):
         """
-        Bind the unbound ResourceIdentifier instances to referred objects.
+        Deprecated, resource identifiers are no longer tracked globally.
 
-        Binds all of the unbound ResourceIdentifier instances to the most
-        recent object assigned to the resource_id. This ensures that all
-        resource identifiers will return the same object they are bound to
-        until the object goes out of scope.
+        Use :meth:`Event.scope_resource_ids()
+        <obspy.core.event.event.Event.scope_resource_ids>` to bind all
+        resource identifiers of an event to the objects of that event.
         """
-        for rid_id in list(cls.__unbound_resource_id):
-            rid = cls.__unbound_resource_id.pop(rid_id, None)
-            if rid is not None:  # if the resource id still exists
-                rid.get_referred_object()  # will bind rid to referred object
+        msg = ("ResourceIdentifier.bind_resource_ids() is deprecated and "
+               "does nothing. Please use Event.scope_resource_ids() to bind "
+               "the resource identifiers of an event to its objects.")
+        warnings.warn(msg, ObsPyDeprecationWarning)
 
     def get_referred_object(self):
         """
@@ -676,74 +961,92 @@ class ResourceIdentifier(object):
 
         Will return None if no object could be found.
         """
-        try:
-            rdic = ResourceIdentifier.__resource_id_weak_dict[self.id]
-        except KeyError:
-            return None
-        else:
-            if self._object_id in rdic and rdic[self._object_id]() is not None:
-                return rdic[self._object_id]()
-            else:  # find last added obj that is not None
-                return self._get_similar_referred_object()
-
-    def _get_similar_referred_object(self):
-        """
-        Find an object with the same resource_id that is not None and
-        return it. Also pop all keys that have None values in the
-        __resource_id_weak_dict
-        """
-        rdic = ResourceIdentifier.__resource_id_weak_dict[self.id]
-        if self._object_id is not None:
+        ref = self._object_ref
+        if ref is not None:
+            obj = ref()
+            if obj is not None:
+                return obj
+        obj = None
+        with ResourceIdentifier.__lock:
+            refs = ResourceIdentifier.__resource_id_weak_dict.get(self.id)
+            if refs:
+                for other in reversed(refs.values()):
+                    obj = other()
+                    if obj is not None:
+                        break
+        # references to lazily loaded objects that do not exist are reset
+        if self._object_ref is not None and obj is not None:
             msg = ("The object with identity of: %d no longer exists, "
                    "returning the most recently created object with a"
                    " resource id of: %s") % (self._object_id, self.id)
             line_number = inspect.currentframe().f_back.f_lineno
             warnings.warn_explicit(msg, UserWarning, __file__,
                                    line_number)
-            self._object_id = None  # reset object id
-        # find a obj that is not None starting at last in ordered dict
-        for key in list(reversed(rdic)):
-            obj = rdic[key]()
-            if obj is not None:
-                self._object_id = id(obj)  # bind object ID
-                return obj
-            else:  # remove references that are None
-                rdic.pop(key)
-        else:  # if iter runs out all objects are none; pop rid, return None
-            ResourceIdentifier.__resource_id_weak_dict.pop(self.id)
-            msg = ('no object found with resource id %s, returning None'
-                   % self.id)
-            line_number = inspect.currentframe().f_back.f_lineno
-            warnings.warn_explicit(msg, UserWarning, __file__, line_number)
-            return None
+        if obj is None:
+            self._object_ref = None
+            self._object_id = None
+        else:
+            self._bind(obj)
+        return obj
 
     def set_referred_object(self, referred_object, warn=True):
         """
         Binds a ResourceIdentifier instance to an object.
 
-        If it already a weak reference it will be used, otherwise one will be
-        created. If the object is None, None will be set.
+        The object will also be returned by all other instances with the same
+        id that are not bound to a specific object. A warning is issued if
+        the object is not equal to the last object bound to the same id,
+        which can be suppressed by setting the warn parameter to False.
+        """
+        self._bind(referred_object)
+        key = self.id
+        object_id = id(referred_object)
+        with ResourceIdentifier.__lock:
+            registry = ResourceIdentifier.__resource_id_weak_dict
+            refs = registry.get(key)
+            if refs is None:
+                refs = OrderedDict()
+            else:
+                ref = refs.get(object_id)
+                if ref is not None and ref() is referred_object:
+                    return
+                last_obj = None
+                for ref in reversed(refs.values()):
+                    last_obj = ref()
+                    if last_obj is not None:
+                        break
+                if warn and last_obj is not None and \
+                        last_obj != referred_object:
+                    msg = ('Warning, binding object to resource ID %s which '
+                           'is not equal to the last object bound to this '
+                           'resource_id') % self.id
+                    line_number = inspect.currentframe().f_back.f_lineno
+                    warnings.warn_explicit(msg, UserWarning, __file__,
+                                           line_number)
+                # The identity might be the one of a collected object whose
+                # callback did not run yet.
+                refs.pop(object_id, None)
+            refs[object_id] = weakref.KeyedRef(
+                referred_object, ResourceIdentifier.__remove_reference,
+                (key, object_id))
+            # A garbage collection might have removed the (then empty)
+            # entry in the meantime.
+            registry[key] = refs
+
+    def _bind(self, referred_object):
+        """
+        Binds the instance to an object without registering the object.
+        """
+        self._object_ref = weakref.ref(referred_object)
+        self._object_id = id(referred_object)
 
-        Will also append self again to the global class level reference list
-        so everything stays consistent. Warning can be ignored by setting
-        the warn parameter to False.
+    def _unbind(self):
         """
-        self._object_id = id(referred_object)  # identity of object
-        rdic = ResourceIdentifier.__resource_id_weak_dict
-        # if the resource_id is in the rid_dict
-        if self.id in rdic and self._object_id not in rdic[self.id]:
-            last_obj = rdic[self.id][next(reversed(rdic[self.id]))]()
-            if warn and last_obj is not None and last_obj != referred_object:
-                msg = ('Warning, binding object to resource ID %s which '
-                       'is not equal to the last object bound to this '
-                       'resource_id') % self.id
-                line_number = inspect.currentframe().f_back.f_lineno
-                warnings.warn_explicit(msg, UserWarning, __file__,
-                                       line_number)
-            rdic[self.id][self._object_id] = weakref.ref(referred_object)
-        else:
-            rdic[self.id] = collections.OrderedDict()
-            rdic[self.id][self._object_id] = weakref.ref(referred_object)
+        Unbinds the instance so it refers to the most recently bound object
+        with the same id until it is bound again.
+        """
+        self._object_ref = None
+        self._object_id = None
 
     def convert_id_to_quakeml_uri(self, authority_id="local"):
         """
@@ -812,18 +1115,6 @@ class ResourceIdentifier(object):
         """
         return deepcopy(self)
 
-    @property
-    def _object_id(self):
-        return self.__dict__['_object_id']
-
-    @_object_id.setter
-    def _object_id(self, value):
-        if value is None:  # add instance to unbound dict
-            self.__class__.__unbound_resource_id[id(self)] = self
-        else:  # binding to object, remove instance from unbound dict
-            self.__class__.__unbound_resource_id.pop(id(self), None)
-        self.__dict__['_object_id'] = value
-
     @property
     def id(self):
         """
@@ -941,6 +1232,40 @@ class ResourceIdentifier(object):
         self._uuid = str(uuid4())
 
 
+def _yield_resource_id_parent_attr(obj):
+    """
+    Yield all resource identifiers contained in an event type object.
+
+    Walks the object and all of its nested event type attributes and
+    containers and yields a tuple of each
+    :class:`~obspy.core.event.base.ResourceIdentifier` found, the object it
+    is an attribute of and the name of that attribute.
+    """
+    stack = [obj]
+    while stack:
+        parent = stack.pop()
+        try:
+            attributes = parent.__dict__
+            resource_id_keys = parent._resource_id_keys
+            nested_keys = parent._nested_keys
+            containers = parent._containers
+        except AttributeError:
+            continue
+        for attr in resource_id_keys:
+            value = attributes.get(attr)
+            if value is not None:
+                yield value, parent, attr
+        for attr in nested_keys:
+            value = attributes.get(attr)
+            if value is not None:
+                stack.append(value)
+        for attr in containers:
+            value = attributes.get(attr)
+            # objects of lazy containers are bound once they are loaded
+            if type(value) is not _LazyContainerList and value:
+                stack.extend(value)
+
+
 __CreationInfo = _event_type_class_factory(
     "__CreationInfo",
     class_attributes=[("agency_id", str),
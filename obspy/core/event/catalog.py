@@ -34,17 +34,34 @@ from pkg_resources import load_entry_point
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import NamedTemporaryFile, _read_from_plugin
 from obspy.core.util.base import ENTRY_POINTS, download_to_file
-from obspy.core.util.decorator import (map_example_filename, rlock,
-                                       uncompress_file)
+from obspy.core.util.decorator import map_example_filename, uncompress_file
 from obspy.imaging.cm import obspy_sequential
 
-from .base import CreationInfo, ResourceIdentifier
+from .base import (CreationInfo, ResourceIdentifier, _ContainerList,
+                   _get_modification_count)
 
 from .event import Event
 
 EVENT_ENTRY_POINTS = ENTRY_POINTS['event']
 EVENT_ENTRY_POINTS_WRITE = ENTRY_POINTS['event_write']
 
+CATALOG_COLUMNS_DTYPE = np.dtype([
+    (native_str('time'), np.int64),
+    (native_str('latitude'), np.float64),
+    (native_str('longitude'), np.float64),
+    (native_str('depth'), np.float64),
+    (native_str('magnitude'), np.float64),
+    (native_str('standard_error'), np.float64),
+    (native_str('azimuthal_gap'), np.float64),
+    (native_str('used_station_count'), np.float64),
+    (native_str('used_phase_count'), np.float64)])
+
+# marks missing times in the time column
+NO_TIME = np.iinfo(np.int64).min
+
+_QUALITY_KEYS = ('standard_error', 'azimuthal_gap', 'used_station_count',
+                 'used_phase_count')
+
 
 class Catalog(object):
     """
@@ -103,6 +120,27 @@ class Catalog(object):
 
     creation_info = property(_get_creation_info, _set_creation_info)
 
+    def _get_events(self):
+        return self.__dict__['events']
+
+    def _set_events(self, value):
+        # the list counts its modifications for the cached columns
+        if type(value) is not _ContainerList:
+            value = _ContainerList(value)
+        self.__dict__['events'] = value
+
+    events = property(_get_events, _set_events)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the cache is only valid in this process
+        state.pop('_columns', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.events = self.__dict__['events']
+
     def __add__(self, other):
         """
         Method to add two catalogs.
@@ -290,6 +328,11 @@ class Catalog(object):
         Use ``inverse=True`` to return the Events that *do not* match the
         specified filter rules.
 
+        The values are taken from the first origin and magnitude of each
+        event. Filtering works on the cached columns of
+        :meth:`~obspy.core.event.Catalog.get_columns`, so that repeated
+        filtering of large catalogs is fast.
+
         :rtype: :class:`Catalog`
         :return: Filtered catalog. A new Catalog object with filtered
             Events as references to the original Events.
@@ -320,41 +363,21 @@ class Catalog(object):
         2012-04-04T14:21:42.300000Z | +41.818,  +79.689 | 4.4 mb | manual
         2012-04-04T14:08:46.000000Z | +38.017,  +37.736 | 3.0 ML | manual
         """
-        # Helper functions. Only first argument might be None. Avoid
-        # unorderable types by checking first shortcut on positive is None
-        # also for the greater stuff (is confusing but correct)
-        def _is_smaller(value_1, value_2):
-            if value_1 is None or value_1 < value_2:
-                return True
-            return False
-
-        def _is_smaller_or_equal(value_1, value_2):
-            if value_1 is None or value_1 <= value_2:
-                return True
-            return False
-
-        def _is_greater(value_1, value_2):
-            if value_1 is None or value_1 <= value_2:
-                return False
-            return True
-
-        def _is_greater_or_equal(value_1, value_2):
-            if value_1 is None or value_1 < value_2:
-                return False
-            return True
-
-        # Map the function to the operators.
-        operator_map = {"<": _is_smaller,
-                        "<=": _is_smaller_or_equal,
-                        ">": _is_greater,
-                        ">=": _is_greater_or_equal}
+        # Map the operators to the numpy comparison functions and to the
+        # result of the comparison for unset values (the ones of events
+        # without origin or origin quality are never matched).
+        operator_map = {"<": (np.less, True),
+                        "<=": (np.less_equal, True),
+                        ">": (np.greater, False),
+                        ">=": (np.greater_equal, False)}
 
         try:
             inverse = kwargs["inverse"]
         except KeyError:
             inverse = False
 
-        events = list(self.events)
+        columns, has_origin, has_quality = self._get_columns()
+        mask = np.ones(len(columns), dtype=np.bool_)
         for arg in args:
             try:
                 key, operator, value = arg.split(" ", 2)
@@ -362,41 +385,153 @@ class Catalog(object):
                 msg = "%s is not a valid filter rule." % arg
                 raise ValueError(msg)
             if key == "magnitude":
-                temp_events = []
-                for event in events:
-                    if (event.magnitudes and event.magnitudes[0].mag and
-                        operator_map[operator](
-                            event.magnitudes[0].mag,
-                            float(value))):
-                        temp_events.append(event)
-                events = temp_events
-            elif key in ("longitude", "latitude", "depth", "time"):
-                temp_events = []
-                for event in events:
-                    if (event.origins and key in event.origins[0] and
-                        operator_map[operator](
-                            event.origins[0].get(key),
-                            UTCDateTime(value) if key == 'time' else
-                            float(value))):
-                        temp_events.append(event)
-                events = temp_events
-            elif key in ('standard_error', 'azimuthal_gap',
-                         'used_station_count', 'used_phase_count'):
-                temp_events = []
-                for event in events:
-                    if (event.origins and event.origins[0].quality and
-                        key in event.origins[0].quality and
-                        operator_map[operator](
-                            event.origins[0].quality.get(key),
-                            float(value))):
-                        temp_events.append(event)
-                events = temp_events
+                compare, unset = operator_map[operator]
+                column = columns[key]
+                # magnitudes of zero are treated like unset ones, events
+                # without a magnitude are never matched
+                present = ~np.isnan(column) & (column != 0)
+                is_unset = ~present
+                result = compare(np.where(present, column, 0), float(value))
+            elif key == "time":
+                compare, unset = operator_map[operator]
+                column = columns[key]
+                is_unset = column == NO_TIME
+                value = UTCDateTime(value)
+                # same rounding as the UTCDateTime comparison operators
+                difference = np.round(
+                    (np.where(is_unset, value._ns, column) - value._ns) / 1e9,
+                    UTCDateTime.DEFAULT_PRECISION)
+                result = compare(difference, 0)
+                present = has_origin
+            elif key in ("longitude", "latitude", "depth") or \
+                    key in _QUALITY_KEYS:
+                compare, unset = operator_map[operator]
+                column = columns[key]
+                is_unset = np.isnan(column)
+                result = compare(np.where(is_unset, 0, column), float(value))
+                present = has_quality if key in _QUALITY_KEYS else has_origin
             else:
                 msg = "%s is not a valid filter key" % key
                 raise ValueError(msg)
+            mask &= present & np.where(is_unset, unset, result)
         if inverse:
-            events = [ev for ev in self.events if ev not in events]
-        return Catalog(events=events)
+            mask = ~mask
+        return Catalog(events=[self.events[_i] for _i in np.flatnonzero(mask)])
+
+    def get_columns(self):
+        """
+        Returns the parameters of all events as columns of a NumPy array.
+
+        The array is a read-only structured array with one row per event and
+        the columns ``time``, ``latitude``, ``longitude``, ``depth``,
+        ``magnitude``, ``standard_error``, ``azimuthal_gap``,
+        ``used_station_count`` and ``used_phase_count``, taken from the first
+        origin (and its quality) and the first magnitude of each event, like
+        in :meth:`~obspy.core.event.Catalog.filter`. Times are integer
+        nanoseconds since 1970-01-01, all other columns are floats. Unset
+        values are ``NaN`` and :data:`NO_TIME` for the time column.
+
+        The columns are built on first use and cached. Changes of the list of
+        events, of the lists of the containers of any event object (e.g.
+        ``cat[0].origins.insert(0, origin)``) and of attributes of any event
+        object (e.g. ``cat[0].origins[0].depth = 1000``) are detected and the
+        columns are rebuilt on the next call. Also used by
+        :meth:`~obspy.core.event.Catalog.filter` and
+        :meth:`~obspy.core.event.Catalog.sort`, the columns allow for fast
+        aggregations over large catalogs.
+
+        :rtype: :class:`numpy.ndarray`
+
+        .. rubric:: Example
+
+        >>> from obspy.core.event import read_events
+        >>> import numpy as np
+        >>> cat = read_events()
+        >>> columns = cat.get_columns()
+        >>> print(columns["magnitude"].tolist())
+        [4.4, 4.3, 3.0]
+        >>> print(np.nanmax(columns["magnitude"]))
+        4.4
+        >>> print(UTCDateTime(ns=int(columns["time"].min())))
+        2012-04-04T14:08:46.000000Z
+        """
+        return self._get_columns()[0]
+
+    def _get_columns(self):
+        """
+        Returns the (cached) columns of the catalog and boolean arrays
+        telling which events have an origin and an origin quality.
+        """
+        cache = self.__dict__.get("_columns")
+        modification_count = _get_modification_count()
+        if cache is not None and cache[0] == modification_count and \
+                cache[1] is self.events:
+            return cache[2:]
+        columns, has_origin, has_quality = _build_columns(self.events)
+        self.__dict__["_columns"] = (modification_count, self.events,
+                                     columns, has_origin, has_quality)
+        return columns, has_origin, has_quality
+
+    def sort(self, keys=['time'], reverse=False):
+        """
+        Sort the events in the Catalog object.
+
+        The events will be sorted according to the keys list, by the first
+        item first, then by the second and so on. Events without a value for
+        a key are always sorted last.
+
+        :type keys: list, optional
+        :param keys: List containing the columns of
+            :meth:`~obspy.core.event.Catalog.get_columns` according to which
+            the events will be sorted. Defaults to ``['time']``.
+        :type reverse: bool
+        :param reverse: Reverts sorting order to descending.
+
+        .. rubric:: Example
+
+        >>> from obspy.core.event import read_events
+        >>> cat = read_events()
+        >>> cat.sort(keys=['magnitude'])  # doctest: +ELLIPSIS
+        <...Catalog object at 0x...>
+        >>> print(cat)
+        3 Event(s) in Catalog:
+        2012-04-04T14:08:46.000000Z | +38.017,  +37.736 | 3.0 ML | manual
+        2012-04-04T14:18:37.000000Z | +39.342,  +41.044 | 4.3 ML | manual
+        2012-04-04T14:21:42.300000Z | +41.818,  +79.689 | 4.4 mb | manual
+        """
+        msg = ("keys must be a list of strings. Available items to sort "
+               "after: \n%s" % ", ".join(
+                   "'%s'" % _i for _i in CATALOG_COLUMNS_DTYPE.names))
+        if not isinstance(keys, list):
+            raise TypeError(msg)
+        for key in keys:
+            if key not in CATALOG_COLUMNS_DTYPE.names:
+                msg = "%s is not a valid sort key" % key
+                raise ValueError(msg)
+        if not keys or len(self.events) < 2:
+            return self
+        columns, has_origin, has_quality = self._get_columns()
+        # np.lexsort sorts by the last key first and is stable.
+        sort_keys = []
+        for key in keys[::-1]:
+            column = columns[key]
+            if key == "time":
+                is_unset = column == NO_TIME
+                column = np.where(is_unset, 0, column)
+            else:
+                is_unset = np.isnan(column)
+            if reverse:
+                column = -column
+            sort_keys.append(column)
+            sort_keys.append(is_unset)
+        order = np.lexsort(sort_keys)
+        self.events = [self.events[_i] for _i in order]
+        columns = columns[order]
+        columns.flags.writeable = False
+        self.__dict__["_columns"] = (
+            _get_modification_count(), self.events, columns,
+            has_origin[order], has_quality[order])
+        return self
 
     def copy(self):
         """
@@ -762,7 +897,6 @@ class Catalog(object):
         return fig
 
 
-@rlock
 @map_example_filename("pathname_or_url")
 def read_events(pathname_or_url=None, format=None, **kwargs):
     """
@@ -841,10 +975,117 @@ def read_events(pathname_or_url=None, format=None, **kwargs):
         if len(pathnames) > 1:
             for filename in pathnames[1:]:
                 catalog.extend(_read(filename, format, **kwargs).events)
-        ResourceIdentifier.bind_resource_ids()
         return catalog
 
 
+@map_example_filename("pathname_or_url")
+def iread_events(pathname_or_url, format=None, **kwargs):
+    """
+    Iterate over the events of one or multiple event files.
+
+    Accepts the same input as :func:`~obspy.core.event.read_events` but
+    returns a generator yielding one :class:`~obspy.core.event.event.Event`
+    at a time. QuakeML documents are parsed incrementally and every processed
+    event is discarded from the parse tree, so that arbitrarily large
+    catalogs can be processed with a constant memory footprint. Resource
+    identifiers are resolved within each event. All other formats are read
+    completely before their events are handed out.
+
+    :type pathname_or_url: str or file-like object
+    :param pathname_or_url: String containing a file name or a URL or a open
+        file-like object. Wildcards are allowed for a file name.
+    :type format: str, optional
+    :param format: Format of the file to read (e.g. ``"QUAKEML"``).
+    :rtype: generator of :class:`~obspy.core.event.event.Event`
+
+    .. rubric:: Example
+
+    >>> from obspy.core.event import iread_events
+    >>> for event in iread_events("/path/to/neries_events.xml"):
+    ...     print(event.short_str())
+    2012-04-04T14:21:42.300000Z | +41.818,  +79.689 | 4.4 mb | manual
+    2012-04-04T14:18:37.000000Z | +39.342,  +41.044 | 4.3 ML | manual
+    2012-04-04T14:08:46.000000Z | +38.017,  +37.736 | 3.0 ML | manual
+    """
+    if not isinstance(pathname_or_url, (str, native_str)):
+        # file-like object
+        return _iread(pathname_or_url, format, **kwargs)
+    elif isinstance(pathname_or_url, bytes) and \
+            pathname_or_url.strip().startswith(b'<'):
+        # XML string
+        return _iread(io.BytesIO(pathname_or_url), format, **kwargs)
+    elif "://" in pathname_or_url[:10]:
+        # URL
+        return _iread_url(pathname_or_url, format, **kwargs)
+    pathname = pathname_or_url
+    # File name(s)
+    pathnames = sorted(glob.glob(pathname))
+    if not pathnames:
+        # try to give more specific information why the stream is empty
+        if glob.has_magic(pathname) and not glob.glob(pathname):
+            raise Exception("No file matching file pattern: %s" % pathname)
+        elif not glob.has_magic(pathname) and not os.path.isfile(pathname):
+            raise IOError(2, "No such file or directory", pathname)
+    return _iread_files(pathnames, format, **kwargs)
+
+
+def _iread_files(pathnames, format=None, **kwargs):
+    """
+    Iterates over the events of multiple event files.
+    """
+    for filename in pathnames:
+        for event in _iread(filename, format, **kwargs):
+            yield event
+
+
+def _iread_url(url, format=None, **kwargs):
+    """
+    Downloads an event file and iterates over its events.
+    """
+    # extract extension if any
+    suffix = os.path.basename(url).partition('.')[2] or '.tmp'
+    with NamedTemporaryFile(suffix=suffix) as fh:
+        download_to_file(url=url, filename_or_buffer=fh)
+        for event in _iread(fh.name, format, **kwargs):
+            yield event
+
+
+def _iread(filename, format=None, **kwargs):
+    """
+    Iterates over the events of a single event file.
+
+    QuakeML files are streamed, if the format is not given this is tried
+    first and all other files are read completely with
+    :func:`~obspy.core.event.read_events`.
+    """
+    if format is None or format.upper() == "QUAKEML":
+        # import here to avoid a circular import
+        from obspy.io.quakeml.core import _iread_quakeml
+        position = None
+        if hasattr(filename, "seek") and hasattr(filename, "tell"):
+            position = filename.tell()
+        events = _iread_quakeml(filename)
+        try:
+            first = next(events)
+        except StopIteration:
+            return
+        except Exception:
+            if format is not None:
+                raise
+            if position is not None:
+                filename.seek(position, 0)
+            events = None
+        if events is not None:
+            first._format = "QUAKEML"
+            yield first
+            for event in events:
+                event._format = "QUAKEML"
+                yield event
+            return
+    for event in read_events(filename, format, **kwargs).events:
+        yield event
+
+
 @uncompress_file
 def _read(filename, format=None, **kwargs):
     """
@@ -854,9 +1095,49 @@ def _read(filename, format=None, **kwargs):
                                         **kwargs)
     for event in catalog:
         event._format = format
+        event.scope_resource_ids()
     return catalog
 
 
+def _build_columns(events):
+    """
+    Builds the columns of :meth:`Catalog.get_columns` for a list of events.
+    """
+    nan = float("nan")
+    rows = []
+    has_origin = np.zeros(len(events), dtype=np.bool_)
+    has_quality = np.zeros(len(events), dtype=np.bool_)
+    for _i, event in enumerate(events):
+        magnitude = event.magnitudes[0].mag if event.magnitudes else None
+        magnitude = nan if magnitude is None else magnitude
+        if not event.origins:
+            rows.append((NO_TIME, nan, nan, nan, magnitude, nan, nan, nan,
+                         nan))
+            continue
+        origin = event.origins[0]
+        has_origin[_i] = True
+        time = NO_TIME if origin.time is None else origin.time._ns
+        row = [time, origin.latitude, origin.longitude, origin.depth,
+               magnitude]
+        quality = origin.quality
+        if quality is not None:
+            values = (quality.standard_error, quality.azimuthal_gap,
+                      quality.used_station_count, quality.used_phase_count)
+            # testing the truth value of the quality is expensive, it is
+            # true anyway if one of the values is set
+            if values.count(None) < 4 or quality:
+                has_quality[_i] = True
+                row.extend(values)
+            else:
+                row.extend((nan, nan, nan, nan))
+        else:
+            row.extend((nan, nan, nan, nan))
+        rows.append(tuple([nan if _j is None else _j for _j in row]))
+    columns = np.array(rows, dtype=CATALOG_COLUMNS_DTYPE)
+    columns.flags.writeable = False
+    return columns, has_origin, has_quality
+
+
 def _create_example_catalog():
     """
     Create an example catalog.
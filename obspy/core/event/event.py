@@ -20,15 +20,13 @@ This class hierarchy is closely modelled after the de-facto standard format
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
-import copy
 
 from obspy.core.event.header import (
     EventType, EventTypeCertainty, EventDescriptionType)
-from obspy.core.util.decorator import rlock
 from obspy.imaging.source import plot_radiation_pattern, _setup_figure_and_axes
 
 
-from .base import (_event_type_class_factory,
+from .base import (_event_type_class_factory, _yield_resource_id_parent_attr,
                    CreationInfo, ResourceIdentifier)
 
 
@@ -273,19 +271,50 @@ class Event(__Event):
 
         return fig
 
-    @rlock
+    def scope_resource_ids(self):
+        """
+        Bind all resource identifiers of the event to objects of the event.
+
+        Every :class:`~obspy.core.event.base.ResourceIdentifier` referring to
+        another object, e.g. the ``pick_id`` of an arrival or the
+        ``preferred_origin_id`` of the event, is bound to the object of this
+        event with the same id, if there is one. Afterwards
+        :meth:`~obspy.core.event.base.ResourceIdentifier.get_referred_object`
+        returns objects of this event even if other objects with the same
+        resource ids exist, e.g. after reading the same file twice or copying
+        the event. This is done automatically by
+        :func:`~obspy.core.event.read_events` and when copying events.
+
+        >>> from obspy.core.event import Arrival, Origin, Pick
+        >>> pick = Pick(resource_id="smi:local/pick/1")
+        >>> arrival = Arrival(pick_id="smi:local/pick/1")
+        >>> event = Event(picks=[pick], origins=[Origin(arrivals=[arrival])])
+        >>> # another pick with the same resource id, e.g. of a copied event
+        >>> other_pick = Pick(resource_id="smi:local/pick/1")
+        >>> event.scope_resource_ids()
+        >>> arrival.pick_id.get_referred_object() is pick
+        True
+        """
+        objects = {}
+        references = []
+        for rid, parent, attr in _yield_resource_id_parent_attr(self):
+            if attr == "resource_id":
+                objects[rid.id] = parent
+                rid._bind(parent)
+            else:
+                references.append(rid)
+        for rid in references:
+            obj = objects.get(rid.id)
+            if obj is not None:
+                rid._bind(obj)
+
     def __deepcopy__(self, memodict=None):
         """
         reset resource_id's object_id after deep copy to allow the
         object specific behavior of get_referred_object
         """
-        memodict = memodict or {}
-        cls = self.__class__
-        result = cls.__new__(cls)
-        memodict[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, memodict))
-        result.resource_id.bind_resource_ids()  # bind all resource_ids
+        result = super(Event, self).__deepcopy__(memodict)
+        result.scope_resource_ids()
         return result
 
     def write(self, filename, format, **kwargs):
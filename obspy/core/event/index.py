@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+obspy.core.event.index - Spatial and temporal index of a Catalog
+================================================================
+This module provides an index over the locations and origin times of the
+events of a :class:`~obspy.core.event.Catalog` answering radius, box and
+nearest neighbour queries without a full pass over the catalog.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import math
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from obspy.core.utcdatetime import UTCDateTime
+from obspy.geodetics.base import kilometers2degrees
+
+from .catalog import NO_TIME, Catalog
+
+
+# Radius of the spherical Earth in km, the same as used by
+# obspy.geodetics.kilometers2degrees().
+EARTH_RADIUS = 6371.0
+
+
+class CatalogIndex(object):
+    """
+    Spatial and temporal index of the events of a catalog.
+
+    Uses the first origin of each event (see
+    :meth:`Catalog.get_columns() <obspy.core.event.Catalog.get_columns>`).
+    Epicentral distances are great circle distances on a spherical Earth,
+    i.e. the same as given by
+    :func:`~obspy.geodetics.base.locations2degrees` and
+    :func:`~obspy.geodetics.base.degrees2kilometers`. If a depth is given
+    for a query, the straight line distances between the hypocenters are
+    used instead. All distances and depths are in kilometers. Events without
+    location, depth or time are never returned by queries restricting them.
+
+    All queries return a new :class:`~obspy.core.event.Catalog` with the
+    matching events or, with ``return_indices=True``, an array of the
+    indices of the matching events in the indexed catalog. The index is a
+    snapshot of the current values of the catalog, later changes of the
+    catalog are not reflected.
+
+    :type catalog: :class:`~obspy.core.event.Catalog`
+    :param catalog: The catalog to index.
+
+    .. rubric:: Example
+
+    >>> from obspy import UTCDateTime
+    >>> from obspy.core.event import read_events
+    >>> cat = read_events()
+    >>> index = CatalogIndex(cat)
+    >>> print(index.query_radius(39.0, 40.0, 300.0))  # doctest: +ELLIPSIS
+    2 Event(s) in Catalog:
+    2012-04-04T14:18:37.000000Z | +39.342,  +41.044 | 4.3 ML | manual
+    2012-04-04T14:08:46.000000Z | +38.017,  +37.736 | 3.0 ML | manual
+    >>> index.query_radius(39.0, 40.0, 300.0, return_indices=True)
+    array([1, 2])
+    >>> index.query_radius(39.0, 40.0, 300.0,
+    ...                    starttime=UTCDateTime(2012, 4, 4, 14, 10),
+    ...                    return_indices=True)
+    array([1])
+    >>> index.query_nearest(40.0, 80.0, k=2, return_indices=True)
+    array([0, 1])
+    >>> index.query_box(minlatitude=39.0, maxlongitude=50.0,
+    ...                 return_indices=True)
+    array([1])
+    """
+    def __init__(self, catalog):
+        self.events = list(catalog.events)
+        columns = catalog.get_columns()
+        self._times = columns["time"]
+        self._latitudes = columns["latitude"]
+        self._longitudes = columns["longitude"]
+        # depths are given in m in the event classes
+        self._depths = columns["depth"] / 1000.0
+        # sorted time axis of all events with a time
+        has_time = np.flatnonzero(self._times != NO_TIME)
+        order = np.argsort(self._times[has_time], kind="mergesort")
+        self._time_order = has_time[order]
+        self._sorted_times = self._times[self._time_order]
+        # unit vectors of all event locations
+        self._unit_vectors = _unit_vectors(self._latitudes, self._longitudes)
+        self._has_location = np.isfinite(self._unit_vectors[:, 0])
+        self._surface_ids = np.flatnonzero(self._has_location)
+        self._surface_tree = _build_tree(
+            self._unit_vectors[self._surface_ids])
+        # only built when needed
+        self._hypocenters = None
+        self._hypocenter_ids = None
+        self._hypocenter_tree = None
+
+    def __len__(self):
+        return len(self.events)
+
+    def query_radius(self, latitude, longitude, radius, depth=None,
+                     starttime=None, endtime=None, return_indices=False):
+        """
+        Returns all events within a distance of a location.
+
+        :type latitude: float
+        :param latitude: Latitude of the location in degrees.
+        :type longitude: float
+        :param longitude: Longitude of the location in degrees.
+        :type radius: float
+        :param radius: Maximum distance in km.
+        :type depth: float, optional
+        :param depth: Depth of the location in km. If given, the distances
+            between the hypocenters are used instead of the epicentral
+            distances.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param starttime: Only return events at or after this time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param endtime: Only return events at or before this time.
+        :type return_indices: bool, optional
+        :param return_indices: Return the sorted indices of the events
+            instead of a catalog.
+        """
+        point, ids, tree, points = self._get_query_point(
+            latitude, longitude, depth)
+        if depth is None:
+            # corresponding distance of points on the unit sphere
+            angle = min(math.radians(kilometers2degrees(radius)), math.pi)
+            radius = 2.0 * math.sin(angle / 2.0)
+        if tree is None:
+            indices = ids
+        elif starttime is None and endtime is None:
+            indices = ids[tree.query_ball_point(point, radius)]
+        else:
+            indices = self._time_candidates(starttime, endtime, ids)
+            distances = np.linalg.norm(points[indices] - point, axis=1)
+            indices = indices[distances <= radius]
+        return self._result(np.sort(indices), return_indices)
+
+    def query_nearest(self, latitude, longitude, k=1, depth=None,
+                      starttime=None, endtime=None, return_indices=False):
+        """
+        Returns the events closest to a location.
+
+        :type latitude: float
+        :param latitude: Latitude of the location in degrees.
+        :type longitude: float
+        :param longitude: Longitude of the location in degrees.
+        :type k: int, optional
+        :param k: Maximum number of events to return.
+        :type depth: float, optional
+        :param depth: Depth of the location in km. If given, the distances
+            between the hypocenters are used instead of the epicentral
+            distances.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param starttime: Only return events at or after this time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param endtime: Only return events at or before this time.
+        :type return_indices: bool, optional
+        :param return_indices: Return the indices of the events instead of a
+            catalog.
+
+        The events are ordered by increasing distance.
+        """
+        point, ids, tree, points = self._get_query_point(
+            latitude, longitude, depth)
+        if tree is None or k < 1:
+            indices = ids[:0]
+        elif starttime is None and endtime is None:
+            _, positions = tree.query(point, k=min(k, len(ids)))
+            indices = ids[np.atleast_1d(positions)]
+        else:
+            indices = np.sort(self._time_candidates(starttime, endtime, ids))
+            distances = np.linalg.norm(points[indices] - point, axis=1)
+            indices = indices[np.argsort(distances, kind="mergesort")[:k]]
+        return self._result(indices, return_indices)
+
+    def query_box(self, minlatitude=None, maxlatitude=None,
+                  minlongitude=None, maxlongitude=None, mindepth=None,
+                  maxdepth=None, starttime=None, endtime=None,
+                  return_indices=False):
+        """
+        Returns all events within a geographic box and time span.
+
+        If ``minlongitude`` is larger than ``maxlongitude`` the box crosses
+        the antimeridian.
+
+        :type minlatitude: float, optional
+        :param minlatitude: Minimum latitude in degrees.
+        :type maxlatitude: float, optional
+        :param maxlatitude: Maximum latitude in degrees.
+        :type minlongitude: float, optional
+        :param minlongitude: Minimum longitude in degrees.
+        :type maxlongitude: float, optional
+        :param maxlongitude: Maximum longitude in degrees.
+        :type mindepth: float, optional
+        :param mindepth: Minimum depth in km.
+        :type maxdepth: float, optional
+        :param maxdepth: Maximum depth in km.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param starttime: Only return events at or after this time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param endtime: Only return events at or before this time.
+        :type return_indices: bool, optional
+        :param return_indices: Return the sorted indices of the events
+            instead of a catalog.
+        """
+        if starttime is None and endtime is None:
+            indices = np.arange(len(self.events))
+        else:
+            indices = np.sort(self._time_candidates(starttime, endtime))
+        mask = np.ones(len(indices), dtype=np.bool_)
+        with np.errstate(invalid="ignore"):
+            if minlatitude is not None:
+                mask &= self._latitudes[indices] >= minlatitude
+            if maxlatitude is not None:
+                mask &= self._latitudes[indices] <= maxlatitude
+            longitudes = self._longitudes[indices]
+            if minlongitude is not None and maxlongitude is not None and \
+                    minlongitude > maxlongitude:
+                mask &= (longitudes >= minlongitude) | \
+                    (longitudes <= maxlongitude)
+            else:
+                if minlongitude is not None:
+                    mask &= longitudes >= minlongitude
+                if maxlongitude is not None:
+                    mask &= longitudes <= maxlongitude
+            if mindepth is not None:
+                mask &= self._depths[indices] >= mindepth
+            if maxdepth is not None:
+                mask &= self._depths[indices] <= maxdepth
+        return self._result(indices[mask], return_indices)
+
+    def _get_query_point(self, latitude, longitude, depth):
+        """
+        Returns the query point, the indices of the events in the tree, the
+        tree and the points of all events for epicentral (no depth given) or
+        hypocentral distances.
+        """
+        point = _unit_vectors(np.array([latitude], dtype=np.float64),
+                              np.array([longitude], dtype=np.float64))[0]
+        if depth is None:
+            return (point, self._surface_ids, self._surface_tree,
+                    self._unit_vectors)
+        if self._hypocenter_tree is None:
+            self._hypocenters = self._unit_vectors * \
+                (EARTH_RADIUS - self._depths)[:, np.newaxis]
+            self._hypocenter_ids = np.flatnonzero(
+                np.isfinite(self._hypocenters[:, 0]))
+            self._hypocenter_tree = _build_tree(
+                self._hypocenters[self._hypocenter_ids])
+        return (point * (EARTH_RADIUS - depth), self._hypocenter_ids,
+                self._hypocenter_tree, self._hypocenters)
+
+    def _time_candidates(self, starttime=None, endtime=None, ids=None):
+        """
+        Returns the indices of all events within the time span that are
+        also in ids (if given), in time order.
+        """
+        start, end = 0, len(self._sorted_times)
+        if starttime is not None:
+            start = np.searchsorted(self._sorted_times,
+                                    UTCDateTime(starttime)._ns, side="left")
+        if endtime is not None:
+            end = np.searchsorted(self._sorted_times,
+                                  UTCDateTime(endtime)._ns, side="right")
+        indices = self._time_order[start:end]
+        if ids is not None and len(ids) != len(self.events):
+            has_point = np.zeros(len(self.events), dtype=np.bool_)
+            has_point[ids] = True
+            indices = indices[has_point[indices]]
+        return indices
+
+    def _result(self, indices, return_indices):
+        if return_indices:
+            return indices
+        return Catalog(events=[self.events[_i] for _i in indices])
+
+
+def _build_tree(points):
+    """
+    Returns a k-d tree of the points or None if there are no points.
+    """
+    if not len(points):
+        return None
+    return cKDTree(points)
+
+
+def _unit_vectors(latitudes, longitudes):
+    """
+    Converts arrays of latitudes and longitudes in degrees to an array of
+    shape (len(latitudes), 3) of cartesian unit vectors.
+    """
+    lat = np.deg2rad(latitudes)
+    lon = np.deg2rad(longitudes)
+    vectors = np.empty((len(lat), 3), dtype=np.float64)
+    vectors[:, 0] = np.cos(lat) * np.cos(lon)
+    vectors[:, 1] = np.cos(lat) * np.sin(lon)
+    vectors[:, 2] = np.sin(lat)
+    return vectors
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
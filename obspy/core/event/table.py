@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+obspy.core.event.table - Column tables of event files
+=====================================================
+This module provides :func:`scan_events` returning the main parameters of
+all events in event files as columns of a NumPy structured array without
+creating any :class:`~obspy.core.event.event.Event` objects. The events
+themselves are only created when they are accessed.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+import glob
+import io
+import os
+
+import numpy as np
+from pkg_resources import load_entry_point
+
+from obspy.core.util import NamedTemporaryFile
+from obspy.core.util.base import _get_format_entry_point, download_to_file
+from obspy.core.util.decorator import map_example_filename, uncompress_file
+
+from .catalog import (CATALOG_COLUMNS_DTYPE, NO_TIME, Catalog, _build_columns,
+                      _read)
+
+
+class CatalogTable(object):
+    """
+    Table of the main parameters of a list of events with lazily created
+    :class:`~obspy.core.event.event.Event` objects.
+
+    The columns are the same as returned by
+    :meth:`Catalog.get_columns() <obspy.core.event.Catalog.get_columns>`.
+    Every row additionally keeps the raw record of its event in the file, the
+    event is only created (and then kept) when it is accessed by indexing or
+    iterating the table. Indexing with a slice, an array of indices or a
+    boolean mask returns a new table of the selected rows.
+
+    Tables are usually created by :func:`~obspy.core.event.scan_events`.
+
+    :type columns: :class:`numpy.ndarray`
+    :param columns: Structured array with the columns of all rows.
+    :type records: list
+    :param records: The raw records of all rows.
+    :type materialize: callable
+    :param materialize: Function creating an
+        :class:`~obspy.core.event.event.Event` from a single record.
+    :type events: list, optional
+    :param events: Already created events, ``None`` for all rows whose
+        events have not been created yet.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.event import scan_events
+    >>> table = scan_events("/path/to/zmap_events.txt")
+    >>> print(table)
+    2 Event(s) in CatalogTable
+    >>> columns = table.get_columns()
+    >>> print(columns["magnitude"].tolist())
+    [4.4, 5.1]
+    >>> print(table[columns["magnitude"] > 5].to_catalog())
+    1 Event(s) in Catalog:
+    2012-04-04T14:21:42.300000Z | +41.822,  +79.684 | 5.1 None
+    """
+    def __init__(self, columns, records, materialize, events=None):
+        if len(columns) != len(records):
+            msg = "The number of columns and records must be equal."
+            raise ValueError(msg)
+        if events is not None and len(events) != len(records):
+            msg = "The number of events and records must be equal."
+            raise ValueError(msg)
+        columns = np.require(columns, dtype=CATALOG_COLUMNS_DTYPE)
+        columns.flags.writeable = False
+        self._columns = columns
+        self._records = list(records)
+        # the function creating the event of each row and its format
+        self._sources = [(materialize, None)] * len(self._records)
+        if events is None:
+            events = [None] * len(self._records)
+        self._events = list(events)
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        """
+        Creates a table of the (already existing) events of a catalog.
+
+        :type catalog: :class:`~obspy.core.event.Catalog`
+        :param catalog: The catalog.
+        """
+        events = list(catalog.events)
+        table = cls(catalog.get_columns(), events, None, events=events)
+        table._sources = [(None, getattr(_e, "_format", None))
+                          for _e in events]
+        return table
+
+    def __len__(self):
+        return len(self._records)
+
+    def __str__(self):
+        return "%d Event(s) in CatalogTable" % len(self)
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+    def __add__(self, other):
+        """
+        Concatenates two tables.
+        """
+        if not isinstance(other, CatalogTable):
+            raise TypeError
+        table = CatalogTable.__new__(CatalogTable)
+        columns = np.concatenate([self._columns, other._columns])
+        columns.flags.writeable = False
+        table._columns = columns
+        table._records = self._records + other._records
+        table._sources = self._sources + other._sources
+        table._events = self._events + other._events
+        return table
+
+    def __iter__(self):
+        for _i in range(len(self)):
+            yield self._get_event(_i)
+
+    def __getitem__(self, index):
+        """
+        Returns the event of a single row or a new table with the selected
+        rows.
+        """
+        if isinstance(index, slice):
+            indices = np.arange(len(self))[index]
+        elif np.ndim(index) == 0:
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("CatalogTable index out of range")
+            return self._get_event(index)
+        else:
+            indices = np.asarray(index)
+            if indices.dtype == np.bool_:
+                if len(indices) != len(self):
+                    msg = "Boolean index must have the length of the table."
+                    raise IndexError(msg)
+                indices = np.flatnonzero(indices)
+            indices = indices.astype(np.intp, copy=False)
+        table = CatalogTable.__new__(CatalogTable)
+        columns = self._columns[indices]
+        columns.flags.writeable = False
+        table._columns = columns
+        table._records = [self._records[_i] for _i in indices]
+        table._sources = [self._sources[_i] for _i in indices]
+        table._events = [self._events[_i] for _i in indices]
+        return table
+
+    def get_columns(self):
+        """
+        Returns the columns of the table.
+
+        :rtype: :class:`numpy.ndarray`
+        :return: Read-only structured array with one row per event, see
+            :meth:`Catalog.get_columns()
+            <obspy.core.event.Catalog.get_columns>`.
+        """
+        return self._columns
+
+    def to_catalog(self):
+        """
+        Returns a :class:`~obspy.core.event.Catalog` with the events of all
+        rows.
+        """
+        return Catalog(events=list(self))
+
+    def _get_event(self, index):
+        event = self._events[index]
+        if event is None:
+            materialize, format = self._sources[index]
+            event = materialize(self._records[index])
+            if format is not None:
+                event._format = format
+            event.scope_resource_ids()
+            self._events[index] = event
+        return event
+
+    def _set_format(self, format):
+        """
+        Sets the format of all rows without a format.
+        """
+        self._sources = [
+            _s if _s[1] is not None else (_s[0], format)
+            for _s in self._sources]
+        for event in self._events:
+            if event is not None and getattr(event, "_format", None) is None:
+                event._format = format
+
+
+@map_example_filename("pathname_or_url")
+def scan_events(pathname_or_url, format=None, **kwargs):
+    """
+    Scans event files and returns a table of all contained events.
+
+    Formats providing a native scanner (NDK, CMTSOLUTION, ZMAP and MCHEDR)
+    parse the fixed width fields of all events at once and do not create any
+    :class:`~obspy.core.event.event.Event` objects until they are accessed.
+    All other formats are read completely with
+    :func:`~obspy.core.event.read_events`.
+
+    :type pathname_or_url: str or file-like object
+    :param pathname_or_url: String containing a file name or a URL or a open
+        file-like object. Wildcards are allowed for a file name.
+    :type format: str, optional
+    :param format: Format of the files. Will be automatically detected if
+        not given.
+    :param kwargs: Additional keyword arguments passed to the underlying
+        scanner or reader.
+    :rtype: :class:`~obspy.core.event.CatalogTable`
+
+    .. rubric:: Example
+
+    >>> from obspy.core.event import scan_events
+    >>> table = scan_events("/path/to/neries_events.xml")
+    >>> print(table.get_columns()["depth"].tolist())
+    [1000.0, 14400.0, 7000.0]
+    >>> print(table[0].short_str())
+    2012-04-04T14:21:42.300000Z | +41.818,  +79.689 | 4.4 mb | manual
+    """
+    if not isinstance(pathname_or_url, (str, native_str)):
+        # file-like object
+        try:
+            return _scan_events(pathname_or_url, format, **kwargs)
+        except TypeError:
+            # if this fails, create a temporary file which is scanned
+            # directly from the file system
+            pathname_or_url.seek(0)
+            with NamedTemporaryFile() as fh:
+                fh.write(pathname_or_url.read())
+                return _scan_events(fh.name, format, **kwargs)
+    elif isinstance(pathname_or_url, bytes) and \
+            pathname_or_url.strip().startswith(b'<'):
+        # XML string
+        return _scan_events(io.BytesIO(pathname_or_url), format, **kwargs)
+    elif "://" in pathname_or_url[:10]:
+        # URL
+        suffix = os.path.basename(pathname_or_url).partition('.')[2] or '.tmp'
+        with NamedTemporaryFile(suffix=suffix) as fh:
+            download_to_file(url=pathname_or_url, filename_or_buffer=fh)
+            return _scan_events(fh.name, format, **kwargs)
+    pathname = pathname_or_url
+    pathnames = sorted(glob.glob(pathname))
+    if not pathnames:
+        if glob.has_magic(pathname):
+            raise Exception("No file matching file pattern: %s" % pathname)
+        raise IOError(2, "No such file or directory", pathname)
+    table = _scan_events(pathnames[0], format, **kwargs)
+    for filename in pathnames[1:]:
+        table += _scan_events(filename, format, **kwargs)
+    return table
+
+
+@uncompress_file
+def _scan_events(filename, format=None, **kwargs):
+    """
+    Scans a single event file using a plug-in's scanFormat function.
+
+    Plug-ins without a scanFormat function are read completely.
+    """
+    format_ep = _get_format_entry_point('event', filename, format=format)
+    try:
+        scan_format = load_entry_point(
+            format_ep.dist.key, 'obspy.plugin.event.%s' % format_ep.name,
+            'scanFormat')
+    except ImportError:
+        scan_format = None
+    if scan_format is None:
+        return CatalogTable.from_catalog(
+            _read(filename, format=format_ep.name, **kwargs))
+    table = scan_format(filename, **kwargs)
+    table._set_format(format_ep.name)
+    return table
+
+
+def _char_matrix(lines, width):
+    """
+    Returns the first ``width`` characters of a list of lines (either all
+    text or all bytes) as a 2D array of 8 bit character codes.
+
+    Short lines are padded with blanks, tabs and line breaks are replaced by
+    blanks and all non ASCII characters by ``?``.
+    """
+    if not lines:
+        return np.empty((0, width), dtype=np.uint8)
+    if isinstance(lines[0], bytes):
+        codes = np.array(lines, dtype=native_str("S%d" % width))
+        codes = codes.view(np.uint8).reshape(len(lines), width)
+    else:
+        codes = np.array(lines, dtype=native_str("U%d" % width))
+        codes = codes.view(np.uint32).reshape(len(lines), width)
+    chars = np.minimum(codes, 127).astype(np.uint8)
+    chars[codes > 127] = ord("?")
+    chars[(chars == 0) | (chars == 9) | (chars == 10) | (chars == 13)] = \
+        ord(" ")
+    return chars
+
+
+# characters allowed in the numeric fields parsed by _parse_floats()
+_NUMBER_CHARS = np.zeros(256, dtype=np.bool_)
+_NUMBER_CHARS[[ord(_c) for _c in " 0123456789.+-eE"]] = True
+_DIGITS = np.zeros(256, dtype=np.bool_)
+_DIGITS[[ord(_c) for _c in "0123456789"]] = True
+
+
+def _is_plain_number(field):
+    """
+    Marks all rows of a character matrix whose tokens are plain decimal
+    numbers with an optional exponent.
+
+    NumPy's parser ignores everything after the valid part of a number
+    (e.g. in ``"0.08."`` or ``"9E"``), such rows have to be parsed with
+    :func:`float`. The signs are checked by the caller.
+    """
+    ok = _NUMBER_CHARS[field].all(axis=1)
+    # the blanks around each row keep the neighbours of all characters
+    # and the tokens within their row
+    width = field.shape[1] + 3
+    padded = np.full((len(field), width), ord(" "), dtype=np.uint8)
+    padded[:, 1:-2] = field
+    padded = padded.ravel()
+    points = np.flatnonzero(padded == ord("."))
+    exponents = np.flatnonzero((padded == ord("e")) | (padded == ord("E")))
+    if not len(points) and not len(exponents):
+        return ok
+    token = np.cumsum(padded == ord(" "))
+    bad = []
+    # at most one point and exponent per token, no point in the exponent
+    for positions in (points, exponents):
+        repeated = token[positions[1:]] == token[positions[:-1]]
+        bad.append(positions[1:][repeated])
+    if len(exponents):
+        last = np.searchsorted(exponents, points) - 1
+        bad.append(points[(last >= 0) &
+                          (token[exponents[last]] == token[points])])
+    # exponents follow a digit or point and are followed by digits
+    before = padded[exponents - 1]
+    after = padded[exponents + 1]
+    signed = (after == ord("+")) | (after == ord("-"))
+    bad.append(exponents[~(_DIGITS[before] | (before == ord("."))) |
+                         ~(_DIGITS[after] |
+                           signed & _DIGITS[padded[exponents + 2]])])
+    ok[np.concatenate(bad) // width] = False
+    return ok
+
+
+def _parse_floats(chars, start, stop, count=1, leading=False):
+    """
+    Parses ``count`` whitespace separated numbers in the columns
+    ``start:stop`` of all rows of a character matrix.
+
+    If ``leading`` is ``True`` only the first ``count`` numbers are parsed
+    and everything after them is ignored. Returns a float array of shape
+    ``(len(chars), count)`` (or ``(len(chars),)`` if ``count`` is 1) and a
+    boolean array marking all rows that could be parsed. All values of the
+    other rows are NaN.
+    """
+    n = len(chars)
+    field = np.empty((n, stop - start + 1), dtype=np.uint8)
+    field[:, :-1] = chars[:, start:stop]
+    field[:, -1] = ord(" ")
+    blank = field == ord(" ")
+    if leading:
+        starts = ~blank
+        starts[:, 1:] &= blank[:, :-1]
+        field[np.cumsum(starts, axis=1) > count] = ord(" ")
+        blank = field == ord(" ")
+    # every token is followed by at least one blank
+    ok = (~blank[:, :-1] & blank[:, 1:]).sum(axis=1) == count
+    # signs are only allowed at the start of a number or an exponent
+    sign = (field[:, 1:] == ord("-")) | (field[:, 1:] == ord("+"))
+    previous = field[:, :-1]
+    ok &= ~(sign & ~blank[:, :-1] & (previous != ord("e")) &
+            (previous != ord("E"))).any(axis=1)
+    simple = ok & _is_plain_number(field)
+    values = np.full((n, count), np.nan)
+    parsed = np.empty(0)
+    if simple.any():
+        parsed = np.fromstring(field[simple].tobytes(), sep=" ")
+    if len(parsed) == simple.sum() * count:
+        values[simple] = parsed.reshape(-1, count)
+        slow = np.flatnonzero(ok & ~simple)
+    else:
+        slow = np.flatnonzero(ok)
+    # parse everything else (e.g. NaN) row by row
+    for _i in slow:
+        try:
+            values[_i] = [float(_j) for _j in field[_i].tobytes().split()]
+        except ValueError:
+            ok[_i] = False
+    if count == 1:
+        values = values[:, 0]
+    return values, ok
+
+
+def _fields_to_ns(year, month, day, hour, minute, second):
+    """
+    Converts arrays of date and time fields to integer nanoseconds.
+
+    Seconds are rounded to microseconds the same way as
+    :class:`~obspy.core.utcdatetime.UTCDateTime` does it. Returns the times
+    and a boolean array marking all valid times, invalid times are
+    ``NO_TIME``.
+    """
+    fields = [np.asarray(_i, dtype=np.float64)
+              for _i in (year, month, day, hour, minute, second)]
+    with np.errstate(invalid="ignore"):
+        ok = np.ones(len(fields[0]), dtype=np.bool_)
+        for field in fields:
+            ok &= np.isfinite(field)
+        for field in fields[:-1]:
+            ok &= field == np.floor(field)
+        year, month, day, hour, minute, second = fields
+        ok &= (year >= 1) & (year <= 9999) & (month >= 1) & (month <= 12) & \
+            (day >= 1) & (hour >= 0) & (hour < 24) & (minute >= 0) & \
+            (minute < 60) & (second >= 0) & (second < 60)
+    year, month, day, hour, minute = [
+        np.where(ok, _i, 1).astype(np.int64)
+        for _i in (year, month, day, hour, minute)]
+    months = (year - 1970) * 12 + month - 1
+    first_day = months.astype("datetime64[M]").astype("datetime64[D]")
+    next_first_day = (months + 1).astype("datetime64[M]").astype(
+        "datetime64[D]")
+    ok &= day <= (next_first_day - first_day).astype(np.int64)
+    days = first_day.astype(np.int64) + day - 1
+    # same rounding as UTCDateTime(year, month, day, hour, minute, second),
+    # i.e. math.modf(round(second, 6))
+    second = np.where(ok, second, 0.0)
+    rounded = np.round(second, 6)
+    # np.round() scales by 10 ** 6 and may differ from round() if the
+    # scaled value is (almost) halfway between two integers
+    scaled = second * 1e6
+    for _i in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) <
+                             1e-6).tolist():
+        rounded[_i] = round(float(second[_i]), 6)
+    fraction, whole = np.modf(rounded)
+    fraction = np.round(fraction * 1e6).astype(np.int64)
+    # seconds might be rounded up to 60
+    ok &= (whole < 60) & (fraction < 10 ** 6)
+    ns = ((days * 24 + hour) * 60 + minute) * 60 * 10 ** 9 + \
+        (whole.astype(np.int64) * 10 ** 6 + fraction) * 1000
+    ns[~ok] = NO_TIME
+    return ns, ok
+
+
+def _materialize_rows(columns, records, materialize, indices, errors=()):
+    """
+    Creates the events of the given rows and updates their columns from the
+    created events.
+
+    Used by the scanners for all rows that can not be parsed in bulk.
+    Exceptions of the types in ``errors`` are caught. Returns the list of
+    events (``None`` for all other rows) and a list of ``(index, exception)``
+    tuples of all rows that failed.
+    """
+    events = [None] * len(records)
+    failed = []
+    created = []
+    for _i in indices:
+        try:
+            event = materialize(records[_i])
+        except errors as e:
+            failed.append((_i, e))
+            continue
+        event.scope_resource_ids()
+        events[_i] = event
+        created.append(_i)
+    if created:
+        columns[created] = _build_columns([events[_i] for _i in created])[0]
+    return events, failed
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -29,8 +29,10 @@ from obspy.core import compatibility
 from obspy.core.trace import Trace
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import NamedTemporaryFile
-from obspy.core.util.base import (ENTRY_POINTS, _get_function_from_entry_point,
-                                  _read_from_plugin, download_to_file)
+from obspy.core.util.base import (ENTRY_POINTS, SEGMENT_TABLE_DTYPE,
+                                  _get_function_from_entry_point,
+                                  _read_from_plugin, _scan_from_plugin,
+                                  download_to_file)
 from obspy.core.util.decorator import (map_example_filename,
                                        raise_if_masked, uncompress_file)
 from obspy.core.util.misc import get_window_times
@@ -277,6 +279,77 @@ def _read(filename, format=None, headonly=False, **kwargs):
     return stream
 
 
+@map_example_filename("pathname")
+def scan(pathname, format=None, **kwargs):
+    """
+    Scans waveform files and returns a table of all contained segments.
+
+    Only the headers are read, no :class:`~obspy.core.trace.Trace` objects
+    are created. Formats providing a native scanner (e.g. MiniSEED, SAC,
+    SEG-Y and GSE2) directly parse their headers, all other formats are read
+    with ``headonly=True``.
+
+    :type pathname: str or io.BytesIO
+    :param pathname: String containing a file name or an open file-like
+        object. Wildcards are allowed for a file name.
+    :type format: str, optional
+    :param format: Format of the files. Will be automatically detected if
+        not given.
+    :param kwargs: Additional keyword arguments passed to the underlying
+        scanner or reader.
+    :rtype: :class:`numpy.ndarray`
+    :return: Structured array with one row per segment and the columns
+        ``network``, ``station``, ``location``, ``channel``, ``starttime``,
+        ``endtime``, ``sampling_rate`` and ``npts``. Times are integer
+        nanoseconds since 1970-01-01 (see
+        :attr:`UTCDateTime.ns <obspy.core.utcdatetime.UTCDateTime.ns>`).
+
+    .. rubric:: Example
+
+    >>> from obspy.core.stream import scan
+    >>> table = scan("/path/to/test.sac")
+    >>> print(table["station"], table["npts"])
+    ['STA'] [100]
+    >>> print(UTCDateTime(ns=int(table["starttime"][0])))
+    1978-07-18T08:00:10.000000Z
+    """
+    tables = []
+    if not isinstance(pathname, (str, native_str)):
+        # not a string - we assume a file-like object
+        pathname.seek(0)
+        try:
+            # first try scanning directly
+            tables.extend(_scan(pathname, format, **kwargs))
+        except TypeError:
+            # if this fails, create a temporary file which is scanned
+            # directly from the file system
+            pathname.seek(0)
+            with NamedTemporaryFile() as fh:
+                fh.write(pathname.read())
+                tables.extend(_scan(fh.name, format, **kwargs))
+        pathname.seek(0)
+    else:
+        for file in sorted(glob(pathname)):
+            tables.extend(_scan(file, format, **kwargs))
+        if not tables:
+            if has_magic(pathname):
+                raise Exception("No file matching file pattern: %s" % pathname)
+            raise IOError(2, "No such file or directory", pathname)
+    if not tables:
+        return np.empty(0, dtype=SEGMENT_TABLE_DTYPE)
+    return np.concatenate(tables)
+
+
+@uncompress_file
+def _scan(filename, format=None, **kwargs):
+    """
+    Scans a single file. Returns a list with the segment table so that the
+    results of multiple files in an archive are concatenated.
+    """
+    table, _ = _scan_from_plugin(filename, format=format, **kwargs)
+    return [table]
+
+
 def _create_example_stream(headonly=False):
     """
     Create an example stream.
@@ -4,7 +4,9 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 
 import copy
+import io
 import os
+import pickle
 import sys
 import unittest
 import warnings
@@ -16,11 +18,17 @@ import numpy as np
 
 from obspy.core.event import (Catalog, Comment, CreationInfo, Event, Origin,
                               Pick, ResourceIdentifier, WaveformStreamID,
-                              read_events, Magnitude, FocalMechanism, Arrival)
+                              read_events, iread_events, Magnitude,
+                              FocalMechanism, Arrival, OriginQuality)
+from obspy.core.event.catalog import NO_TIME
+from obspy.core.event.index import CatalogIndex
+from obspy.core.event.table import CatalogTable, _fields_to_ns, scan_events
 from obspy.core.event.source import farfield
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import BASEMAP_VERSION, CARTOPY_VERSION
+from obspy.core.util.deprecation_helpers import ObsPyDeprecationWarning
 from obspy.core.util.testing import ImageComparison
+from obspy.geodetics import degrees2kilometers, locations2degrees
 from obspy.core.event.base import QuantityError
 
 
@@ -42,8 +50,6 @@ class EventTestCase(unittest.TestCase):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
 
     def test_str(self):
         """
@@ -187,8 +193,6 @@ class OriginTestCase(unittest.TestCase):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
 
     def test_creation_info(self):
         # 1 - empty Origin class will set creation_info to None
@@ -251,8 +255,6 @@ class CatalogTestCase(unittest.TestCase):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
 
     def test_creation_info(self):
         cat = Catalog()
@@ -302,6 +304,40 @@ class CatalogTestCase(unittest.TestCase):
         got = read_events(os.path.join(self.path, "*_events.xml"))
         self.assertEqual(expected, got)
 
+    def test_iread_events(self):
+        """
+        Tests the iread_events() function.
+        """
+        expected = read_events(os.path.join(self.path, "*_events.xml"))
+        # with wildcard
+        got = iread_events(os.path.join(self.path, "*_events.xml"))
+        self.assertFalse(isinstance(got, (list, Catalog)))
+        got = list(got)
+        self.assertEqual(expected.events, got)
+        for event in got:
+            self.assertEqual(event._format, 'QUAKEML')
+        # file-like object and byte string
+        with open(self.neries_xml, 'rb') as fh:
+            data = fh.read()
+            fh.seek(0, 0)
+            self.assertEqual(list(iread_events(fh)),
+                             read_events(self.neries_xml).events)
+        self.assertEqual(list(iread_events(data)),
+                         read_events(self.neries_xml).events)
+        # other formats are read with read_events()
+        got = list(iread_events(os.path.join(self.path,
+                                             'events_longitude_wrap.zmap')))
+        expected = read_events(os.path.join(self.path,
+                                            'events_longitude_wrap.zmap'))
+        self.assertEqual(len(expected), len(got))
+        for event, expected_event in zip(got, expected):
+            self.assertEqual(event._format, 'ZMAP')
+            self.assertEqual(event.origins[0].time,
+                             expected_event.origins[0].time)
+        # missing files are reported right away
+        self.assertRaises(IOError, iread_events,
+                          os.path.join(self.path, "does_not_exist.xml"))
+
     def test_append(self):
         """
         Tests the append method of the Catalog object.
@@ -481,6 +517,115 @@ class CatalogTestCase(unittest.TestCase):
             self.assertTrue(all(event in cat_smaller
                                 for event in cat_bigger_inverse))
 
+    def test_get_columns(self):
+        """
+        Tests the columns of the Catalog object and their invalidation.
+        """
+        cat = read_events()
+        columns = cat.get_columns()
+        self.assertEqual(len(columns), 3)
+        for event, row in zip(cat, columns):
+            origin = event.origins[0]
+            self.assertEqual(row["time"], origin.time._ns)
+            self.assertEqual(row["latitude"], origin.latitude)
+            self.assertEqual(row["longitude"], origin.longitude)
+            self.assertEqual(row["magnitude"], event.magnitudes[0].mag)
+        self.assertFalse(columns.flags.writeable)
+        # cached
+        self.assertIs(cat.get_columns(), columns)
+        # changes of the events list are detected
+        cat.append(Event())
+        columns = cat.get_columns()
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(columns["time"][3], NO_TIME)
+        self.assertTrue(np.isnan(columns["latitude"][3]))
+        del cat.events[0]
+        columns = cat.get_columns()
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns["magnitude"][0], 4.3)
+        # as are replaced, inserted and removed origins and magnitudes
+        columns = cat.get_columns()
+        cat[0].magnitudes[0] = Magnitude(mag=9.0)
+        self.assertEqual(cat.get_columns()["magnitude"][0], 9.0)
+        cat[0].origins.insert(0, Origin(latitude=12.5))
+        self.assertEqual(cat.get_columns()["latitude"][0], 12.5)
+        cat[0].origins[0].quality = OriginQuality(azimuthal_gap=10.0)
+        self.assertEqual(cat.get_columns()["azimuthal_gap"][0], 10.0)
+        del cat[0].origins[0]
+        self.assertEqual(cat.get_columns()["latitude"][0], 39.342)
+        # as are attributes changed in place
+        cat[0].origins[0].depth = 1000.0
+        self.assertEqual(cat.get_columns()["depth"][0], 1000.0)
+        cat[0].origins[0].latitude = 12.5
+        self.assertEqual(len(cat.filter("latitude < 13")), 1)
+        cat[0].magnitudes[0].mag = 1.5
+        self.assertEqual(len(cat.filter("magnitude < 2")), 1)
+        cat[0].origins[0].quality.azimuthal_gap = 20.0
+        self.assertEqual(cat.get_columns()["azimuthal_gap"][0], 20.0)
+        del cat[0].origins[0].quality
+        self.assertTrue(np.isnan(cat.get_columns()["azimuthal_gap"][0]))
+        # and lists of events or containers that are replaced
+        cat[0].magnitudes = [Magnitude(mag=2.5)]
+        self.assertEqual(cat.get_columns()["magnitude"][0], 2.5)
+        cat[0].magnitudes.append(Magnitude(mag=3.5))
+        cat[0].magnitudes.reverse()
+        self.assertEqual(cat.get_columns()["magnitude"][0], 3.5)
+        cat.events = cat.events[:1]
+        self.assertEqual(len(cat.get_columns()), 1)
+        # but not the creation of new objects
+        columns = cat.get_columns()
+        Origin(latitude=1.0)
+        Event(origins=[Origin(latitude=1.0)])
+        self.assertIs(cat.get_columns(), columns)
+        # filter uses the cache
+        cat.filter("magnitude > 1")
+        self.assertIs(cat.get_columns(), columns)
+        # copies and pickled catalogs track their own changes
+        cat2 = pickle.loads(pickle.dumps(cat))
+        self.assertEqual(cat2.get_columns()["magnitude"][0], 3.5)
+        cat2[0].magnitudes[0].mag = 5.5
+        self.assertEqual(cat2.get_columns()["magnitude"][0], 5.5)
+        cat2[0].magnitudes.pop(0)
+        self.assertEqual(cat2.get_columns()["magnitude"][0], 2.5)
+        cat3 = cat.copy()
+        cat3[0].origins[0].depth = 5.0
+        self.assertEqual(cat3.get_columns()["depth"][0], 5.0)
+        self.assertEqual(cat.get_columns()["depth"][0], 1000.0)
+        # empty catalog
+        self.assertEqual(len(Catalog().get_columns()), 0)
+        self.assertEqual(len(Catalog().filter("magnitude > 1")), 0)
+
+    def test_sort(self):
+        """
+        Testing the sort method of the Catalog object.
+        """
+        cat = read_events()
+        cat.append(Event())
+        events = list(cat)
+        self.assertIs(cat.sort(), cat)
+        self.assertEqual([events[_i] for _i in (2, 1, 0, 3)], cat.events)
+        cat.sort(keys=["magnitude"], reverse=True)
+        self.assertEqual([events[_i] for _i in (0, 1, 2, 3)], cat.events)
+        # ties keep their order, also when reversed
+        cat.sort(keys=["standard_error"])
+        self.assertEqual([events[_i] for _i in (0, 1, 2, 3)], cat.events)
+        cat.sort(keys=["standard_error"], reverse=True)
+        self.assertEqual([events[_i] for _i in (0, 1, 2, 3)], cat.events)
+        cat.sort(keys=["standard_error", "time"])
+        self.assertEqual([events[_i] for _i in (2, 1, 0, 3)], cat.events)
+        # the cached columns are sorted along
+        columns = cat.get_columns()
+        self.assertEqual(columns["magnitude"][:3].tolist(), [3.0, 4.3, 4.4])
+        self.assertIs(cat.get_columns(), columns)
+        # attributes changed in place invalidate the cache
+        cat[0].magnitudes[0].mag = 5.0
+        cat.sort(keys=["magnitude"])
+        self.assertEqual(cat.get_columns()["magnitude"][:3].tolist(),
+                         [4.3, 4.4, 5.0])
+        self.assertEqual([events[_i] for _i in (1, 0, 2, 3)], cat.events)
+        self.assertRaises(TypeError, cat.sort, keys="time")
+        self.assertRaises(ValueError, cat.sort, keys=["station"])
+
     def test_catalog_resource_id(self):
         """
         See #662
@@ -530,8 +675,6 @@ class CatalogBasemapTestCase(unittest.TestCase):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
 
     def test_catalog_plot_global(self):
         """
@@ -602,8 +745,6 @@ class CatalogCartopyTestCase(unittest.TestCase):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
 
     def test_catalog_plot_global(self):
         """
@@ -710,8 +851,6 @@ class ResourceIdentifierTestCase(unittest.TestCase):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
 
     def test_same_resource_id_different_referred_object(self):
         """
@@ -898,49 +1037,14 @@ class ResourceIdentifierTestCase(unittest.TestCase):
         rid = ResourceIdentifier()
         self.assertEqual(rid.id, rid.get_quakeml_uri())
 
-    def test_resource_id_tracking(self):
+    def test_automatic_dereferring_if_object_goes_out_of_scope(self):
         """
-        The class keeps track of all instances.
-        """
-        # Create a couple of lightweight objects for testing purposes.
-        t1 = UTCDateTime(2013, 1, 1)
-        t2 = UTCDateTime(2013, 1, 2)
-        t3 = UTCDateTime(2013, 1, 3)
-
-        # First assert, that all ResourceIds are tracked correctly.
-        r1 = ResourceIdentifier("a", referred_object=t1)
-        r2 = ResourceIdentifier("b", referred_object=t2)
-        r3 = ResourceIdentifier("c", referred_object=t3)
-
-        self.assertEqual(
-            ResourceIdentifier._ResourceIdentifier__resource_id_tracker,
-            {"a": 1, "b": 1, "c": 1})
-
-        # Create a new instance, similar to the first one.
-        r4 = ResourceIdentifier("a", referred_object=t1)
-        self.assertEqual(
-            ResourceIdentifier._ResourceIdentifier__resource_id_tracker,
-            {"a": 2, "b": 1, "c": 1})
-
-        # Now delete r2 and r4. They should not be tracked anymore.
-        del r2
-        del r4
-        self.assertEqual(
-            ResourceIdentifier._ResourceIdentifier__resource_id_tracker,
-            {"a": 1, "c": 1})
-
-        # Delete the two others. Nothing should be tracked any more.
-        del r1
-        del r3
-        self.assertEqual(
-            ResourceIdentifier._ResourceIdentifier__resource_id_tracker, {})
-
-    def test_automatic_dereferring_if_resource_id_goes_out_of_scope(self):
-        """
-        Tests that objects that have no more referrer are no longer stored in
-        the reference dictionary.
+        Tests that objects that got garbage collected are no longer stored in
+        the reference dictionary, independent of the ResourceIdentifier
+        instances referring to them.
         """
         t1 = UTCDateTime(2010, 1, 1)  # test object
+        t2 = UTCDateTime(2010, 1, 1)  # test object
         r_dict = ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict
         rid = 'a'  # test resource id
 
@@ -948,20 +1052,65 @@ class ResourceIdentifierTestCase(unittest.TestCase):
         r1 = ResourceIdentifier(rid, referred_object=t1)
         self.assertEqual(r1.get_referred_object(), t1)
         self.assertTrue(rid in r_dict)
-        # Deleting the object should remove the reference.
+        # Deleting the resource identifier does not change anything.
         del r1
-        self.assertFalse(rid in r_dict)
-        # Now create two equal references.
-        r1 = ResourceIdentifier(rid, referred_object=t1)
-        r2 = ResourceIdentifier(rid, referred_object=t1)
-        self.assertEqual(r1.get_referred_object(), t1)
-        # Deleting one should not remove the reference.
-        del r1
-        self.assertEqual(r2.get_referred_object(), t1)
         self.assertTrue(rid in r_dict)
-        # Deleting the second one should
-        del r2
+        self.assertIs(ResourceIdentifier(rid).get_referred_object(), t1)
+        # Bind a second object, deleting one of them keeps the other one.
+        r2 = ResourceIdentifier(rid, referred_object=t2)
+        del t1
+        self.assertTrue(rid in r_dict)
+        self.assertIs(ResourceIdentifier(rid).get_referred_object(), t2)
+        # Deleting the second object removes the entry.
+        del t2
         self.assertFalse(rid in r_dict)
+        self.assertIs(r2.get_referred_object(), None)
+
+    def test_many_objects_with_same_resource_id(self):
+        """
+        Objects sharing a resource id are registered once each, keyed by
+        their identity, and are removed individually.
+        """
+        r_dict = ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict
+        rid = 'smi:local/shared'
+        picks = [Pick(resource_id=ResourceIdentifier(rid))
+                 for _ in range(100)]
+        self.assertEqual(len(r_dict[rid]), 100)
+        # Binding an object again does not register it twice.
+        ResourceIdentifier(rid, referred_object=picks[10])
+        self.assertEqual(len(r_dict[rid]), 100)
+        self.assertIs(ResourceIdentifier(rid).get_referred_object(),
+                      picks[-1])
+        del picks[-1]
+        self.assertEqual(len(r_dict[rid]), 99)
+        self.assertIs(ResourceIdentifier(rid).get_referred_object(),
+                      picks[-1])
+        del picks[:]
+        self.assertFalse(rid in r_dict)
+
+    def test_bind_resource_ids_deprecated(self):
+        """
+        The global binding of resource identifiers has been replaced by
+        Event.scope_resource_ids().
+        """
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            ResourceIdentifier.bind_resource_ids()
+        self.assertEqual(len(w), 1)
+        self.assertEqual(w[0].category, ObsPyDeprecationWarning)
+
+    def test_copy_and_pickle_unbind(self):
+        """
+        Copied and unpickled resource identifiers are not bound to an object
+        but still refer to the most recently bound object with their id.
+        """
+        obj = UTCDateTime()
+        rid = ResourceIdentifier("a", referred_object=obj)
+        for other in (rid.copy(), pickle.loads(pickle.dumps(rid))):
+            self.assertEqual(other, rid)
+            self.assertIs(other._object_id, None)
+            self.assertIs(other.get_referred_object(), obj)
+            self.assertEqual(other._object_id, id(obj))
 
     def test_initialize_with_resource_identifier(self):
         """
@@ -1017,15 +1166,13 @@ class ResourceIDEventScopeTestCase(unittest.TestCase):
         events[0].preferred_origin_id = str(origin_rid.id)
         catalog = Catalog(events=events, resource_id=catatlog_rid)
         # next bind all unbound resource_ids to the current event scope
-        catalog.resource_id.bind_resource_ids()
+        events[0].scope_resource_ids()
         return catalog
 
     def setUp(self):
         # Clear the Resource Identifier dict for the tests. NEVER do this
         # otherwise.
         ResourceIdentifier._ResourceIdentifier__resource_id_weak_dict.clear()
-        # Also clear the tracker.
-        ResourceIdentifier._ResourceIdentifier__resource_id_tracker.clear()
         # set the test catalog as an attr for test access
         self.catalog = self.make_test_catalog()
         # save the catalog to a temp file for testing reading in the catalog
@@ -1065,6 +1212,308 @@ class ResourceIDEventScopeTestCase(unittest.TestCase):
         os.remove(self.catalog_path)
 
 
+class CatalogIndexTestCase(unittest.TestCase):
+    """
+    Test suite for obspy.core.event.index.
+    """
+    def setUp(self):
+        rng = np.random.RandomState(815)
+        self.catalog = Catalog()
+        t0 = UTCDateTime(2010, 1, 1)
+        for i in range(300):
+            origin = Origin(time=t0 + rng.randint(0, 1000) * 3600)
+            # some events without location, depth or origin
+            if i % 50 != 1:
+                origin.latitude = rng.uniform(-90, 90)
+                origin.longitude = rng.uniform(-180, 180)
+            if i % 40 != 2:
+                origin.depth = rng.uniform(0, 700e3)
+            event = Event(origins=[origin] if i % 60 != 3 else [])
+            self.catalog.append(event)
+        self.index = CatalogIndex(self.catalog)
+        self.rng = rng
+
+    def _epicentral_distances(self, latitude, longitude):
+        distances = []
+        for event in self.catalog:
+            if not event.origins or event.origins[0].latitude is None:
+                distances.append(np.nan)
+                continue
+            distances.append(degrees2kilometers(locations2degrees(
+                latitude, longitude, event.origins[0].latitude,
+                event.origins[0].longitude)))
+        return np.array(distances)
+
+    def _times(self):
+        return np.array([
+            event.origins[0].time._ns if event.origins else NO_TIME
+            for event in self.catalog])
+
+    def test_query_radius(self):
+        """
+        Compares radius queries against the geodetics module.
+        """
+        times = self._times()
+        starttime = UTCDateTime(2010, 1, 10)
+        endtime = UTCDateTime(2010, 1, 30)
+        in_time = (times >= starttime._ns) & (times <= endtime._ns)
+        for _ in range(20):
+            lat = self.rng.uniform(-90, 90)
+            lon = self.rng.uniform(-180, 180)
+            radius = self.rng.uniform(100, 8000)
+            distances = self._epicentral_distances(lat, lon)
+            with np.errstate(invalid="ignore"):
+                # avoid events right at the border
+                distances[np.abs(distances - radius) < 1e-3] = np.nan
+                expected = np.flatnonzero(distances < radius)
+                got = self.index.query_radius(lat, lon, radius,
+                                              return_indices=True)
+                got = got[np.isfinite(distances[got])]
+                np.testing.assert_array_equal(got, expected)
+                expected = np.flatnonzero((distances < radius) & in_time)
+                got = self.index.query_radius(
+                    lat, lon, radius, starttime=starttime, endtime=endtime,
+                    return_indices=True)
+                got = got[np.isfinite(distances[got])]
+                np.testing.assert_array_equal(got, expected)
+        # everything with a location is within half the circumference
+        got = self.index.query_radius(0, 0, 30000, return_indices=True)
+        self.assertEqual(len(got), 289)
+        # catalog is returned by default
+        cat = self.index.query_radius(0, 0, 30000)
+        self.assertTrue(isinstance(cat, Catalog))
+        self.assertEqual(len(cat), 289)
+        for i, event in zip(got, cat):
+            self.assertTrue(event is self.catalog[i])
+
+    def test_query_radius_with_depth(self):
+        """
+        Hypocentral distances only return events with depth.
+        """
+        origin = self.catalog[0].origins[0]
+        got = self.index.query_radius(
+            origin.latitude, origin.longitude, 1.0,
+            depth=origin.depth / 1000.0, return_indices=True)
+        np.testing.assert_array_equal(got, [0])
+        got = self.index.query_radius(
+            origin.latitude, origin.longitude, 1.0,
+            depth=origin.depth / 1000.0 + 2.0, return_indices=True)
+        self.assertEqual(len(got), 0)
+        got = self.index.query_radius(0, 0, 20000, depth=0,
+                                      return_indices=True)
+        self.assertEqual(len(got), 281)
+
+    def test_query_nearest(self):
+        """
+        Compares nearest neighbour queries against the geodetics module.
+        """
+        times = self._times()
+        starttime = UTCDateTime(2010, 1, 10)
+        in_time = times >= starttime._ns
+        for _ in range(20):
+            lat = self.rng.uniform(-90, 90)
+            lon = self.rng.uniform(-180, 180)
+            distances = self._epicentral_distances(lat, lon)
+            distances[np.isnan(distances)] = np.inf
+            expected = np.argsort(distances, kind="mergesort")[:5]
+            got = self.index.query_nearest(lat, lon, k=5,
+                                           return_indices=True)
+            np.testing.assert_array_equal(got, expected)
+            distances[~in_time] = np.inf
+            expected = np.argsort(distances, kind="mergesort")[:5]
+            got = self.index.query_nearest(lat, lon, k=5,
+                                           starttime=starttime,
+                                           return_indices=True)
+            np.testing.assert_array_equal(got, expected)
+        got = self.index.query_nearest(0, 0, k=1000, return_indices=True)
+        self.assertEqual(len(got), 289)
+        cat = self.index.query_nearest(0, 0)
+        self.assertEqual(len(cat), 1)
+        self.assertEqual(len(CatalogIndex(Catalog()).query_nearest(0, 0)), 0)
+
+    def test_query_box(self):
+        """
+        Compares box queries against Catalog.filter().
+        """
+        def _expected(filters):
+            events = self.catalog.filter(*filters)
+            return [i for i, event in enumerate(self.catalog)
+                    if any(event is _e for _e in events)]
+
+        got = self.index.query_box(
+            minlatitude=-10, maxlatitude=40, minlongitude=-50,
+            maxlongitude=100, return_indices=True)
+        expected = _expected(["latitude >= -10", "latitude <= 40",
+                              "longitude >= -50", "longitude <= 100"])
+        np.testing.assert_array_equal(got, expected)
+        got = self.index.query_box(
+            mindepth=100, maxdepth=300, starttime=UTCDateTime(2010, 1, 5),
+            endtime=UTCDateTime(2010, 1, 20), return_indices=True)
+        expected = _expected(["depth >= 100000", "depth <= 300000",
+                              "time >= 2010-01-05", "time <= 2010-01-20"])
+        np.testing.assert_array_equal(got, expected)
+        # box across the antimeridian, unlike Catalog.filter() events
+        # without location never match
+        got = self.index.query_box(minlongitude=170, maxlongitude=-170,
+                                   return_indices=True)
+        expected = sorted(set(_expected(["longitude >= 170"])) |
+                          set(_expected(["longitude <= -170",
+                                         "longitude > -180"])))
+        np.testing.assert_array_equal(got, expected)
+        # no restrictions
+        self.assertEqual(len(self.index.query_box()), 300)
+
+    def test_index_of_modified_catalog(self):
+        """
+        The index is built from the current values of a catalog whose
+        columns were cached before it was modified.
+        """
+        cat = read_events()
+        cat.get_columns()
+        cat[0].origins[0].latitude = 10.0
+        cat[0].origins[0].longitude = 10.0
+        index = CatalogIndex(cat)
+        got = index.query_radius(10.0, 10.0, 1.0, return_indices=True)
+        np.testing.assert_array_equal(got, [0])
+        self.assertEqual(len(index.query_radius(41.818, 79.689, 1.0)), 0)
+
+
+class CatalogTableTestCase(unittest.TestCase):
+    """
+    Test suite for obspy.core.event.table.
+    """
+    def setUp(self):
+        self.path = os.path.join(os.path.dirname(__file__), 'data')
+        self.zmap = os.path.join(os.path.dirname(self.path), os.pardir,
+                                 os.pardir, 'io', 'zmap', 'tests', 'data',
+                                 'templates.txt')
+
+    def test_scan_creates_events_lazily(self):
+        """
+        Events are only created when accessed and then kept.
+        """
+        table = scan_events(self.zmap)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table._events, [None] * 4)
+        event = table[-1]
+        self.assertEqual(table._events, [None, None, None, event])
+        self.assertIs(table[3], event)
+        self.assertEqual(event._format, 'ZMAP')
+        self.assertEqual(event.origins[0].time._ns,
+                         table.get_columns()['time'][3])
+        # selections share the created events
+        self.assertIs(table[2:][1], event)
+        self.assertEqual(table._events[:3], [None] * 3)
+
+    def test_columns_equal_catalog_columns(self):
+        """
+        The columns of a scanned table and of its catalog are the same.
+        """
+        table = scan_events(self.zmap)
+        columns = table.get_columns()
+        expected = read_events(self.zmap).get_columns()
+        self.assertFalse(columns.flags.writeable)
+        for key in expected.dtype.names:
+            np.testing.assert_array_equal(columns[key], expected[key])
+        catalog = table.to_catalog()
+        self.assertEqual(len(catalog), 4)
+        for key in expected.dtype.names:
+            np.testing.assert_array_equal(catalog.get_columns()[key],
+                                          expected[key])
+
+    def test_indexing(self):
+        """
+        Tests indexing with integers, slices, index arrays and masks.
+        """
+        table = scan_events(self.zmap)
+        times = table.get_columns()['time']
+        self.assertEqual(len(table[1:3]), 2)
+        np.testing.assert_array_equal(table[::-1].get_columns()['time'],
+                                      times[::-1])
+        np.testing.assert_array_equal(table[[3, 0]].get_columns()['time'],
+                                      times[[3, 0]])
+        mask = times > times[1]
+        np.testing.assert_array_equal(table[mask].get_columns()['time'],
+                                      times[mask])
+        self.assertEqual(len(table[[]]), 0)
+        self.assertRaises(IndexError, table.__getitem__, 4)
+        self.assertRaises(IndexError, table.__getitem__, -5)
+        self.assertRaises(IndexError, table.__getitem__,
+                          np.ones(3, dtype=np.bool_))
+
+    def test_add(self):
+        """
+        Tests concatenating tables.
+        """
+        table = scan_events(self.zmap)
+        quakeml = scan_events('/path/to/neries_events.xml')
+        both = table + quakeml
+        self.assertEqual(len(both), 7)
+        self.assertEqual(both[0]._format, 'ZMAP')
+        self.assertEqual(both[4]._format, 'QUAKEML')
+        self.assertIs(both[4], quakeml[0])
+        self.assertRaises(TypeError, table.__add__, read_events())
+
+    def test_scan_without_scanner(self):
+        """
+        Formats without a scanner are read completely.
+        """
+        catalog = read_events('/path/to/neries_events.xml')
+        table = scan_events('/path/to/neries_events.xml')
+        self.assertEqual(len(table), 3)
+        self.assertNotIn(None, table._events)
+        self.assertEqual(table.to_catalog(), catalog)
+        self.assertEqual(str(table), '3 Event(s) in CatalogTable')
+
+    def test_scan_file_like_objects_and_wildcards(self):
+        """
+        Tests scanning open files, byte strings and multiple files.
+        """
+        with open(self.zmap, 'rb') as fh:
+            data = fh.read()
+            fh.seek(0)
+            table = scan_events(fh, format='ZMAP')
+        self.assertEqual(len(table), 4)
+        table = scan_events(io.BytesIO(data))
+        self.assertEqual(len(table), 4)
+        table = scan_events(os.path.join(os.path.dirname(self.zmap), '*.txt'))
+        self.assertEqual(len(table), 6)
+        self.assertRaises(IOError, scan_events, self.zmap + '_not_existing')
+
+    def test_from_catalog(self):
+        """
+        Tests creating a table of existing events.
+        """
+        catalog = read_events()
+        table = CatalogTable.from_catalog(catalog)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(list(table), catalog.events)
+        for key in table.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          catalog.get_columns()[key])
+        self.assertRaises(ValueError, CatalogTable, table.get_columns(),
+                          [], None)
+
+    def test_fields_to_ns(self):
+        """
+        Times are rounded to microseconds like by UTCDateTime.
+        """
+        seconds = [0.0, 42.3, 59.9999994, 0.0000005, 0.0000015, 0.0000035,
+                   12.3456785, 59.9999995, 60.0, -1.0, np.nan]
+        count = len(seconds)
+        ns, ok = _fields_to_ns([2012] * count, [2] * count, [29] * count,
+                               [23] * count, [59] * count, seconds)
+        np.testing.assert_array_equal(ok, [True] * 7 + [False] * 4)
+        for time, second in zip(ns[ok].tolist(), seconds):
+            self.assertEqual(
+                time, UTCDateTime(2012, 2, 29, 23, 59, second)._ns)
+        self.assertTrue((ns[~ok] == NO_TIME).all())
+        # invalid dates
+        ns, ok = _fields_to_ns([2013, 2012, 2012], [2, 13, 1], [29, 1, 1],
+                               [0, 0, 24], [0, 0, 0], [0, 0, 0])
+        self.assertFalse(ok.any())
+
+
 class BaseTestCase(unittest.TestCase):
     """
     Test suite for obspy.core.event.base.
@@ -1148,6 +1597,8 @@ def suite():
     suite.addTest(unittest.makeSuite(OriginTestCase, 'test'))
     suite.addTest(unittest.makeSuite(WaveformStreamIDTestCase, 'test'))
     suite.addTest(unittest.makeSuite(ResourceIdentifierTestCase, 'test'))
+    suite.addTest(unittest.makeSuite(CatalogIndexTestCase, 'test'))
+    suite.addTest(unittest.makeSuite(CatalogTableTestCase, 'test'))
     suite.addTest(unittest.makeSuite(BaseTestCase, 'test'))
     return suite
 
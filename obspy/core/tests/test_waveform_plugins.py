@@ -15,6 +15,7 @@ from pkg_resources import load_entry_point
 import numpy as np
 
 from obspy import Trace, read
+from obspy.core.stream import scan
 from obspy.core.compatibility import mock
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util.base import (NamedTemporaryFile, _get_entry_points,
@@ -391,6 +392,59 @@ class WaveformPluginsTestCase(unittest.TestCase):
         st2 = read(os.path.join(ascii_path, 'slist.ascii'))
         self.assertEqual(st1, st2)
 
+    def test_scan(self):
+        """
+        Tests scanning waveform files with native scanners and with the
+        fallback using headonly reading.
+        """
+        tr = read()[0]
+        tr.stats.location = "00"
+        tr2 = tr.copy()
+        tr2.stats.starttime += 1000
+        for format in ("MSEED", "SAC", "GSE2", "SEGY", "SLIST", "SH_ASC"):
+            st = read()[:0]
+            for _tr in (tr, tr2):
+                _tr = _tr.copy()
+                if format == "GSE2":
+                    _tr.data = _tr.data.astype(np.int32)
+                else:
+                    _tr.data = _tr.data.astype(np.float32)
+                st += _tr
+            if format == "SAC":
+                # SAC files contain a single trace.
+                st = st[:1]
+            with NamedTemporaryFile() as tf:
+                st.write(tf.name, format=format)
+                expected = read(tf.name, headonly=True)
+                table = scan(tf.name)
+                with open(tf.name, "rb") as fh:
+                    table_2 = scan(io.BytesIO(fh.read()), format=format)
+            np.testing.assert_array_equal(table, table_2)
+            self.assertEqual(len(table), len(expected), msg=format)
+            for row, tr_ in zip(table, expected):
+                stats = tr_.stats
+                self.assertEqual(
+                    (row["network"], row["station"], row["location"],
+                     row["channel"], row["npts"]),
+                    (stats.network, stats.station, stats.location,
+                     stats.channel, stats.npts), msg=format)
+                self.assertAlmostEqual(row["sampling_rate"],
+                                       stats.sampling_rate, msg=format)
+                self.assertEqual(UTCDateTime(ns=int(row["starttime"])),
+                                 stats.starttime, msg=format)
+                self.assertEqual(UTCDateTime(ns=int(row["endtime"])),
+                                 stats.endtime, msg=format)
+
+        # Compressed files are uncompressed and archives fully scanned.
+        path = os.path.join(os.path.dirname(__file__), "data")
+        filename = os.path.join(path, "test.tar.gz")
+        self.assertEqual(len(scan(filename)), len(read(filename)))
+        # Wildcards
+        filename = os.path.join(path, "test.ta*")
+        self.assertEqual(len(scan(filename)), len(read(filename)))
+        self.assertRaises(Exception, scan, os.path.join(path, "xyz*"))
+        self.assertRaises(IOError, scan, os.path.join(path, "xyz"))
+
     def test_raise_on_unknown_format(self):
         """
         Test case for issue #338:
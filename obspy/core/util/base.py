@@ -33,13 +33,14 @@ from obspy.core.util.misc import to_int_or_zero
 # defining ObsPy modules currently used by runtests and the path function
 DEFAULT_MODULES = ['clients.filesystem', 'core', 'db', 'geodetics', 'imaging',
                    'io.ah', 'io.arclink', 'io.ascii', 'io.cmtsolution',
-                   'io.cnv', 'io.css', 'io.win', 'io.gcf', 'io.gse2',
-                   'io.json', 'io.kinemetrics', 'io.kml', 'io.mseed', 'io.ndk',
-                   'io.nied', 'io.nlloc', 'io.nordic', 'io.pdas', 'io.pde',
-                   'io.quakeml', 'io.reftek', 'io.sac', 'io.seg2', 'io.segy',
-                   'io.seisan', 'io.sh', 'io.shapefile', 'io.seiscomp',
-                   'io.stationtxt', 'io.stationxml', 'io.wav', 'io.xseed',
-                   'io.y', 'io.zmap', 'realtime', 'scripts', 'signal', 'taup']
+                   'io.cnv', 'io.css', 'io.eventcache', 'io.win', 'io.gcf',
+                   'io.gse2', 'io.json', 'io.kinemetrics', 'io.kml',
+                   'io.mseed', 'io.ndk', 'io.nied', 'io.nlloc', 'io.nordic',
+                   'io.pdas', 'io.pde', 'io.quakeml', 'io.reftek', 'io.sac',
+                   'io.seg2', 'io.segy', 'io.seisan', 'io.sh', 'io.shapefile',
+                   'io.seiscomp', 'io.stationtxt', 'io.stationxml', 'io.wav',
+                   'io.xseed', 'io.y', 'io.zmap', 'realtime', 'scripts',
+                   'signal', 'taup']
 NETWORK_MODULES = ['clients.arclink', 'clients.earthworm', 'clients.fdsn',
                    'clients.iris', 'clients.neic', 'clients.seedlink',
                    'clients.seishub', 'clients.syngine']
@@ -55,6 +56,18 @@ EVENT_PREFERRED_ORDER = ['QUAKEML', 'NLLOC_HYP']
 # waveform plugins accepting a byteorder keyword
 WAVEFORM_ACCEPT_BYTEORDER = ['MSEED', 'Q', 'SAC', 'SEGY', 'SU']
 
+# columns of the segment tables returned by obspy.core.stream.scan(), times
+# are given as integer nanoseconds since 1970-01-01
+SEGMENT_TABLE_DTYPE = np.dtype([
+    (native_str('network'), native_str('U8')),
+    (native_str('station'), native_str('U8')),
+    (native_str('location'), native_str('U8')),
+    (native_str('channel'), native_str('U8')),
+    (native_str('starttime'), np.int64),
+    (native_str('endtime'), np.int64),
+    (native_str('sampling_rate'), np.float64),
+    (native_str('npts'), np.int64)])
+
 _sys_is_le = sys.byteorder == 'little'
 NATIVE_BYTEORDER = _sys_is_le and '<' or '>'
 
@@ -354,9 +367,10 @@ BASEMAP_VERSION = get_dependency_version('basemap')
 CARTOPY_VERSION = get_dependency_version('cartopy')
 
 
-def _read_from_plugin(plugin_type, filename, format=None, **kwargs):
+def _get_format_entry_point(plugin_type, filename, format=None):
     """
-    Reads a single file from a plug-in's readFormat function.
+    Returns the entry point of the plug-in for the given or auto detected
+    format of a single file.
     """
     eps = ENTRY_POINTS[plugin_type]
     # get format entry point
@@ -392,6 +406,15 @@ def _read_from_plugin(plugin_type, filename, format=None, **kwargs):
         except (KeyError, IndexError):
             msg = "Format \"%s\" is not supported. Supported types: %s"
             raise TypeError(msg % (format, ', '.join(eps)))
+    return format_ep
+
+
+def _read_from_plugin(plugin_type, filename, format=None, **kwargs):
+    """
+    Reads a single file from a plug-in's readFormat function.
+    """
+    eps = ENTRY_POINTS[plugin_type]
+    format_ep = _get_format_entry_point(plugin_type, filename, format=format)
     # file format should be known by now
     try:
         # search readFormat for given entry point
@@ -407,6 +430,62 @@ def _read_from_plugin(plugin_type, filename, format=None, **kwargs):
     return list_obj, format_ep.name
 
 
+def _scan_from_plugin(filename, format=None, **kwargs):
+    """
+    Scans a single waveform file using a plug-in's scanFormat function.
+
+    Plug-ins without a scanFormat function are read with ``headonly=True``
+    and the segment table is assembled from the resulting traces.
+    """
+    format_ep = _get_format_entry_point('waveform', filename, format=format)
+    try:
+        scan_format = load_entry_point(
+            format_ep.dist.key, 'obspy.plugin.waveform.%s' % format_ep.name,
+            'scanFormat')
+    except ImportError:
+        scan_format = None
+    if scan_format is not None:
+        return scan_format(filename, **kwargs), format_ep.name
+    read_format = load_entry_point(
+        format_ep.dist.key, 'obspy.plugin.waveform.%s' % format_ep.name,
+        'readFormat')
+    traces = read_format(filename, headonly=True, **kwargs)
+    table = _get_segment_table(
+        network=[tr.stats.network for tr in traces],
+        station=[tr.stats.station for tr in traces],
+        location=[tr.stats.location for tr in traces],
+        channel=[tr.stats.channel for tr in traces],
+        starttime=[tr.stats.starttime._ns for tr in traces],
+        sampling_rate=[tr.stats.sampling_rate for tr in traces],
+        npts=[tr.stats.npts for tr in traces])
+    return table, format_ep.name
+
+
+def _get_segment_table(network, station, location, channel, starttime,
+                       sampling_rate, npts):
+    """
+    Assembles a segment table from sequences of the individual columns.
+
+    Start times are given as integer nanoseconds, the end times are
+    calculated from them the same way as
+    :class:`~obspy.core.trace.Stats` does it.
+    """
+    table = np.empty(len(npts), dtype=SEGMENT_TABLE_DTYPE)
+    table['network'] = network
+    table['station'] = station
+    table['location'] = location
+    table['channel'] = channel
+    table['starttime'] = starttime
+    table['sampling_rate'] = sampling_rate
+    table['npts'] = npts
+    duration = np.zeros(len(table), dtype=np.int64)
+    mask = (table['npts'] > 0) & (table['sampling_rate'] > 0)
+    duration[mask] = np.round(
+        (table['npts'][mask] - 1) / table['sampling_rate'][mask] * 1e9)
+    table['endtime'] = table['starttime'] + duration
+    return table
+
+
 def get_script_dir_name():
     """
     Get the directory of the current script file. This is more robust than
@@ -429,6 +508,8 @@ def make_format_plugin_table(group="waveform", method="read", numspaces=4,
     ======... ===============... ========================================...
     CMTSOLUTION  :mod:`...io.cmtsolution` :func:`..._write_cmtsolution`
     CNV       :mod:`...io.cnv`   :func:`obspy.io.cnv.core._write_cnv`
+    EVENTCACHE :mod:`...io.eventcache`
+                     :func:`obspy.io.eventcache.core._write_eventcache`
     JSON      :mod:`...io.json`  :func:`obspy.io.json.core._write_json`
     KML       :mod:`obspy.io.kml` :func:`obspy.io.kml.core._write_kml`
     NLLOC_OBS :mod:`...io.nlloc` :func:`obspy.io.nlloc.core.write_nlloc_obs`
@@ -156,6 +156,31 @@ def flat_not_masked_contiguous(a):
     return result
 
 
+def concatenate_ranges(starts, lengths):
+    """
+    Returns the concatenation of ``np.arange(start, start + length)`` for
+    all starts and lengths without a Python loop.
+
+    Useful to gather many variable length chunks of a buffer at once.
+
+    :type starts: array_like
+    :param starts: First value of each range.
+    :type lengths: array_like
+    :param lengths: Number of values of each range.
+    :rtype: :class:`numpy.ndarray`
+    :return: 64 bit integer array with ``sum(lengths)`` values.
+
+    .. rubric:: Example
+
+    >>> print(concatenate_ranges([10, 0, 5], [3, 0, 2]))
+    [10 11 12  5  6]
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
 def complexify_string(line):
     """
     Converts a string in the form "(real, imag)" into a complex type.
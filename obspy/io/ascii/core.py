@@ -36,6 +36,8 @@ from __future__ import (absolute_import, division, print_function,
 from future.builtins import *  # NOQA
 
 import io
+import re
+import warnings
 
 import numpy as np
 
@@ -44,6 +46,9 @@ from obspy.core import Stats
 from obspy.core.util import AttribDict, loadtxt
 
 
+# number of samples formatted at once when writing
+BLOCK_SIZE = 60000
+
 HEADER = ("TIMESERIES {network}_{station}_{location}_{channel}_{dataquality}, "
           "{npts:d} samples, {sampling_rate} sps, {starttime!s:.26s}, "
           "{format}, {dtype}, {unit}\n")
@@ -134,24 +139,7 @@ def _read_slist(filename, headonly=False, **kwargs):  # @UnusedVariable
     >>> from obspy import read
     >>> st = read('/path/to/slist.ascii')
     """
-    with open(filename, 'rt') as fh:
-        # read file and split text into channels
-        buf = []
-        key = False
-        for line in fh:
-            if line.isspace():
-                # blank line
-                continue
-            elif line.startswith('TIMESERIES'):
-                # new header line
-                key = True
-                buf.append((line, io.StringIO()))
-            elif headonly:
-                # skip data for option headonly
-                continue
-            elif key:
-                # data entry - may be written in multiple columns
-                buf[-1][1].write(line.strip() + ' ')
+    buf = _read_sections(filename, headonly)
     # create ObsPy stream object
     stream = Stream()
     for header, data in buf:
@@ -176,7 +164,7 @@ def _read_slist(filename, headonly=False, **kwargs):  # @UnusedVariable
             # skip data
             stream.append(Trace(header=stats))
         else:
-            data = _parse_data(data, parts[8])
+            data = _parse_data(data, parts[8], stats.npts)
             stream.append(Trace(data=data, header=stats))
     return stream
 
@@ -202,24 +190,7 @@ def _read_tspair(filename, headonly=False, **kwargs):  # @UnusedVariable
     >>> from obspy import read
     >>> st = read('/path/to/tspair.ascii')
     """
-    with open(filename, 'rt') as fh:
-        # read file and split text into channels
-        buf = []
-        key = False
-        for line in fh:
-            if line.isspace():
-                # blank line
-                continue
-            elif line.startswith('TIMESERIES'):
-                # new header line
-                key = True
-                buf.append((line, io.StringIO()))
-            elif headonly:
-                # skip data for option headonly
-                continue
-            elif key:
-                # data entry - may be written in multiple columns
-                buf[-1][1].write(line.strip().split()[-1] + ' ')
+    buf = _read_sections(filename, headonly)
     # create ObsPy stream object
     stream = Stream()
     for header, data in buf:
@@ -244,7 +215,7 @@ def _read_tspair(filename, headonly=False, **kwargs):  # @UnusedVariable
             # skip data
             stream.append(Trace(header=stats))
         else:
-            data = _parse_data(data, parts[8])
+            data = _parse_tspair_data(data, parts[8], stats)
             stream.append(Trace(data=data, header=stats))
     return stream
 
@@ -336,18 +307,14 @@ def _write_slist(stream, filename, **kwargs):  # @UnusedVariable
             # write trace header
             header = _format_header(stats, 'SLIST', dataquality, dtype, unit)
             fh.write(header.encode('ascii', 'strict'))
-            # write data
-            rest = stats.npts % 6
-            if rest:
-                data = trace.data[:-rest]
-            else:
-                data = trace.data
-            data = data.reshape((-1, 6))
-            np.savetxt(fh, data, delimiter=b'\t',
-                       fmt=fmt.encode('ascii', 'strict'))
-            if rest:
-                fh.write(('\t'.join([fmt % d for d in trace.data[-rest:]]) +
-                         '\n').encode('ascii', 'strict'))
+            # write data in blocks of 6 columns
+            for i in range(0, stats.npts, BLOCK_SIZE):
+                data = trace.data[i:i + BLOCK_SIZE].tolist()
+                rows, rest = divmod(len(data), 6)
+                lines = ('\t'.join([fmt] * 6) + '\n') * rows
+                if rest:
+                    lines += '\t'.join([fmt] * rest) + '\n'
+                fh.write((lines % tuple(data)).encode('ascii', 'strict'))
 
 
 def _write_tspair(stream, filename, **kwargs):  # @UnusedVariable
@@ -444,40 +411,146 @@ def _write_tspair(stream, filename, **kwargs):  # @UnusedVariable
             # write trace header
             header = _format_header(stats, 'TSPAIR', dataquality, dtype, unit)
             fh.write(header.encode('ascii', 'strict'))
-            # write data
-            times = np.linspace(stats.starttime.timestamp,
-                                stats.endtime.timestamp, stats.npts)
-            for t, d in zip(times, trace.data):
-                # .26s cuts the Z from the time string
-                line = ('%.26s  ' + fmt + '\n') % (UTCDateTime(t), d)
-                fh.write(line.encode('ascii', 'strict'))
+            # write data in blocks
+            line = '%s  ' + fmt + '\n'
+            for i in range(0, stats.npts, BLOCK_SIZE):
+                data = trace.data[i:i + BLOCK_SIZE]
+                times = _format_times(stats, i, len(data))
+                pairs = [None] * (2 * len(data))
+                pairs[0::2] = times
+                pairs[1::2] = data.tolist()
+                lines = (line * len(data)) % tuple(pairs)
+                fh.write(lines.encode('ascii', 'strict'))
+
+
+def _read_sections(filename, headonly=False):
+    """
+    Reads a SLIST or TSPAIR file and splits it into its segments.
+
+    :type filename: str
+    :param filename: ASCII file to be read.
+    :type headonly: bool, optional
+    :param headonly: If set to True, the data part of each segment is empty.
+    :rtype: list of tuple
+    :return: Header line and data text for each segment.
+    """
+    with open(filename, 'rt') as fh:
+        text = fh.read()
+    headers = list(re.finditer(r'^TIMESERIES.*$', text, re.MULTILINE))
+    sections = []
+    for i, match in enumerate(headers):
+        if headonly:
+            data = ''
+        elif i + 1 < len(headers):
+            data = text[match.end():headers[i + 1].start()]
+        else:
+            data = text[match.end():]
+        sections.append((match.group(), data))
+    return sections
 
 
-def _parse_data(data, data_type):
+def _get_dtype(data_type):
     """
-    Simple function to read data contained in a StringIO object to a NumPy
-    array.
+    Returns the NumPy dtype for the given sample type.
+    """
+    if data_type == "INTEGER":
+        return np.int_
+    elif data_type == "FLOAT":
+        return np.float32
+    else:
+        raise NotImplementedError
+
 
-    :type data: io.StringIO
+def _parse_data(data, data_type, npts=None):
+    """
+    Simple function to read whitespace separated data to a NumPy array.
+
+    All values are parsed at once. If the number of parsed values does not
+    match the expected number of samples, e.g. because of invalid values,
+    the data is parsed again with :func:`numpy.loadtxt`.
+
+    :type data: str
     :param data: The actual data.
     :type data_type: str
     :param data_type: The data type of the expected data. Currently supported
         are 'INTEGER' and 'FLOAT'.
+    :type npts: int, optional
+    :param npts: Expected number of samples.
     """
-    if data_type == "INTEGER":
-        dtype = np.int_
-    elif data_type == "FLOAT":
-        dtype = np.float32
-    else:
-        raise NotImplementedError
-    # Seek to the beginning of the StringIO.
-    data.seek(0)
-    # Data will always be a StringIO. Avoid to send empty StringIOs to
-    # numpy.readtxt() which raises a warning.
-    if len(data.read(1)) == 0:
+    dtype = _get_dtype(data_type)
+    # Avoid to send empty strings to numpy.loadtxt() which raises a
+    # warning.
+    if not data.strip():
         return np.array([], dtype=dtype)
-    data.seek(0)
-    return loadtxt(data, dtype=dtype, ndmin=1)
+    if npts is not None:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            values = np.fromstring(data, dtype=dtype, sep=' ')
+        if len(values) == npts:
+            return values
+    # join all lines, data may be written in multiple columns
+    data = ' '.join(line.strip() for line in data.splitlines())
+    return loadtxt(io.StringIO(data), dtype=dtype, ndmin=1)
+
+
+def _parse_tspair_data(data, data_type, stats):
+    """
+    Reads the samples of TSPAIR time-sample pairs to a NumPy array.
+
+    Times and samples are parsed at once. The times are checked against the
+    start time and sampling rate of the header.
+
+    :type data: str
+    :param data: The actual data.
+    :type data_type: str
+    :param data_type: The data type of the expected data. Currently supported
+        are 'INTEGER' and 'FLOAT'.
+    :type stats: :class:`~obspy.core.trace.Stats`
+    :param stats: Header of the segment.
+    """
+    pairs = data.split()
+    try:
+        if len(pairs) != 2 * stats.npts:
+            raise ValueError
+        times = np.array(pairs[0::2], dtype='datetime64[us]')
+    except ValueError:
+        # fall back to using the last column of each line
+        lines = [line.split()[-1] for line in data.splitlines()
+                 if line.strip()]
+        return _parse_data(' '.join(lines), data_type)
+    values = _parse_data(' '.join(pairs[1::2]), data_type, stats.npts)
+    # compare with times as written by _write_tspair
+    expected = np.array(_format_times(stats, 0, stats.npts),
+                        dtype='datetime64[us]')
+    if np.any(np.abs(times - expected) > np.timedelta64(
+            int(round(stats.delta * 5e5)), 'us')):
+        seed_id = ".".join((stats.network, stats.station, stats.location,
+                            stats.channel))
+        msg = ("Sample times of TSPAIR segment %s do not match its start "
+               "time and sampling rate.") % seed_id
+        warnings.warn(msg)
+    return values
+
+
+def _format_times(stats, start, npts):
+    """
+    Returns times of samples as strings without time zone as used in
+    TSPAIR files.
+
+    :type stats: :class:`~obspy.core.trace.Stats`
+    :param stats: Header of the trace.
+    :type start: int
+    :param start: Index of first sample.
+    :type npts: int
+    :param npts: Number of samples.
+    :rtype: list of str
+    """
+    index = np.arange(start, start + npts)
+    # round to microseconds, the precision of the time strings
+    times = stats.starttime._ns + np.round(
+        index * (1e9 / stats.sampling_rate)).astype(np.int64)
+    times = np.floor_divide(times + 500, 1000)
+    return np.datetime_as_string(times.astype('datetime64[us]')).tolist()
 
 
 if __name__ == '__main__':
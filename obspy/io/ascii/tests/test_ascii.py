@@ -3,12 +3,15 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA @UnusedWildImport
 
+import io
 import os
 import unittest
+import warnings
 
 import numpy as np
 
-from obspy import Trace, UTCDateTime, read
+from obspy import Stream, Trace, UTCDateTime, read
+from obspy.core.compatibility import mock
 from obspy.io.ascii.core import (_is_slist, _is_tspair, _read_slist,
                                  _read_tspair, _write_slist, _write_tspair)
 from obspy.core.util import NamedTemporaryFile
@@ -494,6 +497,81 @@ class ASCIITestCase(unittest.TestCase):
                 self.assertEqual(tr.stats.sampling_rate,
                                  got.stats.sampling_rate)
 
+    def test_write_and_read_in_blocks(self):
+        """
+        Samples are formatted in blocks when writing, check all block
+        boundaries with a reduced block size.
+        """
+        st = Stream()
+        for npts in (0, 5, 6, 7, 23, 24, 25):
+            tr = Trace(np.arange(npts) * 3 - 10)
+            tr.stats.starttime = UTCDateTime(2010, 1, 1, 0, 0, 0.123456)
+            tr.stats.sampling_rate = 3.0
+            st.append(tr)
+            tr = tr.copy()
+            tr.data = tr.data.astype(np.float32) / 7
+            st.append(tr)
+        for format in ['SLIST', 'TSPAIR']:
+            with NamedTemporaryFile() as tf:
+                with mock.patch('obspy.io.ascii.core.BLOCK_SIZE', 12):
+                    st.write(tf.name, format=format)
+                with open(tf.name, 'rb') as fh:
+                    expected = fh.read()
+                # compare with writing without blocks
+                st.write(tf.name, format=format)
+                with open(tf.name, 'rb') as fh:
+                    self.assertEqual(fh.read(), expected)
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter("always")
+                    got = read(tf.name, format=format)
+                self.assertEqual(len(w), 0)
+            self.assertEqual(len(got), len(st))
+            for tr, tr_got in zip(st, got):
+                self.assertEqual(tr.stats.starttime, tr_got.stats.starttime)
+                np.testing.assert_array_almost_equal(tr.data, tr_got.data, 5)
+            # times in TSPAIR files
+            if format == 'TSPAIR':
+                lines = expected.decode().splitlines()
+                self.assertEqual(lines[-1].split()[0],
+                                 '2010-01-01T00:00:08.123456')
+
+    def test_read_data_fallback(self):
+        """
+        Data that can not be parsed at once is read line by line.
+        """
+        testfile = os.path.join(self.path, 'data', 'tspair.ascii')
+        expected = _read_tspair(testfile)[0].data
+        with open(testfile, 'rt') as fh:
+            lines = fh.readlines()
+        # additional columns, only the last one is used
+        lines[1] = 'xxx ' + lines[1]
+        with NamedTemporaryFile() as tf:
+            with io.open(tf.name, 'wt') as fh:
+                fh.writelines(lines)
+            data = _read_tspair(tf.name)[0].data
+        np.testing.assert_array_equal(data, expected)
+        # sample times not matching the header
+        lines[1] = lines[1][4:]
+        lines[2] = lines[2].replace('00:00:00.050000', '00:00:01.050000')
+        with NamedTemporaryFile() as tf:
+            with io.open(tf.name, 'wt') as fh:
+                fh.writelines(lines)
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                st = _read_tspair(tf.name)
+        self.assertEqual(len(w), 1)
+        self.assertIn('do not match', str(w[0].message))
+        np.testing.assert_array_equal(st[0].data, expected)
+        # invalid values
+        testfile = os.path.join(self.path, 'data', 'slist.ascii')
+        with open(testfile, 'rt') as fh:
+            lines = fh.readlines()
+        lines[2] = lines[2].replace('209', '2x9')
+        with NamedTemporaryFile() as tf:
+            with io.open(tf.name, 'wt') as fh:
+                fh.writelines(lines)
+            self.assertRaises(ValueError, _read_slist, tf.name)
+
 
 def suite():
     return unittest.makeSuite(ASCIITestCase, 'test')
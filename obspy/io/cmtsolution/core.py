@@ -13,14 +13,21 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA @UnusedWildImport
 
+import io
 import math
 import uuid
 import warnings
 
+import numpy as np
+
 from obspy import UTCDateTime
 from obspy.core.event import (Catalog, Comment, Event, EventDescription,
                               Origin, Magnitude, FocalMechanism, MomentTensor,
                               Tensor, SourceTimeFunction)
+from obspy.core.event.catalog import CATALOG_COLUMNS_DTYPE, NO_TIME
+from obspy.core.event.table import (CatalogTable, _char_matrix,
+                                    _fields_to_ns, _materialize_rows,
+                                    _parse_floats)
 from obspy.geodetics import FlinnEngdahl
 
 
@@ -145,6 +152,98 @@ def _internal_read_cmtsolution(buf, **kwargs):
                    events=events)
 
 
+def _scan_cmtsolution(filename_or_buf, **kwargs):
+    """
+    Scans a CMTSOLUTION file to a :class:`~obspy.core.event.CatalogTable`
+    object.
+
+    The times, locations and moment magnitudes of all events are parsed in
+    bulk, the events are only created when accessed.
+
+    :param filename_or_buf: File to scan.
+    :type filename_or_buf: str or file-like object.
+    """
+    return _buffer_proxy(filename_or_buf, _internal_scan_cmtsolution,
+                         reset_fp=False, **kwargs)
+
+
+def _internal_scan_cmtsolution(buf, **kwargs):
+    """
+    Scans a CMTSOLUTION file to a :class:`~obspy.core.event.CatalogTable`
+    object.
+
+    :param buf: File to scan.
+    :type buf: Open file or open file like object.
+    """
+    lines = buf.read().split(b"\n")
+    # Every event starts at a non empty line and has 13 lines, see
+    # _internal_read_cmtsolution().
+    records = []
+    _i = 0
+    while _i < len(lines):
+        if lines[_i].strip():
+            records.append(lines[_i:_i + 13])
+            _i += 13
+        else:
+            _i += 1
+    count = len(records)
+    headers = [_r[0] for _r in records]
+    header = _char_matrix(headers, max([len(_h) for _h in headers] + [28]))
+    time_fields, ok = _parse_floats(header, 5, 28, count=6)
+    values, ok_values = _parse_floats(header, 28, header.shape[1], count=5,
+                                      leading=True)
+    ok &= ok_values
+    # Only the value after the colon is used for all other lines.
+    cmt_values = []
+    for _j in range(2, 13):
+        value_lines = [_r[_j] if len(_r) > _j else b"" for _r in records]
+        chars = _char_matrix(
+            value_lines, max([len(_l) for _l in value_lines] + [1]))
+        key = np.cumsum(chars == ord(":"), axis=1) == 0
+        key[np.arange(count), np.argmax(chars == ord(":"), axis=1)] = True
+        chars[key] = ord(" ")
+        value, ok_value = _parse_floats(chars, 0, chars.shape[1])
+        cmt_values.append(value)
+        ok &= ok_value
+    origin_times, ok_time = _fields_to_ns(*time_fields.T)
+    ok &= ok_time
+
+    columns = np.full(count, np.nan, dtype=CATALOG_COLUMNS_DTYPE)
+    time_shifts = np.where(ok, cmt_values[0], 0.0)
+    columns["time"] = origin_times + \
+        np.round(time_shifts * 1e9).astype(np.int64)
+    columns["latitude"] = cmt_values[2]
+    columns["longitude"] = cmt_values[3]
+    columns["depth"] = cmt_values[4] * 1000.0
+    # Same calculation as in _internal_read_single_cmtsolution().
+    magnitudes = []
+    tensors = np.array(cmt_values[5:]).T
+    for _i, (m_rr, m_tt, m_pp, m_rt, m_rp, m_tp) in \
+            enumerate(tensors.tolist()):
+        m_0 = 1.0 / math.sqrt(2.0) * math.sqrt(
+            m_rr ** 2 + m_tt ** 2 + m_pp ** 2 + 2.0 * m_rt ** 2 +
+            2.0 * m_rp ** 2 + 2.0 * m_tp ** 2)
+        if not ok[_i] or not m_0 > 0:
+            ok[_i] = False
+            magnitudes.append(float("nan"))
+            continue
+        magnitudes.append(round(2.0 / 3.0 * (math.log10(m_0) - 16.1), 2))
+    columns["magnitude"] = magnitudes
+    # Time column is wrong for all other rows, they are parsed event by
+    # event.
+    columns["time"][~ok] = NO_TIME
+    events, _ = _materialize_rows(columns, records, _record_to_event,
+                                  np.flatnonzero(~ok))
+    return CatalogTable(columns, records, _record_to_event, events=events)
+
+
+def _record_to_event(lines):
+    """
+    Creates an event from the lines of a single event.
+    """
+    return _internal_read_single_cmtsolution(io.BytesIO(b"\n".join(lines)))
+
+
 def _internal_read_single_cmtsolution(buf):
     """
     Reads a single CMTSOLUTION file to a :class:`~obspy.core.event.Catalog`
@@ -8,8 +8,12 @@ import inspect
 import io
 import os
 import unittest
+import warnings
+
+import numpy as np
 
 import obspy
+from obspy.core.event import scan_events
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.io.cmtsolution.core import _is_cmtsolution
 
@@ -244,6 +248,67 @@ class CmtsolutionTestCase(unittest.TestCase):
         self.assertEqual(cat[2].origins[1].latitude, -13.68)
         self.assertEqual(cat[2].origins[1].longitude, -111.93)
 
+    def test_scan_events(self):
+        """
+        The centroid time, location and moment magnitude are scanned from
+        the CMTSOLUTION blocks without creating any event.
+        """
+        for name in ("CMTSOLUTION", "MULTIPLE_EVENTS", "CMTSOLUTION_NEW"):
+            filename = os.path.join(self.datapath, name)
+            cat = obspy.read_events(filename)
+            with open(filename, "rb") as fh:
+                table = scan_events(fh)
+            self.assertEqual(table._events, [None] * len(cat))
+            for key in cat.get_columns().dtype.names:
+                np.testing.assert_array_equal(table.get_columns()[key],
+                                              cat.get_columns()[key])
+            self.assertEqual(table[-1]._format, "CMTSOLUTION")
+            self.assertEqual(table.to_catalog(), cat)
+
+    def test_scan_events_with_invalid_origin_time(self):
+        """
+        Blocks with an invalid origin time are read by the event parser
+        which warns and sets the time to zero.
+        """
+        filename = os.path.join(self.datapath, "CMTSOLUTION")
+        with open(filename, "rb") as fh:
+            data = fh.read()
+        data += b"\n" + data.replace(b"2003 12 26", b"2003 13 26")
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            table = scan_events(io.BytesIO(data), format="CMTSOLUTION")
+        self.assertEqual(len(w), 1)
+        self.assertIn("Could not determine origin time", str(w[0].message))
+        self.assertIsNone(table._events[0])
+        self.assertIsNotNone(table._events[1])
+        # the centroid time shift is added to the epoch
+        self.assertEqual(table.get_columns()["time"][1], 5730000000)
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            cat = obspy.read_events(io.BytesIO(data))
+        for key in cat.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          cat.get_columns()[key])
+
+    def test_scan_events_without_centroid(self):
+        """
+        Blocks without the centroid lines or with a zero moment tensor can
+        not be scanned, just like they can not be read.
+        """
+        filename = os.path.join(self.datapath, "CMTSOLUTION")
+        with open(filename, "rb") as fh:
+            lines = fh.read().splitlines()
+        data = b"\n".join(lines[:2]) + b"\n"
+        self.assertRaises(IndexError, obspy.read_events, io.BytesIO(data),
+                          format="CMTSOLUTION")
+        self.assertRaises(IndexError, scan_events, io.BytesIO(data),
+                          format="CMTSOLUTION")
+        data = b"\n".join(lines[:7] + [_l[:4] + b"0.0" for _l in lines[7:]])
+        self.assertRaises(ValueError, obspy.read_events, io.BytesIO(data),
+                          format="CMTSOLUTION")
+        self.assertRaises(ValueError, scan_events, io.BytesIO(data),
+                          format="CMTSOLUTION")
+
 
 def suite():
     return unittest.makeSuite(CmtsolutionTestCase, "test")
@@ -5,13 +5,16 @@ CSS bindings to ObsPy core module.
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
+import fnmatch
 import os
 
 import numpy as np
 
 from obspy import Stream, Trace, UTCDateTime
 from obspy.core.compatibility import from_buffer
+from obspy.core.util.decorator import map_example_filename
 
 
 DTYPE = {
@@ -106,7 +109,253 @@ def _is_nnsa_kb_core(filename):
     return True
 
 
-def _read_css(filename, **kwargs):
+# column ranges of the wfdisc fields used, for both supported layouts
+WFDISC_COLUMNS = {
+    'CSS': {
+        'station': (0, 6), 'channel': (7, 15), 'starttime': (16, 33),
+        'npts': (79, 87), 'sampling_rate': (88, 99), 'calib': (100, 116),
+        'calper': (117, 133), 'datatype': (143, 145), 'dir': (148, 212),
+        'dfile': (213, 245), 'offset': (246, 256)},
+    'NNSA_KB_CORE': {
+        'station': (0, 6), 'channel': (7, 15), 'starttime': (16, 33),
+        'npts': (80, 88), 'sampling_rate': (89, 100), 'calib': (101, 117),
+        'calper': (118, 134), 'datatype': (144, 146), 'dir': (149, 213),
+        'dfile': (214, 246), 'offset': (247, 257)},
+}
+WFDISC_LINE_LENGTH = {'CSS': 283, 'NNSA_KB_CORE': 287}
+
+
+class WfdiscIndex(object):
+    """
+    Index of all waveform segments listed in a CSS or NNSA KB Core wfdisc
+    file.
+
+    The wfdisc table is parsed once into a NumPy structured array
+    (:attr:`rows`) with the fields ``station``, ``channel``, ``starttime``
+    (POSIX timestamp), ``endtime``, ``npts``, ``sampling_rate``, ``calib``,
+    ``calper``, ``datatype``, ``filename`` and ``offset``. Segments can be
+    selected by station, channel and time and only the requested sample
+    ranges are read from the referenced waveform files.
+
+    :type filename: str
+    :param filename: wfdisc file.
+    :type format: str
+    :param format: ``"CSS"`` or ``"NNSA_KB_CORE"``.
+
+    .. rubric:: Example
+
+    >>> from obspy import UTCDateTime
+    >>> from obspy.io.css.core import WfdiscIndex
+    >>> index = WfdiscIndex("/path/to/test_css.wfdisc")
+    >>> print(index.rows['station'])
+    ['TESTbe' 'TESTbe' 'TESTbe' 'TESTle' 'TESTle' 'TESTle']
+    >>> print(index.select(channel="HHZ"))
+    [0 3]
+    >>> st = index.read(channel="HHZ",
+    ...                 starttime=UTCDateTime(1296474910),
+    ...                 endtime=UTCDateTime(1296474920))
+    >>> print(st)  # doctest: +ELLIPSIS
+    2 Trace(s) in Stream:
+    .TESTbe..HHZ | 2011-01-31T11:55:10.000000Z - ... | 80.0 Hz, 801 samples
+    .TESTle..HHZ | 2011-01-31T11:55:10.000000Z - ... | 80.0 Hz, 801 samples
+    """
+    @map_example_filename("filename")
+    def __init__(self, filename, format="CSS"):
+        self.filename = filename
+        self.format = format
+        self.rows = _parse_wfdisc(filename, format)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def select(self, station=None, channel=None, starttime=None,
+               endtime=None):
+        """
+        Returns the indices of all rows matching the given criteria.
+
+        :type station: str, optional
+        :param station: Station code, may contain wildcards.
+        :type channel: str, optional
+        :param channel: Channel code, may contain wildcards.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param starttime: Only rows with data at or after this time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param endtime: Only rows with data at or before this time.
+        :rtype: :class:`numpy.ndarray`
+        """
+        rows = self.rows
+        mask = np.ones(len(rows), dtype=np.bool_)
+        for key, pattern in (('station', station), ('channel', channel)):
+            if pattern is None:
+                continue
+            values = np.unique(rows[key])
+            matches = [value for value in values
+                       if fnmatch.fnmatch(value.upper(), pattern.upper())]
+            mask &= np.in1d(rows[key], matches)
+        if starttime is not None:
+            mask &= rows['endtime'] >= float(starttime)
+        if endtime is not None:
+            mask &= rows['starttime'] <= float(endtime)
+        return np.nonzero(mask)[0]
+
+    def read(self, station=None, channel=None, starttime=None, endtime=None,
+             headonly=False):
+        """
+        Reads the selected waveform segments.
+
+        Only the samples within the given time window are read from the
+        waveform files, plus at most one sample at each side so that the
+        traces can be trimmed to the requested window afterwards.
+
+        :type station: str, optional
+        :param station: Station code, may contain wildcards.
+        :type channel: str, optional
+        :param channel: Channel code, may contain wildcards.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param starttime: Start of time window to read.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`,
+            optional
+        :param endtime: End of time window to read.
+        :type headonly: bool, optional
+        :param headonly: Do not read any data.
+        :rtype: :class:`~obspy.core.stream.Stream`
+        """
+        traces = []
+        files = {}
+        try:
+            for i in self.select(station, channel):
+                row = self.rows[i]
+                first, last = _sample_range(row, starttime, endtime)
+                if first >= last:
+                    # no data in time window
+                    continue
+                header = {}
+                header['station'] = row['station']
+                header['channel'] = row['channel']
+                header['starttime'] = UTCDateTime(float(row['starttime']))
+                if first:
+                    header['starttime'] += first * (
+                        1.0 / float(row['sampling_rate']))
+                header['sampling_rate'] = float(row['sampling_rate'])
+                header['calib'] = float(row['calib'])
+                header['calper'] = float(row['calper'])
+                if headonly:
+                    header['npts'] = int(last - first)
+                    traces.append(Trace(header=header))
+                    continue
+                dtype = DTYPE[row['datatype']]
+                if isinstance(dtype, tuple):
+                    read_fmt = np.dtype(dtype[0])
+                    fmt = dtype[1]
+                else:
+                    read_fmt = np.dtype(dtype)
+                    fmt = read_fmt
+                filename = row['filename']
+                if filename not in files:
+                    files[filename] = open(filename, "rb")
+                fh = files[filename]
+                fh.seek(int(row['offset']) + first * read_fmt.itemsize)
+                data = fh.read(read_fmt.itemsize * int(last - first))
+                data = from_buffer(data, dtype=read_fmt)
+                data = np.require(data, dtype=fmt)
+                traces.append(Trace(data, header=header))
+        finally:
+            for fh in files.values():
+                fh.close()
+        return Stream(traces=traces)
+
+
+def _parse_wfdisc(filename, format):
+    """
+    Parses all rows of a wfdisc file into a NumPy structured array.
+
+    :type filename: str
+    :param filename: wfdisc file.
+    :type format: str
+    :param format: ``"CSS"`` or ``"NNSA_KB_CORE"``.
+    :rtype: :class:`numpy.ndarray`
+    """
+    columns = WFDISC_COLUMNS[format]
+    length = WFDISC_LINE_LENGTH[format]
+    with open(filename, "rb") as fh:
+        lines = [line.rstrip(b"\n\r").ljust(length)[:length]
+                 for line in fh.read().splitlines() if line.strip()]
+    # view fixed width lines as records of byte strings
+    names = sorted(columns)
+    dtype = np.dtype({
+        'names': [native_str(name) for name in names],
+        'formats': ['S%d' % (columns[name][1] - columns[name][0])
+                    for name in names],
+        'offsets': [columns[name][0] for name in names],
+        'itemsize': length})
+    raw = np.frombuffer(b"".join(lines), dtype=dtype)
+
+    def _decode(values):
+        return np.char.decode(np.char.strip(values), 'utf-8')
+
+    basedir = os.path.dirname(filename)
+    paths = [os.path.join(basedir, dirname, dfile) for dirname, dfile in
+             zip(_decode(raw['dir']), _decode(raw['dfile']))]
+    rows = np.empty(len(raw), dtype=[
+        (native_str('station'), native_str('U6')),
+        (native_str('channel'), native_str('U8')),
+        (native_str('starttime'), np.float64),
+        (native_str('endtime'), np.float64),
+        (native_str('npts'), np.int64),
+        (native_str('sampling_rate'), np.float64),
+        (native_str('calib'), np.float64),
+        (native_str('calper'), np.float64),
+        (native_str('datatype'), native_str('S2')),
+        (native_str('filename'), object),
+        (native_str('offset'), np.int64)])
+    rows['station'] = _decode(raw['station'])
+    rows['channel'] = _decode(raw['channel'])
+    for key in ('starttime', 'sampling_rate', 'calib', 'calper'):
+        rows[key] = raw[key].astype(np.float64)
+    for key in ('npts', 'offset'):
+        rows[key] = raw[key].astype(np.int64)
+    rows['datatype'] = raw['datatype']
+    rows['filename'] = paths
+    # time of last sample
+    rows['endtime'] = rows['starttime'] + \
+        (rows['npts'] - 1) / rows['sampling_rate']
+    return rows
+
+
+def _sample_range(row, starttime=None, endtime=None):
+    """
+    Returns the range of samples of a wfdisc row covering the given time
+    window, including one additional sample at each side.
+    """
+    npts = int(row['npts'])
+    first, last = 0, npts
+    offset = float(row['starttime'])
+    sampling_rate = float(row['sampling_rate'])
+    if starttime is not None:
+        first = int(np.floor((float(starttime) - offset) * sampling_rate))
+        first = min(max(first, 0), npts)
+    if endtime is not None:
+        last = int(np.ceil((float(endtime) - offset) * sampling_rate)) + 1
+        last = min(max(last, 0), npts)
+    return first, last
+
+
+def _read_wfdisc(filename, format, starttime=None, endtime=None,
+                 headonly=False, station=None, channel=None, **kwargs):
+    """
+    Reads the waveform segments of a wfdisc file, see
+    :meth:`WfdiscIndex.read`.
+    """
+    index = WfdiscIndex(filename, format=format)
+    return index.read(station=station, channel=channel, starttime=starttime,
+                      endtime=endtime, headonly=headonly)
+
+
+def _read_css(filename, starttime=None, endtime=None, headonly=False,
+              station=None, channel=None, **kwargs):
     """
     Reads a CSS waveform file and returns a Stream object.
 
@@ -116,46 +365,41 @@ def _read_css(filename, **kwargs):
 
     :type filename: str
     :param filename: CSS file to be read.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param starttime: Only read samples at or after this time.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param endtime: Only read samples at or before this time.
+    :type headonly: bool, optional
+    :param headonly: Only read the wfdisc file.
+    :type station: str, optional
+    :param station: Only read segments of matching stations, may contain
+        wildcards.
+    :type channel: str, optional
+    :param channel: Only read segments of matching channels, may contain
+        wildcards.
     :rtype: :class:`~obspy.core.stream.Stream`
     :returns: Stream with Traces specified by given file.
+
+    .. rubric:: Example
+
+    Only the requested time window is read from the waveform files:
+
+    >>> from obspy import read, UTCDateTime
+    >>> st = read("/path/to/test_css.wfdisc", channel="HHZ",
+    ...           starttime=UTCDateTime(1296474910),
+    ...           endtime=UTCDateTime(1296474920))
+    >>> print(st)  # doctest: +ELLIPSIS
+    2 Trace(s) in Stream:
+    .TESTbe..HHZ | 2011-01-31T11:55:10.000000Z - ... | 80.0 Hz, 801 samples
+    .TESTle..HHZ | 2011-01-31T11:55:10.000000Z - ... | 80.0 Hz, 801 samples
     """
-    # read metafile with info on single traces
-    with open(filename, "rb") as fh:
-        lines = fh.readlines()
-    basedir = os.path.dirname(filename)
-    traces = []
-    # read single traces
-    for line in lines:
-        npts = int(line[79:87])
-        dirname = line[148:212].strip().decode()
-        filename = line[213:245].strip().decode()
-        filename = os.path.join(basedir, dirname, filename)
-        offset = int(line[246:256])
-        dtype = DTYPE[line[143:145]]
-        if isinstance(dtype, tuple):
-            read_fmt = np.dtype(dtype[0])
-            fmt = dtype[1]
-        else:
-            read_fmt = np.dtype(dtype)
-            fmt = read_fmt
-        with open(filename, "rb") as fh:
-            fh.seek(offset)
-            data = fh.read(read_fmt.itemsize * npts)
-            data = from_buffer(data, dtype=read_fmt)
-            data = np.require(data, dtype=fmt)
-        header = {}
-        header['station'] = line[0:6].strip().decode()
-        header['channel'] = line[7:15].strip().decode()
-        header['starttime'] = UTCDateTime(float(line[16:33]))
-        header['sampling_rate'] = float(line[88:99])
-        header['calib'] = float(line[100:116])
-        header['calper'] = float(line[117:133])
-        tr = Trace(data, header=header)
-        traces.append(tr)
-    return Stream(traces=traces)
-
-
-def _read_nnsa_kb_core(filename, **kwargs):
+    return _read_wfdisc(filename, "CSS", starttime=starttime,
+                        endtime=endtime, headonly=headonly, station=station,
+                        channel=channel)
+
+
+def _read_nnsa_kb_core(filename, starttime=None, endtime=None,
+                       headonly=False, station=None, channel=None, **kwargs):
     """
     Reads a NNSA KB Core waveform file and returns a Stream object.
 
@@ -165,40 +409,21 @@ def _read_nnsa_kb_core(filename, **kwargs):
 
     :type filename: str
     :param filename: NNSA KB Core file to be read.
+    :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param starttime: Only read samples at or after this time.
+    :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`, optional
+    :param endtime: Only read samples at or before this time.
+    :type headonly: bool, optional
+    :param headonly: Only read the wfdisc file.
+    :type station: str, optional
+    :param station: Only read segments of matching stations, may contain
+        wildcards.
+    :type channel: str, optional
+    :param channel: Only read segments of matching channels, may contain
+        wildcards.
     :rtype: :class:`~obspy.core.stream.Stream`
     :returns: Stream with Traces specified by given file.
     """
-    # read metafile with info on single traces
-    with open(filename, "rb") as fh:
-        lines = fh.readlines()
-    basedir = os.path.dirname(filename)
-    traces = []
-    # read single traces
-    for line in lines:
-        npts = int(line[80:88])
-        dirname = line[149:213].strip().decode()
-        filename = line[214:246].strip().decode()
-        filename = os.path.join(basedir, dirname, filename)
-        offset = int(line[247:257])
-        dtype = DTYPE[line[144:146]]
-        if isinstance(dtype, tuple):
-            read_fmt = np.dtype(dtype[0])
-            fmt = dtype[1]
-        else:
-            read_fmt = np.dtype(dtype)
-            fmt = read_fmt
-        with open(filename, "rb") as fh:
-            fh.seek(offset)
-            data = fh.read(read_fmt.itemsize * npts)
-            data = from_buffer(data, dtype=read_fmt)
-            data = np.require(data, dtype=fmt)
-        header = {}
-        header['station'] = line[0:6].strip().decode()
-        header['channel'] = line[7:15].strip().decode()
-        header['starttime'] = UTCDateTime(float(line[16:33]))
-        header['sampling_rate'] = float(line[89:100])
-        header['calib'] = float(line[101:117])
-        header['calper'] = float(line[118:134])
-        tr = Trace(data, header=header)
-        traces.append(tr)
-    return Stream(traces=traces)
+    return _read_wfdisc(filename, "NNSA_KB_CORE", starttime=starttime,
+                        endtime=endtime, headonly=headonly, station=station,
+                        channel=channel)
@@ -16,8 +16,8 @@ import numpy as np
 from obspy import read
 from obspy.core import Stream, Trace, UTCDateTime
 from obspy.core.util import NamedTemporaryFile
-from obspy.io.css.core import (_is_css, _read_css, _is_nnsa_kb_core,
-                               _read_nnsa_kb_core)
+from obspy.io.css.core import (WfdiscIndex, _is_css, _read_css,
+                               _is_nnsa_kb_core, _read_nnsa_kb_core)
 
 
 class CoreTestCase(unittest.TestCase):
@@ -122,6 +122,83 @@ class CoreTestCase(unittest.TestCase):
             tr.stats.pop('_format')
         self.assertEqual(st, self.st_result_nnsa)
 
+    def test_wfdisc_index(self):
+        """
+        Test parsing and querying the wfdisc table.
+        """
+        for filename, format in ((self.filename_css, 'CSS'),
+                                 (self.filename_nnsa, 'NNSA_KB_CORE')):
+            index = WfdiscIndex(filename, format=format)
+            self.assertEqual(len(index), 6)
+            rows = index.rows
+            self.assertEqual(rows['channel'].tolist(),
+                             ['HHZ', 'HHE', 'HHN'] * 2)
+            np.testing.assert_array_equal(rows['npts'], 4800)
+            np.testing.assert_array_equal(rows['sampling_rate'], 80.0)
+            np.testing.assert_array_equal(rows['starttime'], 1296474900.0)
+            np.testing.assert_array_equal(rows['endtime'],
+                                          1296474900.0 + 4799 / 80.0)
+            self.assertEqual(rows['offset'].tolist(),
+                             [0, 19200, 38400] * 2)
+            self.assertEqual(os.path.basename(rows['filename'][3]),
+                             '201101311155.10.le.w')
+            # queries
+            self.assertEqual(index.select(station='TESTLE').tolist(),
+                             [3, 4, 5])
+            self.assertEqual(index.select(channel='HH[EN]').tolist(),
+                             [1, 2, 4, 5])
+            self.assertEqual(index.select(station='*be', channel='HHZ')
+                             .tolist(), [0])
+            t = UTCDateTime(1296474900.0)
+            self.assertEqual(len(index.select(starttime=t + 60)), 0)
+            self.assertEqual(len(index.select(endtime=t - 1)), 0)
+            self.assertEqual(len(index.select(starttime=t + 10,
+                                              endtime=t + 20)), 6)
+
+    def test_read_time_window(self):
+        """
+        Reading a time window only reads the needed samples, the result
+        has to match trimming the full traces.
+        """
+        t = UTCDateTime(1296474900.0)
+        for filename in (self.filename_css, self.filename_nnsa):
+            full = read(filename)
+            for starttime, endtime in ((t + 10, t + 20), (t + 10.01, None),
+                                       (None, t + 0.03), (t - 5, t + 70),
+                                       (t + 59.98, t + 59.99)):
+                for nearest_sample in (True, False):
+                    st = read(filename, starttime=starttime, endtime=endtime,
+                              nearest_sample=nearest_sample)
+                    # same as obspy.read() on the full traces
+                    expected = full.copy()
+                    if starttime:
+                        expected._ltrim(starttime,
+                                        nearest_sample=nearest_sample)
+                    if endtime:
+                        expected._rtrim(endtime,
+                                        nearest_sample=nearest_sample)
+                    self.assertEqual(st, expected)
+            # at most one additional sample at each side before trimming
+            st = _read_css(self.filename_css, starttime=t + 10.01,
+                           endtime=t + 19.99)
+            self.assertEqual(st[0].stats.starttime, t + 10)
+            self.assertEqual(st[0].stats.npts, 801)
+            # no data in time window
+            self.assertEqual(len(read(filename, starttime=t + 61)), 0)
+
+    def test_read_station_and_channel(self):
+        """
+        Test selecting segments by station and channel when reading.
+        """
+        st = read(self.filename_css, station='TESTle', channel='HHN')
+        self.assertEqual(st, self.st_result_css.select(station='TESTle',
+                                                       channel='HHN'))
+        st = read(self.filename_nnsa, channel='HH?', headonly=True)
+        self.assertEqual(len(st), 6)
+        for tr in st:
+            self.assertEqual(tr.stats.npts, 4800)
+            self.assertEqual(len(tr.data), 0)
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+obspy.io.eventcache - Binary catalog cache read/write support.
+==============================================================
+
+This module provides read and write support for EVENTCACHE files, a compact
+binary format to store catalogs that are read many times, e.g. catalogs
+originally read from large QuakeML files.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+
+
+Usage Example
+-------------
+
+The EVENTCACHE reader and writer hooks into the standard ObsPy event handling
+mechanisms including format autodetection.
+
+>>> from obspy.core.event import read_events
+>>> cat = read_events()
+>>> cat.write('example.evc', format='EVENTCACHE')  # doctest: +SKIP
+>>> cat2 = read_events('example.evc')  # doctest: +SKIP
+>>> cat2 == cat  # doctest: +SKIP
+True
+
+Picks are often the largest part of a catalog. Passing ``picks=False`` skips
+reading their arrays from the file and returns the events without any picks
+(they are not loaded later when accessed):
+
+>>> cat = read_events('example.evc', picks=False)  # doctest: +SKIP
+
+With ``lazy_picks=True`` the arrays of the picks are read, but the picks of an
+event are only created when its picks are first accessed, e.g. by
+``event.picks`` or by resolving the ``pick_id`` of one of its arrivals:
+
+>>> cat = read_events('example.evc', lazy_picks=True)  # doctest: +SKIP
+>>> arrival = cat[0].origins[0].arrivals[0]  # doctest: +SKIP
+>>> arrival.pick_id.get_referred_object()  # doctest: +SKIP
+Pick(...)
+
+:func:`~obspy.core.event.scan_events` computes the columns of
+:meth:`Catalog.get_columns() <obspy.core.event.Catalog.get_columns>` directly
+from the stored arrays, events are only created when they are accessed:
+
+>>> from obspy.core.event import scan_events
+>>> table = scan_events('example.evc')  # doctest: +SKIP
+>>> print(table)  # doctest: +SKIP
+3 Event(s) in CatalogTable
+
+
+The EVENTCACHE Format
+---------------------
+
+An EVENTCACHE file consists of a short header with a JSON index of all
+stored arrays followed by the raw little endian data of the arrays, so single
+arrays can be read without reading the whole file. Like all event formats,
+gzip or bzip2 compressed files are read transparently.
+
+Every container of the QuakeML data model (e.g. the origins of all events or
+the arrivals of all origins) is stored as a table with one array per
+attribute. Attributes of nested objects (e.g. ``quality.standard_error`` of
+an origin) are stored in arrays of the same table, the ``_parent`` array of
+a table holds the row of the object containing each object. All strings,
+enumeration values and resource identifiers are stored once in a single
+string pool. Missing values are ``NaN`` for floats and the smallest 64 bit
+integer for integers and times (in nanoseconds). Custom tags in the
+``extra`` attribute of objects are stored as JSON strings.
+
+Reading a written catalog returns an equal catalog, i.e. writing it to
+QuakeML results in the same document. Only values of custom tags that are
+no strings, numbers, booleans or nested tags (e.g.
+:class:`~obspy.core.utcdatetime.UTCDateTime` objects) are returned as
+strings like when reading QuakeML.
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,656 @@
+# -*- coding: utf-8 -*-
+"""
+EVENTCACHE bindings to ObsPy core module.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+import functools
+import json
+import struct
+
+import numpy as np
+
+from obspy.core.event import (Amplitude, Arrival, Catalog, Comment,
+                              CompositeTime, CreationInfo, DataUsed, Event,
+                              EventDescription, FocalMechanism, Magnitude,
+                              Origin, Pick, ResourceIdentifier,
+                              StationMagnitude, StationMagnitudeContribution,
+                              WaveformStreamID)
+from obspy.core.event.base import (QuantityError, _LazyContainerList,
+                                   _yield_resource_id_parent_attr)
+from obspy.core.event.catalog import CATALOG_COLUMNS_DTYPE, NO_TIME
+from obspy.core.event.table import CatalogTable
+from obspy.core.util import AttribDict
+from obspy.core.utcdatetime import UTCDateTime
+
+
+# start of every EVENTCACHE file, followed by the version of the layout of
+# the arrays and the length of the JSON index of the arrays
+MAGIC = b"OBSPYEVC"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct(native_str("<IQ"))
+# arrays start at multiples of this number of bytes
+_ALIGNMENT = 8
+
+# marks missing values in integer and boolean columns
+NO_INT = np.iinfo(np.int64).min
+NO_BOOL = -1
+
+# classes of the objects in the containers of the event types
+_CONTAINER_TYPES = {
+    "amplitudes": Amplitude,
+    "arrivals": Arrival,
+    "comments": Comment,
+    "composite_times": CompositeTime,
+    "data_used": DataUsed,
+    "event_descriptions": EventDescription,
+    "events": Event,
+    "focal_mechanisms": FocalMechanism,
+    "magnitudes": Magnitude,
+    "origins": Origin,
+    "picks": Pick,
+    "station_magnitude_contributions": StationMagnitudeContribution,
+    "station_magnitudes": StationMagnitude,
+    "waveform_id": WaveformStreamID}
+
+_QUANTITY_ERROR_KEYS = ("uncertainty", "lower_uncertainty",
+                        "upper_uncertainty", "confidence_level")
+
+# tables of the events and their first origins and magnitudes
+_EVENTS = "catalog.events"
+_ORIGINS = "catalog.events.origins"
+_MAGNITUDES = "catalog.events.magnitudes"
+_PICKS = "catalog.events.picks"
+
+
+class _CatalogHeader(object):
+    """
+    Attributes of a :class:`~obspy.core.event.Catalog` stored like the ones
+    of the event types, the description is stored separately as it may be
+    of any type.
+    """
+    _properties = [("resource_id", ResourceIdentifier),
+                   ("creation_info", CreationInfo)]
+    _containers = ["comments", "events"]
+
+
+class Packer(object):
+    """
+    Flattens event type objects into the columns of tables.
+
+    Every container (e.g. the origins of all events) is stored as one table
+    with a column for every attribute, attributes of nested types (e.g.
+    ``quality.standard_error`` of an origin) are stored in columns of the
+    same table. The ``_parent`` column of a table holds the row of the
+    object containing each object. Columns without any values are not
+    stored. All strings and resource identifiers are stored in a single
+    string pool.
+    """
+    def __init__(self):
+        self.arrays = {}
+        self._strings = {}
+
+    def add(self, table, cls, objects, parents=None):
+        """
+        Adds the objects of a table and the objects of all their containers.
+        """
+        if parents is not None:
+            self.arrays[table + ":_parent"] = np.array(parents,
+                                                       dtype=np.int64)
+        self._add_columns(table, "", cls, objects)
+
+    def add_catalog(self, catalog):
+        """
+        Adds a catalog with all its events.
+        """
+        self.add("catalog", _CatalogHeader, [catalog])
+        description = catalog.description
+        if isinstance(description, str):
+            self._add("catalog:description", str, [description])
+        else:
+            self._add("catalog:description.json", str, [json.dumps(
+                description, default=_to_json)])
+        # namespace abbreviations used when writing QuakeML
+        nsmap = getattr(catalog, "nsmap", None)
+        if nsmap is not None:
+            self._add("catalog:nsmap", str,
+                      [json.dumps(list(nsmap.items()))])
+
+    def get_arrays(self):
+        """
+        Returns all arrays to be stored.
+        """
+        strings = [_i.encode("utf-8")
+                   for _i in sorted(self._strings, key=self._strings.get)]
+        offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(_i) for _i in strings])
+        arrays = dict(self.arrays)
+        arrays["strings"] = np.frombuffer(b"".join(strings), dtype=np.uint8)
+        arrays["string_offsets"] = offsets
+        return arrays
+
+    def _add_columns(self, table, prefix, cls, objects):
+        """
+        Adds the columns of the attributes of objects of the given type,
+        ``None`` for objects of a nested type that are not set.
+        """
+        name = "%s:%s" % (table, prefix)
+        for key, attrib_type in cls._properties:
+            values = [None if _o is None else getattr(_o, key, None)
+                      for _o in objects]
+            if attrib_type is QuantityError:
+                # readers may leave error quantities unset
+                present = [_v is not None for _o, _v in zip(objects, values)
+                           if _o is not None]
+                if not all(present):
+                    self.arrays[name + key] = np.array(
+                        [_v is not None for _v in values], dtype=np.bool_)
+                for error_key in _QUANTITY_ERROR_KEYS:
+                    self._add(
+                        "%s%s.%s" % (name, key, error_key), float,
+                        [None if _v is None else _v.get(error_key)
+                         for _v in values])
+            elif hasattr(attrib_type, "_property_dict"):
+                present = [_v is not None for _v in values]
+                if any(present):
+                    self.arrays[name + key] = np.array(present,
+                                                       dtype=np.bool_)
+                    self._add_columns(table, prefix + key + ".", attrib_type,
+                                      values)
+            else:
+                self._add(name + key, attrib_type, values)
+        extras = [None if _o is None else getattr(_o, "extra", None)
+                  for _o in objects]
+        self._add(name + "extra", str,
+                  [None if _e is None else json.dumps(_e, default=_to_json)
+                   for _e in extras])
+        for key in cls._containers:
+            if key not in _CONTAINER_TYPES:
+                msg = "Can not store container '%s' of %s." % (
+                    key, cls.__name__)
+                raise TypeError(msg)
+            children = []
+            parents = []
+            for _i, obj in enumerate(objects):
+                if obj is None:
+                    continue
+                items = getattr(obj, key)
+                children.extend(items)
+                parents.extend([_i] * len(items))
+            if children:
+                self.add(table + "." + prefix + key, _CONTAINER_TYPES[key],
+                         children, parents)
+
+    def _add(self, name, attrib_type, values):
+        """
+        Adds a single column if any of the values is set.
+        """
+        if all(_v is None for _v in values):
+            return
+        if attrib_type is float and not all(
+                isinstance(_v, int) and not isinstance(_v, bool)
+                for _v in values if _v is not None):
+            column = np.array([np.nan if _v is None else _v for _v in values],
+                              dtype=np.float64)
+        elif attrib_type in (int, float):
+            # also keeps integer values of floats, e.g. uncertainties
+            # read from QuakeML
+            column = np.array([NO_INT if _v is None else _v for _v in values],
+                              dtype=np.int64)
+        elif attrib_type is bool:
+            column = np.array([NO_BOOL if _v is None else _v
+                               for _v in values], dtype=np.int8)
+        elif attrib_type is UTCDateTime:
+            column = np.array([NO_TIME if _v is None else _v._ns
+                               for _v in values], dtype=np.int64)
+        else:
+            # strings, enums and resource identifiers
+            if attrib_type is ResourceIdentifier:
+                values = [None if _v is None else _v.id for _v in values]
+            strings = self._strings
+            column = np.array([
+                -1 if _v is None else strings.setdefault(_v, len(strings))
+                for _v in values], dtype=np.int32)
+        self.arrays[name] = column
+
+
+class Unpacker(object):
+    """
+    Creates event type objects from the columns of the tables stored by
+    :class:`Packer`.
+
+    Arrays are only loaded from the file when they are needed.
+
+    :type arrays: dict-like
+    :param arrays: All stored arrays, e.g. an :class:`ArrayReader`.
+    :type picks: bool
+    :param picks: If ``False``, no picks are created.
+    :type lazy_picks: bool
+    :param lazy_picks: If ``True``, the picks of an event are only created
+        when they are first accessed. All arrays of the picks are loaded
+        right away, so the arrays are not needed afterwards.
+    """
+    def __init__(self, arrays, picks=True, lazy_picks=False):
+        self._arrays = arrays
+        self._names = set(arrays.keys())
+        self._cache = {}
+        self.picks = picks
+        self.lazy_picks = picks and lazy_picks
+        if self.lazy_picks:
+            for name in self._names:
+                if name.startswith((_PICKS + ":", _PICKS + ".")):
+                    self._get(name)
+        blob = arrays["strings"].tobytes()
+        offsets = arrays["string_offsets"].tolist()
+        self._strings = [blob[_i:_j].decode("utf-8")
+                         for _i, _j in zip(offsets[:-1], offsets[1:])]
+
+    def get_catalog(self):
+        """
+        Returns the catalog with all events.
+        """
+        kwargs, extras = self._get_kwargs("catalog", _CatalogHeader,
+                                          np.zeros(1, dtype=np.intp))
+        catalog = Catalog(**kwargs[0])
+        for key, decode in (("description", lambda _i: _i),
+                            ("description.json", json.loads)):
+            description = self._get("catalog:" + key)
+            if description is not None:
+                catalog.description = decode(
+                    self._decode(str, description)[0])
+        if extras[0] is not None:
+            catalog.extra = extras[0]
+        nsmap = self._get("catalog:nsmap")
+        if nsmap is not None:
+            catalog.nsmap = dict(json.loads(self._decode(str, nsmap)[0]))
+        return catalog
+
+    def get_events(self, rows):
+        """
+        Returns the events of the given rows of the events table.
+        """
+        return self._create(_EVENTS, Event, np.asarray(rows, dtype=np.intp))
+
+    def get_columns(self):
+        """
+        Returns the columns of
+        :meth:`Catalog.get_columns() <obspy.core.event.Catalog.get_columns>`
+        of all events.
+        """
+        count = len(self._get(_EVENTS + ":_parent"))
+        columns = np.full(count, np.nan, dtype=CATALOG_COLUMNS_DTYPE)
+        columns["time"] = NO_TIME
+        for table, keys in (
+                (_ORIGINS, ("time", "latitude", "longitude", "depth",
+                            "quality.standard_error",
+                            "quality.azimuthal_gap",
+                            "quality.used_station_count",
+                            "quality.used_phase_count")),
+                (_MAGNITUDES, ("mag",))):
+            parents = self._get(table + ":_parent")
+            if parents is None:
+                continue
+            # the first object of each event
+            first = np.flatnonzero(np.concatenate(
+                [[True], parents[1:] != parents[:-1]]))
+            events = parents[first]
+            for key in keys:
+                column = self._get("%s:%s" % (table, key))
+                if column is None:
+                    continue
+                values = column[first]
+                if key == "time":
+                    columns["time"][events] = values
+                    continue
+                if values.dtype == np.int64:
+                    values = np.where(values == NO_INT, np.nan, values)
+                columns[key.split(".")[-1].replace("mag", "magnitude")][
+                    events] = values
+        return columns
+
+    def _get(self, name):
+        """
+        Returns a stored array or ``None`` if it is not stored.
+        """
+        if name not in self._names:
+            return None
+        try:
+            return self._cache[name]
+        except KeyError:
+            array = self._cache[name] = self._arrays[name]
+            return array
+
+    def _create(self, table, cls, rows, prefix=""):
+        """
+        Creates the objects of the given rows of a table.
+        """
+        kwargs, extras = self._get_kwargs(table, cls, rows, prefix)
+        objects = [cls._from_trusted(**_k) for _k in kwargs]
+        for obj, extra in zip(objects, extras):
+            if extra is not None:
+                obj.extra = extra
+        if self.lazy_picks and table == _EVENTS:
+            for obj, row in zip(objects, rows.tolist()):
+                picks = obj.__dict__["picks"] = _LazyContainerList(
+                    functools.partial(self._load_picks, obj, row))
+                # e.g. the pick ids of arrivals load the picks when resolved
+                for resource_id, _, attr in \
+                        _yield_resource_id_parent_attr(obj):
+                    if attr == "pick_id":
+                        picks._refer(resource_id)
+        return objects
+
+    def _load_picks(self, event, row, picks):
+        """
+        Adds the picks of a row of the events table to the picks of the
+        event and binds the resource identifiers of the event to its
+        objects, e.g. the pick ids of its arrivals to the new picks.
+        """
+        parents = self._get(_PICKS + ":_parent")
+        if parents is None:
+            return
+        start, end = np.searchsorted(parents, [row, row + 1]).tolist()
+        list.extend(picks, self._create(
+            _PICKS, Pick, np.arange(start, end, dtype=np.intp)))
+        event.scope_resource_ids()
+
+    def _get_kwargs(self, table, cls, rows, prefix=""):
+        """
+        Returns the keyword arguments and the extra attributes of the objects
+        of the given rows of a table.
+        """
+        count = len(rows)
+        name = "%s:%s" % (table, prefix)
+        values = {}
+        for key, attrib_type in cls._properties:
+            if attrib_type is QuantityError:
+                present = self._get(name + key)
+                columns = [self._get("%s%s.%s" % (name, key, _i))
+                           for _i in _QUANTITY_ERROR_KEYS]
+                if present is None and all(_i is None for _i in columns):
+                    continue
+                present = [True] * count if present is None \
+                    else present[rows].tolist()
+                columns = [[None] * count if _i is None
+                           else self._decode(float, _i[rows])
+                           for _i in columns]
+                values[key] = [
+                    QuantityError(*_i[1:]) if _i[0] else None
+                    for _i in zip(present, *columns)]
+            elif hasattr(attrib_type, "_property_dict"):
+                present = self._get(name + key)
+                if present is None:
+                    continue
+                present = np.flatnonzero(present[rows])
+                objects = [None] * count
+                for _i, obj in zip(present.tolist(), self._create(
+                        table, attrib_type, rows[present],
+                        prefix + key + ".")):
+                    objects[_i] = obj
+                values[key] = objects
+            else:
+                column = self._get(name + key)
+                if column is not None:
+                    values[key] = self._decode(attrib_type, column[rows])
+        for key in cls._containers:
+            if key == "picks" and (not self.picks or self.lazy_picks):
+                continue
+            child = table + "." + prefix + key
+            parents = self._get(child + ":_parent")
+            if parents is None:
+                continue
+            # all parents are sorted
+            starts = np.searchsorted(parents, rows, side="left")
+            ends = np.searchsorted(parents, rows, side="right")
+            counts = ends - starts
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+            child_rows = np.arange(offsets[-1], dtype=np.intp) + \
+                np.repeat(starts - offsets[:-1], counts)
+            objects = self._create(child, _CONTAINER_TYPES[key], child_rows)
+            values[key] = [objects[_i:_j] for _i, _j in
+                           zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        column = self._get(name + "extra")
+        if column is None:
+            extras = [None] * count
+        else:
+            extras = [None if _i is None else
+                      json.loads(_i, object_hook=AttribDict)
+                      for _i in self._decode(str, column[rows])]
+        keys = list(values.keys())
+        kwargs = [dict(zip(keys, _i)) for _i in zip(*values.values())] \
+            if keys else [{} for _ in range(count)]
+        return kwargs, extras
+
+    def _decode(self, attrib_type, column):
+        """
+        Converts a column to a list of values.
+        """
+        if attrib_type is float and column.dtype.kind == "f":
+            return [None if _i != _i else _i for _i in column.tolist()]
+        elif attrib_type in (int, float):
+            return [None if _i == NO_INT else _i for _i in column.tolist()]
+        elif attrib_type is bool:
+            return [None if _i == NO_BOOL else bool(_i)
+                    for _i in column.tolist()]
+        elif attrib_type is UTCDateTime:
+            return [None if _i == NO_TIME else UTCDateTime(ns=_i)
+                    for _i in column.tolist()]
+        strings = self._strings
+        if attrib_type is ResourceIdentifier:
+            return [None if _i < 0 else ResourceIdentifier(strings[_i])
+                    for _i in column.tolist()]
+        return [None if _i < 0 else strings[_i] for _i in column.tolist()]
+
+
+class ArrayReader(object):
+    """
+    Reads the arrays written by :func:`_write_arrays` from an open file, each
+    array is only read when it is accessed.
+
+    :type fh: file
+    :param fh: Open file positioned at the start of the EVENTCACHE data.
+    """
+    def __init__(self, fh):
+        if fh.read(len(MAGIC)) != MAGIC:
+            msg = "Not an EVENTCACHE file."
+            raise ValueError(msg)
+        version, length = _HEADER.unpack(fh.read(_HEADER.size))
+        if version > FORMAT_VERSION:
+            msg = "EVENTCACHE version %i is not supported." % version
+            raise ValueError(msg)
+        header_length = len(MAGIC) + _HEADER.size + length
+        index = json.loads(fh.read(length).decode("utf-8"))
+        self._fh = fh
+        self._start = fh.tell() + _padding(header_length)
+        self._index = dict((_i[0], _i[1:]) for _i in index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def __getitem__(self, name):
+        dtype, length, offset = self._index[name]
+        dtype = np.dtype(native_str(dtype))
+        self._fh.seek(self._start + offset, 0)
+        data = self._fh.read(length * dtype.itemsize)
+        return np.frombuffer(data, dtype=dtype)
+
+    def read_all(self):
+        """
+        Returns a dictionary with all arrays.
+        """
+        return dict((_i, self[_i]) for _i in self.keys())
+
+
+def _write_arrays(fh, arrays):
+    """
+    Writes one dimensional arrays to an open file.
+
+    The file starts with :data:`MAGIC`, the format version, the length of
+    the following JSON index with the name, little endian type, length and
+    offset of every array and the aligned data of all arrays.
+    """
+    index = []
+    data = []
+    offset = 0
+    for name in sorted(arrays):
+        array = np.ascontiguousarray(arrays[name])
+        array = array.astype(array.dtype.newbyteorder(native_str("<")),
+                             copy=False)
+        index.append([name, array.dtype.str, len(array), offset])
+        data.append(array.tobytes() + b"\0" * _padding(array.nbytes))
+        offset += len(data[-1])
+    index = json.dumps(index).encode("utf-8")
+    fh.write(MAGIC)
+    fh.write(_HEADER.pack(FORMAT_VERSION, len(index)))
+    fh.write(index)
+    fh.write(b"\0" * _padding(len(MAGIC) + _HEADER.size + len(index)))
+    for chunk in data:
+        fh.write(chunk)
+
+
+def _padding(length):
+    """
+    Returns the number of bytes needed to align data after length bytes.
+    """
+    return -length % _ALIGNMENT
+
+
+def _to_json(obj):
+    """
+    Converts the values of custom tags that are not JSON types, mappings
+    to dictionaries and everything else to strings like when writing
+    QuakeML.
+    """
+    if hasattr(obj, "items"):
+        return dict(obj.items())
+    return str(obj)
+
+
+def _is_eventcache(filename):
+    """
+    Checks whether a file is an EVENTCACHE file.
+
+    :type filename: str or file
+    :param filename: Name of the file to be checked or open file-like
+        object.
+    :rtype: bool
+    :return: ``True`` if EVENTCACHE file.
+
+    .. rubric:: Example
+
+    >>> _is_eventcache('/path/to/events.evc')  # doctest: +SKIP
+    True
+    """
+    if hasattr(filename, "tell") and hasattr(filename, "seek"):
+        position = filename.tell()
+    else:
+        position = None
+    try:
+        if position is None:
+            with open(filename, "rb") as fh:
+                return fh.read(len(MAGIC)) == MAGIC
+        return filename.read(len(MAGIC)) == MAGIC
+    except Exception:
+        return False
+    finally:
+        if position is not None:
+            filename.seek(position, 0)
+
+
+def _read_eventcache(filename, picks=True, lazy_picks=False,
+                     **kwargs):  # @UnusedVariable
+    """
+    Reads an EVENTCACHE file and returns an ObsPy Catalog object.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.event.read_events` function, call this
+        instead.
+
+    :type filename: str or file
+    :param filename: Name of the file to be read or open file-like object.
+    :type picks: bool, optional
+    :param picks: If ``False``, the picks of the events are not read and
+        the events are returned without picks.
+    :type lazy_picks: bool, optional
+    :param lazy_picks: If ``True``, the picks of each event are only
+        created when the picks of the event are first accessed.
+    :rtype: :class:`~obspy.core.event.Catalog`
+    :returns: An ObsPy Catalog object.
+    """
+    if hasattr(filename, "read"):
+        return Unpacker(ArrayReader(filename), picks=picks,
+                        lazy_picks=lazy_picks).get_catalog()
+    with open(filename, "rb") as fh:
+        return Unpacker(ArrayReader(fh), picks=picks,
+                        lazy_picks=lazy_picks).get_catalog()
+
+
+def _scan_eventcache(filename, **kwargs):  # @UnusedVariable
+    """
+    Scans an EVENTCACHE file and returns an ObsPy CatalogTable object.
+
+    All arrays are loaded at once, the events are only created when they
+    are accessed.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.event.scan_events` function, call this
+        instead.
+
+    :type filename: str or file
+    :param filename: Name of the file to be scanned or open file-like
+        object.
+    :rtype: :class:`~obspy.core.event.CatalogTable`
+    :returns: An ObsPy CatalogTable object.
+    """
+    if hasattr(filename, "read"):
+        arrays = ArrayReader(filename).read_all()
+    else:
+        with open(filename, "rb") as fh:
+            arrays = ArrayReader(fh).read_all()
+    unpacker = Unpacker(arrays)
+    columns = unpacker.get_columns()
+    return CatalogTable(columns, list(range(len(columns))),
+                        functools.partial(_get_event, unpacker))
+
+
+def _get_event(unpacker, row):
+    return unpacker.get_events([row])[0]
+
+
+def _write_eventcache(catalog, filename, **kwargs):  # @UnusedVariable
+    """
+    Writes a catalog to an EVENTCACHE file.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        the :meth:`~obspy.core.event.Catalog.write` method of an
+        ObsPy :class:`~obspy.core.event.Catalog` object, call this instead.
+
+    :type catalog: :class:`~obspy.core.event.Catalog`
+    :param catalog: The ObsPy Catalog object to write.
+    :type filename: str or file
+    :param filename: Name of the file to write or open file-like object.
+    """
+    packer = Packer()
+    packer.add_catalog(catalog)
+    if hasattr(filename, "write"):
+        _write_arrays(filename, packer.get_arrays())
+    else:
+        with open(filename, "wb") as fh:
+            _write_arrays(fh, packer.get_arrays())
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA @UnusedWildImport
+
+import glob
+import io
+import os
+import unittest
+import warnings
+
+import numpy as np
+
+import obspy
+from obspy import UTCDateTime
+from obspy.core.event import (Amplitude, Arrival, Catalog, Event, Origin,
+                              Pick, scan_events)
+from obspy.core.event.base import _ContainerList, _LazyContainerList
+from obspy.core.util import AttribDict
+from obspy.core.util.base import NamedTemporaryFile
+from obspy.io.eventcache.core import Packer, _is_eventcache
+
+
+class EventCacheTestCase(unittest.TestCase):
+    """
+    Test suite for obspy.io.eventcache.
+
+    The tests usually directly utilize the registered function with the
+    read_events() to also test the integration.
+    """
+    def setUp(self):
+        io_path = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        self.quakeml_path = os.path.join(io_path, "quakeml", "tests", "data")
+        self.ndk_file = os.path.join(io_path, "ndk", "tests", "data",
+                                     "C200604092050A.ndk")
+        self.fnetmt_file = os.path.join(io_path, "nied", "tests", "data",
+                                        "FNETMTCATALOG")
+
+    def _round_trip(self, catalog, **kwargs):
+        with io.BytesIO() as buf:
+            catalog.write(buf, format="EVENTCACHE")
+            buf.seek(0, 0)
+            return obspy.read_events(buf, **kwargs)
+
+    def _to_quakeml(self, catalog):
+        with io.BytesIO() as buf:
+            catalog.write(buf, format="QUAKEML")
+            return buf.getvalue()
+
+    def test_round_trip_quakeml_files(self):
+        """
+        Tests that writing and reading the catalogs of all QuakeML test files
+        does not change anything.
+        """
+        filenames = sorted(glob.glob(os.path.join(self.quakeml_path,
+                                                  "*.xml")))
+        self.assertTrue(filenames)
+        for filename in filenames:
+            with warnings.catch_warnings(record=True):
+                warnings.simplefilter("ignore")
+                cat = obspy.read_events(filename)
+            cat2 = self._round_trip(cat)
+            self.assertEqual(cat2, cat, msg=filename)
+            self.assertEqual(cat2.resource_id, cat.resource_id)
+            self.assertEqual(cat2.description, cat.description)
+            self.assertEqual(cat2.creation_info, cat.creation_info)
+            self.assertEqual(cat2.nsmap, cat.nsmap)
+            for event, event2 in zip(cat, cat2):
+                self.assertEqual(event2._format, "EVENTCACHE")
+                self.assertEqual(event2.resource_id, event.resource_id)
+                self.assertEqual(getattr(event2, "extra", None),
+                                 getattr(event, "extra", None))
+                # resource identifiers refer to the objects of their event
+                for origin in event2.origins:
+                    self.assertIs(origin.resource_id.get_referred_object(),
+                                  origin)
+
+    def test_round_trip_quakeml_output(self):
+        """
+        Tests that writing the read catalog to QuakeML results in the same
+        document, including integer uncertainties, unset error quantities
+        and custom namespaces.
+        """
+        for filename in ("quakeml_1.2_origin.xml", "quakeml_1.2_pick.xml",
+                         "quakeml_1.2_arrival.xml", "qml-example-1.2-RC3.xml",
+                         "usgs_event.xml"):
+            filename = os.path.join(self.quakeml_path, filename)
+            with warnings.catch_warnings(record=True):
+                warnings.simplefilter("ignore")
+                cat = obspy.read_events(filename)
+            self.assertEqual(self._to_quakeml(self._round_trip(cat)),
+                             self._to_quakeml(cat), msg=filename)
+
+    def test_round_trip_extra_tags(self):
+        """
+        Tests custom tags of the catalog, events and picks.
+        """
+        cat = obspy.read_events(
+            os.path.join(self.quakeml_path, "quakeml_1.2_origin.xml"))
+        cat.extra = AttribDict({
+            "catalog_tag": {"value": "abc",
+                            "namespace": "http://test.org/xmlns/0.1"}})
+        cat[0].extra = AttribDict({
+            "public": {"value": False,
+                       "namespace": "http://some-page.de/xmlns/1.0",
+                       "attrib": {"some_attrib": "some_value"}},
+            "new_tag": {"value": 1234,
+                        "namespace": "http://test.org/xmlns/0.1"},
+            "dataid": {"namespace": "http://anss.org/xmlns/catalog/0.1",
+                       "type": "attribute", "value": "00999999"},
+            "quantity": {"namespace": "http://some-page.de/xmlns/1.0",
+                         "value": {
+                             "my_nested_tag": {
+                                 "namespace": "http://some-page.de/xmlns/1.0",
+                                 "value": 1.23E10}}},
+            "tX": {"value": UTCDateTime("2013-01-02T13:12:14.600000Z"),
+                   "namespace": "http://test.org/xmlns/0.1"}})
+        pick = Pick()
+        pick.extra = {"weight": {"value": 2,
+                                 "namespace": "http://test.org/xmlns/0.1"}}
+        cat[0].picks.append(pick)
+        cat2 = self._round_trip(cat)
+        self.assertEqual(cat2, cat)
+        self.assertEqual(cat2.extra, cat.extra)
+        self.assertEqual(cat2[0].picks[-1].extra, cat[0].picks[-1].extra)
+        # values of other types than strings, numbers and booleans are
+        # stored as strings
+        expected = cat[0].extra.copy()
+        expected.tX.value = "2013-01-02T13:12:14.600000Z"
+        self.assertEqual(cat2[0].extra, expected)
+        self.assertEqual(self._to_quakeml(cat2), self._to_quakeml(cat))
+        # custom tags read from QuakeML
+        cat = obspy.read_events(io.BytesIO(self._to_quakeml(cat)))
+        cat2 = self._round_trip(cat)
+        self.assertEqual(cat2[0].extra, cat[0].extra)
+        self.assertEqual(self._to_quakeml(cat2), self._to_quakeml(cat))
+
+    def test_round_trip_other_formats(self):
+        """
+        Tests catalogs read from other formats, e.g. with a catalog
+        description that is not a string.
+        """
+        for filename in (self.ndk_file, self.fnetmt_file):
+            cat = obspy.read_events(filename)
+            cat2 = self._round_trip(cat)
+            self.assertEqual(cat2, cat)
+            self.assertEqual(cat2.description, cat.description)
+        cat = Catalog()
+        cat.description = None
+        cat2 = self._round_trip(cat)
+        self.assertEqual(len(cat2), 0)
+        self.assertEqual(cat2.description, None)
+
+    def test_read_without_picks(self):
+        """
+        Tests reading the events without their picks.
+        """
+        cat = obspy.read_events(
+            os.path.join(self.quakeml_path, "quakeml_1.2_pick.xml"))
+        self.assertTrue(cat[0].picks)
+        cat2 = self._round_trip(cat, picks=False)
+        self.assertEqual(cat2[0].picks, [])
+        cat2[0].picks = cat[0].picks
+        self.assertEqual(cat2, cat)
+
+    def test_read_lazy_picks(self):
+        """
+        Tests reading the events with picks that are created when accessed.
+        """
+        cat = obspy.read_events(
+            os.path.join(self.quakeml_path, "quakeml_1.2_pick.xml"))
+        event = cat[0]
+        event.origins.append(Origin(arrivals=[
+            Arrival(pick_id=_i.resource_id, phase="P") for _i in event.picks]))
+        event.amplitudes.append(Amplitude(generic_amplitude=1.0,
+                                          pick_id=event.picks[1].resource_id))
+        cat.events.insert(0, Event(origins=[Origin(latitude=1.0)]))
+        with NamedTemporaryFile() as tf:
+            cat.write(tf.name, format="EVENTCACHE")
+            cat2 = obspy.read_events(tf.name, lazy_picks=True)
+            cat3 = obspy.read_events(tf.name, lazy_picks=True)
+        # the picks of an event are created when first accessed
+        event = cat2[1]
+        self.assertIs(type(event.__dict__["picks"]), _LazyContainerList)
+        self.assertEqual(len(event.picks), 2)
+        self.assertIs(type(event.__dict__["picks"]), _ContainerList)
+        self.assertEqual(event.picks, cat[1].picks)
+        self.assertIs(event.origins[0].arrivals[1].pick_id
+                      .get_referred_object(), event.picks[1])
+        self.assertEqual(cat2[0].picks, [])
+        # resolving a pick id creates the picks of the event
+        event = cat3[1]
+        pick = event.amplitudes[0].pick_id.get_referred_object()
+        self.assertIs(type(event.__dict__["picks"]), _ContainerList)
+        self.assertIs(pick, event.picks[1])
+        self.assertIs(event.origins[0].arrivals[0].pick_id
+                      .get_referred_object(), event.picks[0])
+        self.assertEqual(cat3, cat)
+
+    def test_unknown_container(self):
+        """
+        Objects with containers of unknown types can not be stored.
+        """
+        class Unknown(object):
+            _properties = []
+            _containers = ["unknown"]
+            unknown = []
+
+        with self.assertRaises(TypeError) as e:
+            Packer().add("catalog.events", Unknown, [Unknown()])
+        self.assertEqual(str(e.exception),
+                         "Can not store container 'unknown' of Unknown.")
+
+    def test_scan_events(self):
+        """
+        Tests scanning EVENTCACHE files.
+        """
+        cat = obspy.read_events(
+            os.path.join(self.quakeml_path, "neries_events.xml"))
+        with NamedTemporaryFile() as tf:
+            cat.write(tf.name, format="EVENTCACHE")
+            table = scan_events(tf.name)
+        self.assertEqual(table._events, [None] * len(cat))
+        columns = table.get_columns()
+        for key in cat.get_columns().dtype.names:
+            np.testing.assert_array_equal(columns[key],
+                                          cat.get_columns()[key])
+        self.assertEqual(table[1], cat[1])
+        self.assertEqual(table[1]._format, "EVENTCACHE")
+        self.assertEqual(table.to_catalog(), cat)
+
+    def test_is_eventcache(self):
+        """
+        Tests the format detection of EVENTCACHE files.
+        """
+        cat = obspy.read_events()
+        with NamedTemporaryFile() as tf:
+            cat.write(tf.name, format="EVENTCACHE")
+            self.assertTrue(_is_eventcache(tf.name))
+            self.assertEqual(obspy.read_events(tf.name), cat)
+            with open(tf.name, "rb") as fh:
+                fh.seek(2, 0)
+                self.assertFalse(_is_eventcache(fh))
+                self.assertEqual(fh.tell(), 2)
+                fh.seek(0, 0)
+                self.assertTrue(_is_eventcache(fh))
+                self.assertEqual(fh.tell(), 0)
+        filename = os.path.join(self.quakeml_path, "neries_events.xml")
+        self.assertFalse(_is_eventcache(filename))
+        self.assertFalse(_is_eventcache("/path/to/nothing"))
+
+
+def suite():
+    return unittest.makeSuite(EventCacheTestCase, "test")
+
+
+if __name__ == "__main__":
+    unittest.main(defaultTest="suite")
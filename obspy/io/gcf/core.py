@@ -81,23 +81,16 @@ def _read_gcf(filename, headonly=False, **kwargs):  # @UnusedVariable
     >>> from obspy import read
     >>> st = read("/path/to/20160603_1955n.gcf", format="GCF")
     """
-    traces = []
     with open(filename, 'rb') as f:
-        while True:
-            try:
-                if headonly:
-                    header = libgcf.read_header(f, **kwargs)
-                    if header:
-                        traces.append(Trace(header=header))
-                else:
-                    hd = libgcf.read(f, **kwargs)
-                    if hd:
-                        traces.append(Trace(header=hd[0], data=hd[1]))
-            except EOFError:
-                break
-    st = Stream(traces=traces)
+        segments = libgcf.read_blocks(f, headonly=headonly, **kwargs)
     if headonly:
-        st = merge_gcf_stream(st)
+        traces = [Trace(header=header) for header, _ in segments]
     else:
+        traces = [Trace(header=header, data=data)
+                  for header, data in segments]
+    st = Stream(traces=traces)
+    if not headonly and len(st) > 1:
+        # contiguous blocks are already joined, this only handles
+        # overlapping blocks
         st.merge(-1)
     return st
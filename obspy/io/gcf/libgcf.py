@@ -12,6 +12,7 @@ from future.builtins import *  # NOQA
 import numpy as np
 
 from obspy import UTCDateTime
+from obspy.core.util.misc import concatenate_ranges
 
 SPS_D = {  # Table 3.1: special sample rates
     157: 0.1,
@@ -148,6 +149,144 @@ def read_data_block(f, headonly=False, channel_prefix="HH", **kwargs):
         return header, data
 
 
+def read_blocks(f, headonly=False, channel_prefix="HH", **kwargs):
+    """
+    Read all data blocks of a GCF file at once.
+
+    The whole file is read in one go, all block headers are parsed into
+    arrays and contiguous blocks of the same stream are joined. The first
+    differences of all blocks are decoded with a single cumulative sum.
+
+    f - file object to read from
+    if headonly is True, no data is decoded.
+
+    Returns a list of (header, data) tuples, one for each contiguous
+    segment. data is None if headonly is True.
+    """
+    buff = np.frombuffer(f.read(), dtype=np.uint8)
+    size = len(buff)
+    nblocks = -(-size // 1024)
+    if size % 1024:
+        # pad a partial last block, its length is checked below
+        buff = np.concatenate([buff, np.zeros(1024 - size % 1024,
+                                              dtype=np.uint8)])
+    blocks = buff.reshape(nblocks, 1024)
+    header = blocks[:, :12].copy().view('>u4')
+    # reserved, SPS, data type compression, number of 32bit records
+    sps_code = blocks[:, 13]
+    compression = blocks[:, 14] & 0b00001111
+    t_offset = blocks[:, 14] >> 4
+    num_records = blocks[:, 15].astype(np.int64)
+
+    # skip blocks that are not data blocks (SPS=0)
+    is_data = sps_code != 0
+    block_index = np.nonzero(is_data)[0]
+    if not len(block_index):
+        return []
+    stid = header[is_data, 1]
+    datecode = header[is_data, 2]
+    sps_code = sps_code[is_data]
+    compression = compression[is_data]
+    t_offset = t_offset[is_data]
+    num_records = num_records[is_data]
+    for code in np.unique(compression):
+        if code not in COMPRESSION_D:
+            msg = "Unsupported compression code %d" % code
+            raise ValueError(msg)
+    if not headonly and \
+            block_index[-1] * 1024 + 24 + num_records[-1] * 4 > size:
+        raise ValueError("Truncated data block")
+    npts = num_records * compression
+
+    sampling_rate = np.arange(256, dtype=np.float64)
+    denominator = np.zeros(256, dtype=np.float64)
+    for code, value in SPS_D.items():
+        sampling_rate[code] = value
+    for code, value in TIME_OFFSETS_D.items():
+        denominator[code] = value
+    sampling_rate = sampling_rate[sps_code]
+
+    # start times in nanoseconds
+    days = (datecode >> 17).astype(np.int64)
+    secs = (datecode & 0x1FFFF).astype(np.int64)
+    starttime = UTCDateTime('1989-11-17')._ns + \
+        (days * 86400 + secs) * 1000000000
+    has_offset = t_offset > 0
+    if has_offset.any():
+        if not denominator[sps_code[has_offset]].all():
+            msg = "Time fractional offset for unsupported sample rate."
+            raise ValueError(msg)
+        starttime[has_offset] += np.round(
+            t_offset[has_offset] * 1e9 /
+            denominator[sps_code[has_offset]]).astype(np.int64)
+
+    # sort by stream and time, keeping the file order otherwise
+    order = np.lexsort((starttime, sampling_rate, stid))
+    block_index = block_index[order]
+    stid = stid[order]
+    sampling_rate = sampling_rate[order]
+    starttime = starttime[order]
+    compression = compression[order]
+    num_records = num_records[order]
+    npts = npts[order]
+
+    # new segments start with a new stream or if the block does not
+    # directly follow the previous one
+    delta_ns = 1e9 / sampling_rate
+    expected = starttime[:-1] + npts[:-1] * delta_ns[:-1]
+    is_new = np.ones(len(block_index), dtype=np.bool_)
+    is_new[1:] = (stid[1:] != stid[:-1]) | \
+        (sampling_rate[1:] != sampling_rate[:-1]) | \
+        (np.abs(starttime[1:] - expected) > 1e-2 * delta_ns[1:])
+    segment_starts = np.nonzero(is_new)[0]
+    segment_npts = np.add.reduceat(npts, segment_starts)
+
+    if not headonly:
+        # first differences of all blocks, block by block
+        block_starts = np.cumsum(npts) - npts
+        diffs = np.empty(npts.sum(), dtype=np.int64)
+        for code in np.unique(compression):
+            mask = compression == code
+            raw = buff[concatenate_ranges(block_index[mask] * 1024 + 20,
+                                          num_records[mask] * 4)]
+            diffs[concatenate_ranges(block_starts[mask], npts[mask])] = \
+                raw.view(COMPRESSION_D[code])
+        offsets = block_index * 1024
+        fic = blocks[block_index, 16:20].copy().view('>i4')[:, 0]
+        ric = buff[concatenate_ranges(
+            offsets + 20 + num_records * 4,
+            np.full(len(offsets), 4, dtype=np.int64))]
+        ric = ric.view('>i4')
+        # construct time series, restarting the sum at every block
+        data = np.cumsum(diffs)
+        data += np.repeat(fic - (data[block_starts] - diffs[block_starts]),
+                          npts)
+        data = data.astype('i4')
+        # verify last sample of each block matches RIC
+        if not np.array_equal(data[block_starts + npts - 1], ric):
+            raise ValueError("Last sample mismatch with RIC")
+        data_starts = block_starts[segment_starts]
+
+    segments = []
+    names = {}
+    for i, block in enumerate(segment_starts):
+        if stid[block] not in names:
+            names[stid[block]] = decode36(int(stid[block]))
+        name = names[stid[block]]
+        header = {}
+        header['starttime'] = UTCDateTime(ns=int(starttime[block]))
+        header['station'] = name[:4]
+        header['channel'] = (channel_prefix[:2] + name[4]).upper()
+        header['sampling_rate'] = float(sampling_rate[block])
+        header['npts'] = int(segment_npts[i])
+        if headonly:
+            segments.append((header, None))
+        else:
+            start = data_starts[i]
+            segments.append((header, data[start:start + segment_npts[i]]))
+    return segments
+
+
 def read_header(f, **kwargs):
     """
     Reads header only from GCF file.
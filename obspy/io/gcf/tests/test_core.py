@@ -7,13 +7,16 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
+import io
 import os
 import unittest
 
 import numpy as np
 
-from obspy import read
+from obspy import Stream, Trace, read
+from obspy.core.util import NamedTemporaryFile
 from obspy.core.utcdatetime import UTCDateTime
+from obspy.io.gcf import libgcf
 from obspy.io.gcf.core import _read_gcf, merge_gcf_stream
 
 
@@ -23,6 +26,33 @@ EXPECTED = np.array([-49378, -49213, -49273, -49277, -49341, -49415, -49289,
                     dtype=np.int32)
 
 
+def _encode36(name):
+    """
+    Converts a base36 string into an integer, inverse of
+    :func:`obspy.io.gcf.libgcf.decode36`.
+    """
+    return int(name, 36)
+
+
+def _encode_block(stid, starttime, sps, compression, data, fic,
+                  t_offset=0):
+    """
+    Encodes a single GCF data block, first differences are taken relative
+    to the given FIC.
+    """
+    delta = UTCDateTime(starttime) - UTCDateTime('1989-11-17')
+    days, secs = divmod(int(delta), 86400)
+    num_records = len(data) // compression
+    diffs = np.diff(np.concatenate([[fic], data]))
+    block = np.array([0, stid, (days << 17) | secs], dtype='>u4').tobytes()
+    block += np.array([0, sps, (t_offset << 4) | compression, num_records],
+                      dtype='>u1').tobytes()
+    block += np.array([fic], dtype='>i4').tobytes()
+    block += diffs.astype(libgcf.COMPRESSION_D[compression]).tobytes()
+    block += np.array([data[-1]], dtype='>i4').tobytes()
+    return block + b'\x00' * (1024 - len(block))
+
+
 class CoreTestCase(unittest.TestCase):
     """
     Test cases for gcf core interface
@@ -162,6 +192,85 @@ class CoreTestCase(unittest.TestCase):
         self.assertEqual(st[0].stats.channel, 'HNN')
         self.assertEqual(st[0].stats.station, '6018')
 
+    def test_read_multiple_blocks(self):
+        """
+        Compares reading all blocks at once with reading block by block
+        for interleaved streams, gaps, all compressions and a status block.
+        """
+        np.random.seed(815)
+        start = UTCDateTime('2016-06-03T19:55:00')
+        blocks = []
+        # contiguous 100 Hz stream using all compression codes, with a gap
+        # after the third block
+        last = 0
+        t = start
+        for i, compression in enumerate([4, 2, 1, 4, 1]):
+            step = {4: 100, 2: 10000, 1: 1000000}[compression]
+            npts = 100
+            data = last + np.cumsum(np.random.randint(-step, step, npts))
+            blocks.append(_encode_block(
+                _encode36('6018N2'), t, 100, compression, data,
+                last))
+            last = data[-1]
+            t += 1 + (5 if i == 2 else 0)
+        # interleaved 500 Hz stream with fractional second offsets
+        t = start
+        last = 10
+        for t_offset in (0, 0, 1):
+            data = last + np.cumsum(np.random.randint(-100, 100, 500))
+            blocks.insert(1, _encode_block(
+                _encode36('6018Z2'), t, 174, 4, data, last,
+                t_offset=t_offset))
+            last = data[-1]
+            t += 1
+        # status block
+        blocks.insert(2, b'\x00' * 13 + b'\x00\x04\x10' + b'\x00' * 1008)
+        with NamedTemporaryFile() as tf:
+            with open(tf.name, 'wb') as fh:
+                fh.write(b''.join(blocks))
+            # read block by block as reference
+            traces = []
+            headers = []
+            with open(tf.name, 'rb') as fh:
+                while True:
+                    try:
+                        hd = libgcf.read(fh)
+                    except EOFError:
+                        break
+                    if hd:
+                        traces.append(Trace(header=hd[0], data=hd[1]))
+                        headers.append(Trace(header=dict(hd[0])))
+            expected = Stream(traces=traces)
+            expected.merge(-1)
+            expected_head = merge_gcf_stream(Stream(traces=headers))
+            st = read(tf.name, format='GCF')
+            st_head = read(tf.name, format='GCF', headonly=True)
+        self.assertEqual(len(st), 4)
+        for tr in st:
+            self.assertEqual(tr.data.dtype, np.int32)
+            del tr.stats._format
+        self.assertEqual(st, expected)
+        self.assertEqual(sorted(tr.stats.npts for tr in st_head),
+                         sorted(tr.stats.npts for tr in expected_head))
+        self.assertEqual(
+            sorted((tr.id, tr.stats.starttime) for tr in st_head),
+            sorted((tr.id, tr.stats.starttime) for tr in expected_head))
+        # the last 500 Hz block starts half a second late
+        self.assertEqual(st.select(channel='HHZ')[1].stats.starttime,
+                         start + 2.5)
+
+    def test_read_ric_mismatch(self):
+        """
+        A corrupt last sample raises an error when reading all blocks.
+        """
+        data = np.arange(100)
+        block = bytearray(_encode_block(_encode36('6018N2'),
+                                        UTCDateTime(2016, 1, 1), 100, 4,
+                                        data, 0))
+        block[120:124] = np.array([1], dtype='>i4').tobytes()
+        self.assertRaises(ValueError, libgcf.read_blocks,
+                          io.BytesIO(bytes(block)))
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
@@ -9,6 +9,7 @@ from future.builtins import *  # NOQA
 import numpy as np
 
 from obspy import Stream, Trace
+from obspy.core.util.base import _get_segment_table
 from . import libgse1, libgse2
 
 
@@ -72,6 +73,52 @@ def _read_gse2(filename, headonly=False, verify_chksum=True,
     return Stream(traces=traces)
 
 
+def _scan_gse2(filename, **kwargs):  # @UnusedVariable
+    """
+    Scans a GSE2 file and returns a table with one segment per WID2 entry.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.stream.scan` function, call this instead.
+
+    Only the WID2 and STA2 lines are parsed, the data blocks are skipped
+    without decompressing them.
+
+    :type filename: str
+    :param filename: GSE2 file to be scanned.
+    :rtype: :class:`numpy.ndarray`
+    :return: Segment table, see :func:`~obspy.core.stream.scan`.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.stream import scan
+    >>> table = scan("/path/to/loc_RJOB20050831023349.z")
+    >>> print(table["station"], table["channel"], table["npts"])
+    ['RJOB'] ['Z'] [12000]
+    """
+    headers = []
+    with open(filename, 'rb') as f:
+        while True:
+            try:
+                headers.append(libgse2.read_header(f))
+            except EOFError:
+                break
+            # Skip the data block up to its checksum line. The CM6 character
+            # set contains no spaces so a data line can not be confused with
+            # it.
+            line = f.readline()
+            while line and not line.startswith(b'CHK2 '):
+                line = f.readline()
+    return _get_segment_table(
+        network=[h.get('network', '') for h in headers],
+        station=[h['station'] for h in headers],
+        location=[h.get('location', '') for h in headers],
+        channel=[h['channel'] for h in headers],
+        starttime=[h['starttime']._ns for h in headers],
+        sampling_rate=[h['sampling_rate'] for h in headers],
+        npts=[h['npts'] for h in headers])
+
+
 def _write_gse2(stream, filename, inplace=False, **kwargs):  # @UnusedVariable
     """
     Write GSE2 file from a Stream object.
@@ -12,6 +12,7 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
+import io
 from struct import unpack
 
 import numpy as np
@@ -106,23 +107,7 @@ class Evt(object):
             self.e_header.unset_dict()
             self.e_header.read(file_pointer, self.e_tag.length, endian)
 
-            self.data = np.ndarray([self.e_header.nchannels, 0])
-
-            while True:
-                try:
-                    self.e_tag.read(file_pointer)
-                    retparam = self.e_frame.read(file_pointer,
-                                                 self.e_tag.length, endian)
-                    if self.samplingrate == 0:
-                        self.samplingrate = retparam[0]
-                    elif self.samplingrate != retparam[0]:
-                        raise EvtBadHeaderError("Sampling rate not constant")
-                    data = self.e_data.read(file_pointer,
-                                            self.e_tag.datalength,
-                                            endian, retparam)
-                    self.data = np.hstack((self.data, data))
-                except EvtEOFError:
-                    break
+            self.data = self._read_frames(file_pointer, endian)
         finally:
             if not is_fileobject:
                 file_pointer.close()
@@ -145,6 +130,89 @@ class Evt(object):
 
         return Stream(traces=traces)
 
+    def _read_frames(self, file_p, endian):
+        """
+        Reads all data frames following the file header.
+
+        The remaining file is read at once. If all frames share the same
+        layout, the frames are demultiplexed in one go, otherwise they are
+        read one after the other.
+
+        :param file_p: file pointer
+        :param endian: endian type in datafile
+        :rtype: :class:`numpy.ndarray`
+        :return: data, one row per channel
+        """
+        buff = file_p.read()
+        try:
+            self.e_tag.read(io.BytesIO(buff))
+        except EvtEOFError:
+            return np.ndarray([self.e_header.nchannels, 0])
+        nframes = self.e_header.duration
+        framelen = 16 + self.e_tag.length + self.e_tag.datalength
+        if self.e_tag.length == 32 and len(buff) >= nframes * framelen and \
+                _is_eof(buff[nframes * framelen:]):
+            frames = np.frombuffer(buff, dtype=np.uint8,
+                                   count=nframes * framelen)
+            frames = frames.reshape((nframes, framelen))
+            if _same_layout(frames):
+                # all frames share tag, sampling rate, sample size and
+                # channels, only the first frame header has to be parsed
+                file_p = io.BytesIO(buff)
+                self.e_tag.read(file_p)
+                samplerate, numbyte, _, numchan = self.e_frame.read(
+                    file_p, self.e_tag.length, endian)
+                if self.e_tag.datalength != \
+                        (samplerate // 10) * numbyte * numchan:
+                    raise EvtBadDataError("Bad data length")
+                self.samplingrate = samplerate
+                self.e_frame.numframe = nframes
+                data = self.e_data.demultiplex(frames[:, 48:], numbyte,
+                                               numchan)
+                return data.astype(np.float64)
+
+        file_p = io.BytesIO(buff)
+        data = []
+        while True:
+            try:
+                self.e_tag.read(file_p)
+                retparam = self.e_frame.read(file_p, self.e_tag.length,
+                                             endian)
+                if self.samplingrate == 0:
+                    self.samplingrate = retparam[0]
+                elif self.samplingrate != retparam[0]:
+                    raise EvtBadHeaderError("Sampling rate not constant")
+                data.append(self.e_data.read(file_p, self.e_tag.datalength,
+                                             endian, retparam))
+            except EvtEOFError:
+                break
+        return np.hstack([np.ndarray([self.e_header.nchannels, 0])] + data)
+
+
+def _is_eof(buff):
+    """
+    Checks if a buffer following the data frames would be read as end of
+    file, see :meth:`EvtTag.read`.
+    """
+    return len(buff) < 16 or buff[0:1] == b'\x00'
+
+
+def _same_layout(frames):
+    """
+    Checks if all frames have the same tag and the same frame type,
+    channels, sampling rate and sample size.
+
+    :type frames: :class:`numpy.ndarray`
+    :param frames: frames as 2D uint8 array, one row per frame
+    """
+    # tag up to data length, frame type, channel bitmap and stream
+    # parameters
+    layout = frames[:, np.r_[0:12, 16, 26:30]]
+    # sample size bits of the frame status
+    samplesize = frames[:, 30] >> 6
+    return bool((layout == layout[0]).all() and
+                (samplesize == samplesize[0]).all())
+
 
 class EvtData(object):
     """
@@ -170,20 +238,30 @@ class EvtData(object):
         if length != num:
             raise EvtBadDataError("Bad data length")
 
+        return self.demultiplex(from_buffer(buff, np.uint8), numbyte, numchan)
+
+    def demultiplex(self, buff, numbyte, numchan):
+        """
+        Converts multiplexed big endian samples to one row per channel
+
+        :type buff: :class:`numpy.ndarray`
+        :param buff: data bytes (uint8) of one or more frames
+        :param numbyte: sample size in bytes (2, 3 or 4)
+        :param numchan: number of channels
+        :rtype: :class:`numpy.ndarray`
+        :return: data, one row per channel
+        """
+        buff = np.ascontiguousarray(buff).reshape(-1)
         if numbyte == 2:
-            data = from_buffer(buff, ">h").reshape((-1, numchan)).T
+            data = buff.view(">h")
         elif numbyte == 4:
-            data = from_buffer(buff, ">i").reshape((-1, numchan)).T
+            data = buff.view(">i")
         elif numbyte == 3:
-            data = np.empty((numchan, samplerate // 10))
-            for j in range(samplerate // 10):
-                for k in range(numchan):
-                    i = (j * numchan) + k
-                    val = unpack(b">i", buff[i * 3:(i * 3) + 3] + b'\0')[0] \
-                        >> 8
-                    data[k, j] = val
-
-        return data
+            # append a zero byte to each sample and shift the sign back
+            samples = np.zeros((len(buff) // 3, 4), dtype=np.uint8)
+            samples[:, :3] = buff.reshape((-1, 3))
+            data = samples.view(">i4").reshape(-1) >> 8
+        return data.reshape((-1, numchan)).T
 
 
 class EvtHeader(EvtVirtual):
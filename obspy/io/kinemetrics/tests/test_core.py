@@ -16,6 +16,7 @@ import numpy as np
 from obspy import read
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.io.kinemetrics.core import is_evt, read_evt
+from obspy.io.kinemetrics.evt import EvtData
 
 
 class CoreTestCase(unittest.TestCase):
@@ -270,6 +271,41 @@ class CoreTestCase(unittest.TestCase):
         self.assertEqual(st[0].stats.channel, '0')
         self.assertEqual(st[0].stats.station, 'MOLA')
 
+    def test_read_frame_by_frame(self):
+        """
+        Frames with differing layouts are read one after the other, the
+        result has to match reading all frames at once.
+        """
+        filename = os.path.join(self.path, 'BI008_MEMA-04823.evt')
+        with open(filename, "rb") as fh:
+            data = bytearray(fh.read())
+        st = read_evt(io.BytesIO(data))
+        # change the version field in the tag of the last frame
+        data[2056 + 229 * 273 + 2] += 1
+        st2 = read_evt(io.BytesIO(data))
+        self.assertEqual(st, st2)
+        self.verify_data_evt0(st2[0].data)
+        self.verify_data_evt2(st2[2].data)
+
+    def test_demultiplex(self):
+        """
+        Test demultiplexing samples of all sizes into channels.
+        """
+        expected = np.array([[1, -1, 2 ** 15 - 1], [-2 ** 15, 0, 5]])
+        for numbyte, values in (
+                (2, expected),
+                (3, expected * 256 + 7),
+                (4, expected * 2 ** 16 + 3)):
+            if numbyte == 3:
+                buff = np.zeros((6, 4), dtype=np.uint8)
+                buff.view('>i4')[:, 0] = values.T.ravel()
+                buff = buff[:, 1:]
+            else:
+                buff = np.ascontiguousarray(values.T, '>i%d' % numbyte)
+                buff = buff.view(np.uint8)
+            data = EvtData().demultiplex(buff.ravel(), numbyte, 2)
+            np.testing.assert_array_equal(data, values)
+
     def verify_stats_evt(self, evt_stats):
         dico = {'chan_fullscale': 2.5, 'chan_sensorgain': 1,
                 'chan_calcoil': 0.0500, 'chan_damping': 0.7070,
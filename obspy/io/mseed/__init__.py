@@ -140,6 +140,10 @@ some purposes. Refer to the documentation of each for details.
 +----------------------------------------------------------+--------------------------------------------------------------------------+
 | :func:`~obspy.io.mseed.util.set_flags_in_fixed_headers`  | Updates a given miniSEED file with some fixed header flags.              |
 +----------------------------------------------------------+--------------------------------------------------------------------------+
+| :func:`~obspy.io.mseed.util.get_record_table`            | Fast vectorized scan of all record headers into a NumPy array.           |
++----------------------------------------------------------+--------------------------------------------------------------------------+
+| :func:`~obspy.io.mseed.util.rewrite_fixed_headers`       | Bulk time shifts, flag changes and renames of all records of a file.     |
++----------------------------------------------------------+--------------------------------------------------------------------------+
 """
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
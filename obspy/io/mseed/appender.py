@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+Appending MiniSEED writer for continuous real-time data.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (https://www.gnu.org/copyleft/lesser.html)
+"""
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+from future.utils import native_str
+
+import io
+import os
+import time
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime
+from . import util
+from .core import _pack_trace
+from .headers import HPTMODULUS, VALID_RECORD_LENGTHS
+
+
+# Default encodings per dtype, the same as used by _write_mseed().
+_DEFAULT_ENCODINGS = {
+    np.int32: 11,
+    np.float32: 4,
+    np.float64: 5,
+    np.int16: 1,
+}
+
+
+class MSEEDAppender(object):
+    """
+    Appends continuous data to MiniSEED files without rewriting them.
+
+    Incoming data is packed into full fixed-length records which are
+    appended to the open output files. Samples that do not fill a whole
+    record are kept in a buffer until more data arrives or until the
+    partial record is flushed according to the flush policy. Records are
+    either appended to a single file or to daily files in a SeisComP Data
+    Structure (SDS) archive which are rolled at day boundaries.
+
+    :type filename: str or file-like object, optional
+    :param filename: Single file to append all records to. Either this or
+        ``sds_root`` must be given.
+    :type sds_root: str, optional
+    :param sds_root: Root directory of a SDS archive to append to. The
+        records of each channel are written to the daily file of their start
+        time, data is split at day boundaries.
+    :type sds_type: str
+    :param sds_type: SDS data type identifier.
+    :type reclen: int
+    :param reclen: Record length in bytes.
+    :type encoding: int or str, optional
+    :param encoding: Data encoding. If not given it will be derived from the
+        dtype of the data, see
+        :meth:`~obspy.core.stream.Stream.write` for details.
+    :type byteorder: int
+    :param byteorder: ``0`` for little endian, ``1`` for big endian.
+    :type flush_interval: float, optional
+    :param flush_interval: Partial records are flushed once their first
+        sample has been buffered for more than this many seconds (wall clock
+        time). Checked on every call to :meth:`append` and :meth:`flush`
+        with ``only_due=True``.
+    :type flush_samples: int, optional
+    :param flush_samples: Partial records are flushed as soon as at least
+        this many samples are buffered for a channel.
+
+    Records written to a file are never rewritten, the output is a valid
+    MiniSEED file at any time. Partial records written by a flush are not
+    refilled later, continuous data then simply continues in the next
+    record.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> st = read()
+    >>> with MSEEDAppender(sds_root="/path/to/SDS") as appender:
+    ...     # Usually the data arrives in small chunks.
+    ...     for tr in st:  # doctest: +SKIP
+    ...         appender.append(tr)
+    """
+    def __init__(self, filename=None, sds_root=None, sds_type="D",
+                 reclen=512, encoding=None, byteorder=1, flush_interval=None,
+                 flush_samples=None):
+        if (filename is None) == (sds_root is None):
+            msg = "Exactly one of 'filename' and 'sds_root' must be given."
+            raise ValueError(msg)
+        if reclen not in VALID_RECORD_LENGTHS:
+            msg = 'Invalid record length. The record length must be a ' + \
+                'value of 2 to the power of X where 8 <= X <= 20.'
+            raise ValueError(msg)
+        if byteorder not in (0, 1):
+            msg = "Invalid byte order. It must be either 0 or 1."
+            raise ValueError(msg)
+        if encoding is not None:
+            encoding = util._convert_and_check_encoding_for_writing(encoding)
+
+        self.filename = filename
+        self.sds_root = sds_root
+        self.sds_type = sds_type
+        self.reclen = reclen
+        self.encoding = encoding
+        self.byteorder = byteorder
+        self.flush_interval = flush_interval
+        self.flush_samples = flush_samples
+
+        # Buffered, not yet written data per SEED id.
+        self._pending = {}
+        # Wall clock time at which the first buffered sample was received.
+        self._pending_since = {}
+        # Next sequence number per SEED id.
+        self._sequence_numbers = {}
+        # Open file handles. A single entry for a single output file or one
+        # entry per SEED id with the filename of the current day file.
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        self.close()
+
+    def append(self, trace):
+        """
+        Appends the data of a trace or all traces of a stream.
+
+        Data that continues the buffered data of the same channel is joined
+        with it. A gap or overlap flushes the buffered data first. Data of
+        type ``int64`` is appended as ``int32`` data if all values fit.
+
+        :type trace: :class:`~obspy.core.trace.Trace`,
+            :class:`~obspy.realtime.rttrace.RtTrace` or
+            :class:`~obspy.core.stream.Stream`
+        :param trace: The new data.
+        """
+        if isinstance(trace, Stream):
+            for tr in trace:
+                self.append(tr)
+            return
+        if not len(trace.data):
+            return
+
+        id_ = trace.id
+        data = trace.data
+        if data.dtype.type == np.int64:
+            # e.g. the result of integer arithmetic on 64 bit platforms
+            limits = np.iinfo(np.int32)
+            if data.min() < limits.min or data.max() > limits.max:
+                msg = ("Data of type int64 of %s exceeds the range of int32 "
+                       "and can not be appended." % id_)
+                raise ValueError(msg)
+            data = data.astype(np.int32)
+        if data.dtype.type not in _DEFAULT_ENCODINGS:
+            msg = "Unsupported data type %s for appending." % data.dtype
+            raise ValueError(msg)
+
+        pending = self._pending.get(id_)
+        if pending is not None and \
+                not self._is_continuous(pending, trace.stats, data):
+            self._pack(id_, flush=True)
+            pending = None
+
+        if pending is None:
+            # A plain Trace, real time processing is not needed here.
+            pending = Trace(data=data.copy(), header=trace.stats.copy())
+            self._pending[id_] = pending
+            self._pending_since[id_] = time.time()
+        else:
+            pending.data = np.concatenate([pending.data,
+                                           data.astype(pending.data.dtype)])
+
+        self._pack(id_, flush=False)
+        if self.flush_samples is not None and id_ in self._pending and \
+                len(self._pending[id_].data) >= self.flush_samples:
+            self._pack(id_, flush=True)
+        self.flush(only_due=True)
+
+    def flush(self, only_due=False):
+        """
+        Writes all buffered data as partial records.
+
+        :type only_due: bool
+        :param only_due: Only flush data that has been buffered for longer
+            than ``flush_interval``.
+        """
+        if only_due and self.flush_interval is None:
+            return
+        now = time.time()
+        for id_ in list(self._pending.keys()):
+            if only_due and \
+                    now - self._pending_since[id_] < self.flush_interval:
+                continue
+            self._pack(id_, flush=True)
+        for fh in self._files.values():
+            fh[1].flush()
+
+    def close(self):
+        """
+        Flushes all buffered data and closes all files.
+        """
+        self.flush()
+        for id_ in list(self._files.keys()):
+            self._close_file(id_)
+
+    def _is_continuous(self, pending, stats, data):
+        """
+        Checks whether new data continues the buffered data without a gap or
+        overlap of more than half a sample.
+        """
+        if stats.sampling_rate != pending.stats.sampling_rate or \
+                data.dtype != pending.data.dtype:
+            return False
+        expected = pending.stats.starttime + \
+            len(pending.data) * pending.stats.delta
+        return abs(stats.starttime - expected) < 0.5 * pending.stats.delta
+
+    def _pack(self, id_, flush):
+        """
+        Packs the buffered data of one channel and writes the records.
+        Without ``flush`` only full records are written and the remaining
+        samples stay in the buffer.
+        """
+        pending = self._pending[id_]
+        while len(pending.data):
+            trace = pending
+            split = False
+            if self.sds_root is not None:
+                # Data of the next day goes to the next file.
+                start = pending.stats.starttime
+                day_end = UTCDateTime(start.year, start.month, start.day) + \
+                    86400
+                n_today = int(np.ceil(
+                    round((day_end - start) * pending.stats.sampling_rate,
+                          6)))
+                if n_today < len(pending.data):
+                    trace = pending.copy()
+                    trace.data = pending.data[:n_today]
+                    split = True
+
+            packed = self._pack_trace(id_, trace, flush=flush or split)
+            if packed == len(pending.data):
+                del self._pending[id_]
+                del self._pending_since[id_]
+                return
+            if packed:
+                pending.data = pending.data[packed:]
+                pending.stats.starttime += packed * pending.stats.delta
+                # The remaining data starts a new buffer.
+                self._pending_since[id_] = time.time()
+            if not split:
+                return
+
+    def _pack_trace(self, id_, trace, flush):
+        """
+        Packs a single trace and writes the records to the corresponding
+        file. Returns the number of packed samples.
+        """
+        data = trace.data
+        encoding = self.encoding
+        if encoding is None:
+            encoding = _DEFAULT_ENCODINGS[data.dtype.type]
+        if encoding == 1:
+            # INT16 needs INT32 data type
+            data = data.astype(np.int32)
+
+        try:
+            dataquality = trace.stats.mseed.dataquality.upper()
+        except AttributeError:
+            dataquality = "D"
+        sequence_number = self._sequence_numbers.get(id_, 1)
+        trace_attr = {"dataquality": dataquality,
+                      "sequence_number": sequence_number,
+                      "timing_quality": 0,
+                      "reclen": self.reclen,
+                      "encoding": encoding,
+                      "byteorder": self.byteorder}
+        starttime = util._convert_datetime_to_mstime(trace.stats.starttime)
+        use_blkt_1001 = starttime % 100 != 0 or \
+            (1.0 / trace.stats.sampling_rate * HPTMODULUS) % 100 != 0
+
+        fh = self._get_file(id_, trace.stats.starttime)
+        buf = io.BytesIO()
+        packed = _pack_trace(trace, data, trace_attr, write=buf.write,
+                             use_blkt_1001=use_blkt_1001,
+                             flush=1 if flush else 0, verbose=0)
+        records = buf.getvalue()
+        fh.write(records)
+
+        record_count = len(records) // self.reclen
+        self._sequence_numbers[id_] = \
+            (sequence_number + record_count - 1) % 999999 + 1
+        return packed
+
+    def _get_file(self, id_, starttime):
+        """
+        Returns the open file handle to write records starting at the given
+        time to. Rolls SDS day files.
+        """
+        if self.sds_root is None:
+            if None not in self._files:
+                if hasattr(self.filename, "write"):
+                    fh = self.filename
+                else:
+                    fh = open(self.filename, "ab")
+                self._files[None] = (self.filename, fh)
+            return self._files[None][1]
+
+        # Import here to avoid circular imports.
+        from obspy.clients.filesystem.sds import SDS_FMTSTR
+        network, station, location, channel = id_.split(".")
+        filename = os.path.join(self.sds_root, SDS_FMTSTR.format(
+            network=network, station=station, location=location,
+            channel=channel, year=starttime.year, doy=starttime.julday,
+            sds_type=self.sds_type))
+        if id_ in self._files:
+            if self._files[id_][0] == filename:
+                return self._files[id_][1]
+            self._close_file(id_)
+        dirname = os.path.dirname(filename)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        fh = open(filename, "ab")
+        self._files[id_] = (filename, fh)
+        return fh
+
+    def _close_file(self, id_):
+        filename, fh = self._files.pop(id_)
+        if fh is not filename:
+            fh.close()
+        else:
+            fh.flush()
+
+
+__all__ = [native_str("MSEEDAppender")]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
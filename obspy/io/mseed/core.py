@@ -11,12 +11,14 @@ import ctypes as C
 import io
 import os
 import warnings
+from multiprocessing.pool import ThreadPool
 from struct import pack
 
 import numpy as np
 
 from obspy import Stream, Trace, UTCDateTime
 from obspy.core.util import NATIVE_BYTEORDER
+from obspy.core.util.base import _get_segment_table
 from . import (util, InternalMSEEDError, ObsPyMSEEDFilesizeTooSmallError,
                ObsPyMSEEDFilesizeTooLargeError)
 from .headers import (DATATYPES, ENCODINGS, HPTERROR, HPTMODULUS, SAMPLETYPE,
@@ -161,10 +163,11 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     :param endtime: Only read data samples before or at the end time.
     :param headonly: Determines whether or not to unpack the data or just
         read the headers.
-    :type sourcename: str
+    :type sourcename: str or list of str
     :param sourcename: Only read data with matching SEED ID (can contain
-        wildcards "?" and "*", e.g. "BW.UH2.*" or "*.??Z"). Defaults to
-        ``None``.
+        wildcards "?" and "*", e.g. "BW.UH2.*" or "*.??Z"). A list of SEED
+        IDs selects all data matching any of them. Records of other channels
+        are skipped without unpacking them. Defaults to ``None``.
     :param reclen: If it is None, it will be automatically determined for every
         record. If it is known, just set it to the record length in bytes which
         will increase the reading speed slightly.
@@ -345,37 +348,49 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
         selections = None
     else:
         select_time = SelectTime()
-        selections = Selections()
-        selections.timewindows.contents = select_time
         if starttime is not None:
             if not isinstance(starttime, UTCDateTime):
                 msg = 'starttime needs to be a UTCDateTime object'
                 raise ValueError(msg)
-            selections.timewindows.contents.starttime = \
-                util._convert_datetime_to_mstime(starttime)
+            select_time.starttime = util._convert_datetime_to_mstime(starttime)
         else:
             # HPTERROR results in no starttime.
-            selections.timewindows.contents.starttime = HPTERROR
+            select_time.starttime = HPTERROR
         if endtime is not None:
             if not isinstance(endtime, UTCDateTime):
                 msg = 'endtime needs to be a UTCDateTime object'
                 raise ValueError(msg)
-            selections.timewindows.contents.endtime = \
-                util._convert_datetime_to_mstime(endtime)
+            select_time.endtime = util._convert_datetime_to_mstime(endtime)
         else:
             # HPTERROR results in no starttime.
-            selections.timewindows.contents.endtime = HPTERROR
-        if sourcename is not None:
-            if not isinstance(sourcename, (str, native_str)):
-                msg = 'sourcename needs to be a string'
+            select_time.endtime = HPTERROR
+        if sourcename is None:
+            srcnames = [b'*']
+        else:
+            if isinstance(sourcename, (str, native_str)):
+                sourcename = [sourcename]
+            if not isinstance(sourcename, (list, tuple)) or not sourcename \
+                    or not all(isinstance(_i, (str, native_str))
+                               for _i in sourcename):
+                msg = ('sourcename needs to be a string or a list of '
+                       'strings')
                 raise ValueError(msg)
             # libmseed uses underscores as separators and allows filtering
             # after the dataquality which is disabled here to not confuse
             # users. (* == all data qualities)
-            selections.srcname = (sourcename.replace('.', '_') + '_*').\
-                encode('ascii', 'ignore')
-        else:
-            selections.srcname = b'*'
+            srcnames = [(_i.replace('.', '_') + '_*').encode('ascii',
+                                                             'ignore')
+                        for _i in sourcename]
+        # One linked selection per source name, all sharing the time window.
+        # Non-matching records are skipped in the C code before their data
+        # is unpacked.
+        all_selections = [Selections() for _i in srcnames]
+        for _i, (sel, srcname) in enumerate(zip(all_selections, srcnames)):
+            sel.srcname = srcname
+            sel.timewindows = C.pointer(select_time)
+            if _i:
+                all_selections[_i - 1].next = C.pointer(sel)
+        selections = all_selections[0]
     all_data = []
 
     # Use a callback function to allocate the memory and keep track of the
@@ -493,8 +508,65 @@ def _read_mseed(mseed_object, starttime=None, endtime=None, headonly=False,
     return Stream(traces=traces)
 
 
+def _scan_mseed(mseed_object, **kwargs):  # @UnusedVariable
+    """
+    Scans a Mini-SEED file and returns a table of its continuous segments.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.stream.scan` function, call this instead.
+
+    The table is assembled from :func:`~obspy.io.mseed.util.get_record_table`
+    without unpacking any data. Records are joined to segments the same way
+    :func:`_read_mseed` joins them to traces: records of the same channel
+    and data quality following each other in the file without a gap or
+    overlap of more than half a sample are merged.
+
+    :param mseed_object: Filename or open file like object that contains the
+        binary Mini-SEED data.
+    :rtype: :class:`numpy.ndarray`
+    :return: Segment table, see :func:`~obspy.core.stream.scan`.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.stream import scan
+    >>> table = scan("/path/to/two_channels.mseed")
+    >>> print(table["channel"], table["npts"])
+    ['EHE' 'EHZ'] [386 386]
+    """
+    rec = util.get_record_table(mseed_object)
+    if not len(rec):
+        return _get_segment_table([], [], [], [], [], [], [])
+    # Group by id and data quality but keep the order of the file within
+    # each group.
+    rec = rec[np.lexsort((np.arange(len(rec)), rec['dataquality'],
+                          rec['channel'], rec['location'], rec['station'],
+                          rec['network']))]
+    delta = np.zeros(len(rec), dtype=np.int64)
+    mask = rec['samp_rate'] > 0
+    delta[mask] = np.round(1e9 / rec['samp_rate'][mask])
+    same_id = np.ones(len(rec) - 1, dtype=np.bool_)
+    for key in ('network', 'station', 'location', 'channel', 'dataquality',
+                'samp_rate'):
+        same_id &= rec[key][1:] == rec[key][:-1]
+    gap = rec['starttime'][1:] - rec['endtime'][:-1] - delta[:-1]
+    # Records without samples always form their own segment.
+    continuous = same_id & (delta[:-1] > 0) & \
+        (rec['npts'][1:] > 0) & (rec['npts'][:-1] > 0) & \
+        (np.abs(gap) <= delta[:-1] // 2)
+    starts = np.concatenate([[0], np.nonzero(~continuous)[0] + 1])
+    rec_starts = rec[starts]
+    return _get_segment_table(
+        network=rec_starts['network'], station=rec_starts['station'],
+        location=rec_starts['location'], channel=rec_starts['channel'],
+        starttime=rec_starts['starttime'],
+        sampling_rate=rec_starts['samp_rate'],
+        npts=np.add.reduceat(rec['npts'].astype(np.int64), starts))
+
+
 def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
-                 sequence_number=None, flush=True, verbose=0, **_kwargs):
+                 sequence_number=None, flush=True, verbose=0, threads=None,
+                 **_kwargs):
     """
     Write Mini-SEED file from a Stream object.
 
@@ -536,6 +608,13 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
     :type verbose: int, optional
     :param verbose: Controls verbosity, a value of ``0`` will result in no
         diagnostic output.
+    :type threads: int, optional
+    :param threads: If given and larger than one, the traces are encoded in
+        parallel using the given number of worker threads. The records are
+        still written in the order of the traces in the stream, the resulting
+        file is byte-identical to one written with a single thread. Useful
+        for large streams with many channels and a CPU bound encoding like
+        ``STEIM2``.
 
     .. note::
         The ``reclen``, ``encoding``, ``byteorder`` and ``sequence_count``
@@ -816,124 +895,178 @@ def _write_mseed(stream, filename, encoding=None, reclen=None, byteorder=None,
         f = filename
 
     # Loop over every trace and finally write it to the filehandler.
+    to_pack = []
     for trace, data, trace_attr in zip(stream, trace_data, trace_attributes):
         if not len(data):
             msg = 'Skipping empty trace "%s".' % (trace)
             warnings.warn(msg)
             continue
-        # Create C struct MSTrace.
-        mst = MST(trace, data, dataquality=trace_attr['dataquality'])
-
-        # Initialize packedsamples pointer for the mst_pack function
-        packedsamples = C.c_int()
-
-        # Callback function for mst_pack to actually write the file
-        def record_handler(record, reclen, _stream):
-            f.write(record[0:reclen])
-        # Define Python callback function for use in C function
-        rec_handler = C.CFUNCTYPE(C.c_void_p, C.POINTER(C.c_char), C.c_int,
-                                  C.c_void_p)(record_handler)
-
-        # Fill up msr record structure, this is already contained in
-        # mstg, however if blk1001 is set we need it anyway
-        msr = clibmseed.msr_init(None)
-        msr.contents.network = trace.stats.network.encode('ascii', 'strict')
-        msr.contents.station = trace.stats.station.encode('ascii', 'strict')
-        msr.contents.location = trace.stats.location.encode('ascii', 'strict')
-        msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
-        msr.contents.dataquality = trace_attr['dataquality'].\
-            encode('ascii', 'strict')
+        to_pack.append((trace, data, trace_attr))
+
+    if threads is not None and threads > 1 and len(to_pack) > 1:
+        # Every trace is packed into an independent buffer on a worker
+        # thread. libmseed releases the GIL while encoding so this scales
+        # with the number of cores. The buffers are written to the file in
+        # the original trace order, the output is thus identical to the
+        # serial writer.
+        def _pack_to_buffer(args):
+            buf = io.BytesIO()
+            _pack_trace(*args, write=buf.write, use_blkt_1001=use_blkt_1001,
+                        flush=flush, verbose=verbose)
+            return buf.getvalue()
+
+        pool = ThreadPool(min(threads, len(to_pack)))
+        try:
+            for records in pool.imap(_pack_to_buffer, to_pack):
+                f.write(records)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for trace, data, trace_attr in to_pack:
+            _pack_trace(trace, data, trace_attr, write=f.write,
+                        use_blkt_1001=use_blkt_1001, flush=flush,
+                        verbose=verbose)
 
-        # Set starting sequence number
-        msr.contents.sequence_number = trace_attr['sequence_number']
-
-        # Only use Blockette 1001 if necessary.
-        if use_blkt_1001:
-            # Timing quality has been set in trace_attr
-
-            size = C.sizeof(Blkt1001S)
-            # Only timing quality matters here, other blockette attributes will
-            # be filled by libmseed.msr_normalize_header
-            blkt_value = pack(native_str("BBBB"), trace_attr['timing_quality'],
-                              0, 0, 0)
-            blkt_ptr = C.create_string_buffer(blkt_value, len(blkt_value))
-
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            ret_val = clibmseed.msr_addblockette(msr, blkt_ptr,
-                                                 size, 1001, 0)
-
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))
-                del msr
-                raise Exception('Error in msr_addblockette')
-
-        # Only use Blockette 100 if necessary.
-        # Determine if a blockette 100 will be needed to represent the input
-        # sample rate or if the sample rate in the fixed section of the data
-        # header will suffice (see ms_genfactmult in libmseed/genutils.c)
-        use_blkt_100 = False
-
-        _factor = C.c_int16()
-        _multiplier = C.c_int16()
-        _retval = clibmseed.ms_genfactmult(
-            trace.stats.sampling_rate, C.pointer(_factor),
-            C.pointer(_multiplier))
-        # Use blockette 100 if ms_genfactmult() failed.
-        if _retval != 0:
+    # Close if its a file handler.
+    if not hasattr(filename, 'write'):
+        f.close()
+
+
+def _pack_trace(trace, data, trace_attr, write, use_blkt_1001, flush,
+                verbose):
+    """
+    Pack a single trace into Mini-SEED records.
+
+    :type trace: :class:`~obspy.core.trace.Trace`
+    :param trace: The trace to pack.
+    :type data: :class:`numpy.ndarray`
+    :param data: The data to pack, already converted to the final dtype.
+    :type trace_attr: dict
+    :param trace_attr: The writing settings of the trace as determined by
+        :func:`_write_mseed`.
+    :param write: Callable that receives each packed record as bytes.
+    :type use_blkt_1001: bool
+    :param use_blkt_1001: Whether or not to write blockette 1001.
+    :type flush: int
+    :param flush: Passed on to libmseed's ``mst_pack``.
+    :type verbose: int
+    :param verbose: Passed on to libmseed's ``mst_pack``.
+    :rtype: int
+    :returns: The number of packed samples.
+    """
+    # Create C struct MSTrace.
+    mst = MST(trace, data, dataquality=trace_attr['dataquality'])
+
+    # Initialize packedsamples pointer for the mst_pack function
+    packedsamples = C.c_int()
+
+    # Callback function for mst_pack to actually write the file
+    def record_handler(record, reclen, _stream):
+        write(record[0:reclen])
+    # Define Python callback function for use in C function
+    rec_handler = C.CFUNCTYPE(C.c_void_p, C.POINTER(C.c_char), C.c_int,
+                              C.c_void_p)(record_handler)
+
+    # Fill up msr record structure, this is already contained in
+    # mstg, however if blk1001 is set we need it anyway
+    msr = clibmseed.msr_init(None)
+    msr.contents.network = trace.stats.network.encode('ascii', 'strict')
+    msr.contents.station = trace.stats.station.encode('ascii', 'strict')
+    msr.contents.location = trace.stats.location.encode('ascii', 'strict')
+    msr.contents.channel = trace.stats.channel.encode('ascii', 'strict')
+    msr.contents.dataquality = trace_attr['dataquality'].\
+        encode('ascii', 'strict')
+
+    # Set starting sequence number
+    msr.contents.sequence_number = trace_attr['sequence_number']
+
+    # Only use Blockette 1001 if necessary.
+    if use_blkt_1001:
+        # Timing quality has been set in trace_attr
+
+        size = C.sizeof(Blkt1001S)
+        # Only timing quality matters here, other blockette attributes will
+        # be filled by libmseed.msr_normalize_header
+        blkt_value = pack(native_str("BBBB"), trace_attr['timing_quality'],
+                          0, 0, 0)
+        blkt_ptr = C.create_string_buffer(blkt_value, len(blkt_value))
+
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        ret_val = clibmseed.msr_addblockette(msr, blkt_ptr,
+                                             size, 1001, 0)
+
+        if bool(ret_val) is False:
+            clibmseed.msr_free(C.pointer(msr))
+            del msr
+            raise Exception('Error in msr_addblockette')
+
+    # Only use Blockette 100 if necessary.
+    # Determine if a blockette 100 will be needed to represent the input
+    # sample rate or if the sample rate in the fixed section of the data
+    # header will suffice (see ms_genfactmult in libmseed/genutils.c)
+    use_blkt_100 = False
+
+    _factor = C.c_int16()
+    _multiplier = C.c_int16()
+    _retval = clibmseed.ms_genfactmult(
+        trace.stats.sampling_rate, C.pointer(_factor),
+        C.pointer(_multiplier))
+    # Use blockette 100 if ms_genfactmult() failed.
+    if _retval != 0:
+        use_blkt_100 = True
+    # Otherwise figure out if ms_genfactmult() found exact factors.
+    # Otherwise write blockette 100.
+    else:
+        ms_sr = clibmseed.ms_nomsamprate(_factor.value, _multiplier.value)
+
+        # It is also necessary if the libmseed calculated sampling rate
+        # would result in a loss of accuracy - the floating point
+        # comparision is on purpose here as it will always try to
+        # preserve all accuracy.
+        # Cast to float32 to not add blockette 100 for values
+        # that cannot be represented with 32bits.
+        if np.float32(ms_sr) != np.float32(trace.stats.sampling_rate):
             use_blkt_100 = True
-        # Otherwise figure out if ms_genfactmult() found exact factors.
-        # Otherwise write blockette 100.
-        else:
-            ms_sr = clibmseed.ms_nomsamprate(_factor.value, _multiplier.value)
-
-            # It is also necessary if the libmseed calculated sampling rate
-            # would result in a loss of accuracy - the floating point
-            # comparision is on purpose here as it will always try to
-            # preserve all accuracy.
-            # Cast to float32 to not add blockette 100 for values
-            # that cannot be represented with 32bits.
-            if np.float32(ms_sr) != np.float32(trace.stats.sampling_rate):
-                use_blkt_100 = True
-
-        if use_blkt_100:
-            size = C.sizeof(Blkt100S)
-            blkt100 = C.c_char(b' ')
-            C.memset(C.pointer(blkt100), 0, size)
-            ret_val = clibmseed.msr_addblockette(
-                msr, C.pointer(blkt100), size, 100, 0)  # NOQA
-            # Usually returns a pointer to the added blockette in the
-            # blockette link chain and a NULL pointer if it fails.
-            # NULL pointers have a false boolean value according to the
-            # ctypes manual.
-            if bool(ret_val) is False:
-                clibmseed.msr_free(C.pointer(msr))  # NOQA
-                del msr  # NOQA
-                raise Exception('Error in msr_addblockette')
-
-        # Pack mstg into a MSEED file using the callback record_handler as
-        # write method.
-        errcode = clibmseed.mst_pack(
-            mst.mst, rec_handler, None, trace_attr['reclen'],
-            trace_attr['encoding'], trace_attr['byteorder'],
-            C.byref(packedsamples), flush, verbose, msr)  # NOQA
-
-        if errcode == 0:
-            msg = ("Did not write any data for trace '%s' even though it "
-                   "contains data values.") % trace
-            raise ValueError(msg)
-        if errcode == -1:
+
+    if use_blkt_100:
+        size = C.sizeof(Blkt100S)
+        blkt100 = C.c_char(b' ')
+        C.memset(C.pointer(blkt100), 0, size)
+        ret_val = clibmseed.msr_addblockette(
+            msr, C.pointer(blkt100), size, 100, 0)  # NOQA
+        # Usually returns a pointer to the added blockette in the
+        # blockette link chain and a NULL pointer if it fails.
+        # NULL pointers have a false boolean value according to the
+        # ctypes manual.
+        if bool(ret_val) is False:
             clibmseed.msr_free(C.pointer(msr))  # NOQA
-            del mst, msr  # NOQA
-            raise Exception('Error in mst_pack')
-        # Deallocate any allocated memory.
+            del msr  # NOQA
+            raise Exception('Error in msr_addblockette')
+
+    # Pack mstg into a MSEED file using the callback record_handler as
+    # write method.
+    errcode = clibmseed.mst_pack(
+        mst.mst, rec_handler, None, trace_attr['reclen'],
+        trace_attr['encoding'], trace_attr['byteorder'],
+        C.byref(packedsamples), flush, verbose, msr)  # NOQA
+
+    # Without flushing there might not be enough data for a full record.
+    if errcode == 0 and flush:
+        msg = ("Did not write any data for trace '%s' even though it "
+               "contains data values.") % trace
+        raise ValueError(msg)
+    if errcode == -1:
         clibmseed.msr_free(C.pointer(msr))  # NOQA
         del mst, msr  # NOQA
-    # Close if its a file handler.
-    if not hasattr(filename, 'write'):
-        f.close()
+        raise Exception('Error in mst_pack')
+    # Deallocate any allocated memory.
+    clibmseed.msr_free(C.pointer(msr))  # NOQA
+    del mst, msr  # NOQA
+    return packedsamples.value
 
 
 class MST(object):
@@ -260,6 +260,31 @@ void log_error(int errcode, int offset) {
 }
 
 
+// Builds the source name (NET_STA_LOC_CHAN_QUAL) of a record directly from
+// the fixed section of the data header in the same way msr_srcname() does
+// it. This is independent of the byte order and does not require the
+// record to be parsed.
+void raw_srcname(char *record, char *srcname) {
+    char *src = srcname;
+
+    // Network
+    src += ms_strncpclean(src, record + 18, 2);
+    *src++ = '_';
+    // Station
+    src += ms_strncpclean(src, record + 8, 5);
+    *src++ = '_';
+    // Location
+    src += ms_strncpclean(src, record + 13, 2);
+    *src++ = '_';
+    // Channel
+    src += ms_strncpclean(src, record + 15, 3);
+    *src++ = '_';
+    // Data quality
+    *src++ = record[6];
+    *src = '\0';
+}
+
+
 // Helper function to connect libmseed's logging and error messaging to Python
 // functions.
 void setupLogging(void (*diag_print) (char*),
@@ -361,6 +386,25 @@ readMSEEDBuffer (char *mseed, int buflen, Selections *selections, flag
             continue;
         }
 
+        // Skip records with non-matching source names before parsing them.
+        // The record length is directly determined from blockette 1000 if
+        // not given. Records without it are parsed and tested below.
+        if ( selections && MS_ISVALIDHEADER(mseed + offset) ) {
+            char srcname[50];
+            int skiplen = reclen;
+            raw_srcname(mseed + offset, srcname);
+            if ( ms_matchselect (selections, srcname, HPTERROR, HPTERROR, NULL) == NULL ) {
+                if ( skiplen == -1 ) {
+                    skiplen = ms_detect(mseed + offset, buflen - offset);
+                }
+                if ( skiplen > 0 && offset + skiplen <= buflen ) {
+                    offset += skiplen;
+                    msr_free(&msr);
+                    continue;
+                }
+            }
+        }
+
         // Pass (buflen - offset) because msr_parse() expects only a single record. This
         // way libmseed can take care to not overstep bounds.
         // Return values:
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+from future.builtins import *  # NOQA
+
+import io
+import os
+import unittest
+
+import numpy as np
+
+from obspy import Stream, Trace, UTCDateTime, read
+from obspy.core.compatibility import mock
+from obspy.core.util import NamedTemporaryFile
+from obspy.core.util.misc import TemporaryWorkingDirectory
+from obspy.io.mseed.appender import MSEEDAppender
+from obspy.realtime import RtTrace
+
+
+class MSEEDAppenderTestCase(unittest.TestCase):
+    """
+    Test cases for the appending MiniSEED writer.
+    """
+    def setUp(self):
+        np.random.seed(815)
+        self.trace = Trace(
+            data=np.random.randint(-1000, 1000, 20000).astype(np.int32),
+            header={"network": "BW", "station": "ALTM", "channel": "EHZ",
+                    "sampling_rate": 100.0,
+                    "starttime": UTCDateTime(2017, 1, 1, 23, 58)})
+
+    def _chunks(self, trace, npts):
+        for _i in range(0, len(trace.data), npts):
+            tr = trace.copy()
+            tr.data = trace.data[_i:_i + npts]
+            tr.stats.starttime += _i * trace.stats.delta
+            yield tr
+
+    def test_append_single_file(self):
+        """
+        Appending many small chunks results in full records containing the
+        original data.
+        """
+        buf = io.BytesIO()
+        with MSEEDAppender(filename=buf, reclen=512) as appender:
+            for tr in self._chunks(self.trace, 37):
+                appender.append(tr)
+                # Only full records have been written so far.
+                self.assertEqual(len(buf.getvalue()) % 512, 0)
+        buf.seek(0, 0)
+        st = read(buf)
+        self.assertEqual(len(st), 1)
+        np.testing.assert_array_equal(st[0].data, self.trace.data)
+        self.assertEqual(st[0].stats.starttime, self.trace.stats.starttime)
+
+    def test_append_rttrace_to_file(self):
+        """
+        Real time traces can be appended and the file is written to
+        incrementally.
+        """
+        with NamedTemporaryFile() as tf:
+            with MSEEDAppender(filename=tf.name, reclen=512) as appender:
+                sizes = []
+                for tr in self._chunks(self.trace, 1000):
+                    rt_trace = RtTrace()
+                    rt_trace.append(tr)
+                    appender.append(rt_trace)
+                    sizes.append(os.path.getsize(tf.name))
+            self.assertEqual(sorted(sizes), sizes)
+            st = read(tf.name)
+        self.assertEqual(len(st), 1)
+        np.testing.assert_array_equal(st[0].data, self.trace.data)
+        self.assertEqual(st[0].stats.starttime, self.trace.stats.starttime)
+
+    def test_gaps_and_flush_policies(self):
+        """
+        Gaps flush the buffered data, so does the size policy.
+        """
+        tr_1, tr_2 = self.trace.copy(), self.trace.copy()
+        tr_2.stats.starttime += 1000
+        buf = io.BytesIO()
+        with MSEEDAppender(filename=buf, reclen=512) as appender:
+            appender.append(Stream([tr_1, tr_2]))
+        buf.seek(0, 0)
+        st = read(buf)
+        self.assertEqual(len(st), 2)
+        for tr, expected in zip(st, (tr_1, tr_2)):
+            np.testing.assert_array_equal(tr.data, expected.data)
+            self.assertEqual(tr.stats.starttime, expected.stats.starttime)
+
+        buf = io.BytesIO()
+        appender = MSEEDAppender(filename=buf, reclen=512, flush_samples=10)
+        appender.append(self.trace.slice(endtime=(
+            self.trace.stats.starttime + 0.2)))
+        # Written although the record is not full.
+        self.assertEqual(len(buf.getvalue()), 512)
+        appender.close()
+        self.assertEqual(len(buf.getvalue()), 512)
+
+        buf = io.BytesIO()
+        appender = MSEEDAppender(filename=buf, reclen=512, flush_interval=0)
+        appender.append(self.trace.slice(endtime=(
+            self.trace.stats.starttime + 0.2)))
+        self.assertEqual(len(buf.getvalue()), 512)
+
+    def test_flush_interval_after_full_records(self):
+        """
+        The age of the buffered data starts again once full records have
+        been written.
+        """
+        buf = io.BytesIO()
+        appender = MSEEDAppender(filename=buf, reclen=512, flush_interval=10)
+        # a record is packed once about 740 samples are buffered
+        chunks = [self.trace.copy() for _ in range(3)]
+        for tr, (start, end) in zip(chunks, [(0, 400), (400, 800),
+                                             (800, 850)]):
+            tr.data = self.trace.data[start:end]
+            tr.stats.starttime += start * tr.stats.delta
+        with mock.patch("time.time") as time_mock:
+            time_mock.return_value = 0.0
+            appender.append(chunks[0])
+            self.assertEqual(len(buf.getvalue()), 0)
+            # writes a full record, the rest stays buffered
+            time_mock.return_value = 9.0
+            appender.append(chunks[1])
+            self.assertEqual(len(buf.getvalue()), 512)
+            self.assertIn(self.trace.id, appender._pending)
+            # not due as the remaining data was buffered at 9 seconds
+            time_mock.return_value = 11.0
+            appender.append(chunks[2])
+            self.assertEqual(len(buf.getvalue()), 512)
+            self.assertIn(self.trace.id, appender._pending)
+            time_mock.return_value = 20.0
+            appender.flush(only_due=True)
+            self.assertNotIn(self.trace.id, appender._pending)
+        buf.seek(0, 0)
+        np.testing.assert_array_equal(read(buf)[0].data,
+                                      self.trace.data[:850])
+
+    def test_append_int64_data(self):
+        """
+        int64 data is appended as int32 data if all values fit.
+        """
+        trace = self.trace.copy()
+        trace.data = trace.data.astype(np.int64)
+        buf = io.BytesIO()
+        with MSEEDAppender(filename=buf, reclen=512) as appender:
+            for tr in self._chunks(trace, 1000):
+                appender.append(tr)
+        buf.seek(0, 0)
+        st = read(buf)
+        self.assertEqual(len(st), 1)
+        self.assertEqual(st[0].data.dtype, np.int32)
+        np.testing.assert_array_equal(st[0].data, self.trace.data)
+
+        trace.data[5] = 2 ** 31
+        with MSEEDAppender(filename=io.BytesIO()) as appender:
+            with self.assertRaises(ValueError) as e:
+                appender.append(trace)
+        self.assertEqual(str(e.exception),
+                         "Data of type int64 of BW.ALTM..EHZ exceeds the "
+                         "range of int32 and can not be appended.")
+
+    def test_sds_day_files(self):
+        """
+        Records are written to SDS day files which are rolled at midnight.
+        """
+        with TemporaryWorkingDirectory():
+            with MSEEDAppender(sds_root="SDS", reclen=512) as appender:
+                for tr in self._chunks(self.trace, 500):
+                    appender.append(tr)
+            filename_1 = os.path.join("SDS", "2017", "BW", "ALTM", "EHZ.D",
+                                      "BW.ALTM..EHZ.D.2017.001")
+            filename_2 = os.path.join("SDS", "2017", "BW", "ALTM", "EHZ.D",
+                                      "BW.ALTM..EHZ.D.2017.002")
+            st_1 = read(filename_1)
+            st_2 = read(filename_2)
+            sequence_numbers = []
+            for filename in (filename_1, filename_2):
+                with open(filename, "rb") as fh:
+                    data = fh.read()
+                sequence_numbers.extend(
+                    int(data[_i:_i + 6]) for _i in range(0, len(data), 512))
+        midnight = UTCDateTime(2017, 1, 2)
+        self.assertEqual(st_1[0].stats.endtime, midnight - 0.01)
+        self.assertEqual(st_2[0].stats.starttime, midnight)
+        st = (st_1 + st_2).merge()
+        self.assertEqual(len(st), 1)
+        np.testing.assert_array_equal(st[0].data, self.trace.data)
+        # Sequence numbers continue across the day files.
+        self.assertEqual(sequence_numbers,
+                         list(range(1, len(sequence_numbers) + 1)))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, MSEEDAppender)
+        self.assertRaises(ValueError, MSEEDAppender, filename="a",
+                          sds_root="b")
+        self.assertRaises(ValueError, MSEEDAppender, filename="a",
+                          reclen=1000)
+
+
+def suite():
+    return unittest.makeSuite(MSEEDAppenderTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -425,6 +425,47 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
         st6 = _read_mseed(testfile, sourcename='*.BLA')
         self.assertEqual(len(st6), 0)
 
+    def test_read_partial_with_multiple_source_names(self):
+        """
+        Reads only some channels of a multiplexed file by passing a list of
+        SEED IDs, optionally combined with a time window.
+        """
+        np.random.seed(815)
+        st = Stream()
+        for cha in ("EHZ", "EHN", "EHE", "HHZ", "HHN", "HHE", "LHZ"):
+            st += Trace(data=np.random.randint(-1000, 1000, 3000).astype(
+                np.int32), header={"network": "BW", "station": "ALTM",
+                                   "location": "00", "channel": cha,
+                                   "starttime": UTCDateTime(2017, 1, 1)})
+        with io.BytesIO() as buf:
+            # Interleave the records of all channels.
+            st.write(buf, format="MSEED", reclen=512)
+            data = buf.getvalue()
+        records = [data[_i:_i + 512] for _i in range(0, len(data), 512)]
+        multiplexed = io.BytesIO(b"".join(records[::2] + records[1::2]))
+
+        st2 = _read_mseed(multiplexed, sourcename=["*.HH?", "BW.ALTM.00.LHZ"])
+        st2.merge()
+        self.assertEqual([tr.stats.channel for tr in st2.sort()],
+                         ["HHE", "HHN", "HHZ", "LHZ"])
+        for tr in st2:
+            np.testing.assert_array_equal(
+                tr.data, st.select(channel=tr.stats.channel)[0].data)
+
+        multiplexed.seek(0, 0)
+        st3 = _read_mseed(multiplexed, sourcename=("*.EHZ", "*.EHE"),
+                          starttime=UTCDateTime(2017, 1, 1, 0, 0, 20))
+        self.assertEqual(sorted(set(tr.stats.channel for tr in st3)),
+                         ["EHE", "EHZ"])
+        for tr in st3:
+            self.assertGreaterEqual(tr.stats.endtime,
+                                    UTCDateTime(2017, 1, 1, 0, 0, 20))
+
+        for sourcename in ([], [1, 2]):
+            multiplexed.seek(0, 0)
+            self.assertRaises(ValueError, _read_mseed, multiplexed,
+                              sourcename=sourcename)
+
     def test_write_integers(self):
         """
         Write integer array via L{obspy.io.mseed.mseed._write_mseed}.
@@ -572,6 +613,35 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
             tf.seek(0, os.SEEK_SET)
             self.assertEqual(tf.read(6), b"000042")
 
+    def test_write_with_multiple_threads(self):
+        """
+        Writing with multiple threads must result in exactly the same bytes
+        as the serial writer.
+        """
+        np.random.seed(815)
+        st = Stream()
+        for _i, encoding in enumerate([11, 11, 10, 3, 4, 5, 11]):
+            dtype = ENCODINGS[encoding][2]
+            data = np.random.randint(-1000, 1000, 5000 + 100 * _i)
+            st.append(Trace(data=data.astype(dtype), header={
+                "network": "BW", "station": "ST%i" % _i, "channel": "HHZ",
+                "sampling_rate": 200.0,
+                "starttime": UTCDateTime(2016, 1, 1, 0, 0, _i),
+                "mseed": {"encoding": encoding}}))
+        # An empty trace is skipped in both cases.
+        st.insert(3, Trace(data=np.array([], dtype=np.int32)))
+
+        serial = io.BytesIO()
+        parallel = io.BytesIO()
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("ignore")
+            st.write(serial, format="MSEED", reclen=512)
+            st.write(parallel, format="MSEED", reclen=512, threads=4)
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+        serial.seek(0, 0)
+        st2 = read(serial)
+        self.assertEqual(len(st2), 7)
+
     def test_write_and_read_different_record_lengths(self):
         """
         Tests Mini-SEED writing and record lengths.
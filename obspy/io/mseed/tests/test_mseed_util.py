@@ -12,7 +12,7 @@ import shutil
 import sys
 import unittest
 from datetime import datetime
-from struct import pack, unpack
+from struct import pack
 import warnings
 
 import numpy as np
@@ -22,9 +22,6 @@ from obspy.core import Stream, Trace
 from obspy.core.util import NamedTemporaryFile
 from obspy.io.mseed import util
 from obspy.io.mseed.core import _read_mseed
-from obspy.io.mseed.headers import (FIXED_HEADER_ACTIVITY_FLAGS,
-                                    FIXED_HEADER_DATA_QUAL_FLAGS,
-                                    FIXED_HEADER_IO_CLOCK_FLAGS)
 from obspy.io.mseed.util import set_flags_in_fixed_headers
 
 
@@ -489,6 +486,65 @@ class MSEEDUtilTestCase(unittest.TestCase):
             self.assertEqual(start, stream[0].stats.starttime)
             self.assertEqual(end, stream[0].stats.endtime)
 
+    def test_get_record_table(self):
+        """
+        Tests the vectorized record header table against the records as
+        parsed by libmseed.
+        """
+        mseed_filenames = ['BW.BGLD.__.EHE.D.2008.001.first_10_records',
+                           'test.mseed', 'timingquality.mseed',
+                           'fullseed.mseed', 'two_channels.mseed']
+        filenames = [os.path.join(self.path, 'data', _i)
+                     for _i in mseed_filenames]
+        table = util.get_record_table(filenames)
+        self.assertEqual(table.dtype, util.RECORD_TABLE_DTYPE)
+        for _i, filename in enumerate(filenames):
+            records = table[table["file_index"] == _i]
+            stream = _read_mseed(filename)
+            self.assertEqual(UTCDateTime(ns=int(records["starttime"][0])),
+                             stream[0].stats.starttime)
+            self.assertEqual(UTCDateTime(ns=int(records["endtime"][-1])),
+                             stream[-1].stats.endtime)
+            self.assertEqual(records["npts"].sum(),
+                             sum(tr.stats.npts for tr in stream))
+            self.assertEqual(records[0]["network"], stream[0].stats.network)
+            self.assertEqual(records[0]["station"], stream[0].stats.station)
+            self.assertEqual(records[0]["location"],
+                             stream[0].stats.location)
+            self.assertEqual(records[0]["channel"], stream[0].stats.channel)
+            self.assertEqual(records[0]["samp_rate"],
+                             stream[0].stats.sampling_rate)
+            self.assertEqual(records[0]["record_length"],
+                             stream[0].stats.mseed.record_length)
+            self.assertTrue(np.all(np.diff(records["offset"]) ==
+                                   records["record_length"][:-1]))
+
+        self.assertEqual(
+            (table["file_index"] == 1).sum(),
+            _read_mseed(filenames[1])[0].stats.mseed.number_of_records)
+
+        # File-like objects.
+        filename = os.path.join(self.path, 'data', 'timingquality.mseed')
+        with io.open(filename, 'rb') as fh:
+            table_2 = util.get_record_table(fh)
+        records = table[table["file_index"] == 2]
+        records["file_index"] = 0
+        np.testing.assert_array_equal(records, table_2)
+
+        # Empty files and lists.
+        with NamedTemporaryFile() as tf:
+            self.assertEqual(len(util.get_record_table(tf.name)), 0)
+        self.assertEqual(len(util.get_record_table([])), 0)
+
+        # The headers are parsed once, i.e. one warning per faulty record.
+        filename = os.path.join(self.path, 'data',
+                                'wrong_blockette_numbers_specified.mseed')
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            table = util.get_record_table(filename)
+        self.assertEqual(len(table), 16)
+        self.assertEqual(len(w), 16)
+
     def test_get_timing_quality(self):
         """
         This test reads a self-made Mini-SEED file with Timing Quality
@@ -647,6 +703,82 @@ class MSEEDUtilTestCase(unittest.TestCase):
             st_before[0].stats.starttime -= 2.2222
             self.assertEqual(st_before, st_after)
 
+    def test_rewrite_fixed_headers(self):
+        """
+        Tests the vectorized header rewriting of rewrite_fixed_headers().
+        """
+        filename = os.path.join(self.path, 'data', 'timingquality.mseed')
+        with open(filename, 'rb') as fh:
+            original = fh.read()
+        st_before = _read_mseed(filename)
+
+        with NamedTemporaryFile() as tf:
+            output_filename = tf.name
+            table = util.rewrite_fixed_headers(
+                filename, output_file=output_filename, timeshift=-12345,
+                codes={"BW.BGL?.*.*": "XX.A.00.*"},
+                flags={"...": {"data_qual_flags": {"glitches_detected": True},
+                               "activity_flags": {"calib_signal": False}}})
+            # Input file is unchanged.
+            with open(filename, 'rb') as fh:
+                self.assertEqual(fh.read(), original)
+            st_after = _read_mseed(output_filename)
+            self.assertEqual(st_after[0].id, "XX.A.00.EHE")
+            self.assertEqual(st_after[0].stats.starttime,
+                             st_before[0].stats.starttime - 1.2345)
+            np.testing.assert_array_equal(st_after[0].data,
+                                          st_before[0].data)
+            flags = util.get_flags(output_filename)
+            self.assertEqual(flags["data_quality_flags_counts"]["glitches"],
+                             len(table))
+            # The returned table matches the written file.
+            np.testing.assert_array_equal(
+                table, util.get_record_table(output_filename))
+
+            # Dry runs do not change anything.
+            with open(output_filename, 'rb') as fh:
+                shifted = fh.read()
+            table_2 = util.rewrite_fixed_headers(
+                output_filename, timeshift=12345,
+                codes={"*": "BW.BGLD..*"}, dry_run=True)
+            with open(output_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), shifted)
+            # But return the same table as actually shifting back in-place.
+            table_3 = util.rewrite_fixed_headers(
+                output_filename, timeshift=12345, codes={"*": "BW.BGLD..*"})
+            np.testing.assert_array_equal(table_2, table_3)
+            # Flags are kept, everything else is back to the original.
+            with open(output_filename, 'rb') as fh:
+                data = np.frombuffer(fh.read(), dtype=np.uint8).copy()
+            self.assertTrue(np.all(data[38::512] & 8))
+            data[38::512] &= ~np.uint8(8)
+            self.assertEqual(data.tobytes(), original)
+
+            # Excessive bytes are only appended when copying the file.
+            with open(output_filename, 'ab') as fh:
+                fh.write(b'\x00' * 100)
+            with NamedTemporaryFile() as tf2:
+                for kwargs, expected in (
+                        ({'dry_run': True}, "would be left unchanged"),
+                        ({}, "will be left unchanged"),
+                        ({'output_file': tf2.name},
+                         "will be appended to the output file")):
+                    with warnings.catch_warnings(record=True) as w:
+                        warnings.simplefilter("always")
+                        util.rewrite_fixed_headers(
+                            output_filename, timeshift=1, **kwargs)
+                    self.assertEqual(len(w), 1)
+                    self.assertEqual(
+                        w[0].message.args[0],
+                        "100 excessive byte(s) in the file. They %s." %
+                        expected)
+
+        # Invalid codes.
+        self.assertRaises(ValueError, util.rewrite_fixed_headers, filename,
+                          codes={"*.*.*.*": "TOOLONG.*.*.*"}, dry_run=True)
+        self.assertRaises(ValueError, util.rewrite_fixed_headers, filename,
+                          codes={"*.*.*.*": "A.B"}, dry_run=True)
+
     def test_check_flag_value(self):
         """
         Test case for obspy.io.mseed.util._check_flag_value
@@ -835,130 +967,6 @@ class MSEEDUtilTestCase(unittest.TestCase):
                                    UTCDateTime("2009-12-25T06:00:00.0")]}
         self.assertRaises(ValueError, util._check_flag_value, flag_value)
 
-    def test_search_flag_in_blockette(self):
-        """
-        Test case for obspy.io.mseed.util._search_flag_in_blockette
-        """
-        # Write dummy file
-        npts = 2000
-        np.random.seed(42)  # make test reproducible
-        data = np.random.randint(-1000, 1000, npts).astype(np.int32)
-        # This header ensures presence of blockettes 1000 and 1001
-        stat_header = {'network': 'NE', 'station': 'STATI', 'location': 'LO',
-                       'channel': 'CHA', 'npts': len(data), 'sampling_rate': 1,
-                       'mseed': {'dataquality': 'D',
-                                 'blkt1001': {'timing_quality': 63}}}
-        stat_header['starttime'] = UTCDateTime(datetime(2012, 8, 1,
-                                                        12, 0, 0, 42))
-        trace1 = Trace(data=data, header=stat_header)
-        st = Stream([trace1])
-        with NamedTemporaryFile() as tf:
-            st.write(tf, format="mseed", encoding=11, reclen=512)
-            tf.seek(0, os.SEEK_SET)
-            file_name = tf.name
-
-            with open(file_name, "rb") as file_desc:
-                file_desc.seek(0, os.SEEK_SET)
-                # Test from file start
-                read_bytes = util._search_flag_in_blockette(
-                    file_desc, 48, 1001, 4, 1)
-                self.assertFalse(read_bytes is None)
-                self.assertEqual(unpack(native_str(">B"), read_bytes)[0], 63)
-
-                # Test from middle of a record header
-                file_desc.seek(14, os.SEEK_CUR)
-                file_pos = file_desc.tell()
-                read_bytes = util._search_flag_in_blockette(
-                    file_desc, 34, 1000, 6, 1)
-                self.assertFalse(read_bytes is None)
-                self.assertEqual(unpack(native_str(">B"), read_bytes)[0], 9)
-                # Check that file_desc position has not changed
-                self.assertEqual(file_desc.tell(), file_pos)
-
-                # Test from middle of a record data
-                file_desc.seek(60, os.SEEK_CUR)
-                read_bytes = util._search_flag_in_blockette(
-                    file_desc, -26, 1001, 5, 1)
-                self.assertFalse(read_bytes is None)
-                self.assertEqual(unpack(native_str(">B"), read_bytes)[0], 42)
-
-                # Test another record. There is at least 3 records in a
-                # mseed with 2000 data points and 512 bytes record length
-                file_desc.seek(1040, os.SEEK_SET)
-                read_bytes = util._search_flag_in_blockette(file_desc,
-                                                            32, 1001, 4, 1)
-                self.assertEqual(unpack(native_str(">B"), read_bytes)[0], 63)
-
-                # Test missing blockette
-                read_bytes = util._search_flag_in_blockette(file_desc,
-                                                            32, 201, 4, 4)
-                self.assertIs(read_bytes, None)
-
-    def test_convert_flags_to_raw_bytes(self):
-        """
-        Test case for obspy.io.mseed.util._convert_flags_to_raw_byte
-        """
-        recstart = UTCDateTime("2009-12-25T06:00:00.0")
-        recend = UTCDateTime("2009-12-26T06:00:00.0")
-        user_flags = {
-            # boolean flags
-            'calib_signal': True,
-            'time_correction': False,
-            # instant value
-            'begin_event': [(UTCDateTime("2009-12-25T07:00:00.0"),
-                             UTCDateTime("2009-12-25T07:00:00.0"))],
-            # duration value (inside record)
-            'end_event': [(UTCDateTime("2009-12-25T07:00:00.0"),
-                           UTCDateTime("2009-12-25T07:04:00.0"))],
-            # instant value at the end of the record
-            'positive_leap': [(UTCDateTime("2009-12-26T06:00:00.0"),
-                               UTCDateTime("2009-12-26T06:00:00.0"))],
-            # value before record start
-            'negative_leap': [(UTCDateTime("2001-12-25T06:00:00.0"),
-                               UTCDateTime("2001-12-25T06:00:00.0"))],
-            # value after record end
-            'event_in_progress': [(UTCDateTime("2020-12-25T06:00:00.0"),
-                                   UTCDateTime("2020-12-25T06:00:00.0"))]}
-
-        act_flags = util._convert_flags_to_raw_byte(
-            FIXED_HEADER_ACTIVITY_FLAGS, user_flags, recstart, recend)
-        self.assertEqual(act_flags, 13)
-
-        user_flags = {
-            # duration value (across record start)
-            'sta_vol_parity_error_possible':
-                [(UTCDateTime("2009-12-25T00:00:00.0"),
-                  UTCDateTime("2009-12-26T00:00:00.0"))],
-            # duration value (across record end)
-            'long_record_read': [(UTCDateTime("2009-12-26T00:00:00.0"),
-                                  UTCDateTime("2009-12-27T00:00:00.0"))],
-            # duration value (record inside duration)
-            'short_record_read': [(UTCDateTime("2009-12-25T00:00:00.0"),
-                                   UTCDateTime("2009-12-27T00:00:00.0"))],
-            # several datation periods, one matching the record
-            'start_of_time_series': [(UTCDateTime("2008-12-25T00:00:00.0"),
-                                      UTCDateTime("2008-12-27T00:00:00.0")),
-                                     (UTCDateTime("2009-12-26T00:00:00.0"),
-                                      UTCDateTime("2009-12-26T00:00:00.0")),
-                                     (UTCDateTime("2010-12-25T00:00:00.0"),
-                                      UTCDateTime("2010-12-27T00:00:00.0"))]}
-        io_clock = util._convert_flags_to_raw_byte(
-            FIXED_HEADER_IO_CLOCK_FLAGS, user_flags, recstart, recend)
-        self.assertEqual(io_clock, 15)
-
-        # Quick check of data quality flags
-        user_flags = {'amplifier_sat_detected': True,
-                      'digitizer_clipping_detected': False,
-                      'spikes_detected': True,
-                      'glitches_detected': False,
-                      'missing_padded_data_present': True,
-                      'telemetry_sync_error': False,
-                      'digital_filter_maybe_charging': True,
-                      'time_tag_questionable': False}
-        data_qual = util._convert_flags_to_raw_byte(
-            FIXED_HEADER_DATA_QUAL_FLAGS, user_flags, recstart, recend)
-        self.assertEqual(data_qual, 85)
-
     def test_set_flags_in_fixed_header(self):
         """
         Test case for obspy.io.mseed.util.set_flags_in_fixed_headers
@@ -1136,6 +1144,36 @@ class MSEEDUtilTestCase(unittest.TestCase):
             self.assertEqual(flags['glitches'], 2)
             self.assertEqual(flags['suspect_time_tag'], 2)
 
+    def test_set_flags_time_span_of_records(self):
+        """
+        Time windows of flags are matched against the time span of the
+        records, records with a sampling rate of zero only span their start
+        time.
+        """
+        flags = {"...": {"activity_flags": {"event_in_progress": {
+            "INSTANT": [UTCDateTime(50)],
+            "DURATION": [(UTCDateTime(10), UTCDateTime(40))]}}}}
+        with NamedTemporaryFile() as tf:
+            # three records with 50 samples at 1 Hz
+            _create_mseed_file(tf.name, record_count=3)
+            table = util.rewrite_fixed_headers(tf.name, flags=flags,
+                                               dry_run=True)
+            np.testing.assert_array_equal(table['samp_rate'], 1.0)
+            np.testing.assert_array_equal(table['activity_flags'] & 64,
+                                          [64, 64, 0])
+            # zero sample rate factor and multiplier
+            with open(tf.name, 'r+b') as fh:
+                data = np.frombuffer(fh.read(), dtype=np.uint8).copy()
+                for offset in range(32, 36):
+                    data[offset::256] = 0
+                fh.seek(0, 0)
+                fh.write(data.tobytes())
+            table = util.rewrite_fixed_headers(tf.name, flags=flags,
+                                               dry_run=True)
+            np.testing.assert_array_equal(table['samp_rate'], 0.0)
+            np.testing.assert_array_equal(table['activity_flags'] & 64,
+                                          [0, 64, 0])
+
     def test_regression_segfault_when_hooking_up_libmseeds_logging(self):
         filename = os.path.join(self.path, 'data',
                                 'wrong_blockette_numbers_specified.mseed')
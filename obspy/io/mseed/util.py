@@ -9,21 +9,22 @@ from future.utils import native_str
 
 import collections
 import ctypes as C
+import fnmatch
 import os
-import sys
+import shutil
 import warnings
 from datetime import datetime
-from struct import pack, unpack
+from struct import unpack
 
 import numpy as np
 
 from obspy import UTCDateTime
 from obspy.core.util.decorator import ObsPyDeprecationWarning
+from . import InternalMSEEDError, InternalMSEEDWarning
 from .headers import (ENCODINGS, ENDIAN, FIXED_HEADER_ACTIVITY_FLAGS,
                       FIXED_HEADER_DATA_QUAL_FLAGS,
-                      FIXED_HEADER_IO_CLOCK_FLAGS, HPTMODULUS,
-                      SAMPLESIZES, UNSUPPORTED_ENCODINGS, MSRecord,
-                      MS_NOERROR, clibmseed)
+                      FIXED_HEADER_IO_CLOCK_FLAGS, SAMPLESIZES,
+                      UNSUPPORTED_ENCODINGS, clibmseed)
 
 
 def get_start_and_end_time(file_or_file_object):
@@ -95,6 +96,390 @@ def get_start_and_end_time(file_or_file_object):
     return starttime, endtime
 
 
+# Structured dtype of the table returned by get_record_table(). Times are
+# POSIX timestamps in integer nanoseconds, matching the internal
+# representation of UTCDateTime.
+RECORD_TABLE_DTYPE = np.dtype([
+    (native_str('file_index'), np.int32),
+    (native_str('offset'), np.int64),
+    (native_str('network'), native_str('U2')),
+    (native_str('station'), native_str('U5')),
+    (native_str('location'), native_str('U2')),
+    (native_str('channel'), native_str('U3')),
+    (native_str('dataquality'), native_str('U1')),
+    (native_str('starttime'), np.int64),
+    (native_str('endtime'), np.int64),
+    (native_str('npts'), np.int32),
+    (native_str('samp_rate'), np.float64),
+    (native_str('encoding'), np.int16),
+    (native_str('record_length'), np.int32),
+    (native_str('byteorder'), native_str('U1')),
+    (native_str('activity_flags'), np.uint8),
+    (native_str('io_and_clock_flags'), np.uint8),
+    (native_str('data_quality_flags'), np.uint8),
+    (native_str('time_correction'), np.int32),
+    (native_str('timing_quality'), np.int16)])
+
+# Valid data record quality indicators.
+_DATA_RECORD_INDICATORS = np.frombuffer(b'DRQM', dtype=np.uint8)
+
+
+def get_record_table(files):
+    """
+    Scans the fixed headers and blockettes of all records in one or more
+    MiniSEED files and returns them as a NumPy structured array.
+
+    The headers are parsed with vectorized NumPy operations over all records
+    at once, no Python code runs per record for files with a constant record
+    length. Only the headers are accessed, files given by name are memory
+    mapped so the waveform data is never read.
+
+    :param files: MiniSEED file or list of MiniSEED files. File-like objects
+        will be read from their current position.
+    :type files: list, str, file-like object
+    :rtype: :class:`numpy.ndarray`
+    :return: Structured array with one row per data record and the dtype
+        :const:`RECORD_TABLE_DTYPE`. The columns are:
+
+        ``file_index``
+            Index of the file in ``files`` the record belongs to.
+        ``offset``
+            Byte offset of the record in the file (relative to the initial
+            position for file-like objects).
+        ``network``, ``station``, ``location``, ``channel``
+            The SEED identifier.
+        ``dataquality``
+            The data quality indicator (``D``, ``R``, ``Q`` or ``M``).
+        ``starttime``, ``endtime``
+            Time of the first and of the last sample of the record as POSIX
+            timestamp in nanoseconds. An unapplied time correction and the
+            microseconds of blockette 1001 are taken into account.
+        ``npts``
+            Number of samples.
+        ``samp_rate``
+            Sampling rate, either from blockette 100 or from the sample rate
+            factor and multiplier in the fixed header.
+        ``encoding``
+            Data encoding from blockette 1000, ``-1`` if not present.
+        ``record_length``
+            The record length in bytes.
+        ``byteorder``
+            ``">"`` or ``"<"``.
+        ``activity_flags``, ``io_and_clock_flags``, ``data_quality_flags``
+            The raw flag bytes of the fixed header.
+        ``time_correction``
+            The time correction field in units of 0.0001 seconds.
+        ``timing_quality``
+            The timing quality of blockette 1001, ``-1`` if not present.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("timingquality.mseed")
+    >>> table = get_record_table(filename)
+    >>> len(table)
+    101
+    >>> print(table[0]["network"], table[0]["station"], table[0]["channel"])
+    BW BGLD EHE
+    >>> print(UTCDateTime(ns=int(table[0]["starttime"])))
+    2007-12-31T23:59:59.765000Z
+    >>> print(table["timing_quality"][:5])
+    [55 70 86 66 54]
+    """
+    if not isinstance(files, list):
+        files = [files]
+
+    tables = []
+    for _i, file in enumerate(files):
+        buf = _get_buffer(file)
+        table = _get_record_headers(buf)
+        offsets = table['offset']
+        table['file_index'] = _i
+        # Records without blockette 1000 extend to the next record.
+        missing = table['record_length'] == 0
+        if missing.any():
+            table['record_length'][missing] = \
+                np.diff(np.append(offsets, len(buf)))[missing]
+        tables.append(table)
+        del buf
+
+    if not tables:
+        return np.empty(0, dtype=RECORD_TABLE_DTYPE)
+    return np.concatenate(tables)
+
+
+def _get_buffer(file):
+    """
+    Returns the contents of a file name or a file-like object as a uint8
+    NumPy array. Files are memory mapped.
+    """
+    if isinstance(file, (str, native_str)):
+        if not os.path.getsize(file):
+            return np.empty(0, dtype=np.uint8)
+        return np.memmap(file, dtype=np.uint8, mode='r').view(np.ndarray)
+    return np.frombuffer(file.read(), dtype=np.uint8)
+
+
+def _get_uint16(buf, pos, big_endian):
+    """
+    Reads unsigned 16 bit integers at the given positions of a uint8 buffer,
+    each with its own byte order.
+    """
+    b0 = buf[pos].astype(np.uint16)
+    b1 = buf[pos + 1].astype(np.uint16)
+    return np.where(big_endian, (b0 << 8) | b1, (b1 << 8) | b0)
+
+
+def _get_bytes(buf, pos, count, big_endian=None, dtype=None):
+    """
+    Gathers ``count`` bytes at each of the given positions of a uint8 buffer
+    and optionally interprets them as a big endian ``dtype`` after swapping
+    the little endian rows.
+    """
+    chunk = buf[pos[:, np.newaxis] + np.arange(count)]
+    if dtype is None:
+        return chunk
+    if big_endian is not None:
+        chunk[~big_endian] = chunk[~big_endian, ::-1]
+    return np.ascontiguousarray(chunk).view(
+        np.dtype(dtype).newbyteorder('>')).ravel()
+
+
+def _is_data_record(buf, offsets):
+    """
+    Vectorized check whether or not data records start at the given offsets.
+    """
+    offsets = offsets[offsets + 48 <= len(buf)]
+    valid = np.in1d(buf[offsets + 6], _DATA_RECORD_INDICATORS)
+    # The sequence number must be ASCII digits, spaces or null bytes.
+    seq = _get_bytes(buf, offsets, 6)
+    valid &= np.all(((seq >= ord('0')) & (seq <= ord('9'))) |
+                    (seq == ord(' ')) | (seq == 0), axis=1)
+    return offsets, valid
+
+
+def _get_record_headers(buf):
+    """
+    Finds all data records in a buffer and parses their headers.
+
+    Assumes a constant record length and validates it for all records at
+    once, the headers parsed for the validation are returned. Files with
+    varying record lengths are walked record by record.
+    """
+    empty = np.empty(0, dtype=np.int64)
+    if len(buf) < 48:
+        return _parse_record_headers(buf, empty)
+
+    # Find the first data record - it might be preceded by the control
+    # headers of a full SEED volume.
+    candidates, valid = _is_data_record(
+        buf, np.arange(0, len(buf), 128, dtype=np.int64))
+    if not valid.any():
+        return _parse_record_headers(buf, empty)
+    first = candidates[np.argmax(valid)]
+    reclen = _get_record_length(buf, first)
+    if reclen is None:
+        return _parse_record_headers(buf, empty)
+
+    offsets = np.arange(first, len(buf), reclen, dtype=np.int64)
+    offsets, valid = _is_data_record(buf, offsets)
+    if valid.all() and offsets[-1] + reclen <= len(buf):
+        messages = []
+        table = _parse_record_headers(buf, offsets, messages)
+        if np.all(table['record_length'] == reclen):
+            for msg in messages:
+                warnings.warn(msg, InternalMSEEDWarning)
+            return table
+
+    # Record lengths vary or the file has some garbage in between. Walk it.
+    offsets = []
+    offset = first
+    while offset + 48 <= len(buf):
+        _, valid = _is_data_record(buf, np.array([offset], dtype=np.int64))
+        if not valid[0]:
+            # Skip noise or empty blocks.
+            offset += 128
+            continue
+        reclen = _get_record_length(buf, offset)
+        if reclen is None or offset + reclen > len(buf):
+            break
+        offsets.append(offset)
+        offset += reclen
+    return _parse_record_headers(buf, np.array(offsets, dtype=np.int64))
+
+
+def _get_record_length(buf, offset):
+    """
+    Returns the length of the record at the given offset, either from its
+    blockette 1000 or as detected by libmseed. ``None`` if it cannot be
+    determined.
+    """
+    reclen = _parse_record_headers(
+        buf, np.array([offset], dtype=np.int64), [])['record_length'][0]
+    if reclen > 0:
+        return int(reclen)
+    record = np.ascontiguousarray(buf[offset:offset + 2 ** 14],
+                                  dtype=np.int8)
+    try:
+        reclen = clibmseed.ms_detect(record, len(record))
+    except InternalMSEEDError:
+        return None
+    if reclen <= 0:
+        # The last record might lack a blockette 1000.
+        if len(record) in [2 ** _i for _i in range(7, 21)]:
+            return len(record)
+        return None
+    return int(reclen)
+
+
+def _get_btime(buf, pos, big_endian):
+    """
+    Reads SEED BTIME structures at the given positions of a uint8 buffer and
+    returns them as POSIX timestamps in nanoseconds.
+    """
+    year = _get_uint16(buf, pos, big_endian).astype(np.int64)
+    julday = _get_uint16(buf, pos + 2, big_endian).astype(np.int64)
+    fraction = _get_uint16(buf, pos + 8, big_endian).astype(np.int64)
+    # Days since 1970-01-01 of the first day of the year.
+    days = (year - 1970).astype('M8[Y]').astype('M8[D]').astype(np.int64)
+    days += julday - 1
+    seconds = days * 86400 + buf[pos + 4].astype(np.int64) * 3600 + \
+        buf[pos + 5].astype(np.int64) * 60 + buf[pos + 6]
+    return seconds * 1000000000 + fraction * 100000
+
+
+def _parse_record_headers(buf, offsets, messages=None):
+    """
+    Parses the fixed headers and blockettes 100, 1000, and 1001 of the data
+    records starting at the given offsets in a uint8 buffer.
+
+    Records lacking a blockette 1000 have a record length of 0. Records with
+    an unexpected number of blockettes are warned about, if ``messages`` is
+    a list the warning messages are appended to it instead.
+    """
+    table = np.zeros(len(offsets), dtype=RECORD_TABLE_DTYPE)
+    if not len(offsets):
+        return table
+    table['offset'] = offsets
+
+    header = _get_bytes(buf, offsets, 48)
+
+    # Determine the byte order per record by checking whether year and day
+    # of year are sensible in big endian (the same check as libmseed).
+    year_be = (header[:, 20].astype(np.uint16) << 8) | header[:, 21]
+    day_be = (header[:, 22].astype(np.uint16) << 8) | header[:, 23]
+    big_endian = (year_be >= 1900) & (year_be <= 2100) & \
+        (day_be >= 1) & (day_be <= 366)
+    table['byteorder'] = np.where(big_endian, '>', '<')
+
+    def _codes(start, length):
+        codes = np.ascontiguousarray(header[:, start:start + length]).view(
+            native_str('S%i' % length)).ravel()
+        return np.char.decode(np.char.strip(codes), native_str('latin-1'))
+
+    table['dataquality'] = _codes(6, 1)
+    table['station'] = _codes(8, 5)
+    table['location'] = _codes(13, 2)
+    table['channel'] = _codes(15, 3)
+    table['network'] = _codes(18, 2)
+
+    npts = _get_uint16(buf, offsets + 30, big_endian)
+    factor = _get_uint16(buf, offsets + 32, big_endian).view(np.int16)
+    multiplier = _get_uint16(buf, offsets + 34, big_endian).view(np.int16)
+    table['npts'] = npts
+    table['activity_flags'] = header[:, 36]
+    table['io_and_clock_flags'] = header[:, 37]
+    table['data_quality_flags'] = header[:, 38]
+    table['time_correction'] = _get_bytes(buf, offsets + 40, 4, big_endian,
+                                          np.int32)
+    blkt_offset = _get_uint16(buf, offsets + 46, big_endian).astype(np.int64)
+
+    starttime = _get_btime(buf, offsets + 20, big_endian)
+
+    # Unapplied time corrections (bit 1 of the activity flags) are applied.
+    apply_correction = (header[:, 36] & 2) == 0
+    starttime += np.where(apply_correction,
+                          table['time_correction'].astype(np.int64) * 100000,
+                          0)
+
+    # Sample rates as defined by the SEED manual.
+    factor = factor.astype(np.float64)
+    multiplier = multiplier.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        samp_rate = np.select(
+            [(factor > 0) & (multiplier > 0),
+             (factor > 0) & (multiplier < 0),
+             (factor < 0) & (multiplier > 0),
+             (factor < 0) & (multiplier < 0)],
+            [factor * multiplier,
+             -factor / multiplier,
+             -multiplier / factor,
+             1.0 / (factor * multiplier)],
+            default=0.0)
+
+    table['encoding'] = -1
+    table['timing_quality'] = -1
+    blkt_count = np.zeros(len(offsets), dtype=np.int64)
+    # Traverse the blockette chains of all records at once. The loop runs
+    # once per chain depth and not once per record.
+    for _ in range(32):
+        active = (blkt_offset >= 48) & \
+            (offsets + blkt_offset + 4 <= len(buf))
+        if not active.any():
+            break
+        idx = np.nonzero(active)[0]
+        pos = offsets[idx] + blkt_offset[idx]
+        be = big_endian[idx]
+        blkt_type = _get_uint16(buf, pos, be)
+        next_blkt = _get_uint16(buf, pos + 2, be).astype(np.int64)
+        blkt_count[idx] += 1
+
+        sel = (blkt_type == 1000) & (pos + 7 <= len(buf))
+        if sel.any():
+            _i = idx[sel]
+            table['encoding'][_i] = buf[pos[sel] + 4]
+            table['record_length'][_i] = \
+                2 ** buf[pos[sel] + 6].astype(np.int64)
+        sel = (blkt_type == 1001) & (pos + 6 <= len(buf))
+        if sel.any():
+            _i = idx[sel]
+            table['timing_quality'][_i] = buf[pos[sel] + 4]
+            starttime[_i] += \
+                buf[pos[sel] + 5].view(np.int8).astype(np.int64) * 1000
+        sel = (blkt_type == 100) & (pos + 8 <= len(buf))
+        if sel.any():
+            samp_rate[idx[sel]] = _get_bytes(buf, pos[sel] + 4, 4, be[sel],
+                                             np.float32)
+
+        # Stop at the end of the chain and at invalid backward references.
+        next_blkt[next_blkt <= blkt_offset[idx]] = 0
+        blkt_offset[:] = 0
+        blkt_offset[idx] = next_blkt
+
+    # Same check and message as libmseed.
+    for _i in np.nonzero(blkt_count != header[:, 39])[0]:
+        row = table[_i]
+        msg = ("%s_%s_%s_%s_%s: Warning: Number of blockettes in fixed header "
+               "(%d) does not match the number parsed (%d)" % (
+                   row['network'], row['station'], row['location'],
+                   row['channel'], row['dataquality'], header[_i, 39],
+                   blkt_count[_i]))
+        if messages is None:
+            warnings.warn(msg, InternalMSEEDWarning)
+        else:
+            messages.append(msg)
+
+    table['samp_rate'] = samp_rate
+    table['starttime'] = starttime
+    # The end time is the time of the last sample.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        span = np.where((samp_rate > 0) & (npts > 0),
+                        (npts.astype(np.float64) - 1.0) / samp_rate * 1e9,
+                        0.0)
+    table['endtime'] = starttime + np.round(span).astype(np.int64)
+    return table
+
+
 def get_flags(files, starttime=None, endtime=None,
               io_flags=True, activity_flags=True,
               data_quality_flags=True, timing_quality=True):
@@ -217,264 +602,143 @@ def get_flags(files, starttime=None, endtime=None,
     min 0.0
     upper_quartile 75.0
     """
-    # Splat input files to array
-    if not isinstance(files, list):
-        files = [files]
-
     starttime = float(UTCDateTime(starttime)) if starttime else None
     endtime = float(UTCDateTime(endtime)) if endtime else None
 
-    records = []
-
-    # Use clibmseed to get header parameters for all files
-    for file in files:
-
-        # If it's a file name just read it.
-        if isinstance(file, (str, native_str)):
-            # Read to NumPy array which is used as a buffer.
-            bfr_np = np.fromfile(file, dtype=np.int8)
-        elif hasattr(file, 'read'):
-            bfr_np = np.fromstring(file.read(), dtype=np.int8)
-
-        offset = 0
-
-        msr = clibmseed.msr_init(C.POINTER(MSRecord)())
-
-        while(True):
-            # Read up to max record length.
-            record = bfr_np[offset: offset + 8192]
-            if len(record) < 48:
-                break
-
-            retcode = clibmseed.msr_parse(record, len(record), C.pointer(msr),
-                                          -1, 0, 0)
-
-            if retcode != MS_NOERROR:
-                break
-
-            offset += msr.contents.reclen
-
-            # Check starttime and endtime of the record
-            # Read the sampling rate from the header (is this unsafe?)
-            # Tried using msr.msr_nomsamprate(msr) but the return is strange
-            r_start = clibmseed.msr_starttime(msr) / HPTMODULUS
-            r_delta = (1 / msr.contents.samprate)
-            r_end = (clibmseed.msr_endtime(msr) / HPTMODULUS) + r_delta
-
-            # Cut off records to start & endtime
-            if starttime is not None:
-                if r_end <= starttime:
-                    continue
-                if r_start < starttime:
-                    r_start = starttime
-
-            if endtime is not None:
-                if r_start >= endtime:
-                    continue
-                if r_end > endtime:
-                    r_end = endtime
-
-            # Get the timing quality in blockette1001 if it exists
-            if msr.contents.Blkt1001:
-                r_tq = msr.contents.Blkt1001.contents.timing_qual
-            else:
-                r_tq = None
-
-            # Collect all records and parameters in the range
-            records.append({
-                'start': r_start,
-                'delta': r_delta,
-                'end': r_end,
-                'tq': r_tq,
-                'tc': msr.contents.fsdh.contents.time_correct,
-                'io': msr.contents.fsdh.contents.io_flags,
-                'dq': msr.contents.fsdh.contents.dq_flags,
-                'ac': msr.contents.fsdh.contents.act_flags
-            })
-
-        # Free memory to be ready for next file.
-        clibmseed.msr_free(C.pointer(msr))
-
-    # It should be faster to sort by record endtime
-    # if we reverse the array first
-    records.reverse()
-    records.sort(key=lambda x: x["end"], reverse=True)
-
-    # Create collections for the flags
-    dq_flags_counts = collections.OrderedDict([
-        ("amplifier_saturation", 0),
-        ("digitizer_clipping", 0),
-        ("spikes", 0),
-        ("glitches", 0),
-        ("missing_padded_data", 0),
-        ("telemetry_sync_error", 0),
-        ("digital_filter_charging", 0),
-        ("suspect_time_tag", 0)
-    ])
-    dq_flags_seconds = collections.OrderedDict([
-        ("amplifier_saturation", 0),
-        ("digitizer_clipping", 0),
-        ("spikes", 0),
-        ("glitches", 0),
-        ("missing_padded_data", 0),
-        ("telemetry_sync_error", 0),
-        ("digital_filter_charging", 0),
-        ("suspect_time_tag", 0)
-    ])
-
-    io_flags_counts = collections.OrderedDict([
-        ("station_volume", 0),
-        ("long_record_read", 0),
-        ("short_record_read", 0),
-        ("start_time_series", 0),
-        ("end_time_series", 0),
-        ("clock_locked", 0)
-    ])
-    io_flags_seconds = collections.OrderedDict([
-        ("station_volume", 0),
-        ("long_record_read", 0),
-        ("short_record_read", 0),
-        ("start_time_series", 0),
-        ("end_time_series", 0),
-        ("clock_locked", 0)
-    ])
-
-    ac_flags_counts = collections.OrderedDict([
-        ("calibration_signal", 0),
-        ("time_correction_applied", 0),
-        ("event_begin", 0),
-        ("event_end", 0),
-        ("positive_leap", 0),
-        ("negative_leap", 0),
-        ("event_in_progress", 0)
-    ])
-    ac_flags_seconds = collections.OrderedDict([
-        ("calibration_signal", 0),
-        ("time_correction_applied", 0),
-        ("event_begin", 0),
-        ("event_end", 0),
-        ("positive_leap", 0),
-        ("negative_leap", 0),
-        ("event_in_progress", 0)
-    ])
-
-    coverage = None
-    used_record_count = 0
-    timing_correction = 0.0
-    timing_correction_count = 0
-    tq = []
-
-    # Go over all sorted records from back to front
-    for record in records:
-
-        # For counts we do not care about overlaps
-        # simply count contribution from all the records
-        if io_flags:
-            for _i, key in enumerate(io_flags_seconds.keys()):
-                if (record["io"] & (1 << _i)) != 0:
-                    io_flags_counts[key] += 1
-
-        if activity_flags:
-            for _i, key in enumerate(ac_flags_seconds.keys()):
-                if (record["ac"] & (1 << _i)) != 0:
-                    ac_flags_counts[key] += 1
-
-        if data_quality_flags:
-            for _i, key in enumerate(dq_flags_seconds.keys()):
-                if (record["dq"] & (1 << _i)) != 0:
-                    dq_flags_counts[key] += 1
-
-        # Coverage is the timewindow that is covered by the records
-        # so bits in overlapping records are not counted
-        # The first record starts a clean window
-        if coverage is None:
-            coverage = [record["start"], record["end"]]
-        else:
-
-            # Account for time tolerance
-            time_tolerance = 0.5 * record['delta']
-            tolerated_end = coverage[0] - time_tolerance
-
-            # Start is beyond coverage, skip the overlapping record
-            if record["start"] >= coverage[0]:
-                continue
-
-            # Fix end to the start of the coverage if it is overlaps
-            # with the coverage window. Or if it is within the allowed
-            # time tolerance
-            if record["end"] > coverage[0] or record["end"] > tolerated_end:
-                record["end"] = coverage[0]
-
-            # Extend the coverage
-            if record["start"] < coverage[0]:
-                coverage[0] = record["start"]
-
-        # Get the record length in seconds
-        record_length_seconds = (record["end"] - record["start"])
-
-        # Skip if the record length is 0 (or negative)
-        if record_length_seconds <= 0.0:
-            continue
-
-        # Overlapping records do not count ot the used_records
-        # used records tracks the amount of timing quality
-        # parameters we expect
-        used_record_count += 1
-
-        # Bitwise AND to count flags and store in orderedDicts
-        if io_flags:
-            for _i, key in enumerate(io_flags_seconds.keys()):
-                if (record["io"] & (1 << _i)) != 0:
-                    io_flags_seconds[key] += record_length_seconds
-
-        if activity_flags:
-            for _i, key in enumerate(ac_flags_seconds.keys()):
-                if (record["ac"] & (1 << _i)) != 0:
-                    ac_flags_seconds[key] += record_length_seconds
-
-        if data_quality_flags:
-            for _i, key in enumerate(dq_flags_seconds.keys()):
-                if (record["dq"] & (1 << _i)) != 0:
-                    dq_flags_seconds[key] += record_length_seconds
+    table = get_record_table(files)
+
+    # Work with float seconds from here on.
+    r_start = table["starttime"] / 1e9
+    with np.errstate(divide='ignore'):
+        r_delta = 1.0 / table["samp_rate"]
+    r_end = table["endtime"] / 1e9 + r_delta
+
+    # Cut off records to start & endtime
+    keep = np.ones(len(table), dtype=np.bool_)
+    if starttime is not None:
+        keep &= r_end > starttime
+        r_start = np.maximum(r_start, starttime)
+    if endtime is not None:
+        keep &= r_start < endtime
+        r_end = np.minimum(r_end, endtime)
+    table = table[keep]
+    r_start = r_start[keep]
+    r_end = r_end[keep]
+    r_delta = r_delta[keep]
+
+    # Sort by record endtime in descending order. Records with the same
+    # endtime are processed in reverse file order.
+    order = np.arange(len(table))[::-1]
+    order = order[np.argsort(-r_end[order], kind="mergesort")]
+    table = table[order]
+    r_start = r_start[order]
+    r_end = r_end[order]
+    r_delta = r_delta[order]
+
+    # Coverage is the time window that is covered by the records so bits in
+    # overlapping records are not counted. Going from back to front, the
+    # coverage before each record starts at the minimum start time of all
+    # previous records.
+    used = np.ones(len(table), dtype=np.bool_)
+    if len(table):
+        coverage_start = np.minimum.accumulate(r_start)
+        previous = np.empty_like(coverage_start)
+        previous[0] = np.inf
+        previous[1:] = coverage_start[:-1]
+        # Start is beyond coverage, skip the overlapping record
+        used[1:] = r_start[1:] < previous[1:]
+        # Fix end to the start of the coverage if it overlaps with the
+        # coverage window or if it is within the allowed time tolerance.
+        clip = used.copy()
+        clip[0] = False
+        clip &= r_end > previous - 0.5 * r_delta
+        r_end = np.where(clip, previous, r_end)
+
+    # Get the record length in seconds and skip records with a length of 0
+    # (or negative)
+    record_length_seconds = r_end - r_start
+    used &= record_length_seconds > 0.0
+    record_length_seconds = record_length_seconds[used]
+
+    def _count_flags(column, keys):
+        counts = collections.OrderedDict()
+        seconds = collections.OrderedDict()
+        for _i, key in enumerate(keys):
+            is_set = (table[column] & (1 << _i)) != 0
+            # For counts we do not care about overlaps simply count
+            # contribution from all the records.
+            counts[key] = int(is_set.sum())
+            seconds[key] = float(record_length_seconds[is_set[used]].sum())
+        return counts, seconds
+
+    dq_keys = ["amplifier_saturation", "digitizer_clipping", "spikes",
+               "glitches", "missing_padded_data", "telemetry_sync_error",
+               "digital_filter_charging", "suspect_time_tag"]
+    io_keys = ["station_volume", "long_record_read", "short_record_read",
+               "start_time_series", "end_time_series", "clock_locked"]
+    ac_keys = ["calibration_signal", "time_correction_applied",
+               "event_begin", "event_end", "positive_leap", "negative_leap",
+               "event_in_progress"]
+
+    if io_flags:
+        io_flags_counts, io_flags_seconds = \
+            _count_flags("io_and_clock_flags", io_keys)
+    else:
+        io_flags_counts = collections.OrderedDict((k, 0) for k in io_keys)
+        io_flags_seconds = collections.OrderedDict((k, 0) for k in io_keys)
+    if activity_flags:
+        ac_flags_counts, ac_flags_seconds = \
+            _count_flags("activity_flags", ac_keys)
+    else:
+        ac_flags_counts = collections.OrderedDict((k, 0) for k in ac_keys)
+        ac_flags_seconds = collections.OrderedDict((k, 0) for k in ac_keys)
+    if data_quality_flags:
+        dq_flags_counts, dq_flags_seconds = \
+            _count_flags("data_quality_flags", dq_keys)
+    else:
+        dq_flags_counts = collections.OrderedDict((k, 0) for k in dq_keys)
+        dq_flags_seconds = collections.OrderedDict((k, 0) for k in dq_keys)
 
-        # Get the timing quality parameter and append to array
-        if timing_quality and record["tq"] is not None:
-            tq.append(float(record["tq"]))
+    # Overlapping records do not count to the used records. Used records
+    # track the amount of timing quality parameters we expect.
+    used_record_count = int(used.sum())
 
-        # Check if a timing correction is specified
-        # (not whether it has been applied)
-        if record["tc"] != 0:
-            timing_correction += record_length_seconds
-            timing_correction_count += 1
+    # Check if a timing correction is specified (not whether it has been
+    # applied)
+    has_correction = table["time_correction"][used] != 0
+    timing_correction = float(record_length_seconds[has_correction].sum())
+    timing_correction_count = int(has_correction.sum())
 
     # Get the total time analyzed
     if endtime is not None and starttime is not None:
         total_time_seconds = endtime - starttime
     # If zero records agree with the selections, zero seconds have been
     # analysed.
-    elif coverage is None:
+    elif not len(table):
         total_time_seconds = 0
     else:
-        total_time_seconds = coverage[1] - coverage[0]
+        total_time_seconds = float(r_end[0] - r_start.min())
 
     # Percentage of time of bit flags set
     if total_time_seconds:
         if io_flags:
-            for _i, key in enumerate(io_flags_seconds.keys()):
+            for key in io_flags_seconds.keys():
                 io_flags_seconds[key] /= total_time_seconds * 1e-2
         if data_quality_flags:
-            for _i, key in enumerate(dq_flags_seconds.keys()):
+            for key in dq_flags_seconds.keys():
                 dq_flags_seconds[key] /= total_time_seconds * 1e-2
         if activity_flags:
-            for _i, key in enumerate(ac_flags_seconds.keys()):
+            for key in ac_flags_seconds.keys():
                 ac_flags_seconds[key] /= total_time_seconds * 1e-2
 
         timing_correction /= total_time_seconds * 1e-2
 
     # Add the timing quality if it is set for all used records
+    tq = {}
     if timing_quality:
-        if len(tq) == used_record_count:
-            tq = np.array(tq, dtype=np.float64)
+        tq = table["timing_quality"][used]
+        if len(tq) and np.all(tq >= 0):
+            tq = tq.astype(np.float64)
             tq = {
                 "all_values": tq,
                 "min": tq.min(),
@@ -484,7 +748,6 @@ def get_flags(files, starttime=None, endtime=None,
                 "lower_quartile": np.percentile(tq, 25),
                 "upper_quartile": np.percentile(tq, 75)
             }
-
         else:
             tq = {}
 
@@ -498,7 +761,7 @@ def get_flags(files, starttime=None, endtime=None,
         'activity_flags_percentages': ac_flags_seconds,
         'activity_flags_counts': ac_flags_counts,
         'timing_quality': tq,
-        'record_count': len(records),
+        'record_count': len(table),
         'number_of_records_used': used_record_count,
     }
 
@@ -954,216 +1217,32 @@ def set_flags_in_fixed_headers(filename, flags):
                     { "INSTANT" : [date5, date6],
                       "DURATION" : [date1, date2, date3, date4]}}}}
 
+    A record is flagged if an instant or duration overlaps the time span
+    from its start time up to but not including the time of the sample
+    following its last sample, i.e. ``npts / sampling_rate`` seconds after
+    its start time. The time span of records with a sampling rate of zero
+    (e.g. log records) is just their start time.
     """
     # import has to be here to break import loop
     from .core import _is_mseed
     # Basic check
     if not os.path.isfile(filename) or not _is_mseed(filename):
         raise IOError("File %s is not a valid MiniSEED file" % filename)
-    filesize = os.path.getsize(filename)
 
-    # Nested dictionaries to allow empty strings as wildcards
-    class NestedDict(dict):
-        def __missing__(self, key):
-            value = self[key] = type(self)()
-            return value
-    # Define wildcard character
-    wildcard = ""
+    # All flags not given for a matching record are cleared.
+    all_flags = {}
+    for key, value in flags.items():
+        all_flags[key] = {
+            'activity_flags': dict.fromkeys(
+                FIXED_HEADER_ACTIVITY_FLAGS.values(), False),
+            'io_clock_flags': dict.fromkeys(
+                FIXED_HEADER_IO_CLOCK_FLAGS.values(), False),
+            'data_qual_flags': dict.fromkeys(
+                FIXED_HEADER_DATA_QUAL_FLAGS.values(), False)}
+        for flag_group, group_flags in value.items():
+            all_flags[key].setdefault(flag_group, {}).update(group_flags)
 
-    # Check channel identifier value
-    flags_bytes = NestedDict()
-    for (key, value) in flags.items():
-        split_key = key.split(".")
-        if len(split_key) != 4:
-            msg = "Invalid channel identifier. " +\
-                  "Expected 'Network.Station.Location.Channel' " +\
-                  "(empty fields allowed), got '%s'."
-            raise ValueError(msg % key)
-
-        # Remove padding spaces and store in new dict
-        net = split_key[0].strip()
-        sta = split_key[1].strip()
-        loc = split_key[2].strip()
-        cha = split_key[3].strip()
-
-        # Check flag value for invalid data
-        for flag_group in value:
-            # Check invalid flag group, and prepare check for invalid flag name
-            if flag_group == 'activity_flags':
-                record_to_check = FIXED_HEADER_ACTIVITY_FLAGS
-            elif flag_group == 'io_clock_flags':
-                record_to_check = FIXED_HEADER_IO_CLOCK_FLAGS
-            elif flag_group == 'data_qual_flags':
-                record_to_check = FIXED_HEADER_DATA_QUAL_FLAGS
-            else:
-                msg = "Invalid flag group %s. One of 'activity_flags', " +\
-                      "'io_clock_flags', 'data_qual_flags' is expected."
-                raise ValueError(msg % flag_group)
-
-            for flag_name in value[flag_group]:
-                # Check invalid flag name
-                if flag_name not in record_to_check.values():
-                    msg = "Invalid flag name %s. One of %s is expected."
-                    raise ValueError(msg % (flag_name,
-                                            str(record_to_check.values())))
-
-                # Check flag values and store them in an "easy to parse" way:
-                # either bool or list of tuples (start, end)
-                flag_value = value[flag_group][flag_name]
-                corrected_flag = _check_flag_value(flag_value)
-                flags_bytes[net][sta][loc][cha][flag_group][flag_name] = \
-                    corrected_flag
-
-    # Open file
-    with open(filename, 'r+b') as mseed_file:
-        # Run through all records
-        while mseed_file.tell() < filesize:
-            record_start = mseed_file.tell()
-
-            # Ignore sequence number and data header
-            mseed_file.seek(8, os.SEEK_CUR)
-            # Read identifier
-            sta = mseed_file.read(5).strip().decode()
-            loc = mseed_file.read(2).strip().decode()
-            chan = mseed_file.read(3).strip().decode()
-            net = mseed_file.read(2).strip().decode()
-
-            # Search the nested dict for the network identifier
-            if net in flags_bytes:
-                dict_to_use = flags_bytes[net]
-            elif wildcard in flags_bytes:
-                dict_to_use = flags_bytes[wildcard]
-            else:
-                dict_to_use = None
-
-            # Search the nested dict for the station identifier
-            if dict_to_use is not None and sta in dict_to_use:
-                dict_to_use = dict_to_use[sta]
-            elif dict_to_use is not None and wildcard in dict_to_use:
-                dict_to_use = dict_to_use[wildcard]
-            else:
-                dict_to_use = None
-
-            # Search the nested dict for the location identifier
-            if dict_to_use is not None and loc in dict_to_use:
-                dict_to_use = dict_to_use[loc]
-            elif dict_to_use is not None and wildcard in dict_to_use:
-                dict_to_use = dict_to_use[wildcard]
-            else:
-                dict_to_use = None
-
-            # Search the nested dict for the channel identifier
-            if dict_to_use is not None and chan in dict_to_use:
-                flags_value = dict_to_use[chan]
-            elif dict_to_use is not None and wildcard in dict_to_use:
-                flags_value = dict_to_use[wildcard]
-            else:
-                flags_value = None
-
-            if flags_value is not None:
-                # Calculate the real start and end of the record
-                recstart = mseed_file.read(10)
-                (yr, doy, hr, mn, sec, _, mil) = unpack(native_str(">HHBBBBH"),
-                                                        recstart)
-                # Transformation to UTCDatetime()
-                recstart = UTCDateTime(year=yr, julday=doy, hour=hr, minute=mn,
-                                       second=sec, microsecond=mil * 100)
-                # Read data to date begin and end of record
-                (nb_samples, fact, mult) = unpack(native_str(">Hhh"),
-                                                  mseed_file.read(6))
-
-                # Manage time correction
-                act_flags = unpack(native_str(">B"), mseed_file.read(1))[0]
-                time_correction_applied = bool(act_flags & 2)
-                (_, _, _, time_correction) = unpack(native_str(">BBBl"),
-                                                    mseed_file.read(7))
-                if (time_correction_applied is False) and time_correction:
-                    # Time correction is in units of 0.0001 seconds.
-                    recstart += time_correction * 0.0001
-
-                # Manage blockette's datation informations
-                # Search for blockette 100's "Actual sample rate" field
-                samp_rate = _search_flag_in_blockette(mseed_file, 4, 100, 4, 1)
-                if samp_rate is not None:
-                    samp_rate = unpack(native_str(">b"), samp_rate)[0]
-                # Search for blockette 1001's "microsec" field
-                microsec = _search_flag_in_blockette(mseed_file, 4, 1001, 5, 1)
-                if microsec is not None:
-                    microsec = unpack(native_str(">b"), microsec)[0]
-                else:
-                    microsec = 0
-
-                realstarttime = recstart + microsec * 0.000001
-
-                # If samprate not set via blockette 100 calculate the sample
-                # rate according to the SEED manual.
-                if samp_rate is None:
-                    if (fact > 0) and (mult) > 0:
-                        samp_rate = float(fact * mult)
-                    elif (fact > 0) and (mult) < 0:
-                        samp_rate = -1.0 * float(fact) / float(mult)
-                    elif (fact < 0) and (mult) > 0:
-                        samp_rate = -1.0 * float(mult) / float(fact)
-                    elif (fact < 0) and (mult) < 0:
-                        samp_rate = -1.0 / float(fact * mult)
-                    else:
-                        # if everything is unset or 0 set sample rate to 1
-                        samp_rate = 1
-
-                # date of the last sample is recstart+samp_rate*(nb_samples-1)
-                # We assume here that a record with samples [0, 1, ..., n]
-                # has a period [ date_0, date_n+1 [  AND NOT [ date_0, date_n ]
-                realendtime = recstart + samp_rate * (nb_samples)
-
-                # Convert flags to bytes : activity
-                if 'activity_flags' in flags_value:
-                    act_flag = _convert_flags_to_raw_byte(
-                        FIXED_HEADER_ACTIVITY_FLAGS,
-                        flags_value['activity_flags'],
-                        realstarttime, realendtime)
-                else:
-                    act_flag = 0
-
-                # Convert flags to bytes : i/o and clock
-                if 'io_clock_flags' in flags_value:
-                    io_clock_flag = _convert_flags_to_raw_byte(
-                        FIXED_HEADER_IO_CLOCK_FLAGS,
-                        flags_value['io_clock_flags'],
-                        realstarttime, realendtime)
-                else:
-                    io_clock_flag = 0
-
-                # Convert flags to bytes : data quality flags
-                if 'data_qual_flags' in flags_value:
-                    data_qual_flag = _convert_flags_to_raw_byte(
-                        FIXED_HEADER_DATA_QUAL_FLAGS,
-                        flags_value['data_qual_flags'],
-                        realstarttime, realendtime)
-                else:
-                    data_qual_flag = 0
-
-                flagsbytes = pack("BBB", act_flag,
-                                  io_clock_flag, data_qual_flag)
-                # Go back right before the fixed header flags
-                mseed_file.seek(-8, os.SEEK_CUR)
-                # Update flags*
-                mseed_file.write(flagsbytes)
-                # Seek to first blockette
-                mseed_file.seek(9, os.SEEK_CUR)
-            else:
-                # Seek directly to first blockette
-                mseed_file.seek(28, os.SEEK_CUR)
-
-            # Read record length in blockette 1000 to seek to the next record
-            reclen_pow = _search_flag_in_blockette(mseed_file, 0, 1000, 6, 1)
-
-            if reclen_pow is None:
-                msg = "Invalid MiniSEED file. No blockette 1000 was found."
-                raise IOError(msg)
-            else:
-                reclen_pow = unpack(native_str("B"), reclen_pow)[0]
-                reclen = 2**reclen_pow
-                mseed_file.seek(record_start + reclen, os.SEEK_SET)
+    rewrite_fixed_headers(filename, flags=all_flags)
 
 
 def _check_flag_value(flag_value):
@@ -1190,7 +1269,7 @@ def _check_flag_value(flag_value):
 
 
     This function then returns all datation events as a list of tuples
-    [(start1, end1), ...] to ease the work of _convert_flags_to_raw_byte. Bool
+    [(start1, end1), ...] to ease the work of _apply_flags. Bool
     values are unchanged, instant events become a tuple
     (event_date, event_date).
 
@@ -1341,131 +1420,6 @@ def _check_flag_value(flag_value):
     return corrected_flag
 
 
-def _search_flag_in_blockette(mseed_file_desc, first_blockette_offset,
-                              blockette_number, field_offset, field_length):
-    """
-    Search for a given flag in a given blockette for the current record.
-
-    This is a utility function for set_flags_in_fixed_headers and is not
-    designed to be called by someone else.
-
-    This function uses the file descriptor``mseed_file_desc``, seeks
-    ``first_blockette_offset`` to go to the first blockette, reads through all
-    the blockettes until it finds the one with number ``blockette_number``,
-    then skips ``field_offset`` bytes to read ``field_length`` bytes and
-    returns them. If the blockette does not exist, it returns None
-
-    Please note that this function does not decommute the binary value into an
-    exploitable data (int, float, string, ...)
-    :type mseed_file_desc: File object
-    :param mseed_file_desc: a File descriptor to the current miniseed file.
-    The value of mseed_file_desc.tell() is set back by this funcion before
-    returning, use in multithread applications at your own risk.
-    :type first_blockette_offset: int
-    :param first_blockette_offset: tells the function where the first blockette
-    of the record is compared to the mseed_file_desc current position in the
-    file. A positive value means the blockette is after the current position.
-    :type blockette_number: int
-    :param blockette_number: the blockette number to search for
-    :type field_offset: int
-    :param field_offset: how many bytes we have to skip before attaining the
-    wanted field. Please note that it also counts blockette number and next
-    blockette index's field.
-    :type field_length: int
-    :param field_length: length of the wanted field, in bytes
-    :return: bytes containing the field's value in this record
-
-    """
-    previous_position = mseed_file_desc.tell()
-
-    try:
-        # Go to first blockette
-        mseed_file_desc.seek(first_blockette_offset, os.SEEK_CUR)
-        mseed_record_start = mseed_file_desc.tell() - 48
-        read_data = mseed_file_desc.read(4)
-        # Read info in the first blockette
-        [cur_blkt_number, next_blkt_offset] = unpack(native_str(">HH"),
-                                                     read_data)
-
-        while cur_blkt_number != blockette_number \
-                and next_blkt_offset != 0:
-            # Nothing here, read next blockette
-            mseed_file_desc.seek(mseed_record_start + next_blkt_offset,
-                                 os.SEEK_SET)
-            read_data = mseed_file_desc.read(4)
-            [cur_blkt_number, next_blkt_offset] = unpack(native_str(">HH"),
-                                                         read_data)
-
-        if cur_blkt_number == blockette_number:
-            # Blockette found: we want to skip ``field_offset`` bytes but we
-            # have already read 4 of the offset to get informations about the
-            # current blockette, so we remove them from skipped data
-            mseed_file_desc.seek(field_offset - 4, os.SEEK_CUR)
-            returned_bytes = mseed_file_desc.read(field_length)
-        else:
-            returned_bytes = None
-
-    finally:
-        mseed_file_desc.seek(previous_position, os.SEEK_SET)
-
-    return returned_bytes
-
-
-def _convert_flags_to_raw_byte(expected_flags, user_flags, recstart, recend):
-    """
-    Converts a flag dictionary to a byte, ready to be encoded in a MiniSEED
-    header.
-
-    This is a utility function for set_flags_in_fixed_headers and is not
-    designed to be called by someone else.
-
-    expected_signals describes all the possible bit names for the user flags
-    and their place in the result byte. Expected: dict { exponent: bit_name }.
-    The fixed header flags are available in obspy.io.mseed.headers as
-    FIXED_HEADER_ACTIVITY_FLAGS, FIXED_HEADER_DATA_QUAL_FLAGS and
-    FIXED_HEADER_IO_CLOCK_FLAGS.
-
-    This expects a user_flags as a dictionary { bit_name : value }. bit_name is
-    compared to the expected_signals, and its value is converted to bool.
-    Missing values are considered false.
-
-    :type expected_flags: dict {int: str}
-    :param expected_flags: every possible flag in this field, with its offset
-    :type user_flags: dict {str: bool}
-    :param user_flags: user defined flags and its value
-    :type recstart: UTCDateTime
-    :param recstart: date of the first sample of the current record
-    :type recstart: UTCDateTime
-    :param recend: date of the last sample of the current record
-    :return: raw int value for the flag group
-    """
-
-    flag_byte = 0
-
-    for (bit, key) in expected_flags.items():
-        use_in_this_record = False
-        if key in user_flags:
-            if isinstance(user_flags[key], bool) and user_flags[key]:
-                # Boolean value, we accept it for all records
-                use_in_this_record = True
-            elif isinstance(user_flags[key], collections.Sequence):
-                # List of tuples (start, end)
-                use_in_this_record = False
-                for tuple_value in user_flags[key]:
-                    # Check wether this record is concerned
-                    event_start = tuple_value[0]
-                    event_end = tuple_value[1]
-
-                    if(event_start < recend) and (recstart <= event_end):
-                        use_in_this_record = True
-                        break
-
-        if use_in_this_record:
-            flag_byte += 2**bit
-
-    return flag_byte
-
-
 def shift_time_of_file(input_file, output_file, timeshift):
     """
     Takes a MiniSEED file and shifts the time of every record by the given
@@ -1517,113 +1471,382 @@ def shift_time_of_file(input_file, output_file, timeshift):
         msg = "The timeshift must to be not equal to 0."
         raise ValueError(msg)
 
-    # Get the necessary information from the file.
-    info = get_record_information(input_file)
-    record_length = info["record_length"]
-
-    byteorder = info["byteorder"]
-    sys_byteorder = "<" if (sys.byteorder == "little") else ">"
-    do_swap = False if (byteorder == sys_byteorder) else True
-
-    # This is in this scenario somewhat easier to use than BytesIO because one
-    # can directly modify the data array.
-    data = np.fromfile(input_file, dtype=np.uint8)
-    array_length = len(data)
-    record_offset = 0
-    # Loop over every record.
-    while True:
-        remaining_bytes = array_length - record_offset
-        if remaining_bytes < 48:
-            if remaining_bytes > 0:
-                msg = "%i excessive byte(s) in the file. " % remaining_bytes
-                msg += "They will be appended to the output file."
-                warnings.warn(msg)
-            break
-        # Use a slice for the current record.
-        current_record = data[record_offset: record_offset + record_length]
-        record_offset += record_length
+    rewrite_fixed_headers(input_file, output_file=output_file,
+                          timeshift=timeshift)
 
-        activity_flags = current_record[36]
-        is_time_correction_applied = bool(activity_flags & 2)
 
-        current_time_shift = current_record[40:44]
-        current_time_shift.dtype = np.int32
-        if do_swap:
-            current_time_shift = current_time_shift.byteswap(False)
-        current_time_shift = current_time_shift[0]
+def rewrite_fixed_headers(filename, output_file=None, timeshift=None,
+                          flags=None, codes=None, dry_run=False):
+    """
+    Rewrites fields in the fixed headers of all records of a MiniSEED file
+    in one vectorized pass.
 
+    The file is memory mapped and scanned with :func:`get_record_table`. All
+    modified fields are computed with NumPy over the whole record table and
+    only the changed header bytes are written back. Data sections and all
+    other header fields and blockettes are left untouched.
+
+    :type filename: str
+    :param filename: Name of the MiniSEED file.
+    :type output_file: str
+    :param output_file: If given, the input file is copied to this file
+        which is then modified. Otherwise the input file is modified in
+        place.
+    :type timeshift: int
+    :param timeshift: Time shift to apply to every record in units of
+        0.0001 seconds. See :func:`shift_time_of_file` for the technical
+        details.
+    :type flags: dict
+    :param flags: Fixed header flags to set or clear. Same nested dictionary
+        as described in :func:`set_flags_in_fixed_headers`. Flags that are
+        ``True`` or whose time windows overlap the time span of a record
+        (see :func:`set_flags_in_fixed_headers`) are set, flags that
+        are ``False`` or do not overlap are cleared. In contrast to
+        :func:`set_flags_in_fixed_headers` flags not given in the dictionary
+        are not changed.
+    :type codes: dict
+    :param codes: Renames the network, station, location, and channel codes.
+        Maps Unix style wildcard patterns matched against the
+        ``"NET.STA.LOC.CHA"`` identifier of each record to new
+        ``"NET.STA.LOC.CHA"`` codes. A ``"*"`` field in the
+        new code keeps the original value. If multiple patterns match a
+        record, the first matching pattern is used.
+    :type dry_run: bool
+    :param dry_run: If ``True``, nothing is written but the resulting record
+        table is still returned.
+    :rtype: :class:`numpy.ndarray`
+    :return: The record table (see :func:`get_record_table`) of the file
+        after the changes have been applied.
+
+    .. rubric:: Example
+
+    Rename a station and shift all records by one second.
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("test.mseed")
+    >>> table = rewrite_fixed_headers(
+    ...     filename, timeshift=10000, codes={"NL.HGN.*.*": "NL.HGN2.*.*"},
+    ...     dry_run=True)
+    >>> print(table["station"])
+    ['HGN2' 'HGN2']
+    >>> print(UTCDateTime(ns=int(table["starttime"][0])))
+    2003-05-29T02:13:23.043400Z
+    """
+    if timeshift is not None:
+        timeshift = int(timeshift)
+    if flags is not None:
+        flags = _parse_flags_dict(flags)
+    if codes is not None:
+        codes = _parse_codes_dict(codes)
+
+    if dry_run:
+        buf = _get_buffer(filename)
+        mmap = None
+    else:
+        if output_file is not None:
+            shutil.copyfile(filename, output_file)
+            filename = output_file
+        if not os.path.getsize(filename):
+            return np.empty(0, dtype=RECORD_TABLE_DTYPE)
+        mmap = np.memmap(filename, dtype=np.uint8, mode='r+')
+        buf = mmap.view(np.ndarray)
+
+    table = _get_record_headers(buf)
+    offsets = table['offset']
+    big_endian = table['byteorder'] == '>'
+
+    excess = len(buf) - (offsets[-1] + table['record_length'][-1]) \
+        if len(offsets) else len(buf)
+    if excess > 0:
+        msg = "%i excessive byte(s) in the file. " % excess
+        if dry_run:
+            msg += "They would be left unchanged."
+        elif output_file is not None:
+            msg += "They will be appended to the output file."
+        else:
+            msg += "They will be left unchanged."
+        warnings.warn(msg)
+
+    if codes:
+        changed = _apply_codes(table, codes)
+        if not dry_run:
+            for key, start, length in (('station', 8, 5), ('location', 13, 2),
+                                       ('channel', 15, 3), ('network', 18, 2)):
+                values = np.char.ljust(
+                    np.char.encode(table[key][changed],
+                                   native_str('ascii')), length)
+                _set_bytes(buf, offsets[changed] + start,
+                           np.frombuffer(values.tobytes(),
+                                         dtype=np.uint8).reshape(-1, length))
+
+    if timeshift:
+        applied = (table['activity_flags'] & 2) != 0
         # If the time correction has been applied, but there is no actual
-        # time correction, then simply set the time correction applied
-        # field to false and process normally.
-        # This should rarely be the case.
-        if current_time_shift == 0 and is_time_correction_applied:
-            # This sets bit 2 of the activity flags to 0.
-            current_record[36] = current_record[36] & (~2)
-            is_time_correction_applied = False
-        # This is the case if the time correction has been applied. This
-        # requires some more work by changing both, the actual time and the
-        # time correction field.
-        elif is_time_correction_applied:
-            msg = "The timeshift can only be applied by actually changing the "
-            msg += "time. This is experimental. Please make sure the output "
-            msg += "file is correct."
+        # time correction, then simply unset the time correction applied bit
+        # and process normally.
+        unset = applied & (table['time_correction'] == 0)
+        table['activity_flags'][unset] &= ~np.uint8(2)
+        applied &= ~unset
+        # If the correction has been applied, the record start time has to
+        # be changed as well.
+        if applied.any():
+            msg = "The timeshift can only be applied by actually changing " \
+                  "the time. This is experimental. Please make sure the " \
+                  "output file is correct."
             warnings.warn(msg)
-            # The whole process is not particularly fast or optimized but
-            # instead intends to avoid errors.
-            # Get the time variables.
-            time = current_record[20:30]
-            year = time[0:2]
-            julday = time[2:4]
-            hour = time[4:5]
-            minute = time[5:6]
-            second = time[6:7]
-            msecs = time[8:10]
-            # Change dtype of multibyte values.
-            year.dtype = np.uint16
-            julday.dtype = np.uint16
-            msecs.dtype = np.uint16
-            if do_swap:
-                year = year.byteswap(False)
-                julday = julday.byteswap(False)
-                msecs = msecs.byteswap(False)
-            dtime = UTCDateTime(year=year[0], julday=julday[0], hour=hour[0],
-                                minute=minute[0], second=second[0],
-                                microsecond=msecs[0] * 100)
-            dtime += (float(timeshift) / 10000)
-            year[0] = dtime.year
-            julday[0] = dtime.julday
-            hour[0] = dtime.hour
-            minute[0] = dtime.minute
-            second[0] = dtime.second
-            msecs[0] = dtime.microsecond / 100
-            # Swap again.
-            if do_swap:
-                year = year.byteswap(False)
-                julday = julday.byteswap(False)
-                msecs = msecs.byteswap(False)
-            # Change dtypes back.
-            year.dtype = np.uint8
-            julday.dtype = np.uint8
-            msecs.dtype = np.uint8
-            # Write to current record.
-            time[0:2] = year[:]
-            time[2:4] = julday[:]
-            time[4] = hour[:]
-            time[5] = minute[:]
-            time[6] = second[:]
-            time[8:10] = msecs[:]
-            current_record[20:30] = time[:]
-
-        # Now modify the time correction flag.
-        current_time_shift += timeshift
-        current_time_shift = np.array([current_time_shift], np.int32)
-        if do_swap:
-            current_time_shift = current_time_shift.byteswap(False)
-        current_time_shift.dtype = np.uint8
-        current_record[40:44] = current_time_shift[:]
-
-    # Write to the output file.
-    data.tofile(output_file)
+            if not dry_run:
+                pos = offsets[applied] + 20
+                _set_btime(buf, pos, big_endian[applied],
+                           _get_btime(buf, pos, big_endian[applied]) +
+                           timeshift * 100000)
+        table['time_correction'] += timeshift
+        table['starttime'] += timeshift * 100000
+        table['endtime'] += timeshift * 100000
+        if not dry_run:
+            _set_bytes(buf, offsets + 40, np.ascontiguousarray(
+                table['time_correction']).astype(np.dtype('>i4')).view(
+                    np.uint8).reshape(-1, 4), big_endian)
+
+    if flags:
+        _apply_flags(table, flags)
+
+    if not dry_run and (flags or timeshift):
+        _set_bytes(buf, offsets + 36, np.column_stack([
+            table['activity_flags'], table['io_and_clock_flags'],
+            table['data_quality_flags']]))
+
+    if mmap is not None:
+        mmap.flush()
+        del buf, mmap
+    return table
+
+
+def _parse_flags_dict(flags):
+    """
+    Validates the nested flags dictionary of
+    :func:`set_flags_in_fixed_headers` and converts it to an easily
+    searchable nested dictionary with all flag values passed through
+    :func:`_check_flag_value`.
+    """
+    flags_bytes = _NestedDict()
+    for (key, value) in flags.items():
+        split_key = key.split(".")
+        if len(split_key) != 4:
+            msg = "Invalid channel identifier. " +\
+                  "Expected 'Network.Station.Location.Channel' " +\
+                  "(empty fields allowed), got '%s'."
+            raise ValueError(msg % key)
+
+        # Remove padding spaces and store in new dict
+        net = split_key[0].strip()
+        sta = split_key[1].strip()
+        loc = split_key[2].strip()
+        cha = split_key[3].strip()
+
+        # Check flag value for invalid data
+        for flag_group in value:
+            # Check invalid flag group, and prepare check for invalid flag name
+            if flag_group == 'activity_flags':
+                record_to_check = FIXED_HEADER_ACTIVITY_FLAGS
+            elif flag_group == 'io_clock_flags':
+                record_to_check = FIXED_HEADER_IO_CLOCK_FLAGS
+            elif flag_group == 'data_qual_flags':
+                record_to_check = FIXED_HEADER_DATA_QUAL_FLAGS
+            else:
+                msg = "Invalid flag group %s. One of 'activity_flags', " +\
+                      "'io_clock_flags', 'data_qual_flags' is expected."
+                raise ValueError(msg % flag_group)
+
+            for flag_name in value[flag_group]:
+                # Check invalid flag name
+                if flag_name not in record_to_check.values():
+                    msg = "Invalid flag name %s. One of %s is expected."
+                    raise ValueError(msg % (flag_name,
+                                            str(record_to_check.values())))
+
+                # Check flag values and store them in an "easy to parse" way:
+                # either bool or list of tuples (start, end)
+                flag_value = value[flag_group][flag_name]
+                corrected_flag = _check_flag_value(flag_value)
+                flags_bytes[net][sta][loc][cha][flag_group][flag_name] = \
+                    corrected_flag
+    return flags_bytes
+
+
+class _NestedDict(dict):
+    """
+    Nested dictionaries to allow empty strings as wildcards.
+    """
+    def __missing__(self, key):
+        value = self[key] = type(self)()
+        return value
+
+
+def _lookup_flags(flags_bytes, net, sta, loc, cha):
+    """
+    Returns the flags to use for the given SEED identifier. Exact matches
+    are preferred over wildcards on every level. ``None`` if no flags apply.
+    """
+    # Define wildcard character
+    wildcard = ""
+    dict_to_use = flags_bytes
+    for code in (net, sta, loc, cha):
+        if code in dict_to_use:
+            dict_to_use = dict_to_use[code]
+        elif wildcard in dict_to_use:
+            dict_to_use = dict_to_use[wildcard]
+        else:
+            return None
+    return dict_to_use
+
+
+def _apply_flags(table, flags_bytes):
+    """
+    Sets and clears the flags in the flag columns of a record table.
+    """
+    groups = (('activity_flags', 'activity_flags',
+               FIXED_HEADER_ACTIVITY_FLAGS),
+              ('io_clock_flags', 'io_and_clock_flags',
+               FIXED_HEADER_IO_CLOCK_FLAGS),
+              ('data_qual_flags', 'data_quality_flags',
+               FIXED_HEADER_DATA_QUAL_FLAGS))
+    # Records cover the time span from their first sample up to but not
+    # including the first sample of the next record, records without a
+    # sampling rate only their start time.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        span = np.where(table['samp_rate'] > 0,
+                        table['npts'] / table['samp_rate'] * 1e9, 0.0)
+    recstart = table['starttime']
+    recend = np.maximum(recstart + np.round(span).astype(np.int64),
+                        recstart + 1)
+
+    ids, inverse = _unique_ids(table)
+    for _i, (net, sta, loc, cha) in enumerate(ids):
+        flags_value = _lookup_flags(flags_bytes, net, sta, loc, cha)
+        if flags_value is None:
+            continue
+        rows = np.nonzero(inverse == _i)[0]
+        for group, column, expected_flags in groups:
+            if group not in flags_value:
+                continue
+            user_flags = flags_value[group]
+            values = table[column][rows]
+            for (bit, key) in expected_flags.items():
+                if key not in user_flags:
+                    continue
+                value = user_flags[key]
+                if isinstance(value, bool):
+                    is_set = np.empty(len(rows), dtype=np.bool_)
+                    is_set.fill(value)
+                else:
+                    # List of tuples (start, end). Check whether the records
+                    # are concerned.
+                    is_set = np.zeros(len(rows), dtype=np.bool_)
+                    for event_start, event_end in value:
+                        is_set |= \
+                            (UTCDateTime(event_start)._ns < recend[rows]) & \
+                            (recstart[rows] <= UTCDateTime(event_end)._ns)
+                values = np.where(is_set, values | (1 << bit),
+                                  values & ~np.uint8(1 << bit))
+            table[column][rows] = values
+
+
+def _parse_codes_dict(codes):
+    """
+    Validates the renaming dictionary of :func:`rewrite_fixed_headers`.
+    """
+    max_lengths = (2, 5, 2, 3)
+    parsed = []
+    for pattern, new_id in codes.items():
+        new_id = new_id.split(".")
+        if len(new_id) != 4:
+            msg = "Invalid channel identifier. Expected " \
+                  "'Network.Station.Location.Channel', got '%s'."
+            raise ValueError(msg % ".".join(new_id))
+        for code, length in zip(new_id, max_lengths):
+            if code == "*":
+                continue
+            if len(code) > length:
+                msg = "Code '%s' is longer than the allowed %i characters."
+                raise ValueError(msg % (code, length))
+            try:
+                code.encode('ascii', 'strict')
+            except UnicodeError:
+                msg = "Code '%s' contains non-ASCII characters."
+                raise ValueError(msg % code)
+        parsed.append((pattern, new_id))
+    return parsed
+
+
+def _unique_ids(table):
+    """
+    Returns the unique (network, station, location, channel) tuples of a
+    record table and the index of each record into them.
+    """
+    keys = np.char.add(np.char.add(np.char.add(np.char.add(np.char.add(
+        np.char.add(table['network'], '.'), table['station']), '.'),
+        table['location']), '.'), table['channel'])
+    ids, inverse = np.unique(keys, return_inverse=True)
+    return [tuple(_i.split('.')) for _i in ids], inverse
+
+
+def _apply_codes(table, codes):
+    """
+    Renames the SEED identifiers in a record table. Returns a boolean mask of
+    the changed records.
+    """
+    changed = np.zeros(len(table), dtype=np.bool_)
+    ids, inverse = _unique_ids(table)
+    for _i, old_id in enumerate(ids):
+        for pattern, new_id in codes:
+            if not fnmatch.fnmatch(".".join(old_id), pattern):
+                continue
+            new_id = tuple(_o if _n == "*" else _n
+                           for _o, _n in zip(old_id, new_id))
+            if new_id != old_id:
+                rows = inverse == _i
+                for key, code in zip(('network', 'station', 'location',
+                                      'channel'), new_id):
+                    table[key][rows] = code
+                changed |= rows
+            break
+    return changed
+
+
+def _set_bytes(buf, pos, values, big_endian=None):
+    """
+    Writes rows of bytes to the given positions of a uint8 buffer. Rows of
+    records that are not big endian are reversed if ``big_endian`` is given.
+    """
+    if not len(pos):
+        return
+    values = np.array(values, dtype=np.uint8)
+    if big_endian is not None:
+        values[~big_endian] = values[~big_endian, ::-1]
+    buf[pos[:, np.newaxis] + np.arange(values.shape[1])] = values
+
+
+def _set_btime(buf, pos, big_endian, timestamps):
+    """
+    Writes POSIX timestamps in nanoseconds as SEED BTIME structures to the
+    given positions of a uint8 buffer.
+    """
+    seconds, fraction = np.divmod(timestamps, 1000000000)
+    days, seconds = np.divmod(seconds, 86400)
+    years = days.astype('M8[D]').astype('M8[Y]')
+    julday = days - years.astype('M8[D]').astype(np.int64) + 1
+    years = years.astype(np.int64) + 1970
+
+    def _uint16(values):
+        return np.ascontiguousarray(values.astype(np.dtype('>u2'))).view(
+            np.uint8).reshape(-1, 2)
+
+    _set_bytes(buf, pos, _uint16(years), big_endian)
+    _set_bytes(buf, pos + 2, _uint16(julday), big_endian)
+    buf[pos + 4] = seconds // 3600
+    buf[pos + 5] = (seconds % 3600) // 60
+    buf[pos + 6] = seconds % 60
+    _set_bytes(buf, pos + 8, _uint16(fraction // 100000), big_endian)
 
 
 def _convert_and_check_encoding_for_writing(encoding):
@@ -15,6 +15,7 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA @UnusedWildImport
 
+import functools
 import math
 import re
 import sys
@@ -27,12 +28,18 @@ if sys.version_info.major == 2:
 else:
     from itertools import zip_longest
 
+import numpy as np
+
 from obspy import UTCDateTime
 from obspy.core.event import (Axis, Catalog, Comment, CreationInfo, DataUsed,
                               Event, EventDescription, FocalMechanism,
                               Magnitude, MomentTensor, NodalPlane, NodalPlanes,
                               Origin, PrincipalAxes, SourceTimeFunction,
                               Tensor)
+from obspy.core.event.catalog import CATALOG_COLUMNS_DTYPE
+from obspy.core.event.table import (CatalogTable, _char_matrix,
+                                    _fields_to_ns, _materialize_rows,
+                                    _parse_floats)
 from obspy.geodetics import FlinnEngdahl
 
 
@@ -149,6 +156,161 @@ def _read_ndk(filename, *args, **kwargs):  # @UnusedVariable
 
     :param filename: File or file-like object in text mode.
     """
+    lines_iter = iter(_get_lines(filename))
+
+    # Use one Flinn Engdahl object for all region determinations.
+    fe = FlinnEngdahl()
+    cat = Catalog(resource_id=_get_resource_id("catalog", str(uuid.uuid4())))
+
+    # Loop over 5 lines at once.
+    for _i, lines in enumerate(zip_longest(*[lines_iter] * 5)):
+        if None in lines:
+            msg = "Skipped last %i lines. Not a multiple of 5 lines." % (
+                lines.count(None))
+            warnings.warn(msg, ObsPyNDKWarning)
+            continue
+
+        parsed = _parse_lines(lines, _i)
+        if parsed is None:
+            continue
+        cat.append(_record_to_event(parsed[0], parsed[1], fe))
+
+    if len(cat) == 0:
+        msg = "No valid events found in NDK file."
+        raise ObsPyNDKException(msg)
+
+    return cat
+
+
+def _scan_ndk(filename, **kwargs):  # @UnusedVariable
+    """
+    Scans an NDK file to a :class:`~obspy.core.event.CatalogTable` object.
+
+    The reference hypocenter, the moment magnitude and the times of all
+    events are parsed in bulk, the events are only created when accessed.
+    All fields read by :func:`_read_ndk` are checked in bulk as well. Only
+    events that do not have the standard layout are parsed one by one,
+    events that can not be parsed are skipped with the same warnings as by
+    :func:`_read_ndk`, so the table always has the events of the read
+    catalog.
+
+    :param filename: File or file-like object in text mode.
+    """
+    lines = _get_lines(filename)
+    count = len(lines) // 5
+    records = [tuple(lines[_i:_i + 5]) for _i in range(0, 5 * count, 5)]
+    line_chars = [
+        _char_matrix(lines[_j:5 * count:5], max(
+            [len(_l) for _l in lines[_j:5 * count:5]] + [80]))
+        for _j in range(5)]
+    ok = _check_layout(*line_chars)
+
+    first_lines = line_chars[0]
+    exponents, ok_exponent = _parse_floats(line_chars[3], 0, 2)
+    moments, ok_moment = _parse_floats(line_chars[4], 49, 56)
+    with np.errstate(invalid="ignore"):
+        ok &= ok_exponent & ok_moment & (moments > 0)
+    fields = []
+    for start, stop in ((5, 9), (10, 12), (13, 15), (16, 18), (19, 21),
+                        (22, 26), (27, 33), (34, 41), (42, 47)):
+        values, ok_field = _parse_floats(first_lines, start, stop)
+        fields.append(values)
+        ok &= ok_field
+    times, ok_time = _fields_to_ns(*fields[:6])
+    ok &= ok_time
+
+    # Events without the standard layout are parsed like by _read_ndk().
+    valid = ok.copy()
+    for _i in np.flatnonzero(~ok):
+        valid[_i] = _parse_lines(records[_i], _i) is not None
+    if len(lines) % 5:
+        msg = "Skipped last %i lines. Not a multiple of 5 lines." % (
+            5 - len(lines) % 5)
+        warnings.warn(msg, ObsPyNDKWarning)
+    if not valid.any():
+        msg = "No valid events found in NDK file."
+        raise ObsPyNDKException(msg)
+
+    columns = np.full(count, np.nan, dtype=CATALOG_COLUMNS_DTYPE)
+    columns["time"] = times
+    columns["latitude"] = fields[6]
+    columns["longitude"] = fields[7]
+    columns["depth"] = fields[8] * 1000.0
+    # Same calculation as in _read_lines().
+    magnitudes = np.full(count, np.nan)
+    for exponent in np.unique(exponents[ok]):
+        factor = 10 ** (int(exponent) - 7)
+        rows = np.flatnonzero(ok & (exponents == exponent))
+        magnitudes[rows] = [
+            round(2.0 / 3.0 * (math.log10(_m * factor) - 9.1), 2)
+            for _m in moments[rows].tolist()]
+    columns["magnitude"] = magnitudes
+
+    # Valid events whose columns can not be parsed in bulk are created
+    # right away.
+    materialize = functools.partial(_lines_to_event, fe=FlinnEngdahl())
+    events, _ = _materialize_rows(columns, records, materialize,
+                                  np.flatnonzero(valid & ~ok))
+    rows = np.flatnonzero(valid)
+    return CatalogTable(columns[rows], [records[_i] for _i in rows],
+                        materialize, events=[events[_i] for _i in rows])
+
+
+def _check_layout(line1, line2, line3, line4, line5):
+    """
+    Checks the five lines of all events given as character matrices of at
+    least 80 columns.
+
+    Returns a boolean array marking all events that have the standard layout
+    of NDK files, i.e. that can be read by :func:`_read_lines` and whose
+    reference time is valid. The times are checked by :func:`_fields_to_ns`,
+    all other events have to be parsed one by one.
+    """
+    digits = np.zeros(256, dtype=np.bool_)
+    digits[[ord(_c) for _c in "0123456789"]] = True
+
+    def _is(chars, start, *texts):
+        codes = np.array([[ord(_c) for _c in _t] for _t in texts],
+                         dtype=np.uint8)
+        field = chars[:, start:start + codes.shape[1]]
+        return (field[:, None, :] == codes[None, :, :]).all(axis=2).any(
+            axis=1)
+
+    # hypocenter line, the date and time are YYYY/MM/DD hh:mm:ss.s
+    ok = digits[line1[:, [5, 6, 7, 8, 10, 11, 13, 14, 16, 17, 19, 20, 22,
+                          23, 25]]].all(axis=1)
+    for position, char in ((9, "/"), (12, "/"), (18, ":"), (21, ":"),
+                           (24, ".")):
+        ok &= line1[:, position] == ord(char)
+    ok &= _parse_floats(line1, 48, 55, count=2)[1]
+    # CMT info (1), all data types are known
+    colons = line2[:, 17:61] == ord(":")
+    data_types = line2[:, 16:60]
+    ok &= ~(colons & (data_types != ord("B")) & (data_types != ord("S")) &
+            (data_types != ord("M"))).any(axis=1)
+    ok &= _is(line2, 62, "CMT: 0", "CMT: 1", "CMT: 2")
+    ok &= _is(line2, 69, "TRIHD:", "BOXHD:")
+    ok &= _parse_floats(line2, 75, line2.shape[1])[1]
+    # CMT info (2), eight centroid values after a single token
+    ok &= (line3[:, :9] != ord(" ")).all(axis=1) & (line3[:, 9] == ord(" "))
+    ok &= _parse_floats(line3, 9, 58, count=8)[1]
+    ok &= _is(line3, 59, "FREE", "FIX ", "BDY ")
+    ok &= _is(line3, 64, "Q-", "S-", "O-")
+    # CMT info (3), integer exponent and twelve plain decimal numbers
+    ok &= digits[line4[:, 1]] & (digits[line4[:, 0]] |
+                                 (line4[:, 0] == ord(" ")))
+    ok &= ~np.isin(line4[:, 2:], [ord("e"), ord("E")]).any(axis=1)
+    ok &= _parse_floats(line4, 2, line4.shape[1], count=12)[1]
+    # CMT info (4), principal axes and at least six nodal plane values
+    ok &= _parse_floats(line5, 3, 48, count=9)[1]
+    ok &= _parse_floats(line5, 57, line5.shape[1], count=6, leading=True)[1]
+    return ok
+
+
+def _get_lines(filename):
+    """
+    Returns the lines of an NDK file, a file-like object or a string.
+    """
     # Read the whole file at once. While an iterator would be more efficient
     # the largest NDK file out in the wild is 13.7 MB so it does not matter
     # much.
@@ -167,240 +329,249 @@ def _read_ndk(filename, *args, **kwargs):  # @UnusedVariable
         data = filename.read()
         if hasattr(data, "decode"):
             data = data.decode()
+    lines = data.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return lines
 
-    # Create iterator that yields lines.
-    def lines_iter():
-        prev_line = -1
-        while True:
-            next_line = data.find("\n", prev_line + 1)
-            if next_line < 0:
-                break
-            yield data[prev_line + 1: next_line]
-            prev_line = next_line
-        if len(data) > prev_line + 1:
-            yield data[prev_line + 1:]
 
-    # Use one Flinn Engdahl object for all region determinations.
-    fe = FlinnEngdahl()
-    cat = Catalog(resource_id=_get_resource_id("catalog", str(uuid.uuid4())))
+def _parse_lines(lines, index):
+    """
+    Parses the five lines of an event to a record and the time of its
+    reference origin.
 
-    # Loop over 5 lines at once.
-    for _i, lines in enumerate(zip_longest(*[lines_iter()] * 5)):
-        if None in lines:
-            msg = "Skipped last %i lines. Not a multiple of 5 lines." % (
-                lines.count(None))
-            warnings.warn(msg, ObsPyNDKWarning)
-            continue
+    Returns ``None`` with a warning if the event can not be parsed.
 
-        # Parse the lines to a human readable dictionary.
-        try:
-            record = _read_lines(*lines)
-        except (ValueError, ObsPyNDKException):
-            exc = traceback.format_exc()
-            msg = (
-                "Could not parse event %i (faulty file?). Will be "
-                "skipped. Lines of the event:\n"
-                "\t%s\n"
-                "%s") % (_i + 1, "\n\t".join(lines), exc)
-            warnings.warn(msg, ObsPyNDKWarning)
-            continue
+    :param lines: The five lines of the event.
+    :param index: Index of the event in the file, used in the warnings.
+    """
+    # Parse the lines to a human readable dictionary.
+    try:
+        record = _read_lines(*lines)
+    except (ValueError, ObsPyNDKException):
+        exc = traceback.format_exc()
+        msg = (
+            "Could not parse event %i (faulty file?). Will be "
+            "skipped. Lines of the event:\n"
+            "\t%s\n"
+            "%s") % (index + 1, "\n\t".join(lines), exc)
+        warnings.warn(msg, ObsPyNDKWarning)
+        return None
+
+    # Assemble the time for the reference origin.
+    try:
+        time = _parse_date_time(record["date"], record["time"])
+    except ObsPyNDKException:
+        msg = ("Invalid time in event %i. '%s' and '%s' cannot be "
+               "assembled to a valid time. Event will be skipped.") % \
+              (index + 1, record["date"], record["time"])
+        warnings.warn(msg, ObsPyNDKWarning)
+        return None
+    return record, time
 
-        # Use one creation info for essentially every item.
-        creation_info = CreationInfo(
-            agency_id="GCMT",
-            version=record["version_code"]
-        )
 
-        # Use the ObsPy Flinn Engdahl region determiner as the region in the
-        # NDK files is oftentimes trimmed.
-        region = fe.get_region(record["centroid_longitude"],
-                               record["centroid_latitude"])
+def _lines_to_event(lines, fe):
+    """
+    Creates an event from the five lines of an event in an NDK file.
+    """
+    record = _read_lines(*lines)
+    try:
+        time = _parse_date_time(record["date"], record["time"])
+    except ObsPyNDKException:
+        msg = ("Invalid time in event. '%s' and '%s' cannot be "
+               "assembled to a valid time.") % (record["date"], record["time"])
+        raise ObsPyNDKException(msg)
+    return _record_to_event(record, time, fe)
 
-        # Create an event object.
-        event = Event(
-            force_resource_id=False,
-            event_type="earthquake",
-            event_type_certainty="known",
-            event_descriptions=[
-                EventDescription(text=region, type="Flinn-Engdahl region"),
-                EventDescription(text=record["cmt_event_name"],
-                                 type="earthquake name")
-            ]
-        )
-
-        # Assemble the time for the reference origin.
-        try:
-            time = _parse_date_time(record["date"], record["time"])
-        except ObsPyNDKException:
-            msg = ("Invalid time in event %i. '%s' and '%s' cannot be "
-                   "assembled to a valid time. Event will be skipped.") % \
-                  (_i + 1, record["date"], record["time"])
-            warnings.warn(msg, ObsPyNDKWarning)
-            continue
 
-        # Create two origins, one with the reference latitude/longitude and
-        # one with the centroidal values.
-        ref_origin = Origin(
-            force_resource_id=False,
-            time=time,
-            longitude=record["hypo_lng"],
-            latitude=record["hypo_lat"],
-            # Convert to m.
-            depth=record["hypo_depth_in_km"] * 1000.0,
-            origin_type="hypocenter",
-            comments=[Comment(text="Hypocenter catalog: %s" %
-                              record["hypocenter_reference_catalog"],
-                              force_resource_id=False)]
-        )
-        ref_origin.comments[0].resource_id = _get_resource_id(
-            record["cmt_event_name"], "comment", tag="ref_origin")
-        ref_origin.resource_id = _get_resource_id(record["cmt_event_name"],
-                                                  "origin", tag="reforigin")
-
-        cmt_origin = Origin(
-            force_resource_id=False,
-            longitude=record["centroid_longitude"],
-            longitude_errors={
-                "uncertainty": record["centroid_longitude_error"]},
-            latitude=record["centroid_latitude"],
-            latitude_errors={
-                "uncertainty": record["centroid_latitude_error"]},
-            # Convert to m.
-            depth=record["centroid_depth_in_km"] * 1000.0,
-            depth_errors={
-                "uncertainty": record["centroid_depth_in_km_error"] * 1000},
-            time=ref_origin["time"] + record["centroid_time"],
-            time_errors={"uncertainty": record["centroid_time_error"]},
-            depth_type=record["type_of_centroid_depth"],
-            origin_type="centroid",
-            time_fixed=False,
-            epicenter_fixed=False,
-            creation_info=creation_info.copy()
-        )
-        cmt_origin.resource_id = _get_resource_id(record["cmt_event_name"],
-                                                  "origin",
-                                                  tag="cmtorigin")
-        event.origins = [ref_origin, cmt_origin]
-        event.preferred_origin_id = cmt_origin.resource_id.id
-
-        # Create the magnitude object.
-        mag = Magnitude(
-            force_resource_id=False,
-            mag=round(record["Mw"], 2),
-            magnitude_type="Mwc",
-            origin_id=cmt_origin.resource_id,
-            creation_info=creation_info.copy()
-        )
-        mag.resource_id = _get_resource_id(record["cmt_event_name"],
-                                           "magnitude", tag="moment_mag")
-        event.magnitudes = [mag]
-        event.preferred_magnitude_id = mag.resource_id.id
-
-        # Add the reported mb, MS magnitudes as additional magnitude objects.
-        event.magnitudes.append(Magnitude(
-            force_resource_id=False,
-            mag=record["mb"],
-            magnitude_type="mb",
-            comments=[Comment(
-                force_resource_id=False,
-                text="Reported magnitude in NDK file. Most likely 'mb'."
-            )]
-        ))
-        event.magnitudes[-1].comments[-1].resource_id = _get_resource_id(
-            record["cmt_event_name"], "comment", tag="mb_magnitude")
-        event.magnitudes[-1].resource_id = _get_resource_id(
-            record["cmt_event_name"], "magnitude", tag="mb")
-
-        event.magnitudes.append(Magnitude(
-            force_resource_id=False,
-            mag=record["MS"],
-            magnitude_type="MS",
-            comments=[Comment(
-                force_resource_id=False,
-                text="Reported magnitude in NDK file. Most likely 'MS'."
-            )]
-        ))
-        event.magnitudes[-1].comments[-1].resource_id = _get_resource_id(
-            record["cmt_event_name"], "comment", tag="MS_magnitude")
-        event.magnitudes[-1].resource_id = _get_resource_id(
-            record["cmt_event_name"], "magnitude", tag="MS")
-
-        # Take care of the moment tensor.
-        tensor = Tensor(
-            m_rr=record["m_rr"],
-            m_rr_errors={"uncertainty": record["m_rr_error"]},
-            m_pp=record["m_pp"],
-            m_pp_errors={"uncertainty": record["m_pp_error"]},
-            m_tt=record["m_tt"],
-            m_tt_errors={"uncertainty": record["m_tt_error"]},
-            m_rt=record["m_rt"],
-            m_rt_errors={"uncertainty": record["m_rt_error"]},
-            m_rp=record["m_rp"],
-            m_rp_errors={"uncertainty": record["m_rp_error"]},
-            m_tp=record["m_tp"],
-            m_tp_errors={"uncertainty": record["m_tp_error"]},
-            creation_info=creation_info.copy()
-        )
-        mt = MomentTensor(
+def _record_to_event(record, time, fe):
+    """
+    Creates an event from a parsed record of an NDK file.
+
+    :param record: Dictionary returned by :func:`_read_lines`.
+    :param time: Time of the reference origin.
+    :param fe: :class:`~obspy.geodetics.FlinnEngdahl` object.
+    """
+    # Use one creation info for essentially every item.
+    creation_info = CreationInfo(
+        agency_id="GCMT",
+        version=record["version_code"]
+    )
+
+    # Use the ObsPy Flinn Engdahl region determiner as the region in the
+    # NDK files is oftentimes trimmed.
+    region = fe.get_region(record["centroid_longitude"],
+                           record["centroid_latitude"])
+
+    # Create an event object.
+    event = Event(
+        force_resource_id=False,
+        event_type="earthquake",
+        event_type_certainty="known",
+        event_descriptions=[
+            EventDescription(text=region, type="Flinn-Engdahl region"),
+            EventDescription(text=record["cmt_event_name"],
+                             type="earthquake name")
+        ]
+    )
+
+    # Create two origins, one with the reference latitude/longitude and
+    # one with the centroidal values.
+    ref_origin = Origin(
+        force_resource_id=False,
+        time=time,
+        longitude=record["hypo_lng"],
+        latitude=record["hypo_lat"],
+        # Convert to m.
+        depth=record["hypo_depth_in_km"] * 1000.0,
+        origin_type="hypocenter",
+        comments=[Comment(text="Hypocenter catalog: %s" %
+                          record["hypocenter_reference_catalog"],
+                          force_resource_id=False)]
+    )
+    ref_origin.comments[0].resource_id = _get_resource_id(
+        record["cmt_event_name"], "comment", tag="ref_origin")
+    ref_origin.resource_id = _get_resource_id(record["cmt_event_name"],
+                                              "origin", tag="reforigin")
+
+    cmt_origin = Origin(
+        force_resource_id=False,
+        longitude=record["centroid_longitude"],
+        longitude_errors={
+            "uncertainty": record["centroid_longitude_error"]},
+        latitude=record["centroid_latitude"],
+        latitude_errors={
+            "uncertainty": record["centroid_latitude_error"]},
+        # Convert to m.
+        depth=record["centroid_depth_in_km"] * 1000.0,
+        depth_errors={
+            "uncertainty": record["centroid_depth_in_km_error"] * 1000},
+        time=ref_origin["time"] + record["centroid_time"],
+        time_errors={"uncertainty": record["centroid_time_error"]},
+        depth_type=record["type_of_centroid_depth"],
+        origin_type="centroid",
+        time_fixed=False,
+        epicenter_fixed=False,
+        creation_info=creation_info.copy()
+    )
+    cmt_origin.resource_id = _get_resource_id(record["cmt_event_name"],
+                                              "origin",
+                                              tag="cmtorigin")
+    event.origins = [ref_origin, cmt_origin]
+    event.preferred_origin_id = cmt_origin.resource_id.id
+
+    # Create the magnitude object.
+    mag = Magnitude(
+        force_resource_id=False,
+        mag=round(record["Mw"], 2),
+        magnitude_type="Mwc",
+        origin_id=cmt_origin.resource_id,
+        creation_info=creation_info.copy()
+    )
+    mag.resource_id = _get_resource_id(record["cmt_event_name"],
+                                       "magnitude", tag="moment_mag")
+    event.magnitudes = [mag]
+    event.preferred_magnitude_id = mag.resource_id.id
+
+    # Add the reported mb, MS magnitudes as additional magnitude objects.
+    event.magnitudes.append(Magnitude(
+        force_resource_id=False,
+        mag=record["mb"],
+        magnitude_type="mb",
+        comments=[Comment(
             force_resource_id=False,
-            scalar_moment=record["scalar_moment"],
-            tensor=tensor,
-            data_used=[DataUsed(**i) for i in record["data_used"]],
-            inversion_type=record["source_type"],
-            source_time_function=SourceTimeFunction(
-                type=record["moment_rate_type"],
-                duration=record["moment_rate_duration"]
-            ),
-            derived_origin_id=cmt_origin.resource_id,
-            creation_info=creation_info.copy()
-        )
-        mt.resource_id = _get_resource_id(record["cmt_event_name"],
-                                          "momenttensor")
-        axis = [Axis(**i) for i in record["principal_axis"]]
-        focmec = FocalMechanism(
+            text="Reported magnitude in NDK file. Most likely 'mb'."
+        )]
+    ))
+    event.magnitudes[-1].comments[-1].resource_id = _get_resource_id(
+        record["cmt_event_name"], "comment", tag="mb_magnitude")
+    event.magnitudes[-1].resource_id = _get_resource_id(
+        record["cmt_event_name"], "magnitude", tag="mb")
+
+    event.magnitudes.append(Magnitude(
+        force_resource_id=False,
+        mag=record["MS"],
+        magnitude_type="MS",
+        comments=[Comment(
             force_resource_id=False,
-            moment_tensor=mt,
-            principal_axes=PrincipalAxes(
-                # The ordering is the same as for the IRIS SPUD service and
-                # from a website of the Saint Louis University Earthquake
-                # center so it should be correct.
-                t_axis=axis[0],
-                p_axis=axis[2],
-                n_axis=axis[1]
-            ),
-            nodal_planes=NodalPlanes(
-                nodal_plane_1=NodalPlane(**record["nodal_plane_1"]),
-                nodal_plane_2=NodalPlane(**record["nodal_plane_2"])
-            ),
-            comments=[
-                Comment(force_resource_id=False,
-                        text="CMT Analysis Type: %s" %
-                             record["cmt_type"].capitalize()),
-                Comment(force_resource_id=False,
-                        text="CMT Timestamp: %s" %
-                             record["cmt_timestamp"])],
-            creation_info=creation_info.copy()
-        )
-        focmec.comments[0].resource_id = _get_resource_id(
-            record["cmt_event_name"], "comment", tag="cmt_type")
-        focmec.comments[1].resource_id = _get_resource_id(
-            record["cmt_event_name"], "comment", tag="cmt_timestamp")
-        focmec.resource_id = _get_resource_id(record["cmt_event_name"],
-                                              "focal_mechanism")
-        event.focal_mechanisms = [focmec]
-        event.preferred_focal_mechanism_id = focmec.resource_id.id
-
-        # Set at end to avoid duplicate resource id warning.
-        event.resource_id = _get_resource_id(record["cmt_event_name"],
-                                             "event")
-
-        cat.append(event)
-
-    if len(cat) == 0:
-        msg = "No valid events found in NDK file."
-        raise ObsPyNDKException(msg)
-
-    return cat
+            text="Reported magnitude in NDK file. Most likely 'MS'."
+        )]
+    ))
+    event.magnitudes[-1].comments[-1].resource_id = _get_resource_id(
+        record["cmt_event_name"], "comment", tag="MS_magnitude")
+    event.magnitudes[-1].resource_id = _get_resource_id(
+        record["cmt_event_name"], "magnitude", tag="MS")
+
+    # Take care of the moment tensor.
+    tensor = Tensor(
+        m_rr=record["m_rr"],
+        m_rr_errors={"uncertainty": record["m_rr_error"]},
+        m_pp=record["m_pp"],
+        m_pp_errors={"uncertainty": record["m_pp_error"]},
+        m_tt=record["m_tt"],
+        m_tt_errors={"uncertainty": record["m_tt_error"]},
+        m_rt=record["m_rt"],
+        m_rt_errors={"uncertainty": record["m_rt_error"]},
+        m_rp=record["m_rp"],
+        m_rp_errors={"uncertainty": record["m_rp_error"]},
+        m_tp=record["m_tp"],
+        m_tp_errors={"uncertainty": record["m_tp_error"]},
+        creation_info=creation_info.copy()
+    )
+    mt = MomentTensor(
+        force_resource_id=False,
+        scalar_moment=record["scalar_moment"],
+        tensor=tensor,
+        data_used=[DataUsed(**i) for i in record["data_used"]],
+        inversion_type=record["source_type"],
+        source_time_function=SourceTimeFunction(
+            type=record["moment_rate_type"],
+            duration=record["moment_rate_duration"]
+        ),
+        derived_origin_id=cmt_origin.resource_id,
+        creation_info=creation_info.copy()
+    )
+    mt.resource_id = _get_resource_id(record["cmt_event_name"],
+                                      "momenttensor")
+    axis = [Axis(**i) for i in record["principal_axis"]]
+    focmec = FocalMechanism(
+        force_resource_id=False,
+        moment_tensor=mt,
+        principal_axes=PrincipalAxes(
+            # The ordering is the same as for the IRIS SPUD service and
+            # from a website of the Saint Louis University Earthquake
+            # center so it should be correct.
+            t_axis=axis[0],
+            p_axis=axis[2],
+            n_axis=axis[1]
+        ),
+        nodal_planes=NodalPlanes(
+            nodal_plane_1=NodalPlane(**record["nodal_plane_1"]),
+            nodal_plane_2=NodalPlane(**record["nodal_plane_2"])
+        ),
+        comments=[
+            Comment(force_resource_id=False,
+                    text="CMT Analysis Type: %s" %
+                         record["cmt_type"].capitalize()),
+            Comment(force_resource_id=False,
+                    text="CMT Timestamp: %s" %
+                         record["cmt_timestamp"])],
+        creation_info=creation_info.copy()
+    )
+    focmec.comments[0].resource_id = _get_resource_id(
+        record["cmt_event_name"], "comment", tag="cmt_type")
+    focmec.comments[1].resource_id = _get_resource_id(
+        record["cmt_event_name"], "comment", tag="cmt_timestamp")
+    focmec.resource_id = _get_resource_id(record["cmt_event_name"],
+                                          "focal_mechanism")
+    event.focal_mechanisms = [focmec]
+    event.preferred_focal_mechanism_id = focmec.resource_id.id
+
+    # Set at end to avoid duplicate resource id warning.
+    event.resource_id = _get_resource_id(record["cmt_event_name"],
+                                         "event")
+
+    return event
 
 
 def _read_lines(line1, line2, line3, line4, line5):
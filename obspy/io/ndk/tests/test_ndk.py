@@ -10,7 +10,10 @@ import os
 import unittest
 import warnings
 
+import numpy as np
+
 from obspy import UTCDateTime, read_events
+from obspy.core.event import scan_events
 from obspy.io.ndk.core import (ObsPyNDKException, _parse_date_time, _is_ndk,
                                _read_ndk)
 
@@ -317,6 +320,74 @@ class NDKTestCase(unittest.TestCase):
             warnings.simplefilter("ignore")
             self.assertRaises(ObsPyNDKException, read_events, data)
 
+    def test_scan_events(self):
+        """
+        The centroid time, location and moment magnitude are scanned from
+        the five line blocks without creating any event, an incomplete last
+        block is skipped with the same warning as when reading.
+        """
+        filename = os.path.join(self.datapath, "multiple_events.ndk")
+        cat = read_events(filename)
+        table = scan_events(filename)
+        self.assertEqual(table._events, [None] * 6)
+        for key in cat.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          cat.get_columns()[key])
+        self.assertEqual(table[2]._format, "NDK")
+        self.assertEqual(table.to_catalog(), cat)
+        with io.open(filename, "rt") as fh:
+            data = "\n".join(fh.read().splitlines()[:-2])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            table = scan_events(io.StringIO(data))
+        self.assertEqual(len(w), 1)
+        self.assertTrue(str(w[0].message).startswith("Skipped last"))
+        self.assertEqual(table._events, [None] * 5)
+        self.assertEqual(table.to_catalog().events, cat.events[:5])
+
+    def test_scan_events_with_non_standard_layout(self):
+        """
+        Events that do not have the standard layout of NDK files but are
+        read fine are parsed one by one when scanning.
+        """
+        with io.open(os.path.join(self.datapath, "multiple_events.ndk"),
+                     "rt") as fh:
+            lines = fh.read().splitlines()
+        # lower case type of depth
+        lines[7] = lines[7][:59] + "fix " + lines[7][63:]
+        # 60 seconds
+        lines[15] = lines[15][:16] + "12:53:60.0" + lines[15][26:]
+        data = "\n".join(lines)
+        cat = read_events(io.StringIO(data))
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            table = scan_events(io.StringIO(data))
+        self.assertEqual(len(w), 0)
+        self.assertEqual([_i is None for _i in table._events],
+                         [True, False, True, False, True, True])
+        for key in cat.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          cat.get_columns()[key])
+        self.assertEqual(table.to_catalog(), cat)
+
+    def test_scan_file_with_multiple_errors(self):
+        """
+        Scanning skips the same events with the same warnings as reading.
+        """
+        filename = os.path.join(self.datapath, "faulty_multiple_events.ndk")
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            table = scan_events(filename)
+        with warnings.catch_warnings(record=True) as w_read:
+            warnings.simplefilter("always")
+            cat = read_events(filename)
+        self.assertEqual(len(w), 6)
+        self.assertEqual([str(_i.message).splitlines()[0] for _i in w],
+                         [str(_i.message).splitlines()[0] for _i in w_read])
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table[0], cat[0])
+        self.assertEqual(table.to_catalog().events, cat.events)
+
     def test_parse_date_time_function(self):
         """
         Tests the _parse_date_time() function.
@@ -24,16 +24,21 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA @UnusedWildImport
 
+import collections
+import glob
+import re
 import warnings
 import datetime
 import os
 import io
+from multiprocessing.pool import ThreadPool
 
 from obspy import UTCDateTime, read
 from obspy.geodetics import kilometers2degrees, degrees2kilometers
 from obspy.core.event import Event, Origin, Magnitude, Comment, Catalog
 from obspy.core.event import EventDescription, CreationInfo, OriginQuality
 from obspy.core.event import Pick, WaveformStreamID, Arrival, Amplitude
+from obspy.core.event import ResourceIdentifier
 
 
 mag_mapping = {"ML": "L", "MLv": "L", "mB": "B", "Ms": "S", "MW": "W",
@@ -452,22 +457,173 @@ def read_nordic(select_file, return_wavnames=False):
     else:
         f = select_file
     wav_names = []
+    for event_str in _iter_event_lines(f):
+        new_event, wav_name = _read_event_lines(event_str, return_wavnames)
+        if return_wavnames:
+            wav_names.append(wav_name)
+        catalog.append(new_event)
+    f.close()
+    if return_wavnames:
+        return catalog, wav_names
+    return catalog
+
+
+def iread_nordic(path, return_wavnames=False, threads=None):
+    """
+    Iterate over the events of Nordic files.
+
+    Yields the events one at a time in the order of the files, so that
+    arbitrarily large collections of events can be processed without reading
+    them into a catalog first. Directories are searched recursively for
+    S-files (e.g. ``01-0411-15L.S201309``), i.e. all events of a SEISAN REA
+    database (e.g. ``REA/BASE``) are read in chronological order.
+
+    :type path: str or list
+    :param path: S-file, Nordic formatted select file, directory with
+        S-files or a list of these. Wildcards are allowed.
+    :type return_wavnames: bool
+    :param return_wavnames:
+        If True, will yield tuples of each event and the names of the
+        waveforms that the event is associated with.
+    :type threads: int
+    :param threads: Number of threads reading the files in parallel, ahead
+        of the events being parsed and handed out. Mostly useful for
+        databases with many small S-files on network file systems.
+
+    :rtype: generator of :class:`~obspy.core.event.event.Event`
+
+    .. rubric:: Example
+
+    >>> from obspy.io.nordic.core import iread_nordic
+    >>> for event in iread_nordic('/path/to/REA/BASE',
+    ...                           threads=4):  # doctest: +SKIP
+    ...     print(event.short_str())
+    """
+    filenames = _find_sfiles(path)
+    if threads is None or threads <= 1 or len(filenames) <= 1:
+        for filename in filenames:
+            with io.open(filename, 'r') as f:
+                for result in _read_nordic_lines(f, return_wavnames):
+                    yield result
+        return
+    # Files are read in chunks, at most a few chunks per thread are read
+    # ahead of the parsed events to keep the memory usage low.
+    pool = ThreadPool(threads)
+    try:
+        pending = collections.deque()
+        for i in range(0, len(filenames), _CHUNK_SIZE):
+            pending.append(pool.apply_async(
+                _read_text, (filenames[i:i + _CHUNK_SIZE],)))
+            if len(pending) > 2 * threads:
+                for text in pending.popleft().get():
+                    for result in _read_nordic_lines(text.splitlines(True),
+                                                     return_wavnames):
+                        yield result
+        while pending:
+            for text in pending.popleft().get():
+                for result in _read_nordic_lines(text.splitlines(True),
+                                                 return_wavnames):
+                    yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+# number of files read by a thread at once
+_CHUNK_SIZE = 16
+
+# names of S-files in a SEISAN REA database, e.g. 01-0411-15L.S201309
+_SFILE_NAME = re.compile(r"^\d{2}-\d{4}-\d{2}[A-Z]\.S\d{6}$")
+
+
+def _find_sfiles(path):
+    """
+    Returns the sorted names of the S-files in a directory tree, the names
+    matching a wildcard pattern or the given file name.
+    """
+    if isinstance(path, (list, tuple)):
+        return [_i for _path in path for _i in _find_sfiles(_path)]
+    if os.path.isdir(path):
+        filenames = []
+        for dirpath, dirnames, files in os.walk(path):
+            # years and months are walked in chronological order
+            dirnames.sort()
+            filenames.extend(os.path.join(dirpath, _i) for _i in
+                             sorted(files) if _SFILE_NAME.match(_i))
+        return filenames
+    if glob.has_magic(path):
+        filenames = sorted(glob.glob(path))
+        if not filenames:
+            raise IOError(2, "No file matching file pattern", path)
+        return filenames
+    if not os.path.isfile(path):
+        raise IOError(2, "No such file or directory", path)
+    return [path]
+
+
+def _read_text(filenames):
+    """
+    Returns the contents of text files.
+    """
+    texts = []
+    for filename in filenames:
+        with io.open(filename, 'r') as f:
+            texts.append(f.read())
+    return texts
+
+
+def _read_nordic_lines(f, return_wavnames=False):
+    """
+    Yields the events or tuples of the events and their waveform names of
+    the lines of a Nordic file like :func:`~obspy.core.event.read_events`.
+    """
+    for lines in _iter_event_lines(f):
+        new_event, wav_names = _read_event_lines(lines, return_wavnames)
+        new_event._format = "NORDIC"
+        new_event.scope_resource_ids()
+        if return_wavnames:
+            yield new_event, wav_names
+        else:
+            yield new_event
+
+
+def _iter_event_lines(f):
+    """
+    Yields the lines of the events of an open Nordic file, events are
+    separated by blank lines.
+
+    :type f: file
+    :param f: File open in read mode.
+    """
+    event_str = []
     for line in f:
         if len(line.rstrip()) > 0:
             event_str.append(line)
         elif len(event_str) > 0:
-            tmp_sfile = io.StringIO()
-            for event_line in event_str:
-                tmp_sfile.write(event_line)
-            new_event = _readheader(f=tmp_sfile)
-            if return_wavnames:
-                wav_names.append(_readwavename(f=tmp_sfile))
-            catalog += _read_picks(f=tmp_sfile, new_event=new_event)
+            yield event_str
             event_str = []
-    f.close()
+    if event_str:
+        yield event_str
+
+
+def _read_event_lines(event_str, return_wavnames=False):
+    """
+    Reads a single event from its lines.
+
+    :type event_str: list
+    :param event_str: Lines of the event.
+    :type return_wavnames: bool
+    :param return_wavnames: If True, also reads the waveform names.
+
+    :returns: :class:`~obspy.core.event.event.Event` and list of the
+        waveform names (``None`` if not read)
+    """
+    tmp_sfile = io.StringIO(''.join(event_str))
+    new_event = _readheader(f=tmp_sfile)
+    wav_names = None
     if return_wavnames:
-        return catalog, wav_names
-    return catalog
+        wav_names = _readwavename(f=tmp_sfile)
+    return _read_picks(f=tmp_sfile, new_event=new_event), wav_names
 
 
 def _read_picks(f, new_event):
@@ -545,33 +701,32 @@ def _read_picks(f, new_event):
         else:
             warnings.warn('%s is not currently supported' % header[57:60])
         # finalweight = _int_conv(line[68:70])
-        # Create a new obspy.event.Pick class for this pick
-        _waveform_id = WaveformStreamID(station_code=line[1:6].strip(),
-                                        channel_code=line[6:8].strip(),
-                                        network_code='NA')
-        pick = Pick(waveform_id=_waveform_id, phase_hint=phase,
-                    polarity=polarity, time=time)
-        try:
-            pick.onset = onsets[line[9]]
-        except KeyError:
-            pass
+        # Create a new obspy.event.Pick class for this pick, None values are
+        # not set
+        _waveform_id = WaveformStreamID._from_trusted(
+            station_code=line[1:6].strip(), channel_code=line[6:8].strip(),
+            network_code='NA')
         if line[15] == 'A':
-            pick.evaluation_mode = 'automatic'
+            evaluation_mode = 'automatic'
         else:
-            pick.evaluation_mode = 'manual'
+            evaluation_mode = 'manual'
         # Note these two are not always filled - velocity conversion not yet
         # implemented, needs to be converted from km/s to s/deg
         # if not velocity == 999.0:
             # new_event.picks[pick_index].horizontal_slowness = 1.0 / velocity
-        if _float_conv(line[46:51]) is not None:
-            pick.backazimuth = _float_conv(line[46:51])
+        pick = Pick._from_trusted(
+            resource_id=ResourceIdentifier(), waveform_id=_waveform_id,
+            phase_hint=phase, polarity=polarity, time=time,
+            onset=onsets.get(line[9]), evaluation_mode=evaluation_mode,
+            backazimuth=_float_conv(line[46:51]))
         # Create new obspy.event.Amplitude class which references above Pick
         # only if there is an amplitude picked.
         if _float_conv(line[33:40]) is not None:
-            _amplitude = Amplitude(generic_amplitude=_float_conv(line[33:40]),
-                                   period=_float_conv(line[41:45]),
-                                   pick_id=pick.resource_id,
-                                   waveform_id=pick.waveform_id)
+            _amplitude = Amplitude._from_trusted(
+                resource_id=ResourceIdentifier(),
+                generic_amplitude=_float_conv(line[33:40]),
+                period=_float_conv(line[41:45]), pick_id=pick.resource_id,
+                waveform_id=pick.waveform_id)
             if pick.phase_hint == 'IAML':
                 # Amplitude for local magnitude
                 _amplitude.type = 'AML'
@@ -590,9 +745,10 @@ def _read_picks(f, new_event):
             new_event.amplitudes.append(_amplitude)
         elif _int_conv(line[28:33]) is not None:
             # Create an amplitude instance for code duration also
-            _amplitude = Amplitude(generic_amplitude=_int_conv(line[28:33]),
-                                   pick_id=pick.resource_id,
-                                   waveform_id=pick.waveform_id)
+            _amplitude = Amplitude._from_trusted(
+                resource_id=ResourceIdentifier(),
+                generic_amplitude=_int_conv(line[28:33]),
+                pick_id=pick.resource_id, waveform_id=pick.waveform_id)
             # Amplitude for coda magnitude
             _amplitude.type = 'END'
             # Set to be evaluating a point in the trace
@@ -604,17 +760,15 @@ def _read_picks(f, new_event):
             new_event.amplitudes.append(_amplitude)
         # Create new obspy.event.Arrival class referencing above Pick
         if _float_conv(line[33:40]) is None:
-            arrival = Arrival(phase=pick.phase_hint, pick_id=pick.resource_id)
-            if weight is not None:
-                arrival.time_weight = weight
-            if _int_conv(line[60:63]) is not None:
-                arrival.backazimuth_residual = _int_conv(line[60:63])
-            if _float_conv(line[63:68]) is not None:
-                arrival.time_residual = _float_conv(line[63:68])
-            if _float_conv(line[70:75]) is not None:
-                arrival.distance = kilometers2degrees(_float_conv(line[70:75]))
-            if _int_conv(line[76:79]) is not None:
-                arrival.azimuth = _int_conv(line[76:79])
+            distance = _float_conv(line[70:75])
+            if distance is not None:
+                distance = kilometers2degrees(distance)
+            arrival = Arrival._from_trusted(
+                resource_id=ResourceIdentifier(), phase=pick.phase_hint,
+                pick_id=pick.resource_id, time_weight=weight,
+                backazimuth_residual=_int_conv(line[60:63]),
+                time_residual=_float_conv(line[63:68]), distance=distance,
+                azimuth=_int_conv(line[76:79]))
             new_event.origins[0].arrivals.append(arrival)
         new_event.picks.append(pick)
     return new_event
@@ -757,16 +911,86 @@ def write_select(catalog, filename, userid='OBSP', evtype='L',
     """
     if not wavefiles:
         wavefiles = ['DUMMY' for _i in range(len(catalog))]
-    with open(filename, 'w') as fout:
+    with NordicWriter(filename, userid=userid, evtype=evtype) as writer:
         for event, wavfile in zip(catalog, wavefiles):
-            select = io.StringIO()
-            _write_nordic(event=event, filename=None, userid=userid,
-                          evtype=evtype, wavefiles=wavfile,
-                          string_io=select)
-            select.seek(0)
-            for line in select:
-                fout.write(line)
-            fout.write('\n')
+            writer.write(event, wavefiles=wavfile)
+
+
+class NordicWriter(object):
+    """
+    Writes events to a select file in nordic format one at a time.
+
+    In contrast to :func:`write_select` the events do not have to be
+    collected in a :class:`~obspy.core.event.Catalog` first. Each event is
+    written to the file as soon as it is passed to :meth:`write`, so that
+    only a single event has to be kept in memory.
+
+    :type filename: str or file
+    :param filename: Path to write to or file-like object open in text
+        mode.
+    :type userid: str
+    :param userid: Up to 4 character user ID
+    :type evtype: str
+    :param evtype:
+        Single character string to describe the event, either L, R or D.
+
+    .. rubric:: Example
+
+    >>> from obspy.io.nordic.core import iread_nordic
+    >>> with NordicWriter('/tmp/select.out') as writer:  # doctest: +SKIP
+    ...     for event in iread_nordic('/path/to/REA/BASE'):
+    ...         writer.write(event)
+    """
+    def __init__(self, filename, userid='OBSP', evtype='L'):
+        self.userid = userid
+        self.evtype = evtype
+        # Open filehandler or use an existing file like object.
+        if not hasattr(filename, 'write'):
+            self._file_opened = True
+            self._fh = open(filename, 'w')
+        else:
+            self._file_opened = False
+            self._fh = filename
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, event, wavefiles='DUMMY'):
+        """
+        Writes one or more events to the file.
+
+        :type event: :class:`~obspy.core.event.Event` or iterable of
+            :class:`~obspy.core.event.Event`
+        :param event: Event or iterable (e.g. a generator or a
+            :class:`~obspy.core.event.Catalog`) of events to write.
+        :type wavefiles: list
+        :param wavefiles: Waveforms to associate all written events with.
+        """
+        if self._fh is None:
+            raise ValueError('I/O operation on closed Nordic writer.')
+        if isinstance(event, Event):
+            event = [event]
+        for event_ in event:
+            _write_nordic(event=event_, filename=None, userid=self.userid,
+                          evtype=self.evtype, wavefiles=wavefiles,
+                          string_io=self._fh)
+            self._fh.write('\n')
+
+    def close(self):
+        """
+        Closes the file if it has been opened by the writer.
+        """
+        if self._fh is None:
+            return
+        try:
+            # Close if a file has been opened by this writer.
+            if self._file_opened is True:
+                self._fh.close()
+        finally:
+            self._fh = None
 
 
 def _write_nordic(event, filename, userid='OBSP', evtype='L', outdir='.',
@@ -18,12 +18,14 @@ from obspy.core.event import Pick, WaveformStreamID, Arrival, Amplitude
 from obspy.core.event import Event, Origin, Magnitude, OriginQuality
 from obspy.core.event import EventDescription, CreationInfo
 from obspy.core.util.base import NamedTemporaryFile
+from obspy.core.util.misc import TemporaryWorkingDirectory
 from obspy.io.nordic.core import _is_sfile, read_spectral_info, read_nordic
 from obspy.io.nordic.core import readwavename, blanksfile, _write_nordic
 from obspy.io.nordic.core import nordpick, readheader
 from obspy.io.nordic.core import _int_conv, _readheader, _evmagtonor
 from obspy.io.nordic.core import write_select, NordicParsingError
 from obspy.io.nordic.core import _float_conv, _nortoevmag, _str_conv
+from obspy.io.nordic.core import iread_nordic, NordicWriter
 
 
 class TestNordicMethods(unittest.TestCase):
@@ -548,6 +550,120 @@ class TestNordicMethods(unittest.TestCase):
             int([p for p in pick_strings if p.split()[0] == 'WZ11' and
                  p.split()[1] == 'HZ'][0].split()[-1]), 30)
 
+    def test_iread_rea_tree(self):
+        """
+        Test iterating over the events of a SEISAN REA directory tree.
+        """
+        testing_path = os.path.join(self.testing_path, 'select.out')
+        # raises "UserWarning: AIN in header, currently unsupported"
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            catalog, wav_names = read_nordic(testing_path,
+                                             return_wavnames=True)
+            with TemporaryWorkingDirectory():
+                for event, wav_name in zip(catalog, wav_names):
+                    evtime = event.origins[0].time
+                    outdir = os.path.join(
+                        'REA', 'BASE', str(evtime.year),
+                        str(evtime.month).zfill(2))
+                    if not os.path.isdir(outdir):
+                        os.makedirs(outdir)
+                    _write_nordic(event, filename=None, outdir=outdir,
+                                  wavefiles=wav_name, overwrite=False)
+                # not an S-file
+                with open(os.path.join(outdir, 'index.txt'), 'w') as f:
+                    f.write('\n')
+                events = list(iread_nordic('REA'))
+                self.assertEqual(len(events), len(catalog))
+                # events are read in the order of the file names
+                times = [(_e.origins[0].time.year, _e.origins[0].time.month,
+                          _e.origins[0].time.day, _e.origins[0].time.hour,
+                          _e.origins[0].time.minute) for _e in events]
+                self.assertEqual(times, sorted(times))
+                for event in events:
+                    self.assertEqual(event._format, 'NORDIC')
+                    pick_ids = [_p.resource_id for _p in event.picks]
+                    for arrival in event.origins[0].arrivals:
+                        self.assertIn(arrival.pick_id, pick_ids)
+                        self.assertIn(arrival.pick_id.get_referred_object(),
+                                      event.picks)
+                # reading with threads returns the same events
+                results = list(iread_nordic(os.path.join('REA', 'BASE'),
+                                            return_wavnames=True, threads=3))
+        self.assertEqual(len(results), len(events))
+        for event, (event_2, wav_name) in zip(events, results):
+            self.assertTrue(test_similarity(event_1=event, event_2=event_2))
+            self.assertIn(wav_name, wav_names)
+
+    def test_iread_files(self):
+        """
+        Test iterating over the events of select files and S-files.
+        """
+        testing_path = os.path.join(self.testing_path, 'select.out')
+        sfile = os.path.join(self.testing_path, '01-0411-15L.S201309')
+        # raises "UserWarning: AIN in header, currently unsupported"
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            catalog = read_nordic(testing_path) + read_nordic(sfile)
+            events = iread_nordic([testing_path, sfile])
+            self.assertFalse(isinstance(events, (list, Catalog)))
+            events = list(events)
+        self.assertEqual(len(events), 51)
+        for event_1, event_2 in zip(catalog, events):
+            self.assertTrue(test_similarity(event_1=event_1, event_2=event_2))
+        self.assertRaises(IOError, list, iread_nordic(
+            os.path.join(self.testing_path, 'not_existing')))
+
+    def test_read_without_trailing_blank_line(self):
+        """
+        The last event of a select file does not need to be followed by a
+        blank line.
+        """
+        testing_path = os.path.join(self.testing_path, 'select.out')
+        with open(testing_path, 'r') as f:
+            lines = f.readlines()
+        while not lines[-1].strip():
+            lines.pop()
+        content = ''.join(lines)
+        # raises "UserWarning: AIN in header, currently unsupported"
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            catalog = read_nordic(io.StringIO(content))
+        self.assertEqual(len(catalog), 50)
+
+    def test_nordic_writer(self):
+        """
+        Test writing events one at a time.
+        """
+        testing_path = os.path.join(self.testing_path, 'select.out')
+        # raises "UserWarning: AIN in header, currently unsupported"
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            catalog = read_nordic(testing_path)
+            with NamedTemporaryFile(suffix='.out') as tf:
+                write_select(catalog, filename=tf.name)
+                with open(tf.name, 'r') as f:
+                    expected = f.read()
+                # writing select.out is not lossless, compare with the events
+                # read from the output of write_select
+                catalog = read_nordic(tf.name)
+                with NordicWriter(tf.name) as writer:
+                    writer.write(catalog[0])
+                    writer.write(iread_nordic(testing_path))
+                with open(tf.name, 'r') as f:
+                    content = f.read()
+                cat_back = read_nordic(tf.name)
+        # the first event and its separating blank line are written twice
+        self.assertEqual(len(content.splitlines()),
+                         len(expected.splitlines()) +
+                         len(expected.split('\n\n')[0].splitlines()) + 1)
+        self.assertEqual(len(cat_back), 51)
+        for event_1, event_2 in zip(catalog[:1] + catalog, cat_back):
+            self.assertTrue(test_similarity(event_1=event_1, event_2=event_2))
+        writer = NordicWriter(io.StringIO())
+        writer.close()
+        self.assertRaises(ValueError, writer.write, catalog[0])
+
 
 def test_similarity(event_1, event_2, verbose=False):
     """
@@ -31,6 +31,10 @@ from obspy.core.event import (Amplitude, Arrival, Axis, Catalog, Comment,
                               Origin, OriginQuality, OriginUncertainty, Pick,
                               PrincipalAxes, QuantityError, ResourceIdentifier,
                               StationMagnitude, Tensor, WaveformStreamID)
+from obspy.core.event.catalog import CATALOG_COLUMNS_DTYPE, NO_TIME
+from obspy.core.event.table import (CatalogTable, _char_matrix,
+                                    _fields_to_ns, _materialize_rows,
+                                    _parse_floats)
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util.decorator import map_example_filename
 from obspy.geodetics import FlinnEngdahl
@@ -1017,14 +1021,108 @@ class Unpickler(object):
         catalog.description = 'Created from NEIC PDE mchedr format'
         catalog.comments = ''
         catalog.creation_info = CreationInfo(creation_time=UTCDateTime())
-        for line in self.fh.readlines():
+        for lines in self._split_events(self.fh.readlines()):
+            catalog.append(self._parse_event(lines))
+        self.fh.close()
+        return catalog
+
+    def _scan(self, lines):
+        """
+        Parses the hypocenter, error and magnitude and additional parameters
+        records of all events in bulk, all other events are parsed one by
+        one.
+        """
+        records = self._split_events(lines)
+        count = len(records)
+        ok = np.ones(count, dtype=np.bool_)
+        hy_lines, e_lines, a_lines = [], [], []
+        for _i, record in enumerate(records):
+            e = [_l for _l in record if _l[0:2] == b'E ']
+            a = [_l for _l in record if _l[0:2] == b'A ']
+            # AE records change the first origin, too
+            if len(e) > 1 or len(a) > 1 or \
+                    any(_l[0:2] == b'AE' for _l in record):
+                ok[_i] = False
+            hy_lines.append(record[0])
+            e_lines.append(e[0] if e else b'')
+            a_lines.append(a[0] if a else b'')
+        columns = np.full(count, np.nan, dtype=CATALOG_COLUMNS_DTYPE)
+        # Same as in _parse_record_hy().
+        hy = _char_matrix(hy_lines, 60)
+        digits = (hy >= ord('0')) & (hy <= ord('9'))
+        ok &= digits[:, 2:10].all(axis=1) & digits[:, 11:17].all(axis=1) & \
+            (hy[:, 17] == ord('.')) & digits[:, 18:20].all(axis=1)
+        time, ok_time = _fields_to_ns(*[
+            _digits_to_int(hy, _j, _j + _k) for _j, _k in
+            ((2, 4), (6, 2), (8, 2), (11, 2), (13, 2), (15, 2))])
+        ok &= ok_time
+        columns["time"] = np.where(
+            ok, time + _digits_to_int(hy, 18, 20) * 10 ** 7, NO_TIME)
+        for key, start, stop, sign_code in (("latitude", 21, 27, "S"),
+                                            ("longitude", 29, 36, "W")):
+            values, ok_values = _parse_floats(hy, start, stop)
+            ok &= ok_values
+            columns[key] = np.where(hy[:, stop] == ord(sign_code), -values,
+                                    values)
+        depth, ok_depth = _parse_floats(hy, 38, 43)
+        ok &= ok_depth
+        columns["depth"] = depth * 1000
+        for key, chars, start, stop, is_int in (
+                ("standard_error", hy, 44, 48, False),
+                ("used_phase_count", _char_matrix(a_lines, 60), 2, 6, True),
+                ("used_station_count", _char_matrix(a_lines, 60), 7, 10,
+                 True),
+                ("azimuthal_gap", _char_matrix(a_lines, 60), 10, 15,
+                 False)):
+            columns[key], ok_values = _optional_floats(chars, start, stop,
+                                                       is_int)
+            ok &= ok_values
+        # Same as in _parse_record_e(), the first magnitude is the first one
+        # given of mb, Ms, mag1 and mag2.
+        e = _char_matrix(e_lines, 60)
+        magnitudes = []
+        for start, stop in ((28, 31), (36, 39), (42, 45), (51, 54)):
+            values, ok_values = _optional_floats(e, start, stop)
+            ok &= ok_values
+            magnitudes.append(values)
+        # mag2 without mag1 fails in _parse_record_e()
+        ok &= np.isnan(magnitudes[3]) | ~np.isnan(magnitudes[2])
+        magnitude = magnitudes[0]
+        for values in magnitudes[1:]:
+            magnitude = np.where(np.isnan(magnitude), values, magnitude)
+        columns["magnitude"] = magnitude
+
+        events, _ = _materialize_rows(columns, records, self._parse_event,
+                                      np.flatnonzero(~ok))
+        return CatalogTable(columns, records, self._parse_event,
+                            events=events)
+
+    @staticmethod
+    def _split_events(lines):
+        """
+        Splits the lines of a file into the lines of the single events, each
+        starting with the hypocenter record HY.
+        """
+        events = []
+        for line in lines:
+            if line[0:2] == b'HY':
+                events.append([])
+            # skip blank lines at the beginning
+            if events:
+                events[-1].append(line)
+        return events
+
+    def _parse_event(self, lines):
+        """
+        Creates an event from its lines.
+        """
+        for line in lines:
             # XXX: ugly, probably we should do everything in byte strings
             # here? Is the pde / mchedr format unicode aware?
             line = line.decode()
             record_id = line[0:2]
             if record_id == 'HY':
                 event = self._parse_record_hy(line)
-                catalog.append(event)
             elif record_id == 'P ':
                 pick, arrival = self._parse_record_p(line, event)
             elif record_id == 'E ':
@@ -1051,12 +1149,41 @@ class Unpickler(object):
                 self._parse_record_m(line, event, pick)
             elif record_id == 'S ':
                 self._parse_record_s(line, event, pick, arrival)
-        self.fh.close()
         # strip extra whitespaces from event comments
-        for event in catalog:
-            for comment in event.comments:
-                comment.text = comment.text.strip()
-        return catalog
+        for comment in event.comments:
+            comment.text = comment.text.strip()
+        return event
+
+
+def _digits_to_int(chars, start, stop):
+    """
+    Converts the digits in the columns ``start:stop`` of a character matrix
+    to integers.
+    """
+    powers = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64)
+    digits = chars[:, start:stop].astype(np.int64) - ord('0')
+    return (digits * powers).sum(axis=1)
+
+
+# characters allowed in the integer fields parsed by _optional_floats()
+_INT_CHARS = np.zeros(256, dtype=np.bool_)
+_INT_CHARS[[ord(_c) for _c in ' 0123456789+-']] = True
+
+
+def _optional_floats(chars, start, stop, is_int=False):
+    """
+    Parses a numeric field of all rows of a character matrix like
+    :meth:`Unpickler._float` (or :meth:`Unpickler._int`), blank fields are
+    NaN. Returns the values and a boolean array marking all rows that could
+    be parsed.
+    """
+    values, ok = _parse_floats(chars, start, stop)
+    blank = (chars[:, start:stop] == ord(' ')).all(axis=1)
+    # explicit NaNs are not missing values
+    ok &= ~np.isnan(values)
+    if is_int:
+        ok &= _INT_CHARS[chars[:, start:stop]].all(axis=1)
+    return values, ok | blank
 
 
 @map_example_filename('filename')
@@ -1086,6 +1213,38 @@ def _read_mchedr(filename):
     return Unpickler().load(filename)
 
 
+@map_example_filename('filename')
+def _scan_mchedr(filename, **kwargs):  # @UnusedVariable
+    """
+    Scans a NEIC PDE mchedr (machine-readable Earthquake Data Report) file
+    and returns an ObsPy CatalogTable object.
+
+    Only the hypocenter, error and magnitude and additional parameters
+    records are parsed, the events are only created when accessed.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.event.scan_events` function, call this
+        instead.
+
+    :type filename: str
+    :param filename: mchedr file to be scanned.
+    :rtype: :class:`~obspy.core.event.CatalogTable`
+    :return: An ObsPy CatalogTable object.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.event import scan_events
+    >>> table = scan_events('/path/to/mchedr.dat')
+    >>> print(table.get_columns()[['latitude', 'magnitude']])
+    [(31.456, 6.2)]
+    """
+    if not isinstance(filename, (str, native_str)):
+        raise TypeError('File name must be a string.')
+    with open(filename, 'rb') as fh:
+        return Unpickler()._scan(fh.readlines())
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
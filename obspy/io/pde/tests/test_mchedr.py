@@ -7,7 +7,9 @@ import os
 import unittest
 import warnings
 
-from obspy.core.event import ResourceIdentifier, read_events
+import numpy as np
+
+from obspy.core.event import ResourceIdentifier, read_events, scan_events
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.io.pde.mchedr import _read_mchedr
@@ -330,6 +332,23 @@ Gumma, Ibaraki, Kanagawa, Miyagi, Saitama, Tochigi and Tokyo.')
             catalog = read_events(filename)
             self.assertTrue(len(catalog), 1)
 
+    def test_scan_events(self):
+        """
+        Tests scanning an mchedr document via scan_events.
+        """
+        filename = os.path.join(self.path, 'mchedr.dat')
+        table = scan_events(filename)
+        self.assertEqual(table._events, [None])
+        for key in self.catalog.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          self.catalog.get_columns()[key])
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            event = table[0]
+        self.assertEqual(event._format, 'MCHEDR')
+        self.assertEqual(event.resource_id, self.catalog[0].resource_id)
+        self.assertEqual(len(event.picks), len(self.catalog[0].picks))
+
 
 def suite():
     return unittest.makeSuite(MchedrTestCase, 'test')
@@ -129,6 +129,8 @@ class Unpickler(object):
     """
     def __init__(self, xml_doc=None):
         self.xml_doc = xml_doc
+        # children of already visited elements, see _xpath()
+        self._children = {}
 
     @property
     def xml_root(self):
@@ -161,6 +163,59 @@ class Unpickler(object):
         self.xml_doc = etree.parse(io.BytesIO(string))
         return self._deserialize()
 
+    def iterload(self, file):
+        """
+        Iterates over the events of a QuakeML file.
+
+        The document is parsed incrementally and each event element is
+        discarded once the corresponding
+        :class:`~obspy.core.event.event.Event` has been created, so that only
+        a single event has to be kept in memory at any time. Resource
+        identifiers are bound within each event.
+
+        :type file: str or file-like object
+        :param file: File name or open file to read.
+        :rtype: generator of :class:`~obspy.core.event.event.Event`
+        """
+        if isinstance(file, bytes) and file.lstrip().startswith(b"<"):
+            file = io.BytesIO(file)
+        context = etree.iterparse(file, events=("start", "end"))
+        root = None
+        event_tag = None
+        for action, element in context:
+            if event_tag is None:
+                # the first two start events determine the root element and
+                # the "eventParameters" element with its namespace
+                if root is None:
+                    root = element
+                    continue
+                namespace = etree.QName(element.tag).namespace
+                if action != "start" or \
+                        etree.QName(element.tag).localname != \
+                        "eventParameters":
+                    raise Exception("Not a QuakeML compatible file or string")
+                self._quakeml_namespaces = [
+                    ns for ns in root.nsmap.values()
+                    if ns.startswith(r"http://quakeml.org/xmlns/")]
+                event_tag = "{%s}event" % namespace
+                continue
+            if action != "end" or element.tag != event_tag:
+                continue
+            event = self._event(element)
+            # free the memory of the processed element and of all preceding
+            # siblings
+            self._children.clear()
+            element.clear()
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+            if event is None:
+                continue
+            event.scope_resource_ids()
+            yield event
+        if event_tag is None:
+            raise Exception("Not a QuakeML compatible file or string")
+
     def _xpath2obj(self, xpath, element=None, convert_to=str, namespace=None):
         q = self._xpath(xpath, element=element, namespace=namespace)
         if not q:
@@ -182,29 +237,51 @@ class Unpickler(object):
         return None
 
     def _xpath(self, xpath, element=None, namespace=None):
+        """
+        Returns all children of an element with the given tag name.
+
+        The children of each element are only walked once and are stored in
+        a dictionary mapping the tag names (without the default namespace of
+        the element) to lists of elements, all further lookups are simple
+        dictionary lookups.
+        """
         if element is None:
             element = self.xml_root
 
-        namespaces = None
-        if namespace:
-            xpath = "b:%s" % xpath
-            namespaces = {"b": namespace}
-        elif hasattr(element, "nsmap") and None in element.nsmap:
-            xpath = "b:%s" % xpath
-            namespaces = {"b": element.nsmap[None]}
-        elif hasattr(self, "nsmap") and None in self.nsmap:
-            xpath = "b:%s" % xpath
-            namespaces = {"b": self.nsmap[None]}
-
-        return element.xpath(xpath, namespaces=namespaces)
+        try:
+            default_namespace, children = self._children[element]
+        except KeyError:
+            try:
+                default_namespace = element.nsmap.get(None)
+            except AttributeError:
+                default_namespace = None
+            if default_namespace is None and hasattr(self, "nsmap"):
+                default_namespace = self.nsmap.get(None)
+            prefix = "{%s}" % default_namespace if default_namespace else ""
+            children = {}
+            for child in element.iterchildren(tag=etree.Element):
+                tag = child.tag
+                if prefix:
+                    if not tag.startswith(prefix):
+                        continue
+                    tag = tag[len(prefix):]
+                elif tag.startswith("{"):
+                    continue
+                children.setdefault(tag, []).append(child)
+            self._children[element] = (default_namespace, children)
+
+        if namespace and namespace != default_namespace:
+            return list(element.iterchildren(tag="{%s}%s" % (namespace,
+                                                             xpath)))
+        return children.get(xpath, [])
 
     def _comments(self, parent):
         obj = []
         for el in self._xpath('comment', parent):
-            comment = Comment(force_resource_id=False)
-            comment.text = self._xpath2obj('text', el)
-            comment.creation_info = self._creation_info(el)
-            comment.resource_id = el.get('id', None)
+            comment = Comment._from_trusted(
+                text=self._xpath2obj('text', el),
+                creation_info=self._creation_info(el),
+                resource_id=el.get('id', None))
             self._extra(el, comment)
             obj.append(comment)
         return obj
@@ -212,11 +289,11 @@ class Unpickler(object):
     def _station_magnitude_contributions(self, parent):
         obj = []
         for el in self._xpath("stationMagnitudeContribution", parent):
-            contrib = StationMagnitudeContribution()
-            contrib.weight = self._xpath2obj("weight", el, float)
-            contrib.residual = self._xpath2obj("residual", el, float)
-            contrib.station_magnitude_id = \
-                self._xpath2obj("stationMagnitudeID", el, str)
+            contrib = StationMagnitudeContribution._from_trusted(
+                weight=self._xpath2obj("weight", el, float),
+                residual=self._xpath2obj("residual", el, float),
+                station_magnitude_id=self._xpath2obj(
+                    "stationMagnitudeID", el, str))
             self._extra(el, contrib)
             obj.append(contrib)
         return obj
@@ -228,14 +305,14 @@ class Unpickler(object):
         elif len(elements) == 0:
             return None
         element = elements[0]
-        obj = CreationInfo()
-        obj.agency_uri = self._xpath2obj('agencyURI', element)
-        obj.author_uri = self._xpath2obj('authorURI', element)
-        obj.agency_id = self._xpath2obj('agencyID', element)
-        obj.author = self._xpath2obj('author', element)
-        obj.creation_time = self._xpath2obj(
-            'creationTime', element, UTCDateTime)
-        obj.version = self._xpath2obj('version', element)
+        obj = CreationInfo._from_trusted(
+            agency_uri=self._xpath2obj('agencyURI', element),
+            author_uri=self._xpath2obj('authorURI', element),
+            agency_id=self._xpath2obj('agencyID', element),
+            author=self._xpath2obj('author', element),
+            creation_time=self._xpath2obj(
+                'creationTime', element, UTCDateTime),
+            version=self._xpath2obj('version', element))
         self._extra(element, obj)
         return obj
 
@@ -247,31 +324,31 @@ class Unpickler(object):
         elif len(elements) == 0:
             return None
         element = elements[0]
-        obj = OriginQuality()
-        obj.associated_phase_count = self._xpath2obj(
-            'associatedPhaseCount', element, int)
-        obj.used_phase_count = self._xpath2obj(
-            'usedPhaseCount', element, int)
-        obj.associated_station_count = self._xpath2obj(
-            'associatedStationCount', element, int)
-        obj.used_station_count = self._xpath2obj(
-            'usedStationCount', element, int)
-        obj.depth_phase_count = self._xpath2obj(
-            'depthPhaseCount', element, int)
-        obj.standard_error = self._xpath2obj(
-            'standardError', element, float)
-        obj.azimuthal_gap = self._xpath2obj(
-            'azimuthalGap', element, float)
-        obj.secondary_azimuthal_gap = self._xpath2obj(
-            'secondaryAzimuthalGap', element, float)
-        obj.ground_truth_level = self._xpath2obj(
-            'groundTruthLevel', element)
-        obj.minimum_distance = self._xpath2obj(
-            'minimumDistance', element, float)
-        obj.maximum_distance = self._xpath2obj(
-            'maximumDistance', element, float)
-        obj.median_distance = self._xpath2obj(
-            'medianDistance', element, float)
+        obj = OriginQuality._from_trusted(
+            associated_phase_count=self._xpath2obj(
+                'associatedPhaseCount', element, int),
+            used_phase_count=self._xpath2obj(
+                'usedPhaseCount', element, int),
+            associated_station_count=self._xpath2obj(
+                'associatedStationCount', element, int),
+            used_station_count=self._xpath2obj(
+                'usedStationCount', element, int),
+            depth_phase_count=self._xpath2obj(
+                'depthPhaseCount', element, int),
+            standard_error=self._xpath2obj(
+                'standardError', element, float),
+            azimuthal_gap=self._xpath2obj(
+                'azimuthalGap', element, float),
+            secondary_azimuthal_gap=self._xpath2obj(
+                'secondaryAzimuthalGap', element, float),
+            ground_truth_level=self._xpath2obj(
+                'groundTruthLevel', element),
+            minimum_distance=self._xpath2obj(
+                'minimumDistance', element, float),
+            maximum_distance=self._xpath2obj(
+                'maximumDistance', element, float),
+            median_distance=self._xpath2obj(
+                'medianDistance', element, float))
         self._extra(element, obj)
         return obj
 
@@ -280,7 +357,7 @@ class Unpickler(object):
         for el in self._xpath('description', parent):
             text = self._xpath2obj('text', el)
             type = self._xpath2obj('type', el)
-            out.append(EventDescription(text=text, type=type))
+            out.append(EventDescription._from_trusted(text=text, type=type))
             self._extra(el, out[-1])
         return out
 
@@ -291,32 +368,19 @@ class Unpickler(object):
             return None, None
 
         value = self._xpath2obj('value', el, quantity_type)
-        # All errors are QuantityError.
-        error = QuantityError()
-        # Don't set the errors if they are not set.
+        # All errors are QuantityError. Errors which are not set are None.
         confidence_level = self._xpath2obj('confidenceLevel', el, float)
-        if confidence_level is not None:
-            error.confidence_level = confidence_level
         if quantity_type != int:
-            uncertainty = self._xpath2obj('uncertainty', el, float)
-            if uncertainty is not None:
-                error.uncertainty = uncertainty
-            lower_uncertainty = self._xpath2obj('lowerUncertainty', el, float)
-            if lower_uncertainty is not None:
-                error.lower_uncertainty = lower_uncertainty
-            upper_uncertainty = self._xpath2obj('upperUncertainty', el, float)
-            if upper_uncertainty is not None:
-                error.upper_uncertainty = upper_uncertainty
+            error_type = float
         else:
-            uncertainty = self._xpath2obj('uncertainty', el, int)
-            if uncertainty is not None:
-                error.uncertainty = uncertainty
-            lower_uncertainty = self._xpath2obj('lowerUncertainty', el, int)
-            if lower_uncertainty is not None:
-                error.lower_uncertainty = lower_uncertainty
-            upper_uncertainty = self._xpath2obj('upperUncertainty', el, int)
-            if upper_uncertainty is not None:
-                error.upper_uncertainty = upper_uncertainty
+            error_type = int
+        error = QuantityError(
+            uncertainty=self._xpath2obj('uncertainty', el, error_type),
+            lower_uncertainty=self._xpath2obj(
+                'lowerUncertainty', el, error_type),
+            upper_uncertainty=self._xpath2obj(
+                'upperUncertainty', el, error_type),
+            confidence_level=confidence_level)
         return value, error
 
     def _float_value(self, element, name):
@@ -331,31 +395,37 @@ class Unpickler(object):
     def _composite_times(self, parent):
         obj = []
         for el in self._xpath('compositeTime', parent):
-            ct = CompositeTime()
-            ct.year, ct.year_errors = self._int_value(el, 'year')
-            ct.month, ct.month_errors = self._int_value(el, 'month')
-            ct.day, ct.day_errors = self._int_value(el, 'day')
-            ct.hour, ct.hour_errors = self._int_value(el, 'hour')
-            ct.minute, ct.minute_errors = self._int_value(el, 'minute')
-            ct.second, ct.second_errors = self._float_value(el, 'second')
+            year, year_errors = self._int_value(el, 'year')
+            month, month_errors = self._int_value(el, 'month')
+            day, day_errors = self._int_value(el, 'day')
+            hour, hour_errors = self._int_value(el, 'hour')
+            minute, minute_errors = self._int_value(el, 'minute')
+            second, second_errors = self._float_value(el, 'second')
+            ct = CompositeTime._from_trusted(
+                year=year, year_errors=year_errors,
+                month=month, month_errors=month_errors,
+                day=day, day_errors=day_errors,
+                hour=hour, hour_errors=hour_errors,
+                minute=minute, minute_errors=minute_errors,
+                second=second, second_errors=second_errors)
             self._extra(el, ct)
             obj.append(ct)
         return obj
 
     def _confidence_ellipsoid(self, element):
-        obj = ConfidenceEllipsoid()
-        obj.semi_major_axis_length = self._xpath2obj(
-            'semiMajorAxisLength', element, float)
-        obj.semi_minor_axis_length = self._xpath2obj(
-            'semiMinorAxisLength', element, float)
-        obj.semi_intermediate_axis_length = self._xpath2obj(
-            'semiIntermediateAxisLength', element, float)
-        obj.major_axis_plunge = self._xpath2obj(
-            'majorAxisPlunge', element, float)
-        obj.major_axis_azimuth = self._xpath2obj(
-            'majorAxisAzimuth', element, float)
-        obj.major_axis_rotation = self._xpath2obj(
-            'majorAxisRotation', element, float)
+        obj = ConfidenceEllipsoid._from_trusted(
+            semi_major_axis_length=self._xpath2obj(
+                'semiMajorAxisLength', element, float),
+            semi_minor_axis_length=self._xpath2obj(
+                'semiMinorAxisLength', element, float),
+            semi_intermediate_axis_length=self._xpath2obj(
+                'semiIntermediateAxisLength', element, float),
+            major_axis_plunge=self._xpath2obj(
+                'majorAxisPlunge', element, float),
+            major_axis_azimuth=self._xpath2obj(
+                'majorAxisAzimuth', element, float),
+            major_axis_rotation=self._xpath2obj(
+                'majorAxisRotation', element, float))
         self._extra(element, obj)
         return obj
 
@@ -367,38 +437,39 @@ class Unpickler(object):
         elif len(elements) == 0:
             return None
         element = elements[0]
-        obj = OriginUncertainty()
-        obj.preferred_description = self._xpath2obj(
-            'preferredDescription', element)
-        obj.horizontal_uncertainty = self._xpath2obj(
-            'horizontalUncertainty', element, float)
-        obj.min_horizontal_uncertainty = self._xpath2obj(
-            'minHorizontalUncertainty', element, float)
-        obj.max_horizontal_uncertainty = self._xpath2obj(
-            'maxHorizontalUncertainty', element, float)
-        obj.azimuth_max_horizontal_uncertainty = self._xpath2obj(
-            'azimuthMaxHorizontalUncertainty', element, float)
-        obj.confidence_level = self._xpath2obj(
-            'confidenceLevel', element, float)
         ce_el = self._xpath('confidenceEllipsoid', element)
         try:
             ce_el = ce_el[0]
         except IndexError:
-            obj.confidence_ellipsoid = ConfidenceEllipsoid()
+            confidence_ellipsoid = ConfidenceEllipsoid()
         else:
-            obj.confidence_ellipsoid = self._confidence_ellipsoid(ce_el)
+            confidence_ellipsoid = self._confidence_ellipsoid(ce_el)
+        obj = OriginUncertainty._from_trusted(
+            preferred_description=self._xpath2obj(
+                'preferredDescription', element),
+            horizontal_uncertainty=self._xpath2obj(
+                'horizontalUncertainty', element, float),
+            min_horizontal_uncertainty=self._xpath2obj(
+                'minHorizontalUncertainty', element, float),
+            max_horizontal_uncertainty=self._xpath2obj(
+                'maxHorizontalUncertainty', element, float),
+            azimuth_max_horizontal_uncertainty=self._xpath2obj(
+                'azimuthMaxHorizontalUncertainty', element, float),
+            confidence_level=self._xpath2obj(
+                'confidenceLevel', element, float),
+            confidence_ellipsoid=confidence_ellipsoid)
         self._extra(element, obj)
         return obj
 
     def _waveform_ids(self, parent):
         objs = []
         for wid_el in self._xpath('waveformID', parent):
-            obj = WaveformStreamID()
-            obj.network_code = wid_el.get('networkCode') or ''
-            obj.station_code = wid_el.get('stationCode') or ''
-            obj.location_code = wid_el.get('locationCode')
-            obj.channel_code = wid_el.get('channelCode')
-            obj.resource_uri = wid_el.text
+            obj = WaveformStreamID._from_trusted(
+                network_code=wid_el.get('networkCode') or '',
+                station_code=wid_el.get('stationCode') or '',
+                location_code=wid_el.get('locationCode'),
+                channel_code=wid_el.get('channelCode'),
+                resource_uri=wid_el.text)
             objs.append(obj)
         return objs
 
@@ -415,30 +486,32 @@ class Unpickler(object):
         :type element: etree.Element
         :rtype: :class:`~obspy.core.event.Arrival`
         """
-        obj = Arrival(force_resource_id=False)
-        # required parameter
-        obj.pick_id = self._xpath2obj('pickID', element) or ''
-        obj.phase = self._xpath2obj('phase', element) or ''
-        # optional parameter
-        obj.time_correction = self._xpath2obj('timeCorrection', element, float)
-        obj.azimuth = self._xpath2obj('azimuth', element, float)
-        obj.distance = self._xpath2obj('distance', element, float)
-        obj.takeoff_angle, obj.takeoff_angle_errors = \
+        takeoff_angle, takeoff_angle_errors = \
             self._float_value(element, 'takeoffAngle')
-        obj.time_residual = self._xpath2obj('timeResidual', element, float)
-        obj.horizontal_slowness_residual = \
-            self._xpath2obj('horizontalSlownessResidual', element, float)
-        obj.backazimuth_residual = \
-            self._xpath2obj('backazimuthResidual', element, float)
-        obj.time_weight = self._xpath2obj('timeWeight', element, float)
-        obj.horizontal_slowness_weight = \
-            self._xpath2obj('horizontalSlownessWeight', element, float)
-        obj.backazimuth_weight = \
-            self._xpath2obj('backazimuthWeight', element, float)
-        obj.earth_model_id = self._xpath2obj('earthModelID', element)
-        obj.comments = self._comments(element)
-        obj.creation_info = self._creation_info(element)
-        obj.resource_id = element.get('publicID')
+        obj = Arrival._from_trusted(
+            # required parameter
+            pick_id=self._xpath2obj('pickID', element) or '',
+            phase=self._xpath2obj('phase', element) or '',
+            # optional parameter
+            time_correction=self._xpath2obj('timeCorrection', element, float),
+            azimuth=self._xpath2obj('azimuth', element, float),
+            distance=self._xpath2obj('distance', element, float),
+            takeoff_angle=takeoff_angle,
+            takeoff_angle_errors=takeoff_angle_errors,
+            time_residual=self._xpath2obj('timeResidual', element, float),
+            horizontal_slowness_residual=self._xpath2obj(
+                'horizontalSlownessResidual', element, float),
+            backazimuth_residual=self._xpath2obj(
+                'backazimuthResidual', element, float),
+            time_weight=self._xpath2obj('timeWeight', element, float),
+            horizontal_slowness_weight=self._xpath2obj(
+                'horizontalSlownessWeight', element, float),
+            backazimuth_weight=self._xpath2obj(
+                'backazimuthWeight', element, float),
+            earth_model_id=self._xpath2obj('earthModelID', element),
+            comments=self._comments(element),
+            creation_info=self._creation_info(element),
+            resource_id=element.get('publicID'))
         self._extra(element, obj)
         return obj
 
@@ -449,26 +522,30 @@ class Unpickler(object):
         :type element: etree.Element
         :rtype: :class:`~obspy.core.event.Pick`
         """
-        obj = Pick(force_resource_id=False)
-        # required parameter
-        obj.time, obj.time_errors = self._time_value(element, 'time')
-        obj.waveform_id = self._waveform_id(element)
-        # optional parameter
-        obj.filter_id = self._xpath2obj('filterID', element)
-        obj.method_id = self._xpath2obj('methodID', element)
-        obj.horizontal_slowness, obj.horizontal_slowness_errors = \
+        time, time_errors = self._time_value(element, 'time')
+        horizontal_slowness, horizontal_slowness_errors = \
             self._float_value(element, 'horizontalSlowness')
-        obj.backazimuth, obj.backazimuth_errors = \
+        backazimuth, backazimuth_errors = \
             self._float_value(element, 'backazimuth')
-        obj.slowness_method_id = self._xpath2obj('slownessMethodID', element)
-        obj.onset = self._xpath2obj('onset', element)
-        obj.phase_hint = self._xpath2obj('phaseHint', element)
-        obj.polarity = self._xpath2obj('polarity', element)
-        obj.evaluation_mode = self._xpath2obj('evaluationMode', element)
-        obj.evaluation_status = self._xpath2obj('evaluationStatus', element)
-        obj.comments = self._comments(element)
-        obj.creation_info = self._creation_info(element)
-        obj.resource_id = element.get('publicID')
+        obj = Pick._from_trusted(
+            # required parameter
+            time=time, time_errors=time_errors,
+            waveform_id=self._waveform_id(element),
+            # optional parameter
+            filter_id=self._xpath2obj('filterID', element),
+            method_id=self._xpath2obj('methodID', element),
+            horizontal_slowness=horizontal_slowness,
+            horizontal_slowness_errors=horizontal_slowness_errors,
+            backazimuth=backazimuth, backazimuth_errors=backazimuth_errors,
+            slowness_method_id=self._xpath2obj('slownessMethodID', element),
+            onset=self._xpath2obj('onset', element),
+            phase_hint=self._xpath2obj('phaseHint', element),
+            polarity=self._xpath2obj('polarity', element),
+            evaluation_mode=self._xpath2obj('evaluationMode', element),
+            evaluation_status=self._xpath2obj('evaluationStatus', element),
+            comments=self._comments(element),
+            creation_info=self._creation_info(element),
+            resource_id=element.get('publicID'))
         self._extra(element, obj)
         return obj
 
@@ -479,12 +556,12 @@ class Unpickler(object):
         :type element: etree.Element
         :rtype: :class:`~obspy.core.event.TimeWindow`
         """
-        obj = TimeWindow(force_resource_id=False)
-        # required parameter
-        obj.begin = self._xpath2obj('begin', element, convert_to=float)
-        obj.end = self._xpath2obj('end', element, convert_to=float)
-        obj.reference = self._xpath2obj('reference', element,
-                                        convert_to=UTCDateTime)
+        obj = TimeWindow._from_trusted(
+            # required parameter
+            begin=self._xpath2obj('begin', element, convert_to=float),
+            end=self._xpath2obj('end', element, convert_to=float),
+            reference=self._xpath2obj('reference', element,
+                                      convert_to=UTCDateTime))
         self._extra(element, obj)
         return obj
 
@@ -495,31 +572,39 @@ class Unpickler(object):
         :type element: etree.Element
         :rtype: :class:`~obspy.core.event.Amplitude`
         """
-        obj = Amplitude(force_resource_id=False)
-        # required parameter
-        obj.generic_amplitude, obj.generic_amplitude_errors = \
+        generic_amplitude, generic_amplitude_errors = \
             self._float_value(element, 'genericAmplitude')
-        # optional parameter
-        obj.type = self._xpath2obj('type', element)
-        obj.category = self._xpath2obj('category', element)
-        obj.unit = self._xpath2obj('unit', element)
-        obj.method_id = self._xpath2obj('methodID', element)
-        obj.period, obj.period_errors = self._float_value(element, 'period')
-        obj.snr = self._xpath2obj('snr', element)
+        period, period_errors = self._float_value(element, 'period')
         time_window_el = self._xpath('timeWindow', element) or None
         if time_window_el is not None:
-            obj.time_window = self._time_window(time_window_el[0])
-        obj.pick_id = self._xpath2obj('pickID', element)
-        obj.waveform_id = self._waveform_id(element)
-        obj.filter_id = self._xpath2obj('filterID', element)
-        obj.scaling_time, obj.scaling_time_errors = \
+            time_window = self._time_window(time_window_el[0])
+        else:
+            time_window = None
+        scaling_time, scaling_time_errors = \
             self._time_value(element, 'scalingTime')
-        obj.magnitude_hint = self._xpath2obj('magnitudeHint', element)
-        obj.evaluation_mode = self._xpath2obj('evaluationMode', element)
-        obj.evaluation_status = self._xpath2obj('evaluationStatus', element)
-        obj.comments = self._comments(element)
-        obj.creation_info = self._creation_info(element)
-        obj.resource_id = element.get('publicID')
+        obj = Amplitude._from_trusted(
+            # required parameter
+            generic_amplitude=generic_amplitude,
+            generic_amplitude_errors=generic_amplitude_errors,
+            # optional parameter
+            type=self._xpath2obj('type', element),
+            category=self._xpath2obj('category', element),
+            unit=self._xpath2obj('unit', element),
+            method_id=self._xpath2obj('methodID', element),
+            period=period, period_errors=period_errors,
+            snr=self._xpath2obj('snr', element),
+            time_window=time_window,
+            pick_id=self._xpath2obj('pickID', element),
+            waveform_id=self._waveform_id(element),
+            filter_id=self._xpath2obj('filterID', element),
+            scaling_time=scaling_time,
+            scaling_time_errors=scaling_time_errors,
+            magnitude_hint=self._xpath2obj('magnitudeHint', element),
+            evaluation_mode=self._xpath2obj('evaluationMode', element),
+            evaluation_status=self._xpath2obj('evaluationStatus', element),
+            comments=self._comments(element),
+            creation_info=self._creation_info(element),
+            resource_id=element.get('publicID'))
         self._extra(element, obj)
         return obj
 
@@ -543,32 +628,35 @@ class Unpickler(object):
         >>> print(origin.latitude)
         34.23
         """
-        obj = Origin(force_resource_id=False)
-        # required parameter
-        obj.time, obj.time_errors = self._time_value(element, 'time')
-        obj.latitude, obj.latitude_errors = \
-            self._float_value(element, 'latitude')
-        obj.longitude, obj.longitude_errors = \
-            self._float_value(element, 'longitude')
-        # optional parameter
-        obj.depth, obj.depth_errors = self._float_value(element, 'depth')
-        obj.depth_type = self._xpath2obj('depthType', element)
-        obj.time_fixed = self._xpath2obj('timeFixed', element, bool)
-        obj.epicenter_fixed = self._xpath2obj('epicenterFixed', element, bool)
-        obj.reference_system_id = self._xpath2obj('referenceSystemID', element)
-        obj.method_id = self._xpath2obj('methodID', element)
-        obj.earth_model_id = self._xpath2obj('earthModelID', element)
-        obj.composite_times = self._composite_times(element)
-        obj.quality = self._origin_quality(element)
-        obj.origin_type = self._xpath2obj('type', element)
-        obj.region = self._xpath2obj('region', element)
-        obj.evaluation_mode = self._xpath2obj('evaluationMode', element)
-        obj.evaluation_status = self._xpath2obj('evaluationStatus', element)
-        obj.creation_info = self._creation_info(element)
-        obj.comments = self._comments(element)
-        obj.origin_uncertainty = self._origin_uncertainty(element)
-        obj.arrivals = arrivals
-        obj.resource_id = element.get('publicID')
+        time, time_errors = self._time_value(element, 'time')
+        latitude, latitude_errors = self._float_value(element, 'latitude')
+        longitude, longitude_errors = self._float_value(element, 'longitude')
+        depth, depth_errors = self._float_value(element, 'depth')
+        obj = Origin._from_trusted(
+            # required parameter
+            time=time, time_errors=time_errors,
+            latitude=latitude, latitude_errors=latitude_errors,
+            longitude=longitude, longitude_errors=longitude_errors,
+            # optional parameter
+            depth=depth, depth_errors=depth_errors,
+            depth_type=self._xpath2obj('depthType', element),
+            time_fixed=self._xpath2obj('timeFixed', element, bool),
+            epicenter_fixed=self._xpath2obj('epicenterFixed', element, bool),
+            reference_system_id=self._xpath2obj(
+                'referenceSystemID', element),
+            method_id=self._xpath2obj('methodID', element),
+            earth_model_id=self._xpath2obj('earthModelID', element),
+            composite_times=self._composite_times(element),
+            quality=self._origin_quality(element),
+            origin_type=self._xpath2obj('type', element),
+            region=self._xpath2obj('region', element),
+            evaluation_mode=self._xpath2obj('evaluationMode', element),
+            evaluation_status=self._xpath2obj('evaluationStatus', element),
+            creation_info=self._creation_info(element),
+            comments=self._comments(element),
+            origin_uncertainty=self._origin_uncertainty(element),
+            arrivals=arrivals,
+            resource_id=element.get('publicID'))
         self._extra(element, obj)
         return obj
 
@@ -592,22 +680,23 @@ class Unpickler(object):
         >>> print(magnitude.mag)
         3.2
         """
-        obj = Magnitude(force_resource_id=False)
-        # required parameter
-        obj.mag, obj.mag_errors = self._float_value(element, 'mag')
-        # optional parameter
-        obj.magnitude_type = self._xpath2obj('type', element)
-        obj.origin_id = self._xpath2obj('originID', element)
-        obj.method_id = self._xpath2obj('methodID', element)
-        obj.station_count = self._xpath2obj('stationCount', element, int)
-        obj.azimuthal_gap = self._xpath2obj('azimuthalGap', element, float)
-        obj.evaluation_mode = self._xpath2obj('evaluationMode', element)
-        obj.evaluation_status = self._xpath2obj('evaluationStatus', element)
-        obj.creation_info = self._creation_info(element)
-        obj.station_magnitude_contributions = \
-            self._station_magnitude_contributions(element)
-        obj.comments = self._comments(element)
-        obj.resource_id = element.get('publicID')
+        mag, mag_errors = self._float_value(element, 'mag')
+        obj = Magnitude._from_trusted(
+            # required parameter
+            mag=mag, mag_errors=mag_errors,
+            # optional parameter
+            magnitude_type=self._xpath2obj('type', element),
+            origin_id=self._xpath2obj('originID', element),
+            method_id=self._xpath2obj('methodID', element),
+            station_count=self._xpath2obj('stationCount', element, int),
+            azimuthal_gap=self._xpath2obj('azimuthalGap', element, float),
+            evaluation_mode=self._xpath2obj('evaluationMode', element),
+            evaluation_status=self._xpath2obj('evaluationStatus', element),
+            creation_info=self._creation_info(element),
+            station_magnitude_contributions=(
+                self._station_magnitude_contributions(element)),
+            comments=self._comments(element),
+            resource_id=element.get('publicID'))
         self._extra(element, obj)
         return obj
 
@@ -631,18 +720,19 @@ class Unpickler(object):
         >>> print(station_mag.mag)
         3.2
         """
-        obj = StationMagnitude(force_resource_id=False)
-        # required parameter
-        obj.origin_id = self._xpath2obj('originID', element) or ''
-        obj.mag, obj.mag_errors = self._float_value(element, 'mag')
-        # optional parameter
-        obj.station_magnitude_type = self._xpath2obj('type', element)
-        obj.amplitude_id = self._xpath2obj('amplitudeID', element)
-        obj.method_id = self._xpath2obj('methodID', element)
-        obj.waveform_id = self._waveform_id(element)
-        obj.creation_info = self._creation_info(element)
-        obj.comments = self._comments(element)
-        obj.resource_id = element.get('publicID')
+        mag, mag_errors = self._float_value(element, 'mag')
+        obj = StationMagnitude._from_trusted(
+            # required parameter
+            origin_id=self._xpath2obj('originID', element) or '',
+            mag=mag, mag_errors=mag_errors,
+            # optional parameter
+            station_magnitude_type=self._xpath2obj('type', element),
+            amplitude_id=self._xpath2obj('amplitudeID', element),
+            method_id=self._xpath2obj('methodID', element),
+            waveform_id=self._waveform_id(element),
+            creation_info=self._creation_info(element),
+            comments=self._comments(element),
+            resource_id=element.get('publicID'))
         self._extra(element, obj)
         return obj
 
@@ -902,86 +992,97 @@ class Unpickler(object):
         catalog.creation_info = self._creation_info(catalog_el)
         # loop over all events
         for event_el in self._xpath('event', catalog_el):
-            # create new Event object
-            event = Event(force_resource_id=False)
-            # optional event attributes
-            event.preferred_origin_id = \
-                self._xpath2obj('preferredOriginID', event_el)
-            event.preferred_magnitude_id = \
-                self._xpath2obj('preferredMagnitudeID', event_el)
-            event.preferred_focal_mechanism_id = \
-                self._xpath2obj('preferredFocalMechanismID', event_el)
-            event_type = self._xpath2obj('type', event_el)
-            # Change for QuakeML 1.2RC4. 'null' is no longer acceptable as an
-            # event type. Will be replaced with 'not reported'.
-            if event_type == "null":
-                event_type = "not reported"
-            # USGS event types contain '_' which is not compliant with
-            # the QuakeML standard
-            if isinstance(event_type, str):
-                event_type = event_type.replace("_", " ")
-            try:
-                event.event_type = event_type
-            except ValueError:
-                msg = "Event type '%s' does not comply " % event_type
-                msg += "with QuakeML standard -- event will be ignored."
-                warnings.warn(msg, UserWarning)
-                continue
-            event.event_type_certainty = self._xpath2obj(
-                'typeCertainty', event_el)
-            event.creation_info = self._creation_info(event_el)
-            event.event_descriptions = self._event_description(event_el)
-            event.comments = self._comments(event_el)
-            # origins
-            event.origins = []
-            for origin_el in self._xpath('origin', event_el):
-                # Have to be created before the origin is created to avoid a
-                # rare issue where a warning is read when the same event is
-                # read twice - the warnings does not occur if two referred
-                # to objects compare equal - for this the arrivals have to
-                # be bound to the event before the resource id is assigned.
-                arrivals = []
-                for arrival_el in self._xpath('arrival', origin_el):
-                    arrival = self._arrival(arrival_el)
-                    arrivals.append(arrival)
-
-                origin = self._origin(origin_el, arrivals=arrivals)
-
-                # append origin with arrivals
-                event.origins.append(origin)
-            # magnitudes
-            event.magnitudes = []
-            for magnitude_el in self._xpath('magnitude', event_el):
-                magnitude = self._magnitude(magnitude_el)
-                event.magnitudes.append(magnitude)
-            # station magnitudes
-            event.station_magnitudes = []
-            for magnitude_el in self._xpath('stationMagnitude', event_el):
-                magnitude = self._station_magnitude(magnitude_el)
-                event.station_magnitudes.append(magnitude)
-            # picks
-            event.picks = []
-            for pick_el in self._xpath('pick', event_el):
-                pick = self._pick(pick_el)
-                event.picks.append(pick)
-            # amplitudes
-            event.amplitudes = []
-            for el in self._xpath('amplitude', event_el):
-                amp = self._amplitude(el)
-                event.amplitudes.append(amp)
-            # focal mechanisms
-            event.focal_mechanisms = []
-            for fm_el in self._xpath('focalMechanism', event_el):
-                fm = self._focal_mechanism(fm_el)
-                event.focal_mechanisms.append(fm)
-            # finally append newly created event to catalog
-            event.resource_id = event_el.get('publicID')
-            self._extra(event_el, event)
-            catalog.append(event)
+            event = self._event(event_el)
+            # the looked up children are not needed anymore
+            self._children.clear()
+            if event is not None:
+                catalog.append(event)
         catalog.resource_id = catalog_el.get('publicID')
         self._extra(catalog_el, catalog)
         return catalog
 
+    def _event(self, event_el):
+        """
+        Creates an event from an event element.
+
+        Returns None if the event has to be ignored.
+        """
+        # create new Event object
+        event = Event(force_resource_id=False)
+        # optional event attributes
+        event.preferred_origin_id = \
+            self._xpath2obj('preferredOriginID', event_el)
+        event.preferred_magnitude_id = \
+            self._xpath2obj('preferredMagnitudeID', event_el)
+        event.preferred_focal_mechanism_id = \
+            self._xpath2obj('preferredFocalMechanismID', event_el)
+        event_type = self._xpath2obj('type', event_el)
+        # Change for QuakeML 1.2RC4. 'null' is no longer acceptable as an
+        # event type. Will be replaced with 'not reported'.
+        if event_type == "null":
+            event_type = "not reported"
+        # USGS event types contain '_' which is not compliant with
+        # the QuakeML standard
+        if isinstance(event_type, str):
+            event_type = event_type.replace("_", " ")
+        try:
+            event.event_type = event_type
+        except ValueError:
+            msg = "Event type '%s' does not comply " % event_type
+            msg += "with QuakeML standard -- event will be ignored."
+            warnings.warn(msg, UserWarning)
+            return None
+        event.event_type_certainty = self._xpath2obj(
+            'typeCertainty', event_el)
+        event.creation_info = self._creation_info(event_el)
+        event.event_descriptions = self._event_description(event_el)
+        event.comments = self._comments(event_el)
+        # origins
+        event.origins = []
+        for origin_el in self._xpath('origin', event_el):
+            # Have to be created before the origin is created to avoid a
+            # rare issue where a warning is read when the same event is
+            # read twice - the warnings does not occur if two referred
+            # to objects compare equal - for this the arrivals have to
+            # be bound to the event before the resource id is assigned.
+            arrivals = []
+            for arrival_el in self._xpath('arrival', origin_el):
+                arrival = self._arrival(arrival_el)
+                arrivals.append(arrival)
+
+            origin = self._origin(origin_el, arrivals=arrivals)
+
+            # append origin with arrivals
+            event.origins.append(origin)
+        # magnitudes
+        event.magnitudes = []
+        for magnitude_el in self._xpath('magnitude', event_el):
+            magnitude = self._magnitude(magnitude_el)
+            event.magnitudes.append(magnitude)
+        # station magnitudes
+        event.station_magnitudes = []
+        for magnitude_el in self._xpath('stationMagnitude', event_el):
+            magnitude = self._station_magnitude(magnitude_el)
+            event.station_magnitudes.append(magnitude)
+        # picks
+        event.picks = []
+        for pick_el in self._xpath('pick', event_el):
+            pick = self._pick(pick_el)
+            event.picks.append(pick)
+        # amplitudes
+        event.amplitudes = []
+        for el in self._xpath('amplitude', event_el):
+            amp = self._amplitude(el)
+            event.amplitudes.append(amp)
+        # focal mechanisms
+        event.focal_mechanisms = []
+        for fm_el in self._xpath('focalMechanism', event_el):
+            fm = self._focal_mechanism(fm_el)
+            event.focal_mechanisms.append(fm)
+        event.resource_id = event_el.get('publicID')
+        self._extra(event_el, event)
+        return event
+
     def _extra(self, element, obj):
         """
         Add information stored in custom tags/attributes in obj.extra.
@@ -1702,6 +1803,59 @@ class Pickler(object):
         self._extra(focal_mechanism, element)
         return element
 
+    def _event(self, event):
+        """
+        Converts an Event into etree.Element object.
+        """
+        # create event node
+        event_el = etree.Element(
+            'event', attrib={'publicID': self._id(event.resource_id)})
+        # optional event attributes
+        if hasattr(event, "preferred_origin_id"):
+            self._str(event.preferred_origin_id, event_el,
+                      'preferredOriginID')
+        if hasattr(event, "preferred_magnitude_id"):
+            self._str(event.preferred_magnitude_id, event_el,
+                      'preferredMagnitudeID')
+        if hasattr(event, "preferred_focal_mechanism_id"):
+            self._str(event.preferred_focal_mechanism_id, event_el,
+                      'preferredFocalMechanismID')
+        # event type and event type certainty also are optional attributes.
+        if hasattr(event, "event_type"):
+            self._str(event.event_type, event_el, 'type')
+        if hasattr(event, "event_type_certainty"):
+            self._str(event.event_type_certainty, event_el,
+                      'typeCertainty')
+        # event descriptions
+        for description in event.event_descriptions:
+            el = etree.Element('description')
+            self._str(description.text, el, 'text', True)
+            self._str(description.type, el, 'type')
+            self._extra(description, el)
+            event_el.append(el)
+        self._comments(event.comments, event_el)
+        self._creation_info(event.creation_info, event_el)
+        # origins
+        for origin in event.origins:
+            event_el.append(self._origin(origin))
+        # magnitudes
+        for magnitude in event.magnitudes:
+            event_el.append(self._magnitude(magnitude))
+        # station magnitudes
+        for magnitude in event.station_magnitudes:
+            event_el.append(self._station_magnitude(magnitude))
+        # picks
+        for pick in event.picks:
+            event_el.append(self._pick(pick))
+        # amplitudes
+        for amp in event.amplitudes:
+            event_el.append(self._amplitude(amp))
+        # focal mechanisms
+        for focal_mechanism in event.focal_mechanisms:
+            event_el.append(self._focal_mechanism(focal_mechanism))
+        self._extra(event, event_el)
+        return event_el
+
     def _serialize(self, catalog, pretty_print=True):
         """
         Converts a Catalog object into XML string.
@@ -1714,55 +1868,7 @@ class Pickler(object):
         self._comments(catalog.comments, catalog_el)
         self._creation_info(catalog.creation_info, catalog_el)
         for event in catalog:
-            # create event node
-            event_el = etree.Element(
-                'event', attrib={'publicID': self._id(event.resource_id)})
-            # optional event attributes
-            if hasattr(event, "preferred_origin_id"):
-                self._str(event.preferred_origin_id, event_el,
-                          'preferredOriginID')
-            if hasattr(event, "preferred_magnitude_id"):
-                self._str(event.preferred_magnitude_id, event_el,
-                          'preferredMagnitudeID')
-            if hasattr(event, "preferred_focal_mechanism_id"):
-                self._str(event.preferred_focal_mechanism_id, event_el,
-                          'preferredFocalMechanismID')
-            # event type and event type certainty also are optional attributes.
-            if hasattr(event, "event_type"):
-                self._str(event.event_type, event_el, 'type')
-            if hasattr(event, "event_type_certainty"):
-                self._str(event.event_type_certainty, event_el,
-                          'typeCertainty')
-            # event descriptions
-            for description in event.event_descriptions:
-                el = etree.Element('description')
-                self._str(description.text, el, 'text', True)
-                self._str(description.type, el, 'type')
-                self._extra(description, el)
-                event_el.append(el)
-            self._comments(event.comments, event_el)
-            self._creation_info(event.creation_info, event_el)
-            # origins
-            for origin in event.origins:
-                event_el.append(self._origin(origin))
-            # magnitudes
-            for magnitude in event.magnitudes:
-                event_el.append(self._magnitude(magnitude))
-            # station magnitudes
-            for magnitude in event.station_magnitudes:
-                event_el.append(self._station_magnitude(magnitude))
-            # picks
-            for pick in event.picks:
-                event_el.append(self._pick(pick))
-            # amplitudes
-            for amp in event.amplitudes:
-                event_el.append(self._amplitude(amp))
-            # focal mechanisms
-            for focal_mechanism in event.focal_mechanisms:
-                event_el.append(self._focal_mechanism(focal_mechanism))
-            self._extra(event, event_el)
-            # add event node to catalog
-            catalog_el.append(event_el)
+            catalog_el.append(self._event(event))
         self._extra(catalog, catalog_el)
         nsmap = self._get_namespace_map()
         root_el = etree.Element('{%s}quakeml' % NSMAP_QUAKEML['q'],
@@ -1772,6 +1878,159 @@ class Pickler(object):
                               encoding="utf-8", xml_declaration=True)
 
 
+class QuakeMLWriter(object):
+    """
+    Incrementally writes events to a QuakeML file.
+
+    In contrast to :meth:`~obspy.core.event.Catalog.write` the events do not
+    have to be collected in a :class:`~obspy.core.event.Catalog` first. Each
+    event is serialized and written to the file as soon as it is passed to
+    :meth:`write`, so that only a single event has to be kept in memory.
+
+    :type filename: str or file
+    :param filename: Filename to write or open file-like object.
+    :type catalog: :class:`~obspy.core.event.Catalog`, optional
+    :param catalog: Catalog providing the resource identifier, description,
+        comments, creation info, custom tags and namespace abbreviations of
+        the written ``eventParameters`` element. The events of the catalog
+        are not written.
+    :type nsmap: dict, optional
+    :param nsmap: Additional custom namespace abbreviation mappings
+        (e.g. `{"edb": "http://erdbeben-in-bayern.de/xmlns/0.1"}`).
+    :type pretty_print: bool, optional
+    :param pretty_print: Indent the written document.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.event import iread_events
+    >>> with QuakeMLWriter("/tmp/large.xml") as writer:  # doctest: +SKIP
+    ...     for event in iread_events("/path/to/large_catalog.xml"):
+    ...         writer.write(event)
+    """
+    def __init__(self, filename, catalog=None, nsmap=None, pretty_print=True):
+        if catalog is None:
+            catalog = Catalog()
+        nsmap_ = getattr(catalog, "nsmap", {}).copy()
+        if nsmap:
+            nsmap_.update(nsmap)
+        self._pickler = Pickler(nsmap=nsmap_)
+        self._pretty_print = pretty_print
+        # catalog parameters preceding and following the events
+        catalog_el = etree.Element('eventParameters', attrib={
+            'publicID': self._pickler._id(catalog.resource_id)})
+        if catalog.description:
+            self._pickler._str(catalog.description, catalog_el, 'description')
+        self._pickler._comments(catalog.comments, catalog_el)
+        self._pickler._creation_info(catalog.creation_info, catalog_el)
+        count = len(catalog_el)
+        self._pickler._extra(catalog, catalog_el)
+        self._trailer = list(catalog_el)[count:]
+        # Open filehandler or use an existing file like object.
+        if not hasattr(filename, "write"):
+            self._file_opened = True
+            self._fh = open(filename, "wb")
+        else:
+            self._file_opened = False
+            self._fh = filename
+        # stack of entered context managers of the incremental writer
+        self._contexts = []
+        self._xf = self._enter(etree.xmlfile(self._fh, encoding="utf-8"))
+        self._xf.write_declaration()
+        nsmap_ = self._pickler._get_namespace_map()
+        self._enter(self._xf.element(
+            '{%s}quakeml' % NSMAP_QUAKEML['q'], nsmap=nsmap_))
+        # elements are serialized on their own, temporarily attaching them to
+        # an element declaring the namespace abbreviations makes them use
+        # the given abbreviations
+        self._ns_parent = etree.Element('eventParameters', nsmap=dict(
+            (key, value) for key, value in nsmap_.items() if key is not None))
+        self._write_whitespace(0)
+        self._enter(self._xf.element(catalog_el.tag, catalog_el.attrib))
+        for element in list(catalog_el)[:count]:
+            self._write_element(element)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _enter(self, context):
+        obj = context.__enter__()
+        self._contexts.append(context)
+        return obj
+
+    def _write_whitespace(self, level):
+        if self._pretty_print:
+            self._xf.write("\n" + "  " * (level + 1))
+
+    def _write_element(self, element):
+        self._ns_parent.append(element)
+        self._ns_parent.remove(element)
+        if self._pretty_print:
+            _indent(element, level=2)
+        self._write_whitespace(1)
+        self._xf.write(element)
+
+    def write(self, event):
+        """
+        Writes one or more events to the file.
+
+        :type event: :class:`~obspy.core.event.Event` or iterable of
+            :class:`~obspy.core.event.Event`
+        :param event: Event or iterable (e.g. a generator or a
+            :class:`~obspy.core.event.Catalog`) of events to write.
+        """
+        if self._xf is None:
+            raise ValueError("I/O operation on closed QuakeML writer.")
+        if isinstance(event, Event):
+            event = [event]
+        for event_ in event:
+            self._write_element(self._pickler._event(event_))
+
+    def close(self):
+        """
+        Writes the closing tags and closes the file if it has been opened by
+        the writer.
+        """
+        if self._xf is None:
+            return
+        try:
+            for element in self._trailer:
+                self._write_element(element)
+            self._write_whitespace(0)
+            # eventParameters
+            self._contexts.pop().__exit__(None, None, None)
+            self._write_whitespace(-1)
+            # quakeml
+            self._contexts.pop().__exit__(None, None, None)
+            # xmlfile
+            self._contexts.pop().__exit__(None, None, None)
+            if self._pretty_print:
+                self._fh.write(b"\n")
+        finally:
+            self._xf = None
+            # Close if a file has been opened by this writer.
+            if self._file_opened is True:
+                self._fh.close()
+
+
+def _indent(element, level=0):
+    """
+    Indents an element in place the same way as lxml's pretty printing at
+    the given nesting level.
+    """
+    children = list(element)
+    if not children or (element.text and element.text.strip()):
+        return
+    padding = "\n" + "  " * (level + 1)
+    element.text = padding
+    for child in children:
+        _indent(child, level + 1)
+        child.tail = padding
+    child.tail = "\n" + "  " * level
+
+
 def _read_quakeml(filename):
     """
     Reads a QuakeML file and returns an ObsPy Catalog object.
@@ -1798,6 +2057,31 @@ def _read_quakeml(filename):
     return Unpickler().load(filename)
 
 
+def _iread_quakeml(filename):
+    """
+    Iterates over the events of a QuakeML file without reading the whole
+    catalog into memory.
+
+    .. warning::
+        This function should NOT be called directly, it is used by the
+        ObsPy :func:`~obspy.core.event.iread_events` function, call this
+        instead.
+
+    :type filename: str or file-like object
+    :param filename: QuakeML file to be read.
+    :rtype: generator of :class:`~obspy.core.event.event.Event`
+
+    .. rubric:: Example
+
+    >>> from obspy.core.event import iread_events
+    >>> for event in iread_events('/path/to/iris_events.xml'):
+    ...     print(event.short_str())
+    2011-03-11T05:46:24.120000Z | +38.297, +142.373 | 9.1 MW
+    2006-09-10T04:26:33.610000Z |  +9.614, +121.961 | 9.8 MS
+    """
+    return Unpickler().iterload(filename)
+
+
 def _write_quakeml(catalog, filename, validate=False, nsmap=None,
                    **kwargs):  # @UnusedVariable
     """
@@ -18,7 +18,8 @@ from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import AttribDict
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.core.util.testing import compare_xml_strings
-from obspy.io.quakeml.core import Pickler, _read_quakeml, _write_quakeml
+from obspy.io.quakeml.core import (Pickler, QuakeMLWriter, _iread_quakeml,
+                                   _read_quakeml, _validate, _write_quakeml)
 
 
 # lxml < 2.3 seems not to ship with RelaxNG schema parser and namespace support
@@ -1009,6 +1010,118 @@ class QuakeMLTestCase(unittest.TestCase):
         # No warning should have been raised.
         self.assertEqual(len(w), 0)
 
+    def test_iread_quakeml(self):
+        """
+        Streaming the events has to yield the same events as reading the
+        complete catalog.
+        """
+        for name in ('iris_events.xml', 'neries_events.xml',
+                     'quakeml_1.2_origin.xml', 'quakeml_1.2_magnitude.xml',
+                     'quakeml_1.2_focalmechanism.xml',
+                     'quakeml_1.2_stationmagnitude.xml',
+                     'quakeml_1.2_arrival.xml', 'quakeml_1.2_pick.xml',
+                     'quakeml_1.2_event.xml'):
+            filename = os.path.join(self.path, name)
+            events = _iread_quakeml(filename)
+            self.assertFalse(isinstance(events, (list, Catalog)))
+            self.assertEqual(list(events), _read_quakeml(filename).events)
+
+    def test_iread_quakeml_resolves_resource_ids_per_event(self):
+        """
+        References are bound to the objects of the event they occur in.
+        """
+        template = """
+            <event publicID="smi:local/event/{0}">
+              <preferredOriginID>smi:local/origin/{0}</preferredOriginID>
+              <pick publicID="smi:local/pick/{0}">
+                <time><value>2012-01-01T00:00:0{0}.000000Z</value></time>
+                <waveformID networkCode="XX" stationCode="ABC"/>
+              </pick>
+              <origin publicID="smi:local/origin/{0}">
+                <time><value>2012-01-01T00:00:00.000000Z</value></time>
+                <latitude><value>{0}</value></latitude>
+                <longitude><value>0</value></longitude>
+                <arrival publicID="smi:local/arrival/{0}">
+                  <pickID>smi:local/pick/{0}</pickID>
+                  <phase>P</phase>
+                </arrival>
+              </origin>
+            </event>"""
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <q:quakeml xmlns:q="http://quakeml.org/xmlns/quakeml/1.2"
+                   xmlns="http://quakeml.org/xmlns/bed/1.2">
+          <eventParameters publicID="smi:local/catalog">
+            {0}
+          </eventParameters>
+        </q:quakeml>""".format("".join(template.format(i) for i in range(3)))
+        events = list(_iread_quakeml(io.BytesIO(xml.encode("utf-8"))))
+        self.assertEqual(len(events), 3)
+        for i, event in enumerate(events):
+            self.assertIs(event.preferred_origin(), event.origins[0])
+            self.assertEqual(event.origins[0].latitude, i)
+            arrival = event.origins[0].arrivals[0]
+            self.assertIs(arrival.pick_id.get_referred_object(),
+                          event.picks[0])
+
+    def test_iread_quakeml_invalid_document(self):
+        """
+        Documents without eventParameters are rejected.
+        """
+        data = io.BytesIO(b'<?xml version="1.0" encoding="UTF-8"?>'
+                          b'<q:quakeml xmlns:q="http://quakeml.org/xmlns/'
+                          b'quakeml/1.2"><something/></q:quakeml>')
+        with self.assertRaises(Exception) as e:
+            list(_iread_quakeml(data))
+        self.assertEqual(str(e.exception),
+                         "Not a QuakeML compatible file or string")
+
+    def test_quakeml_writer(self):
+        """
+        Events written one at a time result in the same document as writing
+        the complete catalog.
+        """
+        filename = os.path.join(self.path, 'iris_events.xml')
+        catalog = _read_quakeml(filename)
+        catalog.description = "Some description"
+        catalog.extra = {'foo': {'value': 'bar',
+                                 'namespace': 'http://test.org/xmlns/0.1'}}
+        nsmap = {'ns0': 'http://www.iris.edu/ws/event',
+                 'test': 'http://test.org/xmlns/0.1'}
+        expected = io.BytesIO()
+        _write_quakeml(catalog, expected, nsmap=nsmap)
+        with NamedTemporaryFile() as tf:
+            with QuakeMLWriter(tf.name, catalog=catalog,
+                               nsmap=nsmap) as writer:
+                for event in _iread_quakeml(filename):
+                    writer.write(event)
+            with open(tf.name, 'rb') as fh:
+                got = fh.read()
+            self.assertTrue(_validate(tf.name))
+        compare_xml_strings(expected.getvalue(), got)
+        self.assertEqual(_read_quakeml(io.BytesIO(got)), catalog)
+
+    def test_quakeml_writer_file_like_object(self):
+        """
+        Writing iterables of events to a file-like object.
+        """
+        buf = io.BytesIO()
+        writer = QuakeMLWriter(buf, pretty_print=False)
+        writer.write(self.neries_catalog[:2])
+        writer.write(event for event in self.neries_catalog[2:])
+        writer.close()
+        # closing twice is a no-op, writing a closed file fails
+        writer.close()
+        self.assertRaises(ValueError, writer.write, self.neries_catalog[0])
+        self.assertFalse(buf.closed)
+        self.assertEqual(buf.getvalue().count(b'\n'), 1)
+        got = _read_quakeml(io.BytesIO(buf.getvalue()))
+        self.assertEqual(got.events, self.neries_catalog.events)
+        # no events at all
+        buf = io.BytesIO()
+        with QuakeMLWriter(buf):
+            pass
+        self.assertEqual(len(_read_quakeml(io.BytesIO(buf.getvalue()))), 0)
+
 
 def suite():
     return unittest.makeSuite(QuakeMLTestCase, 'test')
@@ -21,6 +21,7 @@ from future.builtins import *  # NOQA
 import os
 import sys
 import warnings
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
@@ -78,7 +79,8 @@ def init_header_arrays(arrays=('float', 'int', 'str'), byteorder='='):
     return out
 
 
-def read_sac(source, headonly=False, byteorder=None, checksize=False):
+def read_sac(source, headonly=False, byteorder=None, checksize=False,
+             mmap=False):
     """
     Read a SAC binary file.
 
@@ -95,6 +97,10 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
     :param checksize: If True, check that the theoretical file size from the
         header matches the size on disk.
     :type checksize: bool
+    :param mmap: If True or a :class:`numpy.memmap` mode ('r', 'r+' or 'c'),
+        the data array is memory mapped instead of being read. ``True`` maps
+        the file read-only. Only possible if ``source`` is a file name.
+    :type mmap: bool or str
 
     :return: The float, integer, and string header arrays, and data array,
         in that order. Data array will be None if headonly is True.
@@ -114,6 +120,9 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
         # source is already a file-like object
         f = source
         is_file_name = False
+    if mmap and not is_file_name:
+        msg = "Memory mapping is only possible for file names."
+        raise ValueError(msg)
 
     is_byteorder_specified = byteorder is not None
     if not is_byteorder_specified:
@@ -177,6 +186,17 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
     # --------------------------------------------------------------
     if headonly:
         data = None
+    elif mmap:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < 632 + 4 * int(npts):
+            f.close()
+            raise SacIOError("Cannot read all data points")
+        if npts > 0:
+            data = np.memmap(source, dtype=native_str(endian_str + 'f4'),
+                             mode='r' if mmap is True else mmap,
+                             offset=632, shape=(int(npts),))
+        else:
+            data = np.array([], dtype=native_str(endian_str + 'f4'))
     else:
         data = from_buffer(f.read(int(npts) * 4),
                            dtype=native_str(endian_str + 'f4'))
@@ -191,6 +211,113 @@ def read_sac(source, headonly=False, byteorder=None, checksize=False):
     return hf, hi, hs, data
 
 
+def _header_dtype(byteorder='='):
+    """
+    Structured dtype of the 632 byte binary SAC header with one field per
+    header in :const:`~obspy.io.sac.header.FLOATHDRS`,
+    :const:`~obspy.io.sac.header.INTHDRS` and
+    :const:`~obspy.io.sac.header.STRHDRS`.
+    """
+    return np.dtype(
+        [(native_str(hdr), native_str(byteorder + 'f4'))
+         for hdr in HD.FLOATHDRS] +
+        [(native_str(hdr), native_str(byteorder + 'i4'))
+         for hdr in HD.INTHDRS] +
+        [(native_str(hdr), native_str('S8')) for hdr in HD.STRHDRS])
+
+
+def _read_header_bytes(source):
+    """
+    Returns the raw 632 header bytes of a SAC binary file.
+    """
+    with open(source, 'rb') as f:
+        header = f.read(632)
+    if len(header) != 632:
+        raise SacIOError("Cannot read all header values of {}".format(source))
+    return header
+
+
+def read_sac_headers(sources, byteorder=None, threads=None):
+    """
+    Read the headers of many SAC binary files into a single table.
+
+    Only the 632 header bytes of every file are read. The files are opened
+    and read by a pool of threads.
+
+    :param sources: Full path strings of SAC binary files on disk.
+    :type sources: list of str
+    :param byteorder: If omitted or None, the byte order of each file is
+        detected automatically. If byteorder is specified and incorrect for a
+        file, a SacIOError is raised.
+    :type byteorder: str {'little', 'big'}, optional
+    :param threads: Number of threads used to read the files. Defaults to
+        the number of CPUs, 1 reads the files in the calling thread.
+    :type threads: int
+
+    :return: Structured array with one row per file, in the order of
+        ``sources``, and one field per float, integer and string header in
+        native byte order. Strings are the raw 8 byte values, the 16 byte
+        'kevnm' header is split into 'kevnm' and 'kevnm2'.
+    :rtype: :class:`numpy.ndarray`
+
+    :raises: :class:`SacIOError` if a file is too short, a specified
+        byteorder was wrong or a file is valid in neither byte order.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import get_example_file
+    >>> files = [get_example_file("test.sac"),
+    ...          get_example_file("test.sac.swap")]
+    >>> headers = read_sac_headers(files)
+    >>> print(headers['npts'])
+    [100 100]
+    >>> print(headers['kstnm'][1].decode().strip())
+    STA
+
+    """
+    sources = list(sources)
+    if threads == 1 or len(sources) < 2:
+        raw = [_read_header_bytes(source) for source in sources]
+    else:
+        pool = ThreadPool(threads)
+        try:
+            raw = pool.map(_read_header_bytes, sources)
+        finally:
+            pool.close()
+            pool.join()
+
+    native = _header_dtype('=')
+    headers = np.frombuffer(b''.join(raw), dtype=native)
+    swapped = headers.view(_header_dtype(
+        '>' if sys.byteorder == 'little' else '<'))
+    nvhdr = headers['nvhdr']
+    is_native = (nvhdr > 0) & (nvhdr < 20)
+    if byteorder is None:
+        use_native = is_native
+        nvhdr = swapped['nvhdr']
+        invalid = ~is_native & ~((nvhdr > 0) & (nvhdr < 20))
+        if invalid.any():
+            msg = "Cannot determine the byteorder of {}"
+            raise SacIOError(msg.format(sources[np.nonzero(invalid)[0][0]]))
+    elif byteorder in ('little', 'big'):
+        use_native = np.ones(len(headers), dtype=np.bool_)
+        if byteorder != sys.byteorder:
+            headers, swapped = swapped, headers
+        nvhdr = headers['nvhdr']
+        invalid = ~((nvhdr > 0) & (nvhdr < 20))
+        if invalid.any():
+            msg = "Incorrect byteorder {} for {}"
+            raise SacIOError(msg.format(
+                byteorder, sources[np.nonzero(invalid)[0][0]]))
+    else:
+        raise ValueError("Unrecognized byteorder. Use {'little', 'big'}")
+
+    out = np.empty(len(headers), dtype=native)
+    out[use_native] = headers[use_native]
+    out[~use_native] = swapped[~use_native]
+    return out
+
+
 def read_sac_ascii(source, headonly=False):
     """
     Read a SAC ASCII/Alphanumeric file.
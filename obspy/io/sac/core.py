@@ -16,10 +16,16 @@ from future.utils import native_str
 import os
 import struct
 
-from obspy import Stream
+import numpy as np
+
+from obspy import Stream, UTCDateTime
 
 from obspy.core.compatibility import is_bytes_buffer
+from obspy.core.util.base import _get_segment_table
+from . import arrayio as _io
+from . import header as HD
 from .sactrace import SACTrace
+from .util import SacError, _clean_str, get_sac_reftime
 
 
 def _is_sac(filename):
@@ -353,6 +359,51 @@ def _read_sac(filename, headonly=False, debug_headers=False, fsize=True,
         raise ValueError("Cannot open '%s'." % filename)
 
 
+def _scan_sac(filename, fsize=True, **kwargs):  # @UnusedVariable
+    """
+    Scans a SAC file and returns a table with its single segment.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.stream.scan` function, call this instead.
+
+    Only the header arrays are read and no trace is created. The values are
+    derived the same way as for a :class:`~obspy.core.trace.Trace` read with
+    :func:`_read_sac`.
+
+    :param filename: SAC file to be scanned.
+    :type filename: str, open file, or file-like object
+    :type fsize: bool
+    :param fsize: Check if file size is consistent with theoretical size
+        from header. Defaults to ``True``.
+    :rtype: :class:`numpy.ndarray`
+    :return: Segment table, see :func:`~obspy.core.stream.scan`.
+    """
+    if not is_bytes_buffer(filename) and \
+            not isinstance(filename, (str, bytes)):
+        raise ValueError("Cannot open '%s'." % filename)
+    hf, hi, hs, _ = _io.read_sac(filename, headonly=True, checksize=fsize)
+    header = dict((key, val) for (key, val) in zip(HD.FLOATHDRS, hf)
+                  if val != HD.FNULL)
+    header.update((key, val) for (key, val) in zip(HD.INTHDRS, hi)
+                  if val != HD.INULL)
+    for key in ('knetwk', 'kstnm', 'khole', 'kcmpnm'):
+        value = _clean_str(hs[HD.STRHDRS.index(key)])
+        header[key] = value if value != HD.SNULL.strip() else ''
+    try:
+        reftime = get_sac_reftime(header)
+    except (SacError, ValueError, TypeError):
+        # ObsPy doesn't require a valid reftime
+        reftime = UTCDateTime(0.0)
+    starttime = reftime + header.get('b', 0.0)
+    return _get_segment_table(
+        network=[header['knetwk']], station=[header['kstnm']],
+        location=[header['khole']], channel=[header['kcmpnm']],
+        starttime=[starttime._ns],
+        sampling_rate=[np.float32(1.) / np.float32(header['delta'])],
+        npts=[header['npts']])
+
+
 def _internal_read_sac(buf, headonly=False, debug_headers=False, fsize=True,
                        **kwargs):  # @UnusedVariable
     """
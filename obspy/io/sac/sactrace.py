@@ -1100,7 +1100,7 @@ class SACTrace(object):
     # --------------------------- I/O METHODS ---------------------------------
     @classmethod
     def read(cls, source, headonly=False, ascii=False, byteorder=None,
-             checksize=False, debug_strings=False):
+             checksize=False, debug_strings=False, mmap=False):
         """
         Construct an instance from a binary or ASCII file on disk.
 
@@ -1125,6 +1125,11 @@ class SACTrace(object):
             beginning with '-12345' are considered unset. If True, they
             are instead passed without modification.  Good for debugging.
         :type debug_strings: bool
+        :param mmap: If True or a :class:`numpy.memmap` mode ('r', 'r+' or
+            'c'), the data array is memory mapped instead of being read.
+            ``True`` maps the file read-only. Only valid for binary files
+            given by name.
+        :type mmap: bool or str
 
         :raises: :class:`SacIOError` if checksize failed, byteorder was wrong,
             or header arrays are wrong size.
@@ -1155,7 +1160,7 @@ class SACTrace(object):
         else:
             hf, hi, hs, data = _io.read_sac(source, headonly=headonly,
                                             byteorder=byteorder,
-                                            checksize=checksize)
+                                            checksize=checksize, mmap=mmap)
         if not debug_strings:
             for i, val in enumerate(hs):
                 val = _ut._clean_str(val, strip_whitespace=False)
@@ -14,8 +14,10 @@ from obspy import UTCDateTime, read
 from obspy.core.util import NamedTemporaryFile
 from obspy.geodetics import gps2dist_azimuth, kilometer2degrees
 
+from ..arrayio import read_sac_headers
+from ..header import FLOATHDRS, INTHDRS, STRHDRS
 from ..sactrace import SACTrace
-from ..util import SacHeaderError, SacHeaderTimeError
+from ..util import SacHeaderError, SacHeaderTimeError, SacIOError
 
 
 class SACTraceTestCase(unittest.TestCase):
@@ -62,6 +64,78 @@ class SACTraceTestCase(unittest.TestCase):
         self.assertAlmostEqual(sac.depmen, 8.344650e-8)
         self.assertEqual(sac.depmax, 1.0)
 
+    def test_read_binary_mmap(self):
+        """
+        Memory mapped data is the same as read data and can be modified in
+        place.
+        """
+        for filename in (self.file, self.filebe):
+            sac = SACTrace.read(filename)
+            sac_mmap = SACTrace.read(filename, mmap=True)
+            self.assertIsInstance(sac_mmap.data, np.memmap)
+            np.testing.assert_array_equal(sac_mmap.data, sac.data)
+            self.assertEqual(sac_mmap._header, sac._header)
+            self.assertEqual(sac_mmap.byteorder, sac.byteorder)
+            with self.assertRaises(ValueError):
+                sac_mmap.data[0] = 1.0
+            del sac_mmap
+        with NamedTemporaryFile() as tf:
+            sac.write(tf.name)
+            sac_mmap = SACTrace.read(tf.name, mmap='r+')
+            sac_mmap.data[:] = 2.0
+            sac_mmap.data.flush()
+            del sac_mmap
+            np.testing.assert_array_equal(SACTrace.read(tf.name).data, 2.0)
+            # Files that are too short.
+            with open(tf.name, 'rb+') as fh:
+                fh.truncate(700)
+            with self.assertRaises(SacIOError):
+                SACTrace.read(tf.name, mmap=True)
+        with open(self.file, 'rb') as fh:
+            with self.assertRaises(ValueError):
+                SACTrace.read(fh, mmap=True)
+
+    def test_read_sac_headers(self):
+        """
+        The header table contains the same values as SACTrace for all files
+        and byte orders.
+        """
+        files = [os.path.join(self.path, 'data', name) for name in (
+            'test.sac', 'test.sac.swap', 'seism.sac', 'LMOW.BHE.SAC',
+            'non_ascii.sac', 'null_terminated.sac')] * 20
+        for threads in (None, 1, 4):
+            headers = read_sac_headers(files, threads=threads)
+            self.assertEqual(len(headers), len(files))
+            for filename, row in zip(files[:6], headers):
+                sac = SACTrace.read(filename, headonly=True,
+                                    debug_strings=True)
+                for hdr, value in zip(FLOATHDRS, sac._hf):
+                    self.assertEqual(row[hdr], value)
+                for hdr, value in zip(INTHDRS, sac._hi):
+                    self.assertEqual(row[hdr], value)
+                for hdr, value in zip(STRHDRS, sac._hs):
+                    self.assertEqual(row[hdr], value)
+            self.assertTrue(headers.dtype['delta'].isnative)
+            np.testing.assert_array_equal(headers[:6], headers[6:12])
+        headers = read_sac_headers(files[:1], byteorder='little')
+        self.assertEqual(headers['npts'][0], 100)
+        headers = read_sac_headers(files[1:2], byteorder='big')
+        self.assertEqual(headers['npts'][0], 100)
+        with self.assertRaises(SacIOError):
+            read_sac_headers(files[:2], byteorder='little')
+        with NamedTemporaryFile() as tf:
+            tf.write(b'\x00' * 100)
+            tf.flush()
+            with self.assertRaises(SacIOError):
+                read_sac_headers([self.file, tf.name])
+        # Files valid in neither byte order.
+        with NamedTemporaryFile() as tf:
+            tf.write(b'\x00' * 632)
+            tf.flush()
+            with self.assertRaises(SacIOError) as e:
+                read_sac_headers([self.file, tf.name])
+            self.assertIn(tf.name, str(e.exception))
+
     def test_read_sac_byteorder(self):
         """
         A read should fail if the byteorder is wrong
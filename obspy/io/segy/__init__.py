@@ -29,7 +29,7 @@ file formats usually used in observatories (GSE2, MiniSEED, ...). The
 of ObsPy are therefore not fully suited to handle them. Nonetheless they work
 well enough if some potential problems are kept in mind.
 
-SEG Y files can be read in four different ways that have different
+SEG Y files can be read in five different ways that have different
 advantages/disadvantages. Most of the following also applies to SU files with
 some changes (keep in mind that SU files have no file wide headers).
 
@@ -40,6 +40,8 @@ some changes (keep in mind that SU files have no file wide headers).
 4. Some SEG-Y files are too large to be read into memory. The
    :func:`obspy.io.segy.segy.iread_segy` function reads a large file trace
    by trace circumventing this problem.
+5. Files in which all traces have the same number of samples can be memory
+   mapped with the :func:`obspy.io.segy.segy.memmap_segy` function.
 
 Reading using methods 1 and 2
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
@@ -143,6 +145,58 @@ methods do), read the file trace by trace using the
 -5
 
 
+Memory mapping a file using method 5
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Most SEG Y files store traces of the same length. These can be memory mapped
+with the :func:`obspy.io.segy.segy.memmap_segy` (or
+:func:`obspy.io.segy.segy.memmap_su`) function. Nothing is read until it is
+accessed, so opening even very large files is instantaneous. All trace headers
+are available as a single NumPy structured array and the samples as a 2-D
+array.
+
+>>> from obspy.io.segy.segy import memmap_segy
+>>> segy = memmap_segy(filename)
+>>> print(segy.trace_headers['number_of_samples_in_this_trace'])
+[2001]
+
+Indexing the object returns the samples of the selected traces converted to
+native floating points or integers. IBM floating points are only converted for
+the selected traces.
+
+>>> data = segy[:]
+>>> print(data.shape)
+(1, 2001)
+
+Opening the file with ``mode='r+'`` allows to change headers and samples in
+place.
+
+
+Selecting gathers with a trace header index
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Selecting traces by their header values, e.g. common depth point or shot
+gathers, is done with an index over the required trace header keys which is
+built by :func:`obspy.io.segy.segy.index_segy` (or
+:func:`obspy.io.segy.segy.index_su`). Only the trace headers are read to build
+it and it can be saved next to the file with ``persist=True`` to be reused
+later.
+
+>>> from obspy.io.segy.segy import index_segy
+>>> index = index_segy(filename, ["original_field_record_number",
+...                               "trace_sequence_number_within_line"])
+>>> print(index.select(original_field_record_number=(1000, 2000)))
+[0]
+
+Gathers are read by seeking directly to the selected traces, optionally
+sorted by indexed keys:
+
+>>> st = index.gather(original_field_record_number=1034,
+...                   sort_by="trace_sequence_number_within_line")
+>>> print(len(st))
+1
+
+
 Writing
 -------
 
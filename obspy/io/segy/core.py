@@ -20,12 +20,14 @@ import numpy as np
 
 from obspy import Stream, Trace, UTCDateTime
 from obspy.core import AttribDict
+from obspy.core.util.base import _get_segment_table
 from .header import (BINARY_FILE_HEADER_FORMAT, DATA_SAMPLE_FORMAT_CODE_DTYPE,
-                     ENDIAN, TRACE_HEADER_FORMAT, TRACE_HEADER_KEYS)
+                     DATA_SAMPLE_FORMAT_SAMPLE_SIZE, ENDIAN,
+                     TRACE_HEADER_FORMAT, TRACE_HEADER_KEYS)
 from .segy import _read_segy as _read_segyrev1
 from .segy import _read_su as _read_su_file
 from .segy import (SEGYBinaryFileHeader, SEGYError, SEGYFile, SEGYTrace,
-                   SEGYTraceHeader, SUFile,
+                   SEGYTraceHeader, SEGYTraceReadingError, SUFile,
                    autodetect_endian_and_sanity_check_su)
 from .util import unpack_header_value
 
@@ -200,6 +202,90 @@ def _read_segy(filename, headonly=False, byteorder=None,
     return stream
 
 
+def _scan_segy(filename, byteorder=None, textual_header_encoding=None,
+               **kwargs):  # @UnusedVariable
+    """
+    Scans a SEG Y file and returns a table with one segment per trace.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.stream.scan` function, call this instead.
+
+    Only the file headers and the few trace header fields needed for the
+    table are unpacked, the data of the traces is skipped.
+
+    :type filename: str or file-like object
+    :param filename: SEG Y rev1 file to be scanned.
+    :type byteorder: str or ``None``
+    :param byteorder: Determines the endianness of the file. Either ``'>'`` for
+        big endian or ``'<'`` for little endian. If it is ``None``, it will try
+        to autodetect the endianness.
+    :type textual_header_encoding: str or ``None``
+    :param textual_header_encoding: The encoding of the textual header. Can be
+        ``'EBCDIC'``, ``'ASCII'`` or ``None``.
+    :rtype: :class:`numpy.ndarray`
+    :return: Segment table, see :func:`~obspy.core.stream.scan`.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.stream import scan
+    >>> table = scan("/path/to/00001034.sgy_first_trace")
+    >>> print(table["npts"][0], table["sampling_rate"][0])
+    2001 500.0
+    """
+    if not hasattr(filename, 'read') or not hasattr(filename, 'tell') or \
+            not hasattr(filename, 'seek'):
+        with open(filename, 'rb') as fh:
+            return _scan_segy(fh, byteorder=byteorder,
+                              textual_header_encoding=textual_header_encoding)
+    fh = filename
+    segy = SEGYFile(fh, endian=byteorder,
+                    textual_header_encoding=textual_header_encoding,
+                    read_traces=False)
+    sample_size = DATA_SAMPLE_FORMAT_SAMPLE_SIZE[segy.data_encoding]
+    pos = fh.tell()
+    fh.seek(0, 2)
+    filesize = fh.tell()
+    fh.seek(pos, 0)
+    fmt_samples = ('%sHH' % segy.endian).encode('ascii', 'strict')
+    fmt_time = ('%s5h' % segy.endian).encode('ascii', 'strict')
+    starttime, sampling_rate, npts = [], [], []
+    while True:
+        trace_header = fh.read(240)
+        if len(trace_header) != 240:
+            break
+        # number_of_samples_in_this_trace and
+        # sample_interval_in_ms_for_this_trace
+        n, interval = unpack(fmt_samples, trace_header[114:118])
+        data_needed = sample_size * n
+        if n < 1 or data_needed > filesize - fh.tell():
+            msg = """
+                  Too little data left in the file to unpack it according to
+                  its trace header. This is most likely either due to a wrong
+                  byte order or a corrupt file.
+                  """.strip()
+            raise SEGYTraceReadingError(msg)
+        fh.seek(data_needed, 1)
+        npts.append(n)
+        sampling_rate.append(1E6 / interval if interval > 0 else 1.0)
+        # year_data_recorded, day_of_year, hour_of_day, minute_of_hour and
+        # second_of_minute, mapped the same way as for reading
+        year, julday, hour, minute, second = \
+            unpack(fmt_time, trace_header[156:166])
+        if year > 0:
+            if year < 100:
+                year += 2000 if year < 30 else 1900
+            starttime.append(UTCDateTime(
+                year=year, julday=julday, hour=hour, minute=minute,
+                second=second)._ns)
+        else:
+            starttime.append(0)
+    empty = [''] * len(npts)
+    return _get_segment_table(
+        network=empty, station=empty, location=empty, channel=empty,
+        starttime=starttime, sampling_rate=sampling_rate, npts=npts)
+
+
 def _write_segy(stream, filename, data_encoding=None, byteorder=None,
                 textual_header_encoding=None, **kwargs):  # @UnusedVariable
     """
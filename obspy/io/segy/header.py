@@ -6,6 +6,7 @@ and write support.
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
 import numpy as np
 
@@ -206,9 +207,42 @@ DATA_SAMPLE_FORMAT_CODE_DTYPE = {
     3: np.int16,
     5: np.float32}
 
+# Map the data format sample code and the dtype of the raw values in the file.
+# IBM floating points are stored as unsigned integers and converted on access.
+# 4 byte fixed point with gain is not supported.
+DATA_SAMPLE_FORMAT_RAW_DTYPE = {
+    1: 'u4',
+    2: 'i4',
+    3: 'i2',
+    5: 'f4',
+    8: 'i1'}
+
 # Map the endianness to bigger/smaller sign.
 ENDIAN = {
     'big': '>',
     'little': '<',
     '>': '>',
     '<': '<'}
+
+
+def get_trace_header_dtype(endian='>'):
+    """
+    Returns a NumPy structured dtype of the 240 byte trace header with one
+    field per entry in :const:`TRACE_HEADER_FORMAT`.
+
+    :type endian: str
+    :param endian: ``'>'`` for big endian or ``'<'`` for little endian.
+    """
+    fields = []
+    for length, name, special_format, _ in TRACE_HEADER_FORMAT:
+        if special_format:
+            dtype = endian + special_format
+        elif length == 2:
+            dtype = endian + 'i2'
+        elif length == 4:
+            dtype = endian + 'i4'
+        else:
+            # The unassigned field.
+            dtype = 'V%i' % length
+        fields.append((native_str(name), native_str(dtype)))
+    return np.dtype(fields)
@@ -13,24 +13,34 @@ Routines to read and write SEG Y rev 1 encoded seismic data files.
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
 import io
 import os
+import sys
+import threading
 from struct import pack, unpack
 
 import numpy as np
 
-from obspy import Trace, UTCDateTime
+from obspy import Stream, Trace, UTCDateTime
 from obspy.core import AttribDict
 
 from .header import (BINARY_FILE_HEADER_FORMAT,
                      DATA_SAMPLE_FORMAT_PACK_FUNCTIONS,
+                     DATA_SAMPLE_FORMAT_RAW_DTYPE,
                      DATA_SAMPLE_FORMAT_SAMPLE_SIZE,
                      DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS, ENDIAN,
-                     TRACE_HEADER_FORMAT, TRACE_HEADER_KEYS)
-from .unpack import OnTheFlyDataUnpacker
+                     TRACE_HEADER_FORMAT, TRACE_HEADER_KEYS,
+                     get_trace_header_dtype)
+from .unpack import OnTheFlyDataUnpacker, ibm2ieee
 from .util import unpack_header_value
 
+if sys.version_info.major == 2:
+    import Queue as queue
+else:
+    import queue
+
 
 class SEGYError(Exception):
     """
@@ -909,7 +919,8 @@ def _internal_read_segy(file, endian=None, textual_header_encoding=None,
 
 
 def iread_segy(file, endian=None, textual_header_encoding=None,
-               unpack_headers=False, headonly=False):
+               unpack_headers=False, headonly=False, prefetch=0,
+               batch_size=None):
     """
     Iteratively read a SEG-Y field and yield single ObsPy Traces.
 
@@ -933,6 +944,16 @@ def iread_segy(file, endian=None, textual_header_encoding=None,
     ...     print(int(tr.data.sum() * 1E9))
     -5
 
+    With ``prefetch`` the next traces are read and unpacked by a background
+    thread while the current one is being processed. With ``batch_size``
+    whole blocks of traces are yielded as a structured array of trace
+    headers and a 2-D array of samples:
+
+    >>> for headers, data in iread_segy(filename, batch_size=100,
+    ...                                 prefetch=2):
+    ...     print(headers['trace_sequence_number_within_line'], data.shape)
+    [1] (1, 2001)
+
     :param file: Open file like object or a string which will be assumed to be
         a filename.
     :type endian: str
@@ -952,33 +973,56 @@ def iread_segy(file, endian=None, textual_header_encoding=None,
     :param headonly: Determines whether or not the actual data records will be
         read and unpacked. Has a huge impact on memory usage. Data can be read
         and unpacked on-the-fly after reading the file. Defaults to False.
+    :type prefetch: int
+    :param prefetch: If larger than zero, a background thread reads ahead up
+        to this many traces (or batches). An open file object must not be
+        used otherwise until the iteration is finished.
+    :type batch_size: int
+    :param batch_size: If given, tuples of a NumPy structured array with the
+        trace headers (see
+        :func:`~obspy.io.segy.header.get_trace_header_dtype`) and a 2-D
+        array with the samples of up to ``batch_size`` consecutive traces are
+        yielded instead of single Traces. A batch ends early if the number of
+        samples changes. ``unpack_headers`` and ``headonly`` are ignored.
     """
-    # Open the file if it is not a file like object.
-    if not hasattr(file, 'read') or not hasattr(file, 'tell') or not \
-            hasattr(file, 'seek'):
-        with open(file, 'rb') as open_file:
-            for tr in _internal_iread_segy(
-                    open_file, endian=endian,
-                    textual_header_encoding=textual_header_encoding,
-                    unpack_headers=unpack_headers, headonly=headonly):
-                yield tr
-            return
-    # Otherwise just read it.
-    for tr in _internal_iread_segy(
-            file, endian=endian,
-            textual_header_encoding=textual_header_encoding,
-            unpack_headers=unpack_headers, headonly=headonly):
+    def _iread():
+        # Open the file if it is not a file like object.
+        if not hasattr(file, 'read') or not hasattr(file, 'tell') or not \
+                hasattr(file, 'seek'):
+            with open(file, 'rb') as open_file:
+                for tr in _internal_iread_segy(
+                        open_file, endian=endian,
+                        textual_header_encoding=textual_header_encoding,
+                        unpack_headers=unpack_headers, headonly=headonly,
+                        batch_size=batch_size):
+                    yield tr
+                return
+        # Otherwise just read it.
+        for tr in _internal_iread_segy(
+                file, endian=endian,
+                textual_header_encoding=textual_header_encoding,
+                unpack_headers=unpack_headers, headonly=headonly,
+                batch_size=batch_size):
+            yield tr
+
+    for tr in (_prefetch(_iread, prefetch) if prefetch else _iread()):
         yield tr
 
 
 def _internal_iread_segy(file, endian=None, textual_header_encoding=None,
-                         unpack_headers=False, headonly=False):
+                         unpack_headers=False, headonly=False,
+                         batch_size=None):
     """
     Iteratively read a SEG-Y field and yield single ObsPy Traces.
     """
     segy_file = SEGYFile(
         file, endian=endian, textual_header_encoding=textual_header_encoding,
         unpack_headers=unpack_headers, headonly=headonly, read_traces=False)
+    if batch_size is not None:
+        for batch in _read_trace_batches(file, segy_file.data_encoding,
+                                         segy_file.endian, batch_size):
+            yield batch
+        return
     for trace in segy_file._read_traces(unpack_headers=unpack_headers,
                                         headonly=headonly,
                                         yield_each_trace=True):
@@ -995,7 +1039,8 @@ def _internal_iread_segy(file, endian=None, textual_header_encoding=None,
         yield tr
 
 
-def iread_su(file, endian=None, unpack_headers=False, headonly=False):
+def iread_su(file, endian=None, unpack_headers=False, headonly=False,
+             prefetch=0, batch_size=None):
     """
     Iteratively read a SU field and yield single ObsPy Traces.
 
@@ -1032,31 +1077,47 @@ def iread_su(file, endian=None, unpack_headers=False, headonly=False):
     :param headonly: Determines whether or not the actual data records will be
         read and unpacked. Has a huge impact on memory usage. Data can be read
         and unpacked on-the-fly after reading the file. Defaults to False.
+    :type prefetch: int
+    :param prefetch: See :func:`iread_segy`.
+    :type batch_size: int
+    :param batch_size: See :func:`iread_segy`.
     """
-    # Open the file if it is not a file like object.
-    if not hasattr(file, 'read') or not hasattr(file, 'tell') or not \
-            hasattr(file, 'seek'):
-        with open(file, 'rb') as open_file:
-            for tr in _internal_iread_su(
-                    open_file, endian=endian,
-                    unpack_headers=unpack_headers, headonly=headonly):
-                yield tr
-            return
-    # Otherwise just read it.
-    for tr in _internal_iread_su(
-            file, endian=endian,
-            unpack_headers=unpack_headers, headonly=headonly):
+    def _iread():
+        # Open the file if it is not a file like object.
+        if not hasattr(file, 'read') or not hasattr(file, 'tell') or not \
+                hasattr(file, 'seek'):
+            with open(file, 'rb') as open_file:
+                for tr in _internal_iread_su(
+                        open_file, endian=endian,
+                        unpack_headers=unpack_headers, headonly=headonly,
+                        batch_size=batch_size):
+                    yield tr
+                return
+        # Otherwise just read it.
+        for tr in _internal_iread_su(
+                file, endian=endian,
+                unpack_headers=unpack_headers, headonly=headonly,
+                batch_size=batch_size):
+            yield tr
+
+    for tr in (_prefetch(_iread, prefetch) if prefetch else _iread()):
         yield tr
 
 
 def _internal_iread_su(file, endian=None, unpack_headers=False,
-                       headonly=False):
+                       headonly=False, batch_size=None):
     """
     Iteratively read a SU field and yield single ObsPy Traces.
     """
     su_file = SUFile(
         file, endian=endian, unpack_headers=unpack_headers, headonly=headonly,
         read_traces=False)
+    if batch_size is not None:
+        # SU files always store 4 byte IEEE floating points.
+        for batch in _read_trace_batches(file, 5, su_file.endian,
+                                         batch_size):
+            yield batch
+        return
     for trace in su_file._read_traces(unpack_headers=unpack_headers,
                                       headonly=headonly,
                                       yield_each_trace=True):
@@ -1071,6 +1132,102 @@ def _internal_iread_su(file, endian=None, unpack_headers=False,
         yield tr
 
 
+def _read_trace_batches(file, data_encoding, endian, batch_size):
+    """
+    Reads the traces starting at the current file pointer position to the
+    end of the file and yields them in batches of consecutive traces with
+    the same number of samples.
+
+    Yields tuples of a structured array with the trace headers and a 2-D
+    array with the unpacked samples.
+    """
+    if batch_size < 1:
+        msg = 'The batch size must be at least one.'
+        raise ValueError(msg)
+    sample_size = DATA_SAMPLE_FORMAT_SAMPLE_SIZE[data_encoding]
+    unpack_function = DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS[data_encoding]
+    header_dtype = get_trace_header_dtype(endian)
+    fmt = ('%sH' % endian).encode('ascii', 'strict')
+
+    def _batch(headers, data, npts):
+        headers = np.frombuffer(b''.join(headers), dtype=header_dtype)
+        data = unpack_function(io.BytesIO(b''.join(data)),
+                               len(headers) * npts, endian=endian)
+        return headers, data.reshape(len(headers), npts)
+
+    headers = []
+    data = []
+    npts = None
+    while True:
+        header = file.read(240)
+        if len(header) != 240:
+            break
+        trace_npts = unpack(fmt, header[114:116])[0]
+        if headers and (trace_npts != npts or len(headers) == batch_size):
+            yield _batch(headers, data, npts)
+            headers = []
+            data = []
+        npts = trace_npts
+        samples = file.read(npts * sample_size)
+        if npts < 1 or len(samples) != npts * sample_size:
+            msg = """
+                  Too little data left in the file to unpack it according to
+                  its trace header. This is most likely either due to a wrong
+                  byte order or a corrupt file.
+                  """.strip()
+            raise SEGYTraceReadingError(msg)
+        headers.append(header)
+        data.append(samples)
+    if headers:
+        yield _batch(headers, data, npts)
+
+
+def _prefetch(generator_function, size):
+    """
+    Runs the given generator function in a background thread and yields its
+    items. At most ``size`` items are read ahead, exceptions are raised in the
+    consuming thread.
+    """
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    end = object()
+
+    def _put(item):
+        # Give up if the consumer stopped iterating.
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _worker():
+        try:
+            for item in generator_function():
+                if not _put((item, None)):
+                    return
+        except Exception as e:
+            _put((end, e))
+        else:
+            _put((end, None))
+
+    thread = threading.Thread(target=_worker)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exception = items.get()
+            if item is end:
+                if exception is not None:
+                    raise exception
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
 class SUFile(object):
     """
     Convenience class that internally handles Seismic Unix data files. It
@@ -1265,6 +1422,581 @@ def _internal_read_su(file, endian=None, unpack_headers=False, headonly=False):
                   headonly=headonly)
 
 
+class SEGYMemmapFile(object):
+    """
+    Memory mapped access to SEG Y or SU files in which all traces have the
+    same number of samples.
+
+    Instead of creating objects for every trace, all trace headers are
+    exposed as a single NumPy structured array (with one field per entry in
+    :const:`~obspy.io.segy.header.TRACE_HEADER_FORMAT`) and the samples as a
+    2-D array of shape ``(number of traces, number of samples)``. Both are
+    views of the same memory map, nothing is read from disk until it is
+    accessed.
+
+    Indexing the object returns the converted data of the selected traces.
+    IBM floating points are only converted for the selected traces.
+
+    Use :func:`memmap_segy` or :func:`memmap_su` to create it.
+
+    :type filename: str
+    :param filename: Name of the SEG Y or SU file.
+    :type endian: str
+    :param endian: The endianness of the file. If None, autodetection will
+        be used.
+    :type textual_header_encoding: str
+    :param textual_header_encoding: The encoding of the textual header.
+        Either 'EBCDIC', 'ASCII' or None. Only used for SEG Y files.
+    :type su: bool
+    :param su: ``True`` for Seismic Unix files which have no file headers
+        and are always IEEE 4 byte float encoded.
+    :type mode: str
+    :param mode: Mode of the memory map, ``'r'`` for read only and ``'r+'``
+        to change trace headers or samples in place.
+
+    .. attribute:: trace_headers
+
+        Structured array with the headers of all traces.
+
+    .. attribute:: raw_data
+
+        2-D array with the samples of all traces as stored in the file.
+        IBM floating points are returned as their raw 4 byte integers.
+    """
+    def __init__(self, filename, endian=None, textual_header_encoding=None,
+                 su=False, mode='r'):
+        self.filename = filename
+        self.su = su
+        with open(filename, 'rb') as fh:
+            if su:
+                self.textual_file_header = None
+                self.textual_header_encoding = None
+                self.binary_file_header = None
+                self.endian = SUFile(fh, endian=endian,
+                                     read_traces=False).endian
+                self.data_encoding = 5
+                offset = 0
+            else:
+                segy = SEGYFile(
+                    fh, endian=endian,
+                    textual_header_encoding=textual_header_encoding,
+                    read_traces=False)
+                self.textual_file_header = segy.textual_file_header
+                self.textual_header_encoding = segy.textual_header_encoding
+                self.binary_file_header = segy.binary_file_header
+                self.endian = segy.endian
+                self.data_encoding = segy.data_encoding
+                offset = fh.tell()
+            # The number of samples of the first trace determines the trace
+            # length.
+            fh.seek(offset + 114, 0)
+            npts = fh.read(2)
+            fh.seek(0, 2)
+            filesize = fh.tell()
+        if len(npts) != 2:
+            msg = 'The file contains no traces.'
+            raise SEGYError(msg)
+        self.npts = unpack(('%sH' % self.endian).encode('ascii', 'strict'),
+                           npts)[0]
+        if self.data_encoding not in DATA_SAMPLE_FORMAT_RAW_DTYPE:
+            msg = 'Data sample format code %s is not supported.' % \
+                self.data_encoding
+            raise SEGYError(msg)
+        trace_length = 240 + self.npts * \
+            DATA_SAMPLE_FORMAT_SAMPLE_SIZE[self.data_encoding]
+        if (filesize - offset) % trace_length:
+            msg = ('The file can not be memory mapped because its traces do '
+                   'not all have the same length.')
+            raise SEGYError(msg)
+        dtype = np.dtype([
+            (native_str('header'), get_trace_header_dtype(self.endian)),
+            (native_str('data'),
+             native_str(self.endian +
+                        DATA_SAMPLE_FORMAT_RAW_DTYPE[self.data_encoding]),
+             (self.npts,))])
+        self._memmap = np.memmap(
+            filename, dtype=dtype, mode=mode, offset=offset,
+            shape=((filesize - offset) // trace_length,))
+        self.trace_headers = self._memmap['header']
+        self.raw_data = self._memmap['data']
+        if np.any(self.trace_headers['number_of_samples_in_this_trace'] !=
+                  self.npts):
+            msg = ('The file can not be memory mapped because its traces do '
+                   'not all have the same length.')
+            raise SEGYError(msg)
+
+    def __len__(self):
+        return len(self._memmap)
+
+    def __str__(self):
+        """
+        Prints some information about the file.
+        """
+        return '%i traces in the memory mapped %s structure.' % (
+            len(self), 'SU' if self.su else 'SEG Y')
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+    def __getitem__(self, index):
+        """
+        Returns the samples of the selected traces converted to a native
+        NumPy array, e.g. ``data = segy[10:20]`` for a 2-D array with ten
+        traces.
+        """
+        raw = self.raw_data[index]
+        if self.data_encoding == 1:
+            return ibm2ieee(raw)
+        return np.array(raw, dtype=raw.dtype.newbyteorder(native_str('=')))
+
+    def to_obspy_trace(self, index, headonly=False):
+        """
+        Converts a single trace to an ObsPy Trace object.
+
+        :type index: int
+        :param index: Index of the trace.
+        :type headonly: bool
+        :param headonly: If True, the data will not be converted.
+        """
+        trace = SEGYTrace(endian=self.endian,
+                          data_encoding=self.data_encoding)
+        trace.header = SEGYTraceHeader(self.trace_headers[index].tobytes(),
+                                       endian=self.endian)
+        trace.npts = self.npts
+        if not headonly:
+            trace.data = self[index]
+        tr = trace.to_obspy_trace(headonly=headonly)
+        tr.stats._format = "SU" if self.su else "SEGY"
+        return tr
+
+
+def memmap_segy(filename, endian=None, textual_header_encoding=None,
+                mode='r'):
+    """
+    Memory maps a SEG Y file with traces of equal length.
+
+    Opening a file is independent of the number of traces in it, all trace
+    headers are available as a structured array and the data as a 2-D array.
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("00001034.sgy_first_trace")
+    >>> from obspy.io.segy.segy import memmap_segy
+    >>> segy = memmap_segy(filename)
+    >>> print(segy)
+    1 traces in the memory mapped SEG Y structure.
+    >>> print(segy.trace_headers['trace_sequence_number_within_line'])
+    [1]
+    >>> print(segy.raw_data.shape)
+    (1, 2001)
+    >>> data = segy[0]
+    >>> print(int(data.sum() * 1E9))
+    -5
+
+    See :class:`SEGYMemmapFile` for the parameters.
+    """
+    return SEGYMemmapFile(filename, endian=endian,
+                          textual_header_encoding=textual_header_encoding,
+                          mode=mode)
+
+
+def memmap_su(filename, endian=None, mode='r'):
+    """
+    Memory maps a Seismic Unix file with traces of equal length.
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("1.su_first_trace")
+    >>> from obspy.io.segy.segy import memmap_su
+    >>> su = memmap_su(filename, endian="<")
+    >>> print(su)
+    1 traces in the memory mapped SU structure.
+    >>> print(su.raw_data.shape)
+    (1, 8000)
+
+    See :class:`SEGYMemmapFile` for the parameters.
+    """
+    return SEGYMemmapFile(filename, endian=endian, su=True, mode=mode)
+
+
+class SEGYTraceIndex(object):
+    """
+    Index over selected trace header values of a SEG Y or SU file.
+
+    The index is built by reading only the 240 byte trace headers and
+    skipping the data. It stores the byte offset of every trace and the
+    values of the chosen trace header keys so traces can be selected, e.g.
+    common depth point or shot gathers, without looping over the trace
+    headers in Python. Selected traces are read by seeking directly to their
+    byte offsets.
+
+    Use :func:`index_segy` or :func:`index_su` to create it.
+
+    :type filename: str
+    :param filename: Name of the SEG Y or SU file.
+    :type keys: list of str
+    :param keys: Trace header keys to index, see
+        :const:`~obspy.io.segy.header.TRACE_HEADER_KEYS`.
+    :type endian: str
+    :param endian: The endianness of the file. If None, autodetection will
+        be used.
+    :type textual_header_encoding: str
+    :param textual_header_encoding: The encoding of the textual header.
+        Either 'EBCDIC', 'ASCII' or None. Only used for SEG Y files.
+    :type su: bool
+    :param su: ``True`` for Seismic Unix files.
+
+    .. attribute:: headers
+
+        Structured array with the indexed trace header values of all traces
+        in file order.
+
+    .. attribute:: offsets
+
+        Byte offsets of the trace headers in the file.
+
+    .. attribute:: npts
+
+        Number of samples of all traces.
+    """
+    def __init__(self, filename, keys, endian=None,
+                 textual_header_encoding=None, su=False):
+        if isinstance(keys, (str, native_str)):
+            keys = [keys]
+        keys = list(keys)
+        for key in keys:
+            if key not in TRACE_HEADER_KEYS or key.startswith('unassigned'):
+                msg = "'%s' is not a valid trace header key." % key
+                raise ValueError(msg)
+        self.filename = filename
+        self.keys = keys
+        self.su = su
+        self.textual_header_encoding = None
+        with open(filename, 'rb') as fh:
+            if su:
+                self.endian = SUFile(fh, endian=endian,
+                                     read_traces=False).endian
+                self.data_encoding = 5
+            else:
+                segy = SEGYFile(
+                    fh, endian=endian,
+                    textual_header_encoding=textual_header_encoding,
+                    read_traces=False)
+                self.endian = segy.endian
+                self.data_encoding = segy.data_encoding
+                self.textual_header_encoding = segy.textual_header_encoding
+            filesize = os.fstat(fh.fileno())[6]
+            sample_size = DATA_SAMPLE_FORMAT_SAMPLE_SIZE[self.data_encoding]
+            fmt = ('%sH' % self.endian).encode('ascii', 'strict')
+            offsets = []
+            headers = []
+            while True:
+                pos = fh.tell()
+                header = fh.read(240)
+                if not header:
+                    break
+                if len(header) != 240:
+                    msg = 'The trace header needs to be 240 bytes long'
+                    raise SEGYTraceHeaderTooSmallError(msg)
+                data_needed = unpack(fmt, header[114:116])[0] * sample_size
+                if pos + 240 + data_needed > filesize:
+                    msg = ('Too little data left in the file to unpack it '
+                           'according to its trace header. This is most '
+                           'likely either due to a wrong byte order or a '
+                           'corrupt file.')
+                    raise SEGYTraceReadingError(msg)
+                offsets.append(pos)
+                headers.append(header)
+                fh.seek(data_needed, 1)
+        all_headers = np.frombuffer(b''.join(headers),
+                                    dtype=get_trace_header_dtype(self.endian))
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.npts = all_headers['number_of_samples_in_this_trace'].astype(
+            np.int64)
+        self.headers = np.empty(len(offsets), dtype=[
+            (native_str(key), all_headers.dtype[key].newbyteorder(
+                native_str('=')))
+            for key in keys])
+        for key in keys:
+            self.headers[key] = all_headers[key]
+        self._filesize = filesize
+        self._mtime = os.path.getmtime(filename)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __str__(self):
+        """
+        Prints some information about the index.
+        """
+        return '%i traces indexed by %s in %s.' % (
+            len(self), ', '.join(self.keys), self.filename)
+
+    def _repr_pretty_(self, p, cycle):
+        p.text(str(self))
+
+    def select(self, sort_by=None, **kwargs):
+        """
+        Returns the indices of all traces matching the given trace header
+        values.
+
+        Every keyword argument is an indexed trace header key. A single value
+        selects traces with exactly this value, a tuple ``(min, max)`` an
+        inclusive range (``None`` for an open end) and a list any of the
+        given values.
+
+        >>> from obspy.core.util import get_example_file
+        >>> filename = get_example_file("00001034.sgy_first_trace")
+        >>> index = index_segy(filename, ["ensemble_number",
+        ...                               "original_field_record_number"])
+        >>> print(index.select(ensemble_number=1))
+        []
+        >>> print(index.select(original_field_record_number=(1000, None)))
+        [0]
+
+        :type sort_by: str or list of str
+        :param sort_by: Indexed key(s) to sort the selected traces by. Traces
+            with equal values keep their file order.
+        :rtype: :class:`numpy.ndarray`
+        """
+        mask = np.ones(len(self), dtype=np.bool_)
+        for key, value in kwargs.items():
+            if key not in self.keys:
+                msg = "'%s' is not an indexed trace header key." % key
+                raise ValueError(msg)
+            values = self.headers[key]
+            if isinstance(value, tuple):
+                if len(value) != 2:
+                    msg = 'Ranges must be given as (min, max) tuples.'
+                    raise ValueError(msg)
+                if value[0] is not None:
+                    mask &= values >= value[0]
+                if value[1] is not None:
+                    mask &= values <= value[1]
+            elif isinstance(value, (list, set, np.ndarray)):
+                mask &= np.in1d(values, list(value))
+            else:
+                mask &= values == value
+        indices = np.nonzero(mask)[0]
+        if sort_by is not None:
+            indices = indices[self._argsort(indices, sort_by)]
+        return indices
+
+    def _argsort(self, indices, sort_by):
+        """
+        Stable sort of the given trace indices by one or more keys.
+        """
+        if isinstance(sort_by, (str, native_str)):
+            sort_by = [sort_by]
+        for key in sort_by:
+            if key not in self.keys:
+                msg = "'%s' is not an indexed trace header key." % key
+                raise ValueError(msg)
+        # The last key of lexsort is the primary one.
+        return np.lexsort([self.headers[key][indices]
+                           for key in reversed(sort_by)])
+
+    def iter_traces(self, indices=None, sort_by=None, unpack_headers=False,
+                    headonly=False):
+        """
+        Reads the given traces and yields them as ObsPy Traces.
+
+        Only the byte ranges of the requested traces are read.
+
+        :type indices: list of int
+        :param indices: Indices of the traces, e.g. from :meth:`select`.
+            Defaults to all traces.
+        :type sort_by: str or list of str
+        :param sort_by: Indexed key(s) to sort the traces by.
+        :type unpack_headers: bool
+        :param unpack_headers: Determines whether or not all headers will be
+            unpacked during reading the file.
+        :type headonly: bool
+        :param headonly: Determines whether or not the actual data records
+            will be read and unpacked.
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+        indices = np.asarray(indices, dtype=np.int64)
+        if sort_by is not None:
+            indices = indices[self._argsort(indices, sort_by)]
+        with open(self.filename, 'rb') as fh:
+            if not self.su:
+                segy = SEGYFile(
+                    fh, endian=self.endian,
+                    textual_header_encoding=self.textual_header_encoding,
+                    read_traces=False)
+            for index in indices:
+                fh.seek(self.offsets[index], 0)
+                trace = SEGYTrace(fh, data_encoding=self.data_encoding,
+                                  endian=self.endian,
+                                  unpack_headers=unpack_headers,
+                                  filesize=self._filesize, headonly=headonly)
+                tr = trace.to_obspy_trace(
+                    unpack_trace_headers=unpack_headers, headonly=headonly)
+                if self.su:
+                    tr.stats._format = "SU"
+                    tr.stats.su = tr.stats.pop("segy")
+                else:
+                    tr.stats.segy.textual_file_header = \
+                        segy.textual_file_header
+                    tr.stats.segy.binary_file_header = \
+                        segy.binary_file_header
+                    tr.stats.segy.textual_file_header_encoding = \
+                        segy.textual_header_encoding.upper()
+                    tr.stats.segy.data_encoding = self.data_encoding
+                    tr.stats.segy.endian = self.endian
+                    tr.stats._format = "SEGY"
+                yield tr
+
+    def gather(self, sort_by=None, unpack_headers=False, headonly=False,
+               **kwargs):
+        """
+        Reads all traces matching the given trace header values.
+
+        See :meth:`select` for the selection and :meth:`iter_traces` for the
+        other parameters.
+
+        >>> from obspy.core.util import get_example_file
+        >>> filename = get_example_file("00001034.sgy_first_trace")
+        >>> index = index_segy(filename, ["trace_sequence_number_within_line"])
+        >>> st = index.gather(trace_sequence_number_within_line=[1, 2])
+        >>> print(len(st))
+        1
+
+        :rtype: :class:`~obspy.core.stream.Stream`
+        """
+        indices = self.select(sort_by=sort_by, **kwargs)
+        return Stream(list(self.iter_traces(
+            indices, unpack_headers=unpack_headers, headonly=headonly)))
+
+    def save(self, filename=None):
+        """
+        Saves the index to a NumPy ``.npz`` file.
+
+        :type filename: str
+        :param filename: Defaults to the name of the indexed file with an
+            ``.index.npz`` suffix.
+        """
+        if filename is None:
+            filename = self.filename + '.index.npz'
+        with open(filename, 'wb') as fh:
+            np.savez(fh, headers=self.headers, offsets=self.offsets,
+                     npts=self.npts, filesize=self._filesize,
+                     mtime=self._mtime, endian=native_str(self.endian),
+                     data_encoding=self.data_encoding, su=self.su,
+                     textual_header_encoding=native_str(
+                         self.textual_header_encoding or ''))
+
+    @classmethod
+    def load(cls, filename, index_filename=None):
+        """
+        Loads an index saved with :meth:`save`.
+
+        :type filename: str
+        :param filename: Name of the indexed SEG Y or SU file.
+        :type index_filename: str
+        :param index_filename: Defaults to the name of the indexed file with
+            an ``.index.npz`` suffix.
+        """
+        if index_filename is None:
+            index_filename = filename + '.index.npz'
+        index = cls.__new__(cls)
+        with np.load(index_filename, allow_pickle=False) as npz:
+            index.filename = filename
+            index.headers = npz['headers']
+            index.keys = list(index.headers.dtype.names)
+            index.offsets = npz['offsets']
+            index.npts = npz['npts']
+            index._filesize = int(npz['filesize'])
+            index._mtime = float(npz['mtime'])
+            index.endian = str(npz['endian'])
+            index.data_encoding = int(npz['data_encoding'])
+            index.su = bool(npz['su'])
+            index.textual_header_encoding = \
+                str(npz['textual_header_encoding']) or None
+        return index
+
+    def _is_up_to_date(self):
+        """
+        Whether the indexed file has not been changed since indexing it.
+        """
+        try:
+            return (os.path.getsize(self.filename) == self._filesize and
+                    os.path.getmtime(self.filename) == self._mtime)
+        except OSError:
+            return False
+
+
+def _index(filename, keys, persist, **kwargs):
+    """
+    Loads a persisted index if it is usable or builds a new one.
+    """
+    if isinstance(keys, (str, native_str)):
+        keys = [keys]
+    if persist:
+        if persist is True:
+            persist = filename + '.index.npz'
+        if os.path.exists(persist):
+            try:
+                index = SEGYTraceIndex.load(filename, persist)
+            except Exception:
+                index = None
+            if index is not None and index._is_up_to_date() and \
+                    index.su == kwargs['su'] and \
+                    set(keys).issubset(index.keys):
+                return index
+    index = SEGYTraceIndex(filename, keys, **kwargs)
+    if persist:
+        index.save(persist)
+    return index
+
+
+def index_segy(filename, keys, endian=None, textual_header_encoding=None,
+               persist=False):
+    """
+    Builds an index over the given trace header keys of a SEG Y file.
+
+    >>> from obspy.core.util import get_example_file
+    >>> filename = get_example_file("00001034.sgy_first_trace")
+    >>> from obspy.io.segy.segy import index_segy
+    >>> index = index_segy(filename, ["ensemble_number",
+    ...                               "original_field_record_number"])
+    >>> print(index.headers)
+    [(0, 1034)]
+
+    See :class:`SEGYTraceIndex` for details.
+
+    :type filename: str
+    :param filename: Name of the SEG Y file.
+    :type keys: list of str
+    :param keys: Trace header keys to index.
+    :type endian: str
+    :param endian: The endianness of the file. If None, autodetection will
+        be used.
+    :type textual_header_encoding: str
+    :param textual_header_encoding: The encoding of the textual header.
+        Either 'EBCDIC', 'ASCII' or None.
+    :type persist: bool or str
+    :param persist: If True, the index is saved next to the file with an
+        ``.index.npz`` suffix (or to the given filename) and reused by later
+        calls as long as the file has not been changed and the persisted
+        index contains all requested keys.
+    :rtype: :class:`SEGYTraceIndex`
+    """
+    return _index(filename, keys, persist, endian=endian,
+                  textual_header_encoding=textual_header_encoding, su=False)
+
+
+def index_su(filename, keys, endian=None, persist=False):
+    """
+    Builds an index over the given trace header keys of a Seismic Unix file.
+
+    See :func:`index_segy` for the parameters.
+
+    :rtype: :class:`SEGYTraceIndex`
+    """
+    return _index(filename, keys, persist, endian=endian, su=True)
+
+
 def autodetect_endian_and_sanity_check_su(file):
     """
     Takes an open file and tries to determine the endianness of a Seismic
@@ -9,6 +9,9 @@
 #include <stdio.h>
 
 
+void ibm2ieee_bulk(unsigned int *data, long long len, int swap);
+
+
 /* Converts an array of 32 bit IBM floating point numbers to IEEE
  * floating point numbers.
  *
@@ -20,20 +23,131 @@
  */
 
 void ibm2ieee(float *ibm, int len) {
-    int i = 0;
-    for (i=0; i<len; i++) {
-	/* This very condensed statement was created in an attempt to make it
-	 * work with OpenMP but that still seems to suffer from some problems.
-	 * See the comment below for a cleaner version.
-	 */
-	ibm[i] = (((( (*(int*)&ibm[i]) >> 31) & 0x01) * (-2)) + 1) *
-	         ((float)((*(int*)&ibm[i]) & 0x00ffffff) / 0x1000000) *
-		 ((float)pow(16, (( (*(int*)&ibm[i]) >> 24) & 0x7f) - 64));
+    ibm2ieee_bulk((unsigned int *)ibm, (long long)len, 0);
+    return;
+}
+
+
+/* Swaps the byte order of a 32 bit word. */
+static unsigned int swap4(unsigned int x) {
+    return ((x >> 24) & 0x000000ff) | ((x >> 8) & 0x0000ff00) |
+           ((x << 8) & 0x00ff0000) | ((x << 24) & 0xff000000);
+}
+
+
+/* Converts a single IBM floating point number to the bits of the IEEE
+ * single precision floating point number.
+ *
+ * The 24 bit fraction is exactly representable as a float, scaling it by
+ * a power of two with ldexp() is exact in double precision so the only
+ * rounding happens in the final cast which also takes care of IEEE
+ * subnormal numbers, underflows and overflows.
+ */
+static unsigned int ibm_to_ieee_bits(unsigned int ibm) {
+    union {float f; unsigned int i;} out;
+    unsigned int fraction = ibm & 0x00ffffff;
+    int exponent = (int)((ibm >> 24) & 0x7f);
+    if (fraction == 0) {
+        out.i = ibm & 0x80000000;
+        return out.i;
+    }
+    out.f = (float)ldexp((double)fraction, 4 * (exponent - 64) - 24);
+    out.i |= ibm & 0x80000000;
+    return out.i;
+}
+
+
+/* Converts the bits of an IEEE single precision floating point number to
+ * an IBM floating point number.
+ *
+ * Works directly on the bits without any floating point operations. The
+ * fraction is truncated to fit the hexadecimal exponent. Zeros of either
+ * sign and NaNs are converted to zero, infinities to the largest IBM
+ * number of the same sign.
+ */
+static unsigned int ieee_to_ibm_bits(unsigned int ieee) {
+    unsigned int sign = ieee & 0x80000000;
+    int exponent = (int)((ieee >> 23) & 0xff);
+    unsigned int fraction = ieee & 0x007fffff;
+    int shift;
+    if (exponent == 255) {
+        if (fraction) {
+            return 0;
+        }
+        return sign | 0x7fffffff;
+    }
+    if (exponent == 0) {
+        if (fraction == 0) {
+            return 0;
+        }
+        /* Subnormal number: value = fraction * 2^-149. Normalize it. */
+        exponent = 1;
+        while (!(fraction & 0x00800000)) {
+            fraction <<= 1;
+            exponent -= 1;
+        }
+    }
+    else {
+        fraction |= 0x00800000;
+    }
+    /* value = (fraction / 2^24) * 2^(exponent - 126) */
+    exponent -= 126;
+    /* Round the binary exponent up to the next multiple of four. */
+    shift = (4 - (exponent & 3)) & 3;
+    exponent = (exponent + shift) / 4;
+    fraction >>= shift;
+    return sign | ((unsigned int)(exponent + 64) << 24) | fraction;
+}
+
+
+/* Converts an array of 32 bit IBM floating point numbers to IEEE single
+ * precision floating point numbers inplace.
+ *
+ * Parameters:
+ *	data: Array of 32 bit IBM floating point numbers.
+ *	len: Number of samples in the array.
+ *	swap: If not zero, the input is byte swapped.
+ */
+void ibm2ieee_bulk(unsigned int *data, long long len, int swap) {
+    long long i;
+    if (swap) {
+        for (i=0; i<len; i++) {
+            data[i] = ibm_to_ieee_bits(swap4(data[i]));
+        }
+    }
+    else {
+        for (i=0; i<len; i++) {
+            data[i] = ibm_to_ieee_bits(data[i]);
+        }
+    }
+    return;
+}
+
+
+/* Converts an array of IEEE single precision floating point numbers to 32
+ * bit IBM floating point numbers inplace.
+ *
+ * Parameters:
+ *	data: Array of IEEE single precision floating point numbers.
+ *	len: Number of samples in the array.
+ *	swap: If not zero, the output is byte swapped.
+ */
+void ieee2ibm_bulk(unsigned int *data, long long len, int swap) {
+    long long i;
+    if (swap) {
+        for (i=0; i<len; i++) {
+            data[i] = swap4(ieee_to_ibm_bits(data[i]));
+        }
+    }
+    else {
+        for (i=0; i<len; i++) {
+            data[i] = ieee_to_ibm_bits(data[i]);
+        }
     }
     return;
 }
 
-/* Easier to read version of the above code. */
+/* Old version of the conversion using pow(). */
 
 //void ibm2ieee(float *ibm, int len) {
 //    int sign = 0;
@@ -17,9 +17,14 @@ import obspy
 from obspy.core.util import NamedTemporaryFile
 from obspy.io.segy.header import (DATA_SAMPLE_FORMAT_PACK_FUNCTIONS,
                                   DATA_SAMPLE_FORMAT_UNPACK_FUNCTIONS)
-from obspy.io.segy.segy import (SEGYBinaryFileHeader, SEGYFile,
-                                SEGYTraceHeader, _read_segy, iread_segy)
+from obspy.io.segy.pack import ieee2ibm
+from obspy.io.segy.segy import (SEGYBinaryFileHeader, SEGYError, SEGYFile,
+                                SEGYTraceHeader, SEGYTraceIndex,
+                                SEGYTraceReadingError, _read_segy, _read_su,
+                                index_segy, index_su, iread_segy, iread_su,
+                                memmap_segy, memmap_su)
 from obspy.io.segy.tests.header import DTYPES, FILES
+from obspy.io.segy.unpack import ibm2ieee
 
 
 class SEGYTestCase(unittest.TestCase):
@@ -264,6 +269,78 @@ class SEGYTestCase(unittest.TestCase):
             # Test both.
             np.testing.assert_array_equal(new_data, data)
 
+    def test_bulk_ibm_float_conversion(self):
+        """
+        Tests the bulk IBM floating point conversion against a double
+        precision reference over the whole range of IBM floats.
+        """
+        np.random.seed(815)
+        ibm = np.random.randint(0, 2 ** 32, 100000, dtype=np.uint64).astype(
+            np.uint32)
+        # Normalize the fractions and include zeros.
+        ibm[ibm & 0x00f00000 == 0] |= 0x00100000
+        ibm[::1000] = 0
+        sign = np.where(ibm >> 31, -1.0, 1.0)
+        exponent = ((ibm >> 24) & 0x7f).astype(np.float64)
+        fraction = (ibm & 0x00ffffff).astype(np.float64) / 0x1000000
+        with np.errstate(over='ignore'):
+            expected = np.require(sign * fraction * 16.0 ** (exponent - 64),
+                                  np.float32)
+        for endian in ('<', '>'):
+            data = ibm.astype(np.dtype(np.uint32).newbyteorder(endian))
+            np.testing.assert_array_equal(ibm2ieee(data), expected)
+            # Inplace for all 2-D blocks.
+            block = data.reshape(100, 1000).copy()
+            result = ibm2ieee(block, inplace=True, threads=3)
+            np.testing.assert_array_equal(result, expected.reshape(100, 1000))
+            self.assertTrue(np.may_share_memory(result, block))
+
+        # All IBM floats that are normal IEEE floats survive a round trip.
+        normal = (np.abs(expected) > np.finfo(np.float32).tiny) & \
+            np.isfinite(expected)
+        for endian in ('<', '>'):
+            packed = ieee2ibm(expected[normal], endian=endian)
+            self.assertEqual(packed.dtype.byteorder in ('=', '|'),
+                             endian == ('<' if np.little_endian else '>'))
+            np.testing.assert_array_equal(packed, ibm[normal])
+
+    def test_bulk_ieee_float_conversion(self):
+        """
+        Round trip of random IEEE floats including special values.
+        """
+        np.random.seed(1234)
+        data = np.random.randint(0, 2 ** 32, 100000, dtype=np.uint64).astype(
+            np.uint32).view(np.float32)
+        data = data[np.isfinite(data)]
+        packed = ieee2ibm(data)
+        self.assertEqual(packed.dtype, np.dtype('>u4'))
+        new_data = ibm2ieee(packed)
+        # At most three bits of the fraction are lost.
+        np.testing.assert_allclose(new_data, data, rtol=2.0 ** -20)
+        self.assertTrue(np.all(np.abs(new_data) <= np.abs(data)))
+        # Special values.
+        data = np.array([0.0, -0.0, np.nan, np.inf, -np.inf, 1e-45,
+                         -16.0 ** -30, 1e300, 16.0 ** 20], dtype=np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            packed = ieee2ibm(data, endian='>')
+        self.assertEqual(
+            [int(_i) for _i in packed],
+            [0, 0, 0, 0x7fffffff, 0xffffffff, 0x1b800000, 0xa3100000,
+             0x7fffffff, 0x55100000])
+        # Inplace and threaded conversion of 2-D blocks.
+        data = np.require(np.random.randn(300, 1000), np.float32)
+        expected = ieee2ibm(data, endian='<')
+        block = data.copy()
+        packed = ieee2ibm(block, endian='<', inplace=True, threads=4)
+        self.assertEqual(packed.shape, (300, 1000))
+        self.assertTrue(np.may_share_memory(packed, block))
+        np.testing.assert_array_equal(packed, expected)
+        self.assertRaises(ValueError, ieee2ibm, data.astype(np.float64),
+                          inplace=True)
+        self.assertRaises(ValueError, ibm2ieee, expected[:, ::2],
+                          inplace=True)
+
     def test_read_and_write_binary_file_header(self):
         """
         Reading and writing should not change the binary file header.
@@ -597,6 +674,77 @@ class SEGYTestCase(unittest.TestCase):
 
         self.assertEqual(st.traces, ist)
 
+    def test_iterative_reading_with_prefetch(self):
+        """
+        Prefetching yields the same traces, also for open files, and
+        propagates errors.
+        """
+        with NamedTemporaryFile() as tf:
+            st = self._write_gather_file(tf.name)
+            expected = list(iread_segy(tf.name))
+            for prefetch in (1, 3, 20):
+                traces = list(iread_segy(tf.name, prefetch=prefetch))
+                self.assertEqual(len(traces), 12)
+                for tr, tr_expected in zip(traces, expected):
+                    np.testing.assert_array_equal(tr.data, tr_expected.data)
+                    self.assertEqual(
+                        tr.stats.segy.trace_header.ensemble_number,
+                        tr_expected.stats.segy.trace_header.ensemble_number)
+            with open(tf.name, 'rb') as fh:
+                traces = list(iread_segy(fh, prefetch=2))
+            np.testing.assert_array_equal(traces[-1].data, st[-1].data)
+            # Stopping early stops the background thread.
+            for _i, tr in enumerate(iread_segy(tf.name, prefetch=1)):
+                if _i == 2:
+                    break
+            # Truncated file.
+            with open(tf.name, 'rb') as fh:
+                data = fh.read()
+        with NamedTemporaryFile() as tf:
+            tf.write(data[:-10])
+            tf.flush()
+            it = iread_segy(tf.name, prefetch=4)
+            self.assertRaises(SEGYTraceReadingError, list, it)
+
+    def test_iterative_reading_in_batches(self):
+        """
+        Batches contain consecutive traces of the same length.
+        """
+        with NamedTemporaryFile() as tf:
+            # The lengths of the traces are 10, 10, 10, 11, 11, 11, ...
+            st = obspy.Stream()
+            for _i in range(12):
+                tr = obspy.Trace(
+                    data=np.arange(10 + _i // 3, dtype=np.float32) * _i,
+                    header={"sampling_rate": 1000.0})
+                st.append(tr)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                st.write(tf.name, format="SEGY", data_encoding=1)
+            for prefetch in (0, 2):
+                batches = list(iread_segy(tf.name, batch_size=2,
+                                          prefetch=prefetch))
+                self.assertEqual([data.shape for _, data in batches],
+                                 [(2, 10), (1, 10), (2, 11), (1, 11),
+                                  (2, 12), (1, 12), (2, 13), (1, 13)])
+                np.testing.assert_array_equal(
+                    np.concatenate([headers['number_of_samples_in_this_trace']
+                                    for headers, _ in batches]),
+                    [len(tr.data) for tr in st])
+                for tr, row in zip(st, [row for _, data in batches
+                                        for row in data]):
+                    np.testing.assert_array_equal(row, tr.data)
+                    self.assertEqual(row.dtype, np.float32)
+            st.write(tf.name, format="SU", byteorder="<")
+            batches = list(iread_su(tf.name, endian="<", batch_size=100))
+            self.assertEqual(len(batches), 4)
+            headers, data = batches[0]
+            self.assertEqual(data.shape, (3, 10))
+            np.testing.assert_array_equal(
+                headers['number_of_samples_in_this_trace'], [10, 10, 10])
+            self.assertRaises(ValueError, list,
+                              iread_su(tf.name, endian="<", batch_size=0))
+
     def test_revision_number_in_binary_file_header(self):
         """
         It is a bit awkward but it is encoded in a 16 bit number with the
@@ -619,6 +767,215 @@ class SEGYTestCase(unittest.TestCase):
             else:
                 self.assertEqual(data[3200:3600][-100:-98], b"\x01\x00")
 
+    def test_memmap_segy(self):
+        """
+        Memory mapped files return the same headers and data as the normal
+        reading routines, for IBM and non-IBM encodings.
+        """
+        for file, attribs in self.files.items():
+            filename = os.path.join(self.path, file)
+            # Write a file with several traces.
+            segy = _read_segy(filename, endian=attribs['endian'])
+            segy.traces = [
+                _read_segy(filename, endian=attribs['endian']).traces[0]
+                for _i in range(3)]
+            for _i, tr in enumerate(segy.traces):
+                tr.header.trace_sequence_number_within_line = _i + 1
+            with NamedTemporaryFile() as tf:
+                segy.write(tf.name)
+                expected = _read_segy(tf.name, endian=attribs['endian'])
+                mm = memmap_segy(tf.name, endian=attribs['endian'])
+                self.assertEqual(len(mm), 3)
+                self.assertEqual(mm.data_encoding,
+                                 attribs['data_sample_enc'])
+                self.assertEqual(mm.raw_data.shape,
+                                 (3, len(expected.traces[0].data)))
+                np.testing.assert_array_equal(
+                    mm.trace_headers['trace_sequence_number_within_line'],
+                    [1, 2, 3])
+                for _i, tr in enumerate(expected.traces):
+                    np.testing.assert_array_equal(mm[_i], tr.data)
+                    self.assertEqual(mm[_i].dtype, tr.data.dtype)
+                    self.assertEqual(
+                        mm.trace_headers[_i].tobytes(),
+                        tr.header.unpacked_header)
+                np.testing.assert_array_equal(
+                    mm[1:], np.array([tr.data for tr in expected.traces[1:]]))
+                tr = mm.to_obspy_trace(2)
+                expected_tr = expected.traces[2].to_obspy_trace()
+                self.assertEqual(tr.stats._format, "SEGY")
+                self.assertEqual(tr.stats.starttime,
+                                 expected_tr.stats.starttime)
+                for key in ('trace_sequence_number_within_line',
+                            'number_of_samples_in_this_trace'):
+                    self.assertEqual(tr.stats.segy.trace_header[key],
+                                     expected_tr.stats.segy.trace_header[key])
+                np.testing.assert_array_equal(tr.data, expected_tr.data)
+                del mm
+
+    def test_memmap_segy_in_place(self):
+        """
+        Trace headers can be changed in place.
+        """
+        filename = os.path.join(self.path, '1.sgy_first_trace')
+        with NamedTemporaryFile() as tf:
+            with open(filename, 'rb') as fh:
+                tf.write(fh.read())
+            tf.flush()
+            mm = memmap_segy(tf.name, mode='r+')
+            mm.trace_headers['source_coordinate_x'] = 1234
+            mm._memmap.flush()
+            del mm
+            segy = _read_segy(tf.name)
+        self.assertEqual(segy.traces[0].header.source_coordinate_x, 1234)
+
+    def test_memmap_unsupported_data_encoding(self):
+        """
+        Files with 4 byte fixed point samples can not be memory mapped.
+        """
+        filename = os.path.join(self.path, '1.sgy_first_trace')
+        with open(filename, 'rb') as fh:
+            data = bytearray(fh.read())
+        # Big endian data sample format code in the binary file header.
+        data[3224:3226] = b'\x00\x04'
+        with NamedTemporaryFile() as tf:
+            tf.write(bytes(data))
+            tf.flush()
+            with self.assertRaises(SEGYError) as e:
+                memmap_segy(tf.name)
+        self.assertEqual(str(e.exception),
+                         'Data sample format code 4 is not supported.')
+
+    def test_memmap_variable_trace_length(self):
+        """
+        Files with traces of different lengths can not be memory mapped.
+        """
+        tr = obspy.read()[0]
+        tr.data = np.require(tr.data, dtype=np.float32)
+        st = obspy.Stream([tr, tr.copy()])
+        st[1].data = st[1].data[:1000]
+        with NamedTemporaryFile() as tf:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                st.write(tf.name, format="SEGY")
+                self.assertRaises(SEGYError, memmap_segy, tf.name)
+            st[1].data = st[0].data[:1000]
+            st.write(tf.name, format="SU", byteorder="<")
+            self.assertRaises(SEGYError, memmap_su, tf.name, endian="<")
+            st[1].data = st[0].data
+            st.write(tf.name, format="SU", byteorder="<")
+            mm = memmap_su(tf.name, endian="<")
+            self.assertEqual(len(mm), 2)
+            np.testing.assert_array_equal(
+                mm[:], [tr.data for tr in
+                        _read_su(tf.name, endian="<").traces])
+            del mm
+
+    def _write_gather_file(self, filename, format="SEGY"):
+        """
+        Writes a file with 12 traces of varying length and CDP and offset
+        headers.
+        """
+        st = obspy.Stream()
+        for _i in range(12):
+            tr = obspy.Trace(data=np.arange(10 + _i, dtype=np.float32),
+                             header={"sampling_rate": 1000.0})
+            tr.stats[format.lower()] = obspy.core.AttribDict()
+            header = SEGYTraceHeader()
+            header.trace_sequence_number_within_line = _i + 1
+            header.ensemble_number = _i % 3
+            header.distance_from_center_of_the_source_point_to_the_center_of_the_receiver_group = 100 * (12 - _i)  # NOQA
+            tr.stats[format.lower()].trace_header = header
+            st.append(tr)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            st.write(filename, format=format, byteorder="<")
+        return st
+
+    def test_trace_index(self):
+        """
+        Selecting and sorting traces by indexed header values.
+        """
+        offset = 'distance_from_center_of_the_source_point_to_the_center_' \
+            'of_the_receiver_group'
+        with NamedTemporaryFile() as tf:
+            st = self._write_gather_file(tf.name)
+            index = index_segy(tf.name, ['ensemble_number', offset])
+            self.assertEqual(len(index), 12)
+            np.testing.assert_array_equal(index.npts, np.arange(10, 22))
+            np.testing.assert_array_equal(
+                index.select(ensemble_number=1), [1, 4, 7, 10])
+            np.testing.assert_array_equal(
+                index.select(ensemble_number=[0, 2], sort_by=offset),
+                [11, 9, 8, 6, 5, 3, 2, 0])
+            np.testing.assert_array_equal(
+                index.select(**{offset: (None, 300)}), [9, 10, 11])
+            np.testing.assert_array_equal(
+                index.select(ensemble_number=2, **{offset: (200, 900)}),
+                [5, 8])
+            np.testing.assert_array_equal(
+                index.select(sort_by=['ensemble_number', offset])[:4],
+                [9, 6, 3, 0])
+            self.assertRaises(ValueError, index.select, cdp=1)
+            self.assertRaises(ValueError, index_segy, tf.name, ['cdp'])
+
+            # Gathers read only the selected traces.
+            gather = index.gather(ensemble_number=1, sort_by=offset)
+            self.assertEqual(len(gather), 4)
+            for tr, expected in zip(gather, st[10::-3]):
+                np.testing.assert_array_equal(tr.data, expected.data)
+                self.assertEqual(tr.stats._format, "SEGY")
+                self.assertEqual(tr.stats.segy.trace_header.ensemble_number,
+                                 1)
+            # Sorted iteration over all traces is the same as reading the
+            # file and sorting it.
+            traces = list(index.iter_traces(sort_by=offset))
+            self.assertEqual(
+                [tr.stats.segy.trace_header[offset] for tr in traces],
+                list(range(100, 1300, 100)))
+            np.testing.assert_array_equal(traces[0].data, st[-1].data)
+
+    def test_trace_index_persistence(self):
+        """
+        Persisted indices are reused as long as the file has not been
+        changed.
+        """
+        with NamedTemporaryFile() as tf:
+            self._write_gather_file(tf.name, format="SU")
+            index_filename = tf.name + '.index.npz'
+            try:
+                index = index_su(tf.name, 'ensemble_number', endian="<",
+                                 persist=True)
+                self.assertTrue(os.path.exists(index_filename))
+                loaded = SEGYTraceIndex.load(tf.name)
+                self.assertEqual(loaded.keys, ['ensemble_number'])
+                self.assertEqual(loaded.endian, '<')
+                self.assertTrue(loaded.su)
+                np.testing.assert_array_equal(loaded.headers, index.headers)
+                np.testing.assert_array_equal(loaded.offsets, index.offsets)
+                st = loaded.gather(ensemble_number=0)
+                self.assertEqual(len(st), 4)
+                self.assertEqual(st[0].stats._format, "SU")
+                # Reused if the file did not change, rebuilt otherwise.
+                os.utime(index_filename, (0, 0))
+                index_su(tf.name, 'ensemble_number', endian="<",
+                         persist=True)
+                self.assertEqual(os.path.getmtime(index_filename), 0)
+                os.utime(tf.name, (index._mtime + 10, index._mtime + 10))
+                index_su(tf.name, 'ensemble_number', endian="<",
+                         persist=True)
+                self.assertNotEqual(os.path.getmtime(index_filename), 0)
+                # Rebuilt if keys are missing.
+                index = index_su(
+                    tf.name, ['ensemble_number',
+                              'trace_sequence_number_within_line'],
+                    endian="<", persist=True)
+                self.assertEqual(SEGYTraceIndex.load(tf.name).keys,
+                                 index.keys)
+            finally:
+                if os.path.exists(index_filename):
+                    os.remove(index_filename)
+
 
 def rms(x, y):
     """
@@ -23,7 +23,7 @@ import warnings
 
 import numpy as np
 
-from .util import clibsegy
+from .util import _convert_inplace, clibsegy
 
 
 # Get the system byte order.
@@ -46,14 +46,55 @@ def unpack_4byte_ibm(file, count, endian='>'):
     Unpacks 4 byte IBM floating points.
     """
     # Read as 4 byte integer so bit shifting works.
-    data = np.fromstring(file.read(count * 4), dtype=np.float32)
-    # Swap the byte order if necessary.
-    if BYTEORDER != endian:
-        data = data.byteswap()
-    length = len(data)
-    # Call the C code which transforms the data inplace.
-    clibsegy.ibm2ieee(data, length)
-    return data
+    data = np.fromstring(file.read(count * 4), dtype=np.uint32)
+    # Call the C code which swaps the byte order if necessary and transforms
+    # the data inplace.
+    clibsegy.ibm2ieee_bulk(data, len(data), int(BYTEORDER != endian))
+    return data.view(np.float32)
+
+
+def ibm2ieee(data, inplace=False, threads=None):
+    """
+    Converts an array of raw 4 byte IBM floating point values to IEEE single
+    precision floating points.
+
+    >>> data = np.array([0x42640000, 0xc1180000], dtype='>u4')
+    >>> print(ibm2ieee(data))
+    [100.   -1.5]
+
+    :type data: :class:`numpy.ndarray`
+    :param data: Array of any shape with the raw IBM values as 4 byte
+        values in any byte order, e.g. a slice of a memory map.
+    :type inplace: bool
+    :param inplace: Convert the data inplace instead of returning a
+        converted copy. Requires a writeable, C contiguous array. The
+        converted values are returned as a float32 view of the same memory.
+    :type threads: int
+    :param threads: If larger than one, large arrays are converted in
+        parallel using the given number of threads.
+    :rtype: :class:`numpy.ndarray`
+    :return: Native float32 array with the same shape.
+    """
+    if data.dtype.itemsize != 4:
+        msg = 'IBM floating points must be given as 4 byte values.'
+        raise ValueError(msg)
+    # Interpret the values as unsigned integers in their byte order.
+    raw = data.view(np.dtype(native_str('u4')).newbyteorder(
+        data.dtype.byteorder))
+    if inplace:
+        if not data.flags.c_contiguous or not data.flags.writeable:
+            msg = 'Inplace conversion requires a writeable, C contiguous ' \
+                'array.'
+            raise ValueError(msg)
+        swap = not raw.dtype.isnative
+        out = raw.view(native_str('=u4'))
+    else:
+        # A single C contiguous copy in native byte order is the output.
+        swap = False
+        out = np.array(raw, dtype=native_str('=u4'), order='C')
+    _convert_inplace(clibsegy.ibm2ieee_bulk, out.reshape(-1), swap,
+                     threads=threads)
+    return out.view(np.float32)
 
 
 # Old pure Python/NumPy code
@@ -3,14 +3,52 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
 
+import ctypes as C
+from multiprocessing.pool import ThreadPool
 from struct import unpack
 
+import numpy as np
+from future.utils import native_str
+
 from obspy.core.util.libnames import _load_cdll
 
 
 # Import shared libsegy
 clibsegy = _load_cdll("segy")
 
+for _func in (clibsegy.ibm2ieee_bulk, clibsegy.ieee2ibm_bulk):
+    _func.argtypes = [
+        np.ctypeslib.ndpointer(dtype=np.uint32, ndim=1,
+                               flags=native_str('C_CONTIGUOUS')),
+        C.c_longlong, C.c_int]
+    _func.restype = C.c_void_p
+
+# Arrays with less samples per thread are not split any further.
+_MIN_SAMPLES_PER_THREAD = 65536
+
+
+def _convert_inplace(func, data, swap, threads=None):
+    """
+    Calls one of the inplace bulk IBM floating point conversion routines of
+    libsegy on a flat, C contiguous uint32 array.
+
+    The ctypes call releases the GIL so with ``threads`` larger than one,
+    the array is split into equally sized parts that are converted in
+    parallel.
+    """
+    if threads is not None and threads > 1:
+        threads = min(threads, len(data) // _MIN_SAMPLES_PER_THREAD)
+    if threads is None or threads <= 1:
+        func(data, len(data), swap)
+        return
+    pool = ThreadPool(threads)
+    try:
+        pool.map(lambda chunk: func(chunk, len(chunk), swap),
+                 np.array_split(data, threads))
+    finally:
+        pool.close()
+        pool.join()
+
 
 def unpack_header_value(endian, packed_value, length, special_format):
     """
@@ -15,6 +15,8 @@ from future.utils import native_str
 
 import io
 import os
+import re
+import warnings
 
 import numpy as np
 
@@ -23,6 +25,9 @@ from obspy.core import Stats
 from obspy.core.util import loadtxt
 
 
+# number of samples formatted at once when writing ASCII files
+BLOCK_SIZE = 60000
+
 MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP',
           'OCT', 'NOV', 'DEC']
 
@@ -130,38 +135,34 @@ def _read_asc(filename, headonly=False, skip=0, delta=None, length=None,
     .TEST..BHE | 2009-10-01T12:46:01.000000Z - ... | 20.0 Hz, 801 samples
     .WET..HHZ  | 2010-01-01T01:01:05.999000Z - ... | 100.0 Hz, 4001 samples
     """
-    fh = open(filename, 'rt')
-    # read file and split text into channels
+    with open(filename, 'rt') as fh:
+        text = fh.read()
+    if skip:
+        text = text.split('\n', skip)[-1] if text.count('\n') >= skip \
+            else ''
+    # split text into channels, a channel ends with a blank line
     channels = []
-    headers = {}
-    data = io.StringIO()
-    for line in fh.readlines()[skip:]:
-        if line.isspace():
-            # blank line
-            # check if any data fetched yet
-            if len(headers) == 0 and data.tell() == 0:
-                continue
-            # append current channel
-            data.seek(0)
-            channels.append((headers, data))
-            # create new channel
-            headers = {}
-            data = io.StringIO()
-            if skip:
-                # if skip is set only one trace is read, everything else makes
-                # no sense.
-                break
-            continue
-        elif line[0].isalpha():
-            # header entry
+    pos = 0
+    for blank in re.finditer(r'^[^\S\n]*\n', text, re.MULTILINE):
+        chunk = text[pos:blank.start()]
+        pos = blank.end()
+        # header entries start with a letter
+        headers = {}
+        for line in re.findall(r'^[^\W\d_].*$', chunk, re.MULTILINE):
             key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            headers[key] = value
-        elif not headonly:
-            # data entry - may be written in multiple columns
-            data.write(line.strip() + ' ')
-    fh.close()
+            headers[key.strip()] = value.strip()
+        if headonly:
+            data = ''
+        else:
+            # data entries - may be written in multiple columns
+            data = re.sub(r'^[^\W\d_].*$', '', chunk, flags=re.MULTILINE)
+        if len(headers) == 0 and not data.strip():
+            continue
+        channels.append((headers, data))
+        if skip:
+            # if skip is set only one trace is read, everything else makes
+            # no sense.
+            break
     # create ObsPy stream object
     stream = Stream()
     # custom header
@@ -211,7 +212,7 @@ def _read_asc(filename, headonly=False, skip=0, delta=None, length=None,
             stream.append(Trace(header=header))
         else:
             # read data
-            data = loadtxt(data, dtype=np.float32, ndmin=1)
+            data = _parse_data(data, headers.get('LENGTH'))
 
             # cut data if requested
             if skip and length:
@@ -254,47 +255,57 @@ def _write_asc(stream, filename, included_headers=None, npl=4,
     if included_headers is None:
         included_headers = STANDARD_ASC_HEADERS
 
-    sio = io.StringIO()
-    for trace in stream:
-        # write headers
-        sio.write("DELTA: %-.6e\n" % (trace.stats.delta))
-        sio.write("LENGTH: %d\n" % trace.stats.npts)
-        # additional headers
-        for key, value in trace.stats.get('sh', {}).items():
-            if included_headers and key not in included_headers:
-                continue
-            sio.write("%s: %s\n" % (key, value))
-        # special format for start time
-        if "START" in included_headers:
-            dt = trace.stats.starttime
-            sio.write("START: %s\n" % from_utcdatetime(dt))
-        # component must be split
-        if len(trace.stats.channel) > 2 and "COMP" in included_headers:
-            sio.write("COMP: %c\n" % trace.stats.channel[2])
-        if len(trace.stats.channel) > 0 and "CHAN1" in included_headers:
-            sio.write("CHAN1: %c\n" % trace.stats.channel[0])
-        if len(trace.stats.channel) > 1 and "CHAN2" in included_headers:
-            sio.write("CHAN2: %c\n" % trace.stats.channel[1])
-        if "STATION" in included_headers:
-            sio.write("STATION: %s\n" % trace.stats.station)
-        if "CALIB" in included_headers:
-            sio.write("CALIB: %-.6e\n" % (trace.stats.calib))
-        # write data in npl columns
-        mask = ([''] * (npl - 1)) + ['\n']
-        delimiter = mask * ((trace.stats.npts // npl) + 1)
-        delimiter = delimiter[:trace.stats.npts - 1]
-        delimiter.append('\n')
-        for (sample, delim) in zip(trace.data, delimiter):
-            value = custom_format % (sample)
-            sio.write("%s %s" % (value, delim))
-        sio.write("\n")
     if append:
         mode = 'ab'
     else:
         mode = 'wb'
     with open(filename, mode=mode) as fh:
-        sio.seek(0)
-        fh.write(sio.read().encode('ascii', 'strict'))
+        for trace in stream:
+            _write_asc_trace(trace, fh, included_headers, npl, custom_format)
+
+
+def _write_asc_trace(trace, fh, included_headers, npl, custom_format):
+    """
+    Writes a single trace to a Seismic Handler ASCII file.
+
+    Samples are formatted in blocks of rows of ``npl`` columns.
+    """
+    sio = io.StringIO()
+    # write headers
+    sio.write("DELTA: %-.6e\n" % (trace.stats.delta))
+    sio.write("LENGTH: %d\n" % trace.stats.npts)
+    # additional headers
+    for key, value in trace.stats.get('sh', {}).items():
+        if included_headers and key not in included_headers:
+            continue
+        sio.write("%s: %s\n" % (key, value))
+    # special format for start time
+    if "START" in included_headers:
+        dt = trace.stats.starttime
+        sio.write("START: %s\n" % from_utcdatetime(dt))
+    # component must be split
+    if len(trace.stats.channel) > 2 and "COMP" in included_headers:
+        sio.write("COMP: %c\n" % trace.stats.channel[2])
+    if len(trace.stats.channel) > 0 and "CHAN1" in included_headers:
+        sio.write("CHAN1: %c\n" % trace.stats.channel[0])
+    if len(trace.stats.channel) > 1 and "CHAN2" in included_headers:
+        sio.write("CHAN2: %c\n" % trace.stats.channel[1])
+    if "STATION" in included_headers:
+        sio.write("STATION: %s\n" % trace.stats.station)
+    if "CALIB" in included_headers:
+        sio.write("CALIB: %-.6e\n" % (trace.stats.calib))
+    fh.write(sio.getvalue().encode('ascii', 'strict'))
+    # write data in npl columns, formatting blocks of full rows at once
+    value = custom_format + ' '
+    block_size = max(BLOCK_SIZE // npl, 1) * npl
+    for i in range(0, trace.stats.npts, block_size):
+        data = trace.data[i:i + block_size].tolist()
+        rows, rest = divmod(len(data), npl)
+        lines = (value * npl + '\n') * rows
+        if rest:
+            lines += value * rest + '\n'
+        fh.write((lines % tuple(data)).encode('ascii', 'strict'))
+    fh.write(b"\n")
 
 
 def _is_q(filename):
@@ -581,6 +592,34 @@ def _write_q(stream, filename, data_directory=None, byteorder='=',
     fh_data.close()
 
 
+def _parse_data(data, length=None):
+    """
+    Reads whitespace separated samples to a NumPy array.
+
+    All values are parsed at once. If the number of values does not match
+    the given length, e.g. because of invalid values, the data is parsed
+    again with :func:`numpy.loadtxt`.
+
+    :type data: str
+    :param data: The actual data.
+    :type length: str, optional
+    :param length: Value of the LENGTH header entry.
+    """
+    # Avoid to send empty strings to numpy.loadtxt() which raises a
+    # warning.
+    if not data.strip():
+        return np.array([], dtype=np.float32)
+    if length is not None:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            values = np.fromstring(data, dtype=np.float32, sep=' ')
+        if str(len(values)) == length:
+            return values
+    # join all lines, data may be written in multiple columns
+    data = ' '.join(line.strip() for line in data.splitlines())
+    return loadtxt(io.StringIO(data), dtype=np.float32, ndmin=1)
+
+
 def to_utcdatetime(value):
     """
     Converts time string used within Seismic Handler into a UTCDateTime.
@@ -9,7 +9,8 @@ import warnings
 
 import numpy as np
 
-from obspy import Trace, UTCDateTime, read
+from obspy import Stream, Trace, UTCDateTime, read
+from obspy.core.compatibility import mock
 from obspy.core.util import NamedTemporaryFile
 from obspy.io.sh.core import (STANDARD_ASC_HEADERS, _is_asc, _is_q, _read_asc,
                               _read_q, _write_asc, _write_q)
@@ -301,6 +302,50 @@ class CoreTestCase(unittest.TestCase):
         self.assertEqual(len(tr.stats.sh.COMMENT), len(tr2.stats.sh.COMMENT))
         self.assertEqual(tr.stats.sh.COMMENT, tr2.stats.sh.COMMENT)
 
+    def test_write_and_read_asc_in_blocks(self):
+        """
+        Samples are formatted in blocks when writing, check all block
+        boundaries with a reduced block size.
+        """
+        st = Stream([Trace(np.arange(npts, dtype=np.float32) / 3 - 2)
+                     for npts in (0, 1, 7, 8, 9, 25)])
+        for npl in (1, 4, 5):
+            with NamedTemporaryFile() as tf:
+                with mock.patch('obspy.io.sh.core.BLOCK_SIZE', 8):
+                    _write_asc(st, tf.name, npl=npl)
+                with open(tf.name, 'rb') as fh:
+                    expected = fh.read()
+                _write_asc(st, tf.name, npl=npl)
+                with open(tf.name, 'rb') as fh:
+                    self.assertEqual(fh.read(), expected)
+                got = _read_asc(tf.name)
+            self.assertEqual(len(got), len(st))
+            for tr, tr_got in zip(st, got):
+                np.testing.assert_array_almost_equal(tr.data, tr_got.data, 5)
+        # rows of npl values, each trace ends with a blank line
+        lines = expected.decode().splitlines()
+        self.assertEqual(lines[-1], '')
+        self.assertEqual(lines[-2].split(), ['4.666667e+00', '5.000000e+00',
+                                             '5.333333e+00', '5.666667e+00',
+                                             '6.000000e+00'])
+
+    def test_read_asc_with_wrong_length(self):
+        """
+        Data with a number of samples not matching the LENGTH header is
+        read as well.
+        """
+        testfile = os.path.join(self.path, 'data', 'QFILE-TEST-ASC.ASC')
+        expected = _read_asc(testfile)
+        with open(testfile, 'rt') as fh:
+            text = fh.read()
+        with NamedTemporaryFile() as tf:
+            with open(tf.name, 'wt') as fh:
+                fh.write(text.replace('LENGTH: 801', 'LENGTH: 802'))
+            st = _read_asc(tf.name)
+        for tr, tr_expected in zip(st, expected):
+            np.testing.assert_array_equal(tr.data, tr_expected.data)
+            self.assertEqual(tr.stats.npts, tr_expected.stats.npts)
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
@@ -8,10 +8,12 @@ from future.builtins import *  # NOQA
 from future.utils import native_str
 
 import warnings
+from struct import unpack
 
 import numpy as np
 
 from obspy import Stream, Trace, UTCDateTime
+from obspy.core.util.misc import concatenate_ranges
 
 
 def _is_win(filename, century="20"):  # @UnusedVariable
@@ -67,114 +69,146 @@ def _read_win(filename, century="20", **kwargs):  # @UnusedVariable
     :rtype: :class:`~obspy.core.stream.Stream`
     :returns: Stream object containing header and data.
     """
-    output = {}
-    srates = {}
-
-    # read win file
     with open(filename, "rb") as fpin:
-        fpin.seek(0, 2)
-        sz = fpin.tell()
-        fpin.seek(0)
-        leng = 0
-        status0 = 0
-        start = 0
-        while leng < sz:
-            pklen = fpin.read(4)
-            if len(pklen) < 4:
-                break
-            leng = 4
-            truelen = np.fromstring(pklen, native_str('>i'))[0]
-            if truelen == 0:
-                break
-            buff = fpin.read(6)
-            leng += 6
-
-            yy = "%s%02x" % (century, ord(buff[0:1]))
-            mm = "%x" % ord(buff[1:2])
-            dd = "%x" % ord(buff[2:3])
-            hh = "%x" % ord(buff[3:4])
-            mi = "%x" % ord(buff[4:5])
-            sec = "%x" % ord(buff[5:6])
-
-            date = UTCDateTime(int(yy), int(mm), int(dd), int(hh), int(mi),
-                               int(sec))
-            if start == 0:
-                start = date
-            if status0 == 0:
-                sdata = None
-            while leng < truelen:
-                buff = fpin.read(4)
-                leng += 4
-                flag = '%02x' % ord(buff[0:1])
-                chanum = '%02x' % ord(buff[1:2])
-                chanum = "%02s%02s" % (flag, chanum)
-                datawide = int('%x' % (ord(buff[2:3]) >> 4))
-                srate = ord(buff[3:4])
-                xlen = (srate - 1) * datawide
-                if datawide == 0:
-                    xlen = srate // 2
-                    datawide = 0.5
-
-                idata00 = fpin.read(4)
-                leng += 4
-                idata22 = np.fromstring(idata00, native_str('>i'))[0]
-
-                if chanum in output:
-                    output[chanum].append(idata22)
-                else:
-                    output[chanum] = [idata22, ]
-                    srates[chanum] = srate
-                sdata = fpin.read(xlen)
-                leng += xlen
-
-                if len(sdata) < xlen:
-                    fpin.seek(-(xlen - len(sdata)), 1)
-                    sdata += fpin.read(xlen - len(sdata))
-                    msg = "This shouldn't happen, it's weird..."
-                    warnings.warn(msg)
-
-                if datawide == 0.5:
-                    for i in range(xlen):
-                        idata2 = output[chanum][-1] + \
-                            np.fromstring(sdata[i:i + 1], np.int8)[0] >> 4
-                        output[chanum].append(idata2)
-                        idata2 = idata2 +\
-                            (np.fromstring(sdata[i:i + 1],
-                                           np.int8)[0] << 4) >> 4
-                        output[chanum].append(idata2)
-                elif datawide == 1:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            np.fromstring(sdata[i:i + 1], np.int8)[0]
-                        output[chanum].append(idata2)
-                elif datawide == 2:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            np.fromstring(sdata[2 * i:2 * (i + 1)],
-                                          native_str('>h'))[0]
-                        output[chanum].append(idata2)
-                elif datawide == 3:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            np.fromstring(sdata[3 * i:3 * (i + 1)] + b' ',
-                                          native_str('>i'))[0] >> 8
-                        output[chanum].append(idata2)
-                elif datawide == 4:
-                    for i in range((xlen // datawide)):
-                        idata2 = output[chanum][-1] +\
-                            np.fromstring(sdata[4 * i:4 * (i + 1)],
-                                          native_str('>i'))[0]
-                        output[chanum].append(idata2)
-                else:
-                    msg = "DATAWIDE is %s " % datawide + \
-                          "but only values of 0.5, 1, 2, 3 or 4 are supported."
-                    raise NotImplementedError(msg)
+        buff = np.frombuffer(fpin.read(), dtype=np.uint8)
+    blocks, times = _index_win(buff)
+    if not len(blocks):
+        return Stream()
+
+    # Order the channel blocks by channel, in the order of the first
+    # appearance of the channels, and then by time so the samples of each
+    # channel are stored consecutively.
+    _, first, inverse = np.unique(blocks['channel'], return_index=True,
+                                  return_inverse=True)
+    rank = np.argsort(np.argsort(first))[inverse]
+    order = np.argsort(rank, kind='mergesort')
+    blocks = blocks[order]
+    rank = rank[order]
+
+    npts = blocks['sampling_rate'].astype(np.int64)
+    block_starts = np.cumsum(npts) - npts
+    ndiffs = npts - 1
+    # The first sample of every block is stored as an absolute value, all
+    # others as differences to the previous sample.
+    data = np.empty(npts.sum(), dtype=np.int64)
+    data[block_starts] = blocks['first_sample']
+    for width in np.unique(blocks['width']):
+        mask = blocks['width'] == width
+        data[concatenate_ranges(block_starts[mask] + 1, ndiffs[mask])] = \
+            _decode_differences(buff, blocks['offset'][mask], ndiffs[mask],
+                                width)
+    # Cumulative sums restarting at every block.
+    data = np.cumsum(data)
+    data -= np.repeat(data[block_starts] - blocks['first_sample'], npts)
+    data = data.astype(np.int32)
 
     traces = []
-    for i in output.keys():
-        t = Trace(data=np.array(output[i]))
-        t.stats.channel = str(i)
-        t.stats.sampling_rate = float(srates[i])
-        t.stats.starttime = start
+    trace_blocks = np.searchsorted(rank, np.arange(len(first)))
+    trace_ends = np.append(block_starts[trace_blocks[1:]], len(data))
+    for block, end in zip(trace_blocks, trace_ends):
+        t = Trace(data=data[block_starts[block]:end])
+        t.stats.channel = str("%04x" % blocks['channel'][block])
+        t.stats.sampling_rate = float(blocks['sampling_rate'][block])
+        t.stats.starttime = _bcd_to_utcdatetime(
+            times[blocks['second'][block]], century)
         traces.append(t)
     return Stream(traces=traces)
+
+
+def _index_win(buff):
+    """
+    Indexes all second blocks and channel blocks of a WIN file in a single
+    pass over the block headers.
+
+    :type buff: :class:`numpy.ndarray`
+    :param buff: The whole file as an uint8 array.
+    :returns: Structured array with one row per channel block and an array
+        with the six BCD coded time bytes of each second block.
+    """
+    raw = buff.tostring()
+    size = len(raw)
+    channel_blocks = []
+    times = []
+    pos = 0
+    while pos + 10 <= size:
+        block_length = unpack(native_str('>I'), raw[pos:pos + 4])[0]
+        if block_length == 0:
+            break
+        second = len(times)
+        times.append(pos + 4)
+        end = min(pos + block_length, size)
+        cur = pos + 10
+        while cur + 8 <= end:
+            channel, info, first_sample = unpack(native_str('>HHi'),
+                                                 raw[cur:cur + 8])
+            width = info >> 12
+            sampling_rate = info & 0x0fff
+            if width == 0:
+                # Half byte differences.
+                data_length = sampling_rate // 2
+            elif width <= 4:
+                data_length = (sampling_rate - 1) * width
+            else:
+                msg = "DATAWIDE is %s " % width + \
+                      "but only values of 0.5, 1, 2, 3 or 4 are supported."
+                raise NotImplementedError(msg)
+            if cur + 8 + data_length > size:
+                msg = "This shouldn't happen, it's weird..."
+                warnings.warn(msg)
+                break
+            channel_blocks.append((channel, width, sampling_rate,
+                                   first_sample, cur + 8, second))
+            cur += 8 + data_length
+        pos += block_length
+
+    blocks = np.array(channel_blocks, dtype=[
+        (native_str('channel'), np.uint16), (native_str('width'), np.uint8),
+        (native_str('sampling_rate'), np.uint16),
+        (native_str('first_sample'), np.int64),
+        (native_str('offset'), np.int64), (native_str('second'), np.int64)])
+    times = buff[np.add.outer(np.array(times, dtype=np.int64),
+                              np.arange(6))]
+    return blocks, times
+
+
+def _decode_differences(buff, offsets, ndiffs, width):
+    """
+    Decodes the sample differences of all channel blocks with the same data
+    width at once.
+
+    :param buff: The whole file as an uint8 array.
+    :param offsets: Byte offsets of the differences of each channel block.
+    :param ndiffs: Number of differences of each channel block.
+    :param width: Data width code, 0 for half bytes or 1 to 4 bytes.
+    :returns: The concatenated differences of all channel blocks.
+    """
+    if width == 0:
+        # Two differences per byte, the high nibble first. The last nibble
+        # is unused for an odd number of differences.
+        nbytes = (ndiffs + 1) // 2
+        raw = buff[concatenate_ranges(offsets, nbytes)]
+        nibbles = np.empty((len(raw), 2), dtype=np.int8)
+        nibbles[:, 0] = raw.view(np.int8) >> 4
+        nibbles[:, 1] = (raw << 4).view(np.int8) >> 4
+        nibbles = nibbles.ravel()
+        return nibbles[concatenate_ranges(2 * (np.cumsum(nbytes) - nbytes),
+                                          ndiffs)]
+    raw = buff[concatenate_ranges(offsets, ndiffs * width)]
+    if width == 1:
+        return raw.view(np.int8)
+    elif width == 2:
+        return raw.view(native_str('>i2'))
+    elif width == 3:
+        raw = raw.reshape(-1, 3).astype(np.int32)
+        # Sign extend the 24 bit integers.
+        return ((raw[:, 0] << 24) | (raw[:, 1] << 16) | (raw[:, 2] << 8)) >> 8
+    return raw.view(native_str('>i4'))
+
+
+def _bcd_to_utcdatetime(bcd, century="20"):
+    """
+    Converts the six BCD coded bytes (year, month, day, hour, minute,
+    second) of a second block to an UTCDateTime.
+    """
+    yy, mm, dd, hh, mi, sec = [int(x) for x in (bcd >> 4) * 10 + (bcd & 0x0f)]
+    return UTCDateTime(int(century) * 100 + yy, mm, dd, hh, mi, sec)
@@ -6,11 +6,17 @@ The obspy.io.win.core test suite.
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 from future.builtins import *  # NOQA
+from future.utils import native_str
 
+import io
 import os
 import unittest
+from struct import pack
+
+import numpy as np
 
 from obspy import read
+from obspy.core.util import NamedTemporaryFile
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.io.win.core import _read_win
 
@@ -63,6 +69,71 @@ class CoreTestCase(unittest.TestCase):
         self.assertAlmostEqual(st[0].stats.sampling_rate, 100.0)
         self.assertEqual(st[0].stats.channel, 'a100')
 
+    def test_read_all_data_widths(self):
+        """
+        Reads channel blocks with all data widths, sampling rates with odd
+        and even numbers of samples and channels starting in later second
+        blocks.
+        """
+        np.random.seed(42)
+        # channel, sampling rate, maximum difference and data width
+        channels = [(0x0001, 100, 7, 0), (0x0002, 11, 7, 0),
+                    (0x0a10, 20, 127, 1), (0x0a11, 50, 32767, 2),
+                    (0x0b01, 200, 2 ** 23 - 1, 3),
+                    (0xffff, 10, 2 ** 31 - 1, 4)]
+        seconds = 3
+        expected = {}
+        for channel, srate, max_diff, _ in channels:
+            diffs = np.random.randint(-max_diff, max_diff + 1,
+                                      seconds * srate).astype(np.int64)
+            diffs[0] = 123456
+            expected[channel] = np.cumsum(diffs).astype(np.int32)
+        buf = io.BytesIO()
+        for second in range(seconds):
+            block = io.BytesIO()
+            # BCD coded 2017-12-31 23:59:58 + second
+            block.write(bytes(bytearray([0x17, 0x12, 0x31, 0x23, 0x59,
+                                         0x58 + second])))
+            for channel, srate, _, width in channels:
+                if channel == 0xffff and second == 0:
+                    # Channel starts one second later.
+                    continue
+                data = expected[channel][second * srate:(second + 1) * srate]
+                block.write(pack(native_str('>HHi'), channel,
+                                 (width << 12) | srate, data[0]))
+                diffs = np.diff(data)
+                if width == 0:
+                    if len(diffs) % 2:
+                        diffs = np.append(diffs, 0)
+                    block.write(((diffs[::2] << 4) | (diffs[1::2] & 0x0f))
+                                .astype(np.uint8).tostring())
+                elif width == 3:
+                    block.write(b''.join(pack(native_str('>i'), d)[1:]
+                                         for d in diffs))
+                else:
+                    block.write(diffs.astype(native_str('>i%i' % width))
+                                .tostring())
+            block = block.getvalue()
+            buf.write(pack(native_str('>I'), len(block) + 4) + block)
+
+        with NamedTemporaryFile() as tf:
+            tf.write(buf.getvalue())
+            tf.flush()
+            st = read(tf.name, format='WIN')
+        self.assertEqual([tr.stats.channel for tr in st],
+                         ['0001', '0002', '0a10', '0a11', '0b01', 'ffff'])
+        for tr, (channel, srate, _, _) in zip(st, channels):
+            self.assertEqual(tr.stats.sampling_rate, srate)
+            if channel == 0xffff:
+                self.assertEqual(tr.stats.starttime,
+                                 UTCDateTime(2017, 12, 31, 23, 59, 59))
+                np.testing.assert_array_equal(tr.data,
+                                              expected[channel][srate:])
+            else:
+                self.assertEqual(tr.stats.starttime,
+                                 UTCDateTime(2017, 12, 31, 23, 59, 58))
+                np.testing.assert_array_equal(tr.data, expected[channel])
+
 
 def suite():
     return unittest.makeSuite(CoreTestCase, 'test')
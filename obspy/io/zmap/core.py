@@ -17,9 +17,15 @@ from future.builtins import *  # NOQA
 
 import math
 
+import numpy as np
+
 from obspy.core import UTCDateTime
 from obspy.core.event import (Catalog, Event, Magnitude, Origin,
                               OriginUncertainty)
+from obspy.core.event.catalog import CATALOG_COLUMNS_DTYPE, NO_TIME
+from obspy.core.event.table import (CatalogTable, _char_matrix,
+                                    _fields_to_ns, _materialize_rows,
+                                    _parse_floats)
 from obspy.core.util.decorator import map_example_filename
 
 
@@ -180,6 +186,43 @@ class Unpickler(object):
         :rtype: :class:`~obspy.core.event.Catalog`
         :returns: ObsPy catalog
         """
+        return self._deserialize(self._read_file(filename))
+
+    def loads(self, zmap_str):
+        """
+        Returns an ObsPy Catalog object from a ZMAP string.
+
+        :type zmap_str: str
+        :param zmap_str: ObsPy Catalog object.
+        :rtype: :class:`~obspy.core.event.Catalog`
+        :returns: ObsPy catalog
+        """
+        return self._deserialize(zmap_str)
+
+    def scan(self, filename):
+        """
+        Returns an ObsPy CatalogTable object from a ZMAP file.
+
+        :type filename: str or file
+        :param filename: Source file name or open file-like object.
+        :rtype: :class:`~obspy.core.event.CatalogTable`
+        :returns: ObsPy catalog table
+        """
+        return self._scan(self._read_file(filename))
+
+    def scans(self, zmap_str):
+        """
+        Returns an ObsPy CatalogTable object from a ZMAP string.
+
+        :type zmap_str: str
+        :param zmap_str: ZMAP string.
+        :rtype: :class:`~obspy.core.event.CatalogTable`
+        :returns: ObsPy catalog table
+        """
+        return self._scan(zmap_str)
+
+    @staticmethod
+    def _read_file(filename):
         # Open filehandler or use an existing file like object.
         if not hasattr(filename, "read"):
             file_opened = True
@@ -191,77 +234,128 @@ class Unpickler(object):
             zmap_str = fh.read()
             if hasattr(zmap_str, 'decode'):
                 zmap_str = zmap_str.decode('utf-8')
-            catalog = self._deserialize(zmap_str)
-            return catalog
+            return zmap_str
         finally:
             if file_opened:
                 fh.close()
 
-    def loads(self, zmap_str):
-        """
-        Returns an ObsPy Catalog object from a ZMAP string.
-
-        :type zmap_str: str
-        :param zmap_str: ObsPy Catalog object.
-        :rtype: :class:`~obspy.core.event.Catalog`
-        :returns: ObsPy catalog
-        """
-        return self._deserialize(zmap_str)
-
     def _deserialize(self, zmap_str):
         catalog = Catalog()
         for row in zmap_str.split('\n'):
             if len(row) == 0:
                 continue
-            origin = Origin()
-            event = Event(origins=[origin])
-            event.preferred_origin_id = origin.resource_id.id
-            # Begin value extraction
-            columns = row.split('\t', 13)[:13]  # ignore extra columns
-            values = dict(zip(_STD_ZMAP_COLUMNS + _EXT_ZMAP_COLUMNS, columns))
-            # Extract origin
-            origin.longitude = self._str2num(values.get('lon'))
-            origin.latitude = self._str2num(values.get('lat'))
-            depth = self._str2num(values.get('depth'))
-            if depth is not None:
-                origin.depth = depth * 1000.0
-            z_err = self._str2num(values.get('z_err'))
-            if z_err is not None:
-                origin.depth_errors.uncertainty = z_err * 1000.0
-            h_err = self._str2num(values.get('h_err'))
-            if h_err is not None:
-                ou = OriginUncertainty()
-                ou.horizontal_uncertainty = h_err
-                ou.preferred_description = 'horizontal uncertainty'
-                origin.origin_uncertainty = ou
-            year = self._str2num(values.get('year'))
-            if year is not None:
-                t_fields = ['year', 'month', 'day', 'hour', 'minute', 'second']
-                comps = [self._str2num(values.get(f)) for f in t_fields]
-                if year % 1 != 0:
-                    origin.time = self._decyear2utc(year)
-                elif any(v > 0 for v in comps[1:]):
-                    # no seconds involved
-                    if len(comps) < 6:
-                        utc_args = [int(v) for v in comps if v is not None]
-                    # we also have to handle seconds
-                    else:
-                        utc_args = [int(v) if v is not None else 0
-                                    for v in comps[:-1]]
-                        # just leave float seconds as is
-                        utc_args.append(comps[-1])
-                    origin.time = UTCDateTime(*utc_args)
-            mag = self._str2num(values.get('mag'))
-            # Extract magnitude
-            if mag is not None:
-                magnitude = Magnitude(mag=mag)
-                m_err = self._str2num(values.get('m_err'))
-                magnitude.mag_errors.uncertainty = m_err
-                event.magnitudes.append(magnitude)
-                event.preferred_magnitude_id = magnitude.resource_id.id
-            catalog.append(event)
+            catalog.append(self._parse_row(row))
         return catalog
 
+    def _scan(self, zmap_str):
+        """
+        Parses all rows with 10 or 13 numeric columns in bulk, all other
+        rows are parsed one by one.
+        """
+        rows = [_r for _r in zmap_str.split('\n') if len(_r)]
+        count = len(rows)
+        values = np.full((count, 13), np.nan)
+        ok = np.zeros(count, dtype=np.bool_)
+        tabs = np.array([_r.count('\t') for _r in rows], dtype=np.int64)
+        for num_columns in (10, 13):
+            indices = np.flatnonzero(tabs == num_columns - 1)
+            if not len(indices):
+                continue
+            group = [rows[_i] for _i in indices]
+            chars = _char_matrix(group, max(len(_r) for _r in group))
+            values[indices, :num_columns], ok[indices] = _parse_floats(
+                chars, 0, chars.shape[1], count=num_columns)
+        lon, lat, year, month, day, mag, depth, hour, minute, second = \
+            values.T[:10]
+        columns = np.full(count, np.nan, dtype=CATALOG_COLUMNS_DTYPE)
+        columns["time"] = NO_TIME
+        columns["latitude"] = lat
+        columns["longitude"] = lon
+        columns["depth"] = depth * 1000.0
+        columns["magnitude"] = mag
+        # Same time handling as in _parse_row().
+        with np.errstate(invalid="ignore"):
+            ok &= (year >= 1) & (year < 9999) | np.isnan(year)
+            decimal = ok & ~np.isnan(year) & (np.mod(year, 1) != 0)
+        # Same calculation as in _decyear2utc().
+        full_year = np.floor(year[decimal])
+        ones = np.ones(len(full_year))
+        start, _ = _fields_to_ns(full_year, ones, ones, 0 * ones, 0 * ones,
+                                 0 * ones)
+        end, _ = _fields_to_ns(full_year + 1, ones, ones, 0 * ones, 0 * ones,
+                               0 * ones)
+        seconds = np.mod(year[decimal], 1) * ((end - start) / 1e9)
+        columns["time"][decimal] = start + \
+            np.round(seconds * 1e9).astype(np.int64)
+        components = np.array([month, day, hour, minute, second])
+        with np.errstate(invalid="ignore"):
+            has_time = ok & ~np.isnan(year) & ~decimal & \
+                (components > 0).any(axis=0)
+            # any() fails for missing components in _parse_row()
+            ok &= ~(has_time & np.isnan(components).any(axis=0))
+            ok &= np.isnan(year) | decimal | has_time | \
+                (components <= 0).all(axis=0)
+        times, ok_time = _fields_to_ns(year[has_time],
+                                       *components[:, has_time])
+        columns["time"][has_time] = times
+        ok[has_time] &= ok_time
+
+        events, _ = _materialize_rows(columns, rows, self._parse_row,
+                                      np.flatnonzero(~ok))
+        return CatalogTable(columns, rows, self._parse_row, events=events)
+
+    def _parse_row(self, row):
+        """
+        Creates an event from a single row.
+        """
+        origin = Origin()
+        event = Event(origins=[origin])
+        event.preferred_origin_id = origin.resource_id.id
+        # Begin value extraction
+        columns = row.split('\t', 13)[:13]  # ignore extra columns
+        values = dict(zip(_STD_ZMAP_COLUMNS + _EXT_ZMAP_COLUMNS, columns))
+        # Extract origin
+        origin.longitude = self._str2num(values.get('lon'))
+        origin.latitude = self._str2num(values.get('lat'))
+        depth = self._str2num(values.get('depth'))
+        if depth is not None:
+            origin.depth = depth * 1000.0
+        z_err = self._str2num(values.get('z_err'))
+        if z_err is not None:
+            origin.depth_errors.uncertainty = z_err * 1000.0
+        h_err = self._str2num(values.get('h_err'))
+        if h_err is not None:
+            ou = OriginUncertainty()
+            ou.horizontal_uncertainty = h_err
+            ou.preferred_description = 'horizontal uncertainty'
+            origin.origin_uncertainty = ou
+        year = self._str2num(values.get('year'))
+        if year is not None:
+            t_fields = ['year', 'month', 'day', 'hour', 'minute', 'second']
+            comps = [self._str2num(values.get(f)) for f in t_fields]
+            if year % 1 != 0:
+                origin.time = self._decyear2utc(year)
+            elif any(v > 0 for v in comps[1:]):
+                # no seconds involved
+                if len(comps) < 6:
+                    utc_args = [int(v) for v in comps if v is not None]
+                # we also have to handle seconds
+                else:
+                    utc_args = [int(v) if v is not None else 0
+                                for v in comps[:-1]]
+                    # just leave float seconds as is
+                    utc_args.append(comps[-1])
+                origin.time = UTCDateTime(*utc_args)
+        mag = self._str2num(values.get('mag'))
+        # Extract magnitude
+        if mag is not None:
+            magnitude = Magnitude(mag=mag)
+            m_err = self._str2num(values.get('m_err'))
+            magnitude.mag_errors.uncertainty = m_err
+            event.magnitudes.append(magnitude)
+            event.preferred_magnitude_id = magnitude.resource_id.id
+        return event
+
     @staticmethod
     def _str2num(num_str):
         try:
@@ -334,6 +428,34 @@ def _read_zmap(filename, **kwargs):
     return Unpickler().load(filename)
 
 
+def _scan_zmap(filename, **kwargs):  # @UnusedVariable
+    """
+    Scans a ZMAP file and returns an ObsPy CatalogTable object.
+
+    All rows with 10 or 13 numerical columns are parsed in bulk, the events
+    are only created when accessed.
+
+    .. warning::
+        This function should NOT be called directly, it registers via the
+        ObsPy :func:`~obspy.core.event.scan_events` function, call this
+        instead.
+
+    :type filename: str or file
+    :param filename: ZMAP string, name of ZMAP file to be read or open
+        file-like object.
+    :rtype: :class:`~obspy.core.event.CatalogTable`
+    :return: An ObsPy CatalogTable object.
+    """
+    if not hasattr(filename, 'read'):
+        try:
+            with open(filename):
+                pass
+        except Exception:
+            # we assume it's a string now
+            return Unpickler().scans(filename)
+    return Unpickler().scan(filename)
+
+
 @map_example_filename("filename")
 def _is_zmap(filename):
     """
@@ -6,7 +6,9 @@ from future.builtins import *  # NOQA
 import os
 import unittest
 
-from obspy.core.event import read_events
+import numpy as np
+
+from obspy.core.event import read_events, scan_events
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import NamedTemporaryFile, get_example_file
 from obspy.io.zmap import core as zmap
@@ -249,6 +251,73 @@ class ZMAPTestCase(unittest.TestCase):
         self.assertEqual(catalog[2].origins[0].time.microsecond, 550000)
         self.assertEqual(catalog[3].origins[0].time.microsecond, 450000)
 
+    def test_scan(self):
+        """
+        Rows with decimal years, calendar times and NaN times are scanned
+        in bulk, only the row with a missing hour is parsed on its own.
+        """
+        test_events = [self.test_data, dict(self.test_data, lon='5.1'),
+                       dict(self.test_data, year='2012'),
+                       dict(self.test_data, year='NaN'),
+                       dict(self.test_data, year='2012', hour='NaN')]
+        zmap_str = self._serialize(test_events)
+        catalog = zmap.Unpickler().loads(zmap_str)
+        table = zmap.Unpickler().scans(zmap_str)
+        # only the row with a missing hour is created when scanning
+        self.assertEqual(table._events[:4], [None] * 4)
+        self.assertIsNotNone(table._events[4])
+        for key in catalog.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          catalog.get_columns()[key])
+        self._assert_zmap_equal(table[:3].to_catalog(), test_events[:3])
+        self.assertIsNone(table[3].origins[0].time)
+        self.assertEqual(table[4].origins[0].time,
+                         UTCDateTime(2012, 4, 4, 0, 21, 42.3))
+        # via file name and plugin interface
+        filename = os.path.join(self.data_dir, "templates.txt")
+        table = scan_events(filename)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table[1].origins[0].time.microsecond, 880000)
+        self.assertEqual(table[1]._format, "ZMAP")
+
+    def test_scan_missing_columns(self):
+        """
+        Rows with missing, empty, non-numeric or extra columns are parsed
+        one by one and give the same columns as loading the string.
+        """
+        row = self._serialize([self.test_data]).rstrip('\n')
+        fields = row.split('\t')
+        rows = [
+            # 10 and 13 columns are parsed in bulk
+            row,
+            row + '\t0.5\t1.2\t0.1',
+            # missing or additional columns
+            '\t'.join(fields[:9]),
+            '\t'.join(fields[:7]),
+            row + '\t0.5',
+            row + '\t0.5\t1.2',
+            row + '\t0.5\t1.2\t0.1\t7',
+            # empty and non-numeric columns
+            '\t'.join(fields[:5] + ['', ''] + fields[7:]),
+            '\t'.join(fields[:5] + ['x'] + fields[6:]),
+            '\t'.join(fields[:5] + ['nan'] + fields[6:]),
+        ]
+        zmap_str = '\n'.join(rows) + '\n'
+        catalog = zmap.Unpickler().loads(zmap_str)
+        table = zmap.Unpickler().scans(zmap_str)
+        self.assertEqual(table._events[:2], [None, None])
+        self.assertEqual(table._events[-1], None)
+        for event in table._events[2:-1]:
+            self.assertIsNotNone(event)
+        for key in catalog.get_columns().dtype.names:
+            np.testing.assert_array_equal(table.get_columns()[key],
+                                          catalog.get_columns()[key])
+        self.assertIsNone(table[3].magnitudes[0].mag_errors.uncertainty)
+        self.assertEqual(
+            table[1].preferred_magnitude().mag_errors.uncertainty, 0.1)
+        self.assertEqual(table[7].preferred_magnitude(), None)
+        self.assertEqual(table[8].preferred_magnitude(), None)
+
     def _assert_zmap_equal(self, catalog, dicts):
         """
         Compares a zmap imported catalog with test event dictionaries
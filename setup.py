@@ -203,11 +203,13 @@ ENTRY_POINTS = {
     'obspy.plugin.waveform.GSE2': [
         'isFormat = obspy.io.gse2.core:_is_gse2',
         'readFormat = obspy.io.gse2.core:_read_gse2',
+        'scanFormat = obspy.io.gse2.core:_scan_gse2',
         'writeFormat = obspy.io.gse2.core:_write_gse2',
         ],
     'obspy.plugin.waveform.MSEED': [
         'isFormat = obspy.io.mseed.core:_is_mseed',
         'readFormat = obspy.io.mseed.core:_read_mseed',
+        'scanFormat = obspy.io.mseed.core:_scan_mseed',
         'writeFormat = obspy.io.mseed.core:_write_mseed',
         ],
     'obspy.plugin.waveform.PDAS': [
@@ -217,6 +219,7 @@ ENTRY_POINTS = {
     'obspy.plugin.waveform.SAC': [
         'isFormat = obspy.io.sac.core:_is_sac',
         'readFormat = obspy.io.sac.core:_read_sac',
+        'scanFormat = obspy.io.sac.core:_scan_sac',
         'writeFormat = obspy.io.sac.core:_write_sac',
         ],
     'obspy.plugin.waveform.SACXY': [
@@ -231,6 +234,7 @@ ENTRY_POINTS = {
     'obspy.plugin.waveform.SEGY': [
         'isFormat = obspy.io.segy.core:_is_segy',
         'readFormat = obspy.io.segy.core:_read_segy',
+        'scanFormat = obspy.io.segy.core:_scan_segy',
         'writeFormat = obspy.io.segy.core:_write_segy',
         ],
     'obspy.plugin.waveform.SU': [
@@ -292,7 +296,8 @@ ENTRY_POINTS = {
         'SHAPEFILE = obspy.io.shapefile.core',
         'KML = obspy.io.kml.core',
         'FNETMT = obspy.io.nied.fnetmt',
-        'GSE2 = obspy.io.gse2.bulletin'
+        'GSE2 = obspy.io.gse2.bulletin',
+        'EVENTCACHE = obspy.io.eventcache.core'
         ],
     'obspy.plugin.event.QUAKEML': [
         'isFormat = obspy.io.quakeml.core:_is_quakeml',
@@ -305,6 +310,7 @@ ENTRY_POINTS = {
     'obspy.plugin.event.MCHEDR': [
         'isFormat = obspy.io.pde.mchedr:_is_mchedr',
         'readFormat = obspy.io.pde.mchedr:_read_mchedr',
+        'scanFormat = obspy.io.pde.mchedr:_scan_mchedr',
         ],
     'obspy.plugin.event.JSON': [
         'writeFormat = obspy.io.json.core:_write_json',
@@ -312,14 +318,22 @@ ENTRY_POINTS = {
     'obspy.plugin.event.ZMAP': [
         'isFormat = obspy.io.zmap.core:_is_zmap',
         'readFormat = obspy.io.zmap.core:_read_zmap',
+        'scanFormat = obspy.io.zmap.core:_scan_zmap',
         'writeFormat = obspy.io.zmap.core:_write_zmap',
         ],
+    'obspy.plugin.event.EVENTCACHE': [
+        'isFormat = obspy.io.eventcache.core:_is_eventcache',
+        'readFormat = obspy.io.eventcache.core:_read_eventcache',
+        'scanFormat = obspy.io.eventcache.core:_scan_eventcache',
+        'writeFormat = obspy.io.eventcache.core:_write_eventcache',
+        ],
     'obspy.plugin.event.CNV': [
         'writeFormat = obspy.io.cnv.core:_write_cnv',
         ],
     'obspy.plugin.event.NDK': [
         'isFormat = obspy.io.ndk.core:_is_ndk',
         'readFormat = obspy.io.ndk.core:_read_ndk',
+        'scanFormat = obspy.io.ndk.core:_scan_ndk',
         ],
     'obspy.plugin.event.NLLOC_HYP': [
         'isFormat = obspy.io.nlloc.core:is_nlloc_hyp',
@@ -336,6 +350,7 @@ ENTRY_POINTS = {
     'obspy.plugin.event.CMTSOLUTION': [
         'isFormat = obspy.io.cmtsolution.core:_is_cmtsolution',
         'readFormat = obspy.io.cmtsolution.core:_read_cmtsolution',
+        'scanFormat = obspy.io.cmtsolution.core:_scan_cmtsolution',
         'writeFormat = obspy.io.cmtsolution.core:_write_cmtsolution'
         ],
     'obspy.plugin.event.FNETMT': [